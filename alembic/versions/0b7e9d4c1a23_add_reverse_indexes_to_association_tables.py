@@ -0,0 +1,36 @@
+"""add reverse indexes to association tables
+
+Revision ID: 0b7e9d4c1a23
+Revises: f4b1c2d3e5a6
+Create Date: 2026-10-19 11:03:27.518302
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0b7e9d4c1a23"
+down_revision: Union[str, None] = "f4b1c2d3e5a6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_movie_producer_producer_id_movie_id",
+        "movie_producer",
+        ["producer_id", "movie_id"],
+    )
+    op.create_index(
+        "ix_movie_studio_studio_id_movie_id",
+        "movie_studio",
+        ["studio_id", "movie_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_movie_studio_studio_id_movie_id", table_name="movie_studio")
+    op.drop_index("ix_movie_producer_producer_id_movie_id", table_name="movie_producer")
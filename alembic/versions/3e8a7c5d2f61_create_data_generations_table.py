@@ -0,0 +1,43 @@
+"""create data_generations table
+
+Revision ID: 3e8a7c5d2f61
+Revises: 9d3f6a1b2c47
+Create Date: 2026-10-19 13:14:40.271906
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3e8a7c5d2f61"
+down_revision: Union[str, None] = "9d3f6a1b2c47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRACKED_TABLES = ("movies", "producers", "studios")
+
+
+def upgrade() -> None:
+    table = op.create_table(
+        "data_generations",
+        sa.Column("table_name", sa.String(), nullable=False),
+        sa.Column("generation", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("table_name"),
+    )
+    op.bulk_insert(
+        table, [{"table_name": name, "generation": 0} for name in TRACKED_TABLES]
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("data_generations")
@@ -0,0 +1,66 @@
+"""add name_normalized to producers and studios
+
+Revision ID: 5c2a8e7f9b14
+Revises: 0b7e9d4c1a23
+Create Date: 2026-10-19 11:47:05.930215
+
+"""
+
+import unicodedata
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c2a8e7f9b14"
+down_revision: Union[str, None] = "0b7e9d4c1a23"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("producers", "studios")
+
+
+def _normalize(value: str) -> str:
+    # Cópia de app.utils.text.normalize_name, para a migration não depender do app
+    decomposed = unicodedata.normalize("NFKD", value.strip())
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    for table_name in TABLES:
+        op.add_column(
+            table_name, sa.Column("name_normalized", sa.String(), nullable=True)
+        )
+
+        table = sa.table(
+            table_name,
+            sa.column("id", sa.Integer()),
+            sa.column("name", sa.String()),
+            sa.column("name_normalized", sa.String()),
+        )
+        rows = connection.execute(sa.select(table.c.id, table.c.name)).all()
+        if rows:
+            connection.execute(
+                table.update()
+                .where(table.c.id == sa.bindparam("row_id"))
+                .values(name_normalized=sa.bindparam("normalized")),
+                [{"row_id": id_, "normalized": _normalize(name)} for id_, name in rows],
+            )
+
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.alter_column(
+                "name_normalized", existing_type=sa.String(), nullable=False
+            )
+        op.create_index(
+            f"ix_{table_name}_name_normalized", table_name, ["name_normalized"]
+        )
+
+
+def downgrade() -> None:
+    for table_name in TABLES:
+        op.drop_index(f"ix_{table_name}_name_normalized", table_name=table_name)
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.drop_column("name_normalized")
@@ -0,0 +1,78 @@
+"""add on delete cascade to association tables
+
+Revision ID: 7a4d2e9c1b58
+Revises: 3e8a7c5d2f61
+Create Date: 2026-10-19 13:52:18.664093
+
+"""
+
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7a4d2e9c1b58"
+down_revision: Union[str, None] = "3e8a7c5d2f61"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tabela de associação -> (tabela relacionada, coluna)
+ASSOCIATIONS = {
+    "movie_producer": ("producers", "producer_id"),
+    "movie_studio": ("studios", "studio_id"),
+}
+
+
+def _association_table(name: str, ondelete: Optional[str]) -> sa.Table:
+    """Definição completa da tabela de associação, com o ondelete informado."""
+    other, column = ASSOCIATIONS[name]
+    metadata = sa.MetaData()
+    for referenced in ("movies", other):
+        sa.Table(referenced, metadata, sa.Column("id", sa.Integer, primary_key=True))
+    return sa.Table(
+        name,
+        metadata,
+        sa.Column(
+            "movie_id",
+            sa.Integer,
+            sa.ForeignKey("movies.id", ondelete=ondelete),
+            primary_key=True,
+        ),
+        sa.Column(
+            column,
+            sa.Integer,
+            sa.ForeignKey(f"{other}.id", ondelete=ondelete),
+            primary_key=True,
+        ),
+        sa.Index(f"ix_{name}_{column}_movie_id", column, "movie_id"),
+    )
+
+
+def _set_ondelete(ondelete: Optional[str]) -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        # O SQLite não altera chaves estrangeiras: a tabela é recriada a partir
+        # da definição nova e os dados são copiados
+        for name in ASSOCIATIONS:
+            with op.batch_alter_table(
+                name, copy_from=_association_table(name, ondelete), recreate="always"
+            ):
+                pass
+        return
+
+    for name, (other, column) in ASSOCIATIONS.items():
+        for local, referenced in (("movie_id", "movies"), (column, other)):
+            constraint = f"{name}_{local}_fkey"
+            op.drop_constraint(constraint, name, type_="foreignkey")
+            op.create_foreign_key(
+                constraint, name, referenced, [local], ["id"], ondelete=ondelete
+            )
+
+
+def upgrade() -> None:
+    _set_ondelete("CASCADE")
+
+
+def downgrade() -> None:
+    _set_ondelete(None)
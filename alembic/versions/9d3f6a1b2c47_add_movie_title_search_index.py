@@ -0,0 +1,88 @@
+"""add movie title search index
+
+Revision ID: 9d3f6a1b2c47
+Revises: 5c2a8e7f9b14
+Create Date: 2026-10-19 12:31:52.604117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9d3f6a1b2c47"
+down_revision: Union[str, None] = "5c2a8e7f9b14"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SQLITE_UPGRADE = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS movies_fts USING fts5(
+        title,
+        content='movies',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS movies_fts_ai AFTER INSERT ON movies BEGIN
+        INSERT INTO movies_fts(rowid, title) VALUES (new.id, new.title);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS movies_fts_ad AFTER DELETE ON movies BEGIN
+        INSERT INTO movies_fts(movies_fts, rowid, title)
+        VALUES ('delete', old.id, old.title);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS movies_fts_au AFTER UPDATE OF title ON movies BEGIN
+        INSERT INTO movies_fts(movies_fts, rowid, title)
+        VALUES ('delete', old.id, old.title);
+        INSERT INTO movies_fts(rowid, title) VALUES (new.id, new.title);
+    END
+    """,
+    # Indexa os filmes já cadastrados
+    "INSERT INTO movies_fts(movies_fts) VALUES ('rebuild')",
+]
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS movies_fts_au",
+    "DROP TRIGGER IF EXISTS movies_fts_ad",
+    "DROP TRIGGER IF EXISTS movies_fts_ai",
+    "DROP TABLE IF EXISTS movies_fts",
+]
+
+POSTGRES_UPGRADE = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_movies_title_trgm "
+    "ON movies USING gin (title gin_trgm_ops)",
+]
+POSTGRES_DOWNGRADE = ["DROP INDEX IF EXISTS ix_movies_title_trgm"]
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        statements = SQLITE_UPGRADE
+    elif dialect == "postgresql":
+        statements = POSTGRES_UPGRADE
+    else:
+        statements = []
+
+    for statement in statements:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        statements = SQLITE_DOWNGRADE
+    elif dialect == "postgresql":
+        statements = POSTGRES_DOWNGRADE
+    else:
+        statements = []
+
+    for statement in statements:
+        op.execute(statement)
@@ -0,0 +1,46 @@
+"""drop redundant id indexes and add winner id indexes
+
+Revision ID: b8e4f1a6c903
+Revises: 7a4d2e9c1b58
+Create Date: 2026-10-19 16:04:27.519362
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8e4f1a6c903"
+down_revision: Union[str, None] = "7a4d2e9c1b58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Os índices ix_*_id repetem a chave primária (no SQLite, o próprio rowid):
+# só ocupam espaço e custam uma escrita a mais por INSERT/DELETE
+TABLES = ("movies", "producers", "studios")
+# Índices parciais da listagem filtrada por vencedor -> valor de `winner`
+WINNER_INDEXES = {"ix_movies_winners_id": True, "ix_movies_nominees_id": False}
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.drop_index(f"ix_{table}_id", table_name=table)
+    # Listagem filtrada por vencedor e paginada por ID sem varrer a tabela
+    for name, winner in WINNER_INDEXES.items():
+        op.create_index(
+            name,
+            "movies",
+            ["id"],
+            sqlite_where=sa.column("winner").is_(winner),
+            postgresql_where=sa.column("winner").is_(winner),
+        )
+
+
+def downgrade() -> None:
+    for name in WINNER_INDEXES:
+        op.drop_index(name, table_name="movies")
+    for table in TABLES:
+        op.create_index(f"ix_{table}_id", table, ["id"], unique=False)
@@ -0,0 +1,35 @@
+"""add year/winner indexes to movies
+
+Revision ID: f4b1c2d3e5a6
+Revises: d2851158e412
+Create Date: 2026-10-19 10:12:41.204118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f4b1c2d3e5a6"
+down_revision: Union[str, None] = "d2851158e412"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_movies_year_winner", "movies", ["year", "winner"])
+    op.create_index(
+        "ix_movies_winners_year",
+        "movies",
+        ["year"],
+        sqlite_where=sa.column("winner").is_(True),
+        postgresql_where=sa.column("winner").is_(True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_movies_winners_year", table_name="movies")
+    op.drop_index("ix_movies_year_winner", table_name="movies")
@@ -3,3 +3,7 @@ from .studio_handler import StudioHandler
 from .movie_handler import MovieHandler
 from .csv_importer_handler import CSVImporterHandler
 from .award_interval_handler import AwardIntervalHandler
+from .async_producer_handler import AsyncProducerHandler
+from .async_studio_handler import AsyncStudioHandler
+from .async_movie_handler import AsyncMovieHandler
+from .async_award_interval_handler import AsyncAwardIntervalHandler
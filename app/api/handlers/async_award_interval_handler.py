@@ -0,0 +1,25 @@
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.services.async_award_interval_service import AsyncAwardIntervalService
+from app.schemas.award_interval import AwardIntervalResponse
+
+
+class AsyncAwardIntervalHandler:
+    """
+    Variante async de `AwardIntervalHandler` (ASYNC_DB=true).
+    """
+
+    @staticmethod
+    async def get_award_intervals(db: AsyncSession) -> AwardIntervalResponse:
+        """
+        Obtém os produtores com maior e menor intervalo entre prêmios consecutivos.
+
+        :return: AwardIntervalResponse contendo os produtores com
+        maior e menor intervalo.
+        """
+        try:
+            return await AsyncAwardIntervalService.calculate_award_intervals_cached(db)
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Erro ao processar os dados: {str(e)}"
+            )
@@ -0,0 +1,169 @@
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException
+from fastapi.responses import Response, StreamingResponse
+from app.api.handlers.movie_handler import MovieHandler
+from app.config import Config
+from app.schemas.batch import BatchGetRequest
+from app.schemas.movie import (
+    MovieBatchGetResponse,
+    MovieBulkDeleteResponse,
+    MovieBulkRequest,
+    MovieBulkResponse,
+    MovieCreate,
+    MovieFilter,
+    MovieListResponse,
+    MovieResponse,
+)
+from app.services.async_catalog_snapshot_service import AsyncCatalogSnapshotService
+from app.services.async_generation_service import AsyncGenerationService
+from app.services.async_movie_service import AsyncMovieService
+from app.utils.conditional import etag_matches
+from app.utils.streaming import (
+    JSON_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    close_session_after_async,
+)
+from app.utils.text import fts_query
+from typing import Optional
+
+
+class AsyncMovieHandler:
+    """
+    Variante async de `MovieHandler` (ASYNC_DB=true): mesmas validações e
+    respostas, com a service async.
+    """
+
+    @staticmethod
+    async def create_movie(db: AsyncSession, movie_data: MovieCreate) -> MovieResponse:
+        """Cria um novo filme e retorna os dados formatados."""
+        return await AsyncMovieService.create_movie(db, movie_data)
+
+    @staticmethod
+    async def bulk_create_movies(
+        db: AsyncSession, request: MovieBulkRequest
+    ) -> MovieBulkResponse:
+        """Cadastra vários filmes em uma transação, limitando o tamanho do lote."""
+        MovieHandler._check_batch_size(len(request.movies))
+
+        try:
+            return await AsyncMovieService.bulk_create_movies(db, request)
+        except IntegrityError:
+            raise HTTPException(
+                status_code=409,
+                detail="Conflito ao gravar o lote; nenhum filme foi cadastrado.",
+            )
+
+    @staticmethod
+    async def get_movie_by_id(db: AsyncSession, movie_id: int) -> MovieResponse:
+        """Obtém um filme pelo ID."""
+        movie = await AsyncMovieService.get_movie_by_id(db, movie_id)
+        if not movie:
+            raise HTTPException(status_code=404, detail="Movie not found")
+        return movie
+
+    @staticmethod
+    async def get_movie_by_title(db: AsyncSession, title: str) -> MovieResponse:
+        """Obtém um filme pelo título."""
+        movie = await AsyncMovieService.get_movie_by_title(db, title)
+        if not movie:
+            raise HTTPException(status_code=404, detail="Movie not found")
+        return movie
+
+    @staticmethod
+    async def batch_get_movies(
+        db: AsyncSession, request: BatchGetRequest
+    ) -> MovieBatchGetResponse:
+        """Busca vários filmes de uma vez, limitando o tamanho do lote."""
+        keys = request.ids if request.ids is not None else request.names or []
+        MovieHandler._check_batch_size(len(keys))
+
+        return await AsyncMovieService.batch_get_movies(db, request)
+
+    @staticmethod
+    async def search_movies(
+        db: AsyncSession, query: str, limit: int
+    ) -> MovieListResponse:
+        """Busca filmes pelo título, validando o termo informado."""
+        if not fts_query(query):
+            raise HTTPException(status_code=400, detail="Informe um termo de busca.")
+        return await AsyncMovieService.search_movies(
+            db, query, min(limit, Config.MAX_PAGE_SIZE)
+        )
+
+    @staticmethod
+    async def get_all_movies(
+        db: AsyncSession,
+        expand: str,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        accept: Optional[str] = None,
+        stream: bool = False,
+        fields: Optional[str] = None,
+        filters: Optional[MovieFilter] = None,
+        if_none_match: Optional[str] = None,
+        accept_encoding: Optional[str] = None,
+    ) -> Response:
+        """
+        Obtém os filmes, permitindo expandir os relacionamentos e paginar
+        (parâmetros e respostas de `MovieHandler.get_all_movies`).
+
+        :return: Resposta JSON já codificada ou resposta em streaming.
+        """
+        listing = MovieHandler._parse_listing(
+            expand, limit, after, accept, stream, fields, filters, accept_encoding
+        )
+        headers = await AsyncGenerationService.list_validators(
+            db, "movies", listing.tables, listing.variant
+        )
+        headers["Vary"] = "Accept, Accept-Encoding"
+        if etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+
+        if listing.encoding is not None:
+            return Response(
+                content=await AsyncCatalogSnapshotService.get_catalog(
+                    db, headers["ETag"], listing.encoding
+                ),
+                media_type=JSON_MEDIA_TYPE,
+                headers={**headers, "Content-Encoding": listing.encoding},
+            )
+
+        if listing.streaming:
+            return StreamingResponse(
+                close_session_after_async(
+                    db,
+                    AsyncMovieService.stream_movies(
+                        db, listing.expand, listing.after_id, listing.ndjson, filters
+                    ),
+                ),
+                media_type=NDJSON_MEDIA_TYPE if listing.ndjson else JSON_MEDIA_TYPE,
+                headers=headers,
+            )
+
+        return Response(
+            content=await AsyncMovieService.get_all_movies_json(
+                db,
+                listing.expand,
+                listing.page_limit,
+                listing.after_id,
+                listing.fields,
+                filters,
+            ),
+            media_type=JSON_MEDIA_TYPE,
+            headers=headers,
+        )
+
+    @staticmethod
+    async def delete_movies(db: AsyncSession, ids: str) -> MovieBulkDeleteResponse:
+        """
+        Deleta vários filmes, validando a lista de IDs separados por vírgula
+        e limitando o tamanho do lote.
+        """
+        return await AsyncMovieService.delete_movies(db, MovieHandler._parse_ids(ids))
+
+    @staticmethod
+    async def delete_movie(db: AsyncSession, movie_id: int) -> None:
+        """Deleta um filme pelo ID."""
+        if not await AsyncMovieService.delete_movie(db, movie_id):
+            raise HTTPException(status_code=404, detail="Movie not found")
@@ -0,0 +1,159 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.handlers.producer_handler import ProducerHandler
+from app.config import Config
+from app.schemas.batch import BatchGetRequest
+from app.schemas.movie import MovieFilter
+from app.schemas.producer import (
+    ProducerBatchGetResponse,
+    ProducerCreate,
+    ProducerListResponse,
+    ProducerResponse,
+)
+from app.services.async_generation_service import AsyncGenerationService
+from app.services.async_movie_service import AsyncMovieService
+from app.services.async_producer_service import AsyncProducerService
+from app.utils.conditional import etag_matches
+from app.utils.pagination import resolve_page
+from app.utils.text import normalize_name
+from app.utils.streaming import (
+    JSON_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    close_session_after_async,
+)
+from fastapi import HTTPException
+from fastapi.responses import Response, StreamingResponse
+from typing import Optional
+
+
+class AsyncProducerHandler:
+    """Variante async de `ProducerHandler` (ASYNC_DB=true), com as mesmas
+    validações e respostas."""
+
+    @staticmethod
+    async def create_producer(
+        db: AsyncSession, producer_data: ProducerCreate
+    ) -> ProducerResponse:
+        """Cria um novo produtor, validando os dados antes de chamar a service."""
+        if not producer_data.name.strip():
+            raise HTTPException(status_code=400, detail="Producer name cannot be empty")
+
+        return await AsyncProducerService.create_producer(db, producer_data)
+
+    @staticmethod
+    async def get_producer_by_id(
+        db: AsyncSession, producer_id: int
+    ) -> ProducerResponse:
+        """Obtém um produtor pelo ID, garantindo que ele exista antes de retornar."""
+        producer = await AsyncProducerService.get_producer_by_id(db, producer_id)
+        if not producer:
+            raise HTTPException(status_code=404, detail="Producer not found")
+        return producer
+
+    @staticmethod
+    async def get_producer_by_name(db: AsyncSession, name: str) -> ProducerResponse:
+        """Obtém um produtor pelo nome, garantindo que ele exista antes de retornar."""
+        producer = await AsyncProducerService.get_producer_by_name(db, name)
+        if not producer:
+            raise HTTPException(status_code=404, detail="Producer not found")
+        return producer
+
+    @staticmethod
+    async def batch_get_producers(
+        db: AsyncSession, request: BatchGetRequest
+    ) -> ProducerBatchGetResponse:
+        """Busca vários produtores de uma vez, limitando o tamanho do lote."""
+        keys = request.ids if request.ids is not None else request.names or []
+        if len(keys) > Config.MAX_BATCH_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail=f"O lote pode ter no máximo {Config.MAX_BATCH_SIZE} itens.",
+            )
+
+        return await AsyncProducerService.batch_get_producers(db, request)
+
+    @staticmethod
+    async def search_producers(
+        db: AsyncSession, query: str, limit: int
+    ) -> ProducerListResponse:
+        """Busca produtores pelo início do nome, validando o termo informado."""
+        if not normalize_name(query):
+            raise HTTPException(status_code=400, detail="Informe um termo de busca.")
+        return await AsyncProducerService.search_producers(
+            db, query, min(limit, Config.MAX_PAGE_SIZE)
+        )
+
+    @staticmethod
+    async def get_all_producers(
+        db: AsyncSession,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        accept: Optional[str] = None,
+        stream: bool = False,
+        fields: Optional[str] = None,
+        if_none_match: Optional[str] = None,
+    ) -> Response:
+        """
+        Obtém os produtores cadastrados (parâmetros e respostas de
+        `ProducerHandler.get_all_producers`).
+        """
+        fields_list, page_limit, after_id, ndjson, variant = (
+            ProducerHandler._parse_listing(limit, after, accept, stream, fields)
+        )
+        headers = await AsyncGenerationService.list_validators(
+            db, "producers", ProducerHandler.LIST_TABLES, variant
+        )
+        if etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+
+        if variant != "json":
+            return StreamingResponse(
+                close_session_after_async(
+                    db, AsyncProducerService.stream_producers(db, after_id, ndjson)
+                ),
+                media_type=NDJSON_MEDIA_TYPE if ndjson else JSON_MEDIA_TYPE,
+                headers=headers,
+            )
+
+        return Response(
+            content=await AsyncProducerService.get_all_producers_json(
+                db, page_limit, after_id, fields_list
+            ),
+            media_type=JSON_MEDIA_TYPE,
+            headers=headers,
+        )
+
+    @staticmethod
+    async def get_producer_movies(
+        db: AsyncSession,
+        producer_id: int,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        winner: Optional[bool] = None,
+    ) -> Response:
+        """
+        Obtém os filmes de um produtor, com paginação por cursor e filtro de
+        vencedor, garantindo que o produtor exista.
+        """
+        if not await AsyncProducerService.get_producer_by_id(db, producer_id):
+            raise HTTPException(status_code=404, detail="Producer not found")
+
+        try:
+            page_limit, after_id = resolve_page(limit, after)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        filters = MovieFilter(producer_id=producer_id, winner=winner)
+        return Response(
+            content=await AsyncMovieService.get_all_movies_json(
+                db, [], page_limit, after_id, filters=filters
+            ),
+            media_type=JSON_MEDIA_TYPE,
+        )
+
+    @staticmethod
+    async def delete_producer(db: AsyncSession, producer_id: int) -> None:
+        """Deleta um produtor pelo ID, retornando erro se não existir."""
+        deleted = await AsyncProducerService.delete_producer(db, producer_id)
+
+        if not deleted:
+            raise HTTPException(status_code=404, detail="Producer not found")
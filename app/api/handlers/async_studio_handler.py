@@ -0,0 +1,157 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.handlers.studio_handler import StudioHandler
+from app.config import Config
+from app.schemas.batch import BatchGetRequest
+from app.schemas.movie import MovieFilter
+from app.schemas.studio import (
+    StudioBatchGetResponse,
+    StudioCreate,
+    StudioListResponse,
+    StudioResponse,
+)
+from app.services.async_generation_service import AsyncGenerationService
+from app.services.async_movie_service import AsyncMovieService
+from app.services.async_studio_service import AsyncStudioService
+from app.utils.conditional import etag_matches
+from app.utils.pagination import resolve_page
+from app.utils.text import normalize_name
+from app.utils.streaming import (
+    JSON_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    close_session_after_async,
+)
+from fastapi import HTTPException
+from fastapi.responses import Response, StreamingResponse
+from typing import Optional
+
+
+class AsyncStudioHandler:
+    """Variante async de `StudioHandler` (ASYNC_DB=true), com as mesmas
+    validações e respostas."""
+
+    @staticmethod
+    async def create_studio(
+        db: AsyncSession, studio_data: StudioCreate
+    ) -> StudioResponse:
+        """Cria um novo estúdio, validando os dados antes de chamar a service."""
+        if not studio_data.name.strip():
+            raise HTTPException(status_code=400, detail="Studio name cannot be empty")
+
+        return await AsyncStudioService.create_studio(db, studio_data)
+
+    @staticmethod
+    async def get_studio_by_id(db: AsyncSession, studio_id: int) -> StudioResponse:
+        """Obtém um estúdio pelo ID, garantindo que ele exista antes de retornar."""
+        studio = await AsyncStudioService.get_studio_by_id(db, studio_id)
+        if not studio:
+            raise HTTPException(status_code=404, detail="Studio not found")
+        return studio
+
+    @staticmethod
+    async def get_studio_by_name(db: AsyncSession, name: str) -> StudioResponse:
+        """Obtém um estúdio pelo nome, garantindo que ele exista antes de retornar."""
+        studio = await AsyncStudioService.get_studio_by_name(db, name)
+        if not studio:
+            raise HTTPException(status_code=404, detail="Studio not found")
+        return studio
+
+    @staticmethod
+    async def batch_get_studios(
+        db: AsyncSession, request: BatchGetRequest
+    ) -> StudioBatchGetResponse:
+        """Busca vários estúdios de uma vez, limitando o tamanho do lote."""
+        keys = request.ids if request.ids is not None else request.names or []
+        if len(keys) > Config.MAX_BATCH_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail=f"O lote pode ter no máximo {Config.MAX_BATCH_SIZE} itens.",
+            )
+
+        return await AsyncStudioService.batch_get_studios(db, request)
+
+    @staticmethod
+    async def search_studios(
+        db: AsyncSession, query: str, limit: int
+    ) -> StudioListResponse:
+        """Busca estúdios pelo início do nome, validando o termo informado."""
+        if not normalize_name(query):
+            raise HTTPException(status_code=400, detail="Informe um termo de busca.")
+        return await AsyncStudioService.search_studios(
+            db, query, min(limit, Config.MAX_PAGE_SIZE)
+        )
+
+    @staticmethod
+    async def get_all_studios(
+        db: AsyncSession,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        accept: Optional[str] = None,
+        stream: bool = False,
+        fields: Optional[str] = None,
+        if_none_match: Optional[str] = None,
+    ) -> Response:
+        """
+        Obtém os estúdios cadastrados (parâmetros e respostas de
+        `StudioHandler.get_all_studios`).
+        """
+        fields_list, page_limit, after_id, ndjson, variant = (
+            StudioHandler._parse_listing(limit, after, accept, stream, fields)
+        )
+        headers = await AsyncGenerationService.list_validators(
+            db, "studios", StudioHandler.LIST_TABLES, variant
+        )
+        if etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+
+        if variant != "json":
+            return StreamingResponse(
+                close_session_after_async(
+                    db, AsyncStudioService.stream_studios(db, after_id, ndjson)
+                ),
+                media_type=NDJSON_MEDIA_TYPE if ndjson else JSON_MEDIA_TYPE,
+                headers=headers,
+            )
+
+        return Response(
+            content=await AsyncStudioService.get_all_studios_json(
+                db, page_limit, after_id, fields_list
+            ),
+            media_type=JSON_MEDIA_TYPE,
+            headers=headers,
+        )
+
+    @staticmethod
+    async def get_studio_movies(
+        db: AsyncSession,
+        studio_id: int,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        winner: Optional[bool] = None,
+    ) -> Response:
+        """
+        Obtém os filmes de um estúdio, com paginação por cursor e filtro de
+        vencedor, garantindo que o estúdio exista.
+        """
+        if not await AsyncStudioService.get_studio_by_id(db, studio_id):
+            raise HTTPException(status_code=404, detail="Studio not found")
+
+        try:
+            page_limit, after_id = resolve_page(limit, after)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        filters = MovieFilter(studio_id=studio_id, winner=winner)
+        return Response(
+            content=await AsyncMovieService.get_all_movies_json(
+                db, [], page_limit, after_id, filters=filters
+            ),
+            media_type=JSON_MEDIA_TYPE,
+        )
+
+    @staticmethod
+    async def delete_studio(db: AsyncSession, studio_id: int) -> None:
+        """Deleta um estúdio pelo ID, retornando erro se não existir."""
+        deleted = await AsyncStudioService.delete_studio(db, studio_id)
+
+        if not deleted:
+            raise HTTPException(status_code=404, detail="Studio not found")
@@ -1,5 +1,6 @@
 from fastapi import UploadFile, HTTPException
 from sqlalchemy.orm import Session
+from app.db.database import is_read_only_error
 from app.services.csv_importer_service import CSVImporterService
 from app.schemas.csv_importer import CSVImportResponse
 
@@ -23,6 +24,8 @@ class CSVImporterHandler:
             csv_content = file.file.read().decode("utf-8")
             return CSVImporterService.import_csv(db, csv_content)
         except Exception as e:
+            if is_read_only_error(e):
+                raise  # 503 do handler de banco somente leitura
             raise HTTPException(
                 status_code=500, detail=f"Erro ao processar o CSV: {str(e)}"
             )
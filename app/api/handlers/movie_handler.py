@@ -1,20 +1,76 @@
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
+from fastapi.responses import Response, StreamingResponse
+from app.services.catalog_snapshot_service import CatalogSnapshotService
+from app.services.generation_service import GenerationService
 from app.services.movie_service import MovieService
-from app.schemas.movie import MovieCreate, MovieResponse, MovieListResponse
-from typing import Optional
+from app.utils.compression import negotiate_encoding
+from app.utils.conditional import etag_matches
+from app.config import Config
+from app.schemas.batch import BatchGetRequest
+from app.schemas.movie import (
+    MovieBatchGetResponse,
+    MovieBulkDeleteResponse,
+    MovieBulkRequest,
+    MovieBulkResponse,
+    MovieCreate,
+    MovieFilter,
+    MovieListResponse,
+    MovieResponse,
+)
+from app.utils.pagination import resolve_page
+from app.utils.text import fts_query
+from app.utils.streaming import (
+    JSON_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    close_session_after,
+    wants_ndjson,
+)
+from typing import List, NamedTuple, Optional
+
+
+class MovieListing(NamedTuple):
+    """Parâmetros validados de uma listagem de filmes (ver `_parse_listing`)."""
+
+    expand: List[str]
+    fields: Optional[List[str]]
+    page_limit: Optional[int]
+    after_id: Optional[int]
+    ndjson: bool
+    streaming: bool
+    # Codificação do snapshot do catálogo completo (None fora dele)
+    encoding: Optional[str]
+    # Representação que compõe a ETag (ex: "json", "ndjson", "json+br")
+    variant: str
+    # Tabelas cujas gerações compõem a ETag
+    tables: List[str]
 
 
 class MovieHandler:
     """Camada de manipulação de requisições para Movies."""
 
     ALLOWED_EXPANDS = {"producers", "studios"}
+    ALLOWED_FIELDS = {"id", "title", "year", "winner"}
 
     @staticmethod
     def create_movie(db: Session, movie_data: MovieCreate) -> MovieResponse:
         """Cria um novo filme e retorna os dados formatados."""
         return MovieService.create_movie(db, movie_data)
 
+    @staticmethod
+    def bulk_create_movies(db: Session, request: MovieBulkRequest) -> MovieBulkResponse:
+        """Cadastra vários filmes em uma transação, limitando o tamanho do lote."""
+        MovieHandler._check_batch_size(len(request.movies))
+
+        try:
+            return MovieService.bulk_create_movies(db, request)
+        except IntegrityError:
+            raise HTTPException(
+                status_code=409,
+                detail="Conflito ao gravar o lote; nenhum filme foi cadastrado.",
+            )
+
     @staticmethod
     def get_movie_by_id(db: Session, movie_id: int) -> MovieResponse:
         """Obtém um filme pelo ID."""
@@ -32,13 +88,114 @@ class MovieHandler:
         return movie
 
     @staticmethod
-    def get_all_movies(db: Session, expand: str) -> MovieListResponse:
+    def batch_get_movies(
+        db: Session, request: BatchGetRequest
+    ) -> MovieBatchGetResponse:
+        """Busca vários filmes de uma vez, limitando o tamanho do lote."""
+        keys = request.ids if request.ids is not None else request.names or []
+        MovieHandler._check_batch_size(len(keys))
+
+        return MovieService.batch_get_movies(db, request)
+
+    @staticmethod
+    def search_movies(db: Session, query: str, limit: int) -> MovieListResponse:
+        """Busca filmes pelo título, validando o termo informado."""
+        if not fts_query(query):
+            raise HTTPException(status_code=400, detail="Informe um termo de busca.")
+        return MovieService.search_movies(db, query, min(limit, Config.MAX_PAGE_SIZE))
+
+    @staticmethod
+    def get_all_movies(
+        db: Session,
+        expand: str,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        accept: Optional[str] = None,
+        stream: bool = False,
+        fields: Optional[str] = None,
+        filters: Optional[MovieFilter] = None,
+        if_none_match: Optional[str] = None,
+        accept_encoding: Optional[str] = None,
+    ) -> Response:
         """
-        Obtém todos os filmes, permitindo expandir os relacionamentos.
+        Obtém os filmes, permitindo expandir os relacionamentos e paginar.
 
         :param db: Sessão do banco de dados.
         :param expand: String com os campos a serem expandidos, separados por vírgula.
-        :return: Lista de filmes.
+        :param limit: Tamanho da página solicitado.
+        :param after: Cursor opaco retornado na página anterior.
+        :param accept: Cabeçalho Accept (application/x-ndjson ativa o streaming).
+        :param stream: Envia a listagem completa em streaming (JSON em blocos).
+        :param fields: Colunas desejadas, separadas por vírgula (ex: "id,title").
+        :param filters: Filtros de ano e vencedor (None quando não informados).
+        :param if_none_match: ETag recebida antes; se ainda for a atual, responde 304.
+        :param accept_encoding: Cabeçalho Accept-Encoding; o catálogo completo
+            expandido é enviado do snapshot já comprimido.
+        :return: Resposta JSON já codificada ou resposta em streaming.
+        """
+        listing = MovieHandler._parse_listing(
+            expand, limit, after, accept, stream, fields, filters, accept_encoding
+        )
+        headers = GenerationService.list_validators(
+            db, "movies", listing.tables, listing.variant
+        )
+        # O Accept-Encoding decide se a mesma URL sai comprimida, então todas
+        # as respostas da listagem (inclusive 304 e streaming) o declaram
+        headers["Vary"] = "Accept, Accept-Encoding"
+        if etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+
+        if listing.encoding is not None:
+            return Response(
+                content=CatalogSnapshotService.get_catalog(
+                    db, headers["ETag"], listing.encoding
+                ),
+                media_type=JSON_MEDIA_TYPE,
+                headers={**headers, "Content-Encoding": listing.encoding},
+            )
+
+        if listing.streaming:
+            return StreamingResponse(
+                close_session_after(
+                    db,
+                    MovieService.stream_movies(
+                        db, listing.expand, listing.after_id, listing.ndjson, filters
+                    ),
+                ),
+                media_type=NDJSON_MEDIA_TYPE if listing.ndjson else JSON_MEDIA_TYPE,
+                headers=headers,
+            )
+
+        return Response(
+            content=MovieService.get_all_movies_json(
+                db,
+                listing.expand,
+                listing.page_limit,
+                listing.after_id,
+                listing.fields,
+                filters,
+            ),
+            media_type=JSON_MEDIA_TYPE,
+            headers=headers,
+        )
+
+    @staticmethod
+    def _parse_listing(
+        expand: str,
+        limit: Optional[int],
+        after: Optional[str],
+        accept: Optional[str],
+        stream: bool,
+        fields: Optional[str],
+        filters: Optional[MovieFilter],
+        accept_encoding: Optional[str],
+    ) -> MovieListing:
+        """
+        Valida os parâmetros da listagem (compartilhado com `AsyncMovieHandler`)
+        e decide a representação da resposta.
+
+        :raises HTTPException: 400 para expansões, colunas, anos, cursor ou
+            combinações com streaming inválidos.
         """
         expand_list = expand.split(",") if expand else []
         invalid_expands = set(expand_list) - MovieHandler.ALLOWED_EXPANDS
@@ -49,7 +206,103 @@ class MovieHandler:
                 detail=f"Campos inválidos em expand: {', '.join(invalid_expands)}",
             )
 
-        return MovieService.get_all_movies(db, expand_list)
+        fields_list = fields.split(",") if fields else None
+        invalid_fields = set(fields_list or []) - MovieHandler.ALLOWED_FIELDS
+
+        if invalid_fields:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Campos inválidos em fields: {', '.join(invalid_fields)}",
+            )
+
+        if (
+            filters is not None
+            and filters.year_from is not None
+            and filters.year_to is not None
+            and filters.year_from > filters.year_to
+        ):
+            raise HTTPException(
+                status_code=400, detail="year_from não pode ser maior que year_to."
+            )
+
+        try:
+            page_limit, after_id = resolve_page(limit, after)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        ndjson = wants_ndjson(accept)
+        if (ndjson or stream) and limit is not None:
+            raise HTTPException(
+                status_code=400, detail="limit não é suportado com streaming."
+            )
+        if (ndjson or stream) and fields_list is not None:
+            raise HTTPException(
+                status_code=400, detail="fields não é suportado com streaming."
+            )
+
+        full_catalog = (
+            not (ndjson or stream)
+            and set(expand_list) == set(CatalogSnapshotService.EXPAND)
+            and page_limit is None
+            and after_id is None
+            and fields_list is None
+            and filters is None
+        )
+        encoding = negotiate_encoding(accept_encoding) if full_catalog else None
+        variant = "ndjson" if ndjson else "stream" if stream else "json"
+        return MovieListing(
+            expand=expand_list,
+            fields=fields_list,
+            page_limit=page_limit,
+            after_id=after_id,
+            ndjson=ndjson,
+            streaming=ndjson or stream,
+            encoding=encoding,
+            variant=f"{variant}+{encoding}" if encoding else variant,
+            # Os nomes de produtores e estúdios só aparecem quando expandidos
+            tables=[
+                "movies",
+                *(r for r in MovieService.EXPAND_ORDER if r in expand_list),
+            ],
+        )
+
+    @staticmethod
+    def _check_batch_size(size: int) -> None:
+        """Recusa lotes maiores que MAX_BATCH_SIZE com 400."""
+        if size > Config.MAX_BATCH_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail=f"O lote pode ter no máximo {Config.MAX_BATCH_SIZE} itens.",
+            )
+
+    @staticmethod
+    def _parse_ids(ids: str) -> List[int]:
+        """
+        Converte a lista de IDs separados por vírgula da remoção em lote.
+
+        :raises HTTPException: 400 se algum ID não for inteiro, se a lista
+            estiver vazia ou exceder MAX_BATCH_SIZE.
+        """
+        try:
+            id_list = [int(value) for value in ids.split(",") if value.strip()]
+        except ValueError:
+            raise HTTPException(
+                status_code=400, detail="ids deve ser uma lista de inteiros."
+            )
+
+        if not id_list:
+            raise HTTPException(status_code=400, detail="Informe ao menos um ID.")
+        MovieHandler._check_batch_size(len(id_list))
+        return id_list
+
+    @staticmethod
+    def delete_movies(db: Session, ids: str) -> MovieBulkDeleteResponse:
+        """
+        Deleta vários filmes, validando a lista de IDs separados por vírgula
+        e limitando o tamanho do lote.
+        """
+        id_list = MovieHandler._parse_ids(ids)
+        return MovieService.delete_movies(db, id_list)
 
     @staticmethod
     def delete_movie(db: Session, movie_id: int) -> None:
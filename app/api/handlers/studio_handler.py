@@ -1,13 +1,38 @@
 from sqlalchemy.orm import Session
-from app.schemas.studio import StudioCreate, StudioResponse, StudioListResponse
+from app.config import Config
+from app.schemas.batch import BatchGetRequest
+from app.schemas.movie import MovieFilter
+from app.schemas.studio import (
+    StudioBatchGetResponse,
+    StudioCreate,
+    StudioListResponse,
+    StudioResponse,
+)
+from app.services.movie_service import MovieService
+from app.services.generation_service import GenerationService
 from app.services.studio_service import StudioService
+from app.utils.conditional import etag_matches
+from app.utils.pagination import resolve_page
+from app.utils.text import normalize_name
+from app.utils.streaming import (
+    JSON_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    close_session_after,
+    wants_ndjson,
+)
 from fastapi import HTTPException
+from fastapi.responses import Response, StreamingResponse
+from typing import List, Optional, Tuple
 
 
 class StudioHandler:
     """Camada intermediária para validar e processar requisições da API
     antes de chamar a service."""
 
+    ALLOWED_FIELDS = {"id", "name"}
+    # Tabelas cujas gerações compõem a ETag da listagem
+    LIST_TABLES = ("studios",)
+
     @staticmethod
     def create_studio(db: Session, studio_data: StudioCreate) -> StudioResponse:
         """Cria um novo estúdio, validando os dados antes de chamar a service."""
@@ -33,9 +58,138 @@ class StudioHandler:
         return studio
 
     @staticmethod
-    def get_all_studios(db: Session) -> StudioListResponse:
-        """Obtém todos os estúdios cadastrados."""
-        return StudioService.get_all_studios(db)
+    def batch_get_studios(
+        db: Session, request: BatchGetRequest
+    ) -> StudioBatchGetResponse:
+        """Busca vários estúdios de uma vez, limitando o tamanho do lote."""
+        keys = request.ids if request.ids is not None else request.names or []
+        if len(keys) > Config.MAX_BATCH_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail=f"O lote pode ter no máximo {Config.MAX_BATCH_SIZE} itens.",
+            )
+
+        return StudioService.batch_get_studios(db, request)
+
+    @staticmethod
+    def search_studios(db: Session, query: str, limit: int) -> StudioListResponse:
+        """Busca estúdios pelo início do nome, validando o termo informado."""
+        if not normalize_name(query):
+            raise HTTPException(status_code=400, detail="Informe um termo de busca.")
+        return StudioService.search_studios(db, query, min(limit, Config.MAX_PAGE_SIZE))
+
+    @staticmethod
+    def get_all_studios(
+        db: Session,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        accept: Optional[str] = None,
+        stream: bool = False,
+        fields: Optional[str] = None,
+        if_none_match: Optional[str] = None,
+    ) -> Response:
+        """
+        Obtém os estúdios cadastrados, validando os parâmetros de paginação.
+        Com `Accept: application/x-ndjson` ou `stream=true` a listagem completa
+        é enviada em streaming. `fields` restringe as colunas retornadas.
+        Responde 304 quando `If-None-Match` ainda corresponde à ETag atual.
+        """
+        fields_list, page_limit, after_id, ndjson, variant = (
+            StudioHandler._parse_listing(limit, after, accept, stream, fields)
+        )
+        headers = GenerationService.list_validators(
+            db, "studios", StudioHandler.LIST_TABLES, variant
+        )
+        if etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+
+        if variant != "json":
+            return StreamingResponse(
+                close_session_after(
+                    db, StudioService.stream_studios(db, after_id, ndjson)
+                ),
+                media_type=NDJSON_MEDIA_TYPE if ndjson else JSON_MEDIA_TYPE,
+                headers=headers,
+            )
+
+        return Response(
+            content=StudioService.get_all_studios_json(
+                db, page_limit, after_id, fields_list
+            ),
+            media_type=JSON_MEDIA_TYPE,
+            headers=headers,
+        )
+
+    @staticmethod
+    def _parse_listing(
+        limit: Optional[int],
+        after: Optional[str],
+        accept: Optional[str],
+        stream: bool,
+        fields: Optional[str],
+    ) -> Tuple[Optional[List[str]], Optional[int], Optional[int], bool, str]:
+        """
+        Valida os parâmetros da listagem (compartilhado com a versão async).
+
+        :return: Colunas pedidas, tamanho da página, cursor, se a resposta é
+            NDJSON e a representação ("json", "ndjson" ou "stream").
+        :raises HTTPException: 400 para colunas, cursor ou combinações com
+            streaming inválidos.
+        """
+        fields_list = fields.split(",") if fields else None
+        invalid_fields = set(fields_list or []) - StudioHandler.ALLOWED_FIELDS
+
+        if invalid_fields:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Campos inválidos em fields: {', '.join(invalid_fields)}",
+            )
+
+        try:
+            page_limit, after_id = resolve_page(limit, after)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        ndjson = wants_ndjson(accept)
+        if (ndjson or stream) and limit is not None:
+            raise HTTPException(
+                status_code=400, detail="limit não é suportado com streaming."
+            )
+        if (ndjson or stream) and fields_list is not None:
+            raise HTTPException(
+                status_code=400, detail="fields não é suportado com streaming."
+            )
+
+        variant = "ndjson" if ndjson else "stream" if stream else "json"
+        return fields_list, page_limit, after_id, ndjson, variant
+
+    @staticmethod
+    def get_studio_movies(
+        db: Session,
+        studio_id: int,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        winner: Optional[bool] = None,
+    ) -> Response:
+        """
+        Obtém os filmes de um estúdio, com paginação por cursor e filtro de
+        vencedor, garantindo que o estúdio exista.
+        """
+        if not StudioService.get_studio_by_id(db, studio_id):
+            raise HTTPException(status_code=404, detail="Studio not found")
+
+        try:
+            page_limit, after_id = resolve_page(limit, after)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        filters = MovieFilter(studio_id=studio_id, winner=winner)
+        return Response(
+            content=MovieService.get_all_movies_json(
+                db, [], page_limit, after_id, filters=filters
+            ),
+            media_type=JSON_MEDIA_TYPE,
+        )
 
     @staticmethod
     def delete_studio(db: Session, studio_id: int) -> None:
@@ -0,0 +1,31 @@
+"""Variante async de `award_interval_route` (ASYNC_DB=true), sobre AsyncSession."""
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.async_database import get_async_db
+from app.api.handlers import AsyncAwardIntervalHandler, AwardIntervalHandler
+from app.schemas.award_interval import AwardIntervalResponse
+
+router = APIRouter(prefix="/awards", tags=["Awards"])
+
+
+@router.get("/intervals", response_model=AwardIntervalResponse)
+async def get_award_intervals(
+    db: AsyncSession = Depends(get_async_db),
+) -> AwardIntervalResponse:
+    """
+    Endpoint para obter os produtores com maior e
+    menor intervalo entre prêmios consecutivos.
+
+    :param db: Sessão do banco de dados (injeção de dependência).
+    :return: AwardIntervalResponse contendo os produtores com maior e menor intervalo.
+    """
+    return await AsyncAwardIntervalHandler.get_award_intervals(db)
+
+
+@router.post("/invalidate-cache")
+async def invalidate_award_cache() -> dict:
+    """
+    Endpoint para invalidar manualmente o cache dos cálculos de prêmios.
+    """
+    return AwardIntervalHandler.invalidate_cache()
@@ -0,0 +1,141 @@
+"""Variante async de `movie_routes` (ASYNC_DB=true), sobre AsyncSession."""
+
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from app.db.async_database import get_async_db
+from app.api.handlers.async_movie_handler import AsyncMovieHandler
+from app.schemas.batch import BatchGetRequest
+from app.schemas.movie import (
+    MovieBatchGetResponse,
+    MovieBulkDeleteResponse,
+    MovieBulkRequest,
+    MovieBulkResponse,
+    MovieCreate,
+    MovieFilter,
+    MovieListResponse,
+    MovieResponse,
+)
+
+router = APIRouter(prefix="/movies", tags=["Movies"])
+
+
+@router.post("/", response_model=MovieResponse, status_code=201)
+async def create_movie(
+    movie_data: MovieCreate, db: AsyncSession = Depends(get_async_db)
+) -> MovieResponse:
+    """Cria um novo filme e retorna os dados formatados."""
+    return await AsyncMovieHandler.create_movie(db, movie_data)
+
+
+@router.post("/bulk", response_model=MovieBulkResponse)
+async def bulk_create_movies(
+    request: MovieBulkRequest, db: AsyncSession = Depends(get_async_db)
+) -> MovieBulkResponse:
+    """Cadastra vários filmes, com produtores e estúdios, em uma única transação."""
+    return await AsyncMovieHandler.bulk_create_movies(db, request)
+
+
+@router.post("/batch-get", response_model=MovieBatchGetResponse)
+async def batch_get_movies(
+    request: BatchGetRequest, db: AsyncSession = Depends(get_async_db)
+) -> MovieBatchGetResponse:
+    """Busca vários filmes por IDs ou títulos em uma única requisição."""
+    return await AsyncMovieHandler.batch_get_movies(db, request)
+
+
+@router.get("/search", response_model=MovieListResponse)
+async def search_movies(
+    q: str = Query(..., min_length=1, description="Palavras do título"),
+    limit: int = Query(10, ge=1, description="Quantidade máxima de resultados"),
+    db: AsyncSession = Depends(get_async_db),
+) -> MovieListResponse:
+    """Busca filmes por palavras do título (a última também como prefixo),
+    ordenados por relevância."""
+    return await AsyncMovieHandler.search_movies(db, q, limit)
+
+
+@router.get("/{movie_id}", response_model=MovieResponse)
+async def get_movie_by_id(
+    movie_id: int, db: AsyncSession = Depends(get_async_db)
+) -> MovieResponse:
+    """Obtém um filme pelo ID."""
+    return await AsyncMovieHandler.get_movie_by_id(db, movie_id)
+
+
+@router.get("/title/{title}", response_model=MovieResponse)
+async def get_movie_by_title(
+    title: str, db: AsyncSession = Depends(get_async_db)
+) -> MovieResponse:
+    """Obtém um filme pelo título."""
+    return await AsyncMovieHandler.get_movie_by_title(db, title)
+
+
+@router.get("/", response_model=MovieListResponse)
+async def get_all_movies(
+    db: AsyncSession = Depends(get_async_db),
+    expand: str = Query(
+        None, description="Expandir detalhes (ex: 'producers,studios')"
+    ),
+    limit: Optional[int] = Query(
+        None, ge=1, description="Tamanho da página (limitado pelo servidor)"
+    ),
+    after: Optional[str] = Query(
+        None, description="Cursor retornado em next_cursor na página anterior"
+    ),
+    stream: bool = Query(
+        False, description="Envia a listagem completa em streaming (JSON em blocos)"
+    ),
+    fields: Optional[str] = Query(
+        None, description="Colunas retornadas, separadas por vírgula (ex: 'id,title')"
+    ),
+    year: Optional[int] = Query(None, description="Filmes de um ano específico"),
+    year_from: Optional[int] = Query(None, description="Ano inicial (inclusive)"),
+    year_to: Optional[int] = Query(None, description="Ano final (inclusive)"),
+    winner: Optional[bool] = Query(None, description="Apenas vencedores ou não"),
+    accept: Optional[str] = Header(
+        None, description="Use application/x-ndjson para receber NDJSON"
+    ),
+    if_none_match: Optional[str] = Header(
+        None, description="ETag recebida antes; responde 304 se nada mudou"
+    ),
+    accept_encoding: Optional[str] = Header(
+        None, description="gzip ou br: catálogo completo expandido pré-comprimido"
+    ),
+) -> Response:
+    """Obtém os filmes cadastrados, com opção de expandir
+    produtores e estúdios, de filtrar por ano e vencedor,
+    de paginar por cursor e de receber em streaming."""
+    filters = None
+    if any(value is not None for value in (year, year_from, year_to, winner)):
+        filters = MovieFilter(
+            year=year, year_from=year_from, year_to=year_to, winner=winner
+        )
+    return await AsyncMovieHandler.get_all_movies(
+        db,
+        expand,
+        limit,
+        after,
+        accept,
+        stream,
+        fields,
+        filters,
+        if_none_match,
+        accept_encoding,
+    )
+
+
+@router.delete("/", response_model=MovieBulkDeleteResponse)
+async def delete_movies(
+    ids: str = Query(..., description="IDs separados por vírgula (ex: '1,2,3')"),
+    db: AsyncSession = Depends(get_async_db),
+) -> MovieBulkDeleteResponse:
+    """Deleta vários filmes pelos IDs, com um único DELETE por bloco."""
+    return await AsyncMovieHandler.delete_movies(db, ids)
+
+
+@router.delete("/{movie_id}", status_code=204)
+async def delete_movie(movie_id: int, db: AsyncSession = Depends(get_async_db)) -> None:
+    """Deleta um filme pelo ID."""
+    return await AsyncMovieHandler.delete_movie(db, movie_id)
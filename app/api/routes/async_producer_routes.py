@@ -0,0 +1,121 @@
+"""Variante async de `producer_routes` (ASYNC_DB=true), sobre AsyncSession."""
+
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from app.db.async_database import get_async_db
+from app.schemas.batch import BatchGetRequest
+from app.schemas.movie import MovieListResponse
+from app.schemas.producer import (
+    ProducerBatchGetResponse,
+    ProducerCreate,
+    ProducerListResponse,
+    ProducerResponse,
+)
+from app.api.handlers.async_producer_handler import AsyncProducerHandler
+
+router = APIRouter(prefix="/producers", tags=["Producers"])
+
+
+@router.post("/", response_model=ProducerResponse, status_code=201)
+async def create_producer(
+    producer_data: ProducerCreate, db: AsyncSession = Depends(get_async_db)
+) -> ProducerResponse:
+    """Cria um novo produtor."""
+    return await AsyncProducerHandler.create_producer(db, producer_data)
+
+
+@router.post("/batch-get", response_model=ProducerBatchGetResponse)
+async def batch_get_producers(
+    request: BatchGetRequest, db: AsyncSession = Depends(get_async_db)
+) -> ProducerBatchGetResponse:
+    """Busca vários produtores por IDs ou nomes em uma única requisição."""
+    return await AsyncProducerHandler.batch_get_producers(db, request)
+
+
+@router.get("/search", response_model=ProducerListResponse)
+async def search_producers(
+    q: str = Query(..., min_length=1, description="Início do nome (sem acentos)"),
+    limit: int = Query(10, ge=1, description="Quantidade máxima de resultados"),
+    db: AsyncSession = Depends(get_async_db),
+) -> ProducerListResponse:
+    """Busca produtores pelo início do nome, ignorando maiúsculas e acentos."""
+    return await AsyncProducerHandler.search_producers(db, q, limit)
+
+
+@router.get("/{producer_id}", response_model=ProducerResponse)
+async def get_producer_by_id(
+    producer_id: int, db: AsyncSession = Depends(get_async_db)
+) -> ProducerResponse:
+    """Obtém um produtor pelo ID."""
+    return await AsyncProducerHandler.get_producer_by_id(db, producer_id)
+
+
+@router.get("/{producer_id}/movies", response_model=MovieListResponse)
+async def get_producer_movies(
+    producer_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    limit: Optional[int] = Query(
+        None, ge=1, description="Tamanho da página (limitado pelo servidor)"
+    ),
+    after: Optional[str] = Query(
+        None, description="Cursor retornado em next_cursor na página anterior"
+    ),
+    winner: Optional[bool] = Query(None, description="Apenas vencedores ou não"),
+) -> Response:
+    """Obtém os filmes de um produtor, com paginação por cursor."""
+    return await AsyncProducerHandler.get_producer_movies(
+        db, producer_id, limit, after, winner
+    )
+
+
+@router.get("/name/{name}", response_model=ProducerResponse)
+async def get_producer_by_name(
+    name: str, db: AsyncSession = Depends(get_async_db)
+) -> ProducerResponse:
+    """Obtém um produtor pelo nome."""
+    return await AsyncProducerHandler.get_producer_by_name(db, name)
+
+
+@router.get("/", response_model=ProducerListResponse)
+async def get_all_producers(
+    db: AsyncSession = Depends(get_async_db),
+    limit: Optional[int] = Query(
+        None, ge=1, description="Tamanho da página (limitado pelo servidor)"
+    ),
+    after: Optional[str] = Query(
+        None, description="Cursor retornado em next_cursor na página anterior"
+    ),
+    stream: bool = Query(
+        False, description="Envia a listagem completa em streaming (JSON em blocos)"
+    ),
+    fields: Optional[str] = Query(
+        None, description="Colunas retornadas, separadas por vírgula (ex: 'id,name')"
+    ),
+    accept: Optional[str] = Header(
+        None, description="Use application/x-ndjson para receber NDJSON"
+    ),
+    if_none_match: Optional[str] = Header(
+        None, description="ETag recebida antes; responde 304 se nada mudou"
+    ),
+) -> Response:
+    """Obtém os produtores cadastrados, com paginação opcional por cursor
+    ou envio em streaming."""
+    return await AsyncProducerHandler.get_all_producers(
+        db,
+        limit,
+        after,
+        accept,
+        stream,
+        fields,
+        if_none_match,
+    )
+
+
+@router.delete("/{producer_id}", status_code=204)
+async def delete_producer(
+    producer_id: int, db: AsyncSession = Depends(get_async_db)
+) -> None:
+    """Deleta um produtor pelo ID."""
+    return await AsyncProducerHandler.delete_producer(db, producer_id)
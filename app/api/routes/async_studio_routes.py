@@ -0,0 +1,121 @@
+"""Variante async de `studio_routes` (ASYNC_DB=true), sobre AsyncSession."""
+
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from app.db.async_database import get_async_db
+from app.schemas.batch import BatchGetRequest
+from app.schemas.movie import MovieListResponse
+from app.schemas.studio import (
+    StudioBatchGetResponse,
+    StudioCreate,
+    StudioListResponse,
+    StudioResponse,
+)
+from app.api.handlers.async_studio_handler import AsyncStudioHandler
+
+router = APIRouter(prefix="/studios", tags=["Studios"])
+
+
+@router.post("/", response_model=StudioResponse, status_code=201)
+async def create_studio(
+    studio_data: StudioCreate, db: AsyncSession = Depends(get_async_db)
+) -> StudioResponse:
+    """Cria um novo estúdio."""
+    return await AsyncStudioHandler.create_studio(db, studio_data)
+
+
+@router.post("/batch-get", response_model=StudioBatchGetResponse)
+async def batch_get_studios(
+    request: BatchGetRequest, db: AsyncSession = Depends(get_async_db)
+) -> StudioBatchGetResponse:
+    """Busca vários estúdios por IDs ou nomes em uma única requisição."""
+    return await AsyncStudioHandler.batch_get_studios(db, request)
+
+
+@router.get("/search", response_model=StudioListResponse)
+async def search_studios(
+    q: str = Query(..., min_length=1, description="Início do nome (sem acentos)"),
+    limit: int = Query(10, ge=1, description="Quantidade máxima de resultados"),
+    db: AsyncSession = Depends(get_async_db),
+) -> StudioListResponse:
+    """Busca estúdios pelo início do nome, ignorando maiúsculas e acentos."""
+    return await AsyncStudioHandler.search_studios(db, q, limit)
+
+
+@router.get("/{studio_id}", response_model=StudioResponse)
+async def get_studio_by_id(
+    studio_id: int, db: AsyncSession = Depends(get_async_db)
+) -> StudioResponse:
+    """Obtém um estúdio pelo ID."""
+    return await AsyncStudioHandler.get_studio_by_id(db, studio_id)
+
+
+@router.get("/{studio_id}/movies", response_model=MovieListResponse)
+async def get_studio_movies(
+    studio_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    limit: Optional[int] = Query(
+        None, ge=1, description="Tamanho da página (limitado pelo servidor)"
+    ),
+    after: Optional[str] = Query(
+        None, description="Cursor retornado em next_cursor na página anterior"
+    ),
+    winner: Optional[bool] = Query(None, description="Apenas vencedores ou não"),
+) -> Response:
+    """Obtém os filmes de um estúdio, com paginação por cursor."""
+    return await AsyncStudioHandler.get_studio_movies(
+        db, studio_id, limit, after, winner
+    )
+
+
+@router.get("/name/{name}", response_model=StudioResponse)
+async def get_studio_by_name(
+    name: str, db: AsyncSession = Depends(get_async_db)
+) -> StudioResponse:
+    """Obtém um estúdio pelo nome."""
+    return await AsyncStudioHandler.get_studio_by_name(db, name)
+
+
+@router.get("/", response_model=StudioListResponse)
+async def get_all_studios(
+    db: AsyncSession = Depends(get_async_db),
+    limit: Optional[int] = Query(
+        None, ge=1, description="Tamanho da página (limitado pelo servidor)"
+    ),
+    after: Optional[str] = Query(
+        None, description="Cursor retornado em next_cursor na página anterior"
+    ),
+    stream: bool = Query(
+        False, description="Envia a listagem completa em streaming (JSON em blocos)"
+    ),
+    fields: Optional[str] = Query(
+        None, description="Colunas retornadas, separadas por vírgula (ex: 'id,name')"
+    ),
+    accept: Optional[str] = Header(
+        None, description="Use application/x-ndjson para receber NDJSON"
+    ),
+    if_none_match: Optional[str] = Header(
+        None, description="ETag recebida antes; responde 304 se nada mudou"
+    ),
+) -> Response:
+    """Obtém os estúdios cadastrados, com paginação opcional por cursor
+    ou envio em streaming."""
+    return await AsyncStudioHandler.get_all_studios(
+        db,
+        limit,
+        after,
+        accept,
+        stream,
+        fields,
+        if_none_match,
+    )
+
+
+@router.delete("/{studio_id}", status_code=204)
+async def delete_studio(
+    studio_id: int, db: AsyncSession = Depends(get_async_db)
+) -> None:
+    """Deleta um estúdio pelo ID."""
+    return await AsyncStudioHandler.delete_studio(db, studio_id)
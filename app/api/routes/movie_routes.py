@@ -1,8 +1,20 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
+from typing import Optional
 from app.db.database import get_db
 from app.api.handlers.movie_handler import MovieHandler
-from app.schemas.movie import MovieCreate, MovieResponse, MovieListResponse
+from app.schemas.batch import BatchGetRequest
+from app.schemas.movie import (
+    MovieBatchGetResponse,
+    MovieBulkDeleteResponse,
+    MovieBulkRequest,
+    MovieBulkResponse,
+    MovieCreate,
+    MovieFilter,
+    MovieListResponse,
+    MovieResponse,
+)
 
 router = APIRouter(prefix="/movies", tags=["Movies"])
 
@@ -15,6 +27,33 @@ def create_movie(
     return MovieHandler.create_movie(db, movie_data)
 
 
+@router.post("/bulk", response_model=MovieBulkResponse)
+def bulk_create_movies(
+    request: MovieBulkRequest, db: Session = Depends(get_db)
+) -> MovieBulkResponse:
+    """Cadastra vários filmes, com produtores e estúdios, em uma única transação."""
+    return MovieHandler.bulk_create_movies(db, request)
+
+
+@router.post("/batch-get", response_model=MovieBatchGetResponse)
+def batch_get_movies(
+    request: BatchGetRequest, db: Session = Depends(get_db)
+) -> MovieBatchGetResponse:
+    """Busca vários filmes por IDs ou títulos em uma única requisição."""
+    return MovieHandler.batch_get_movies(db, request)
+
+
+@router.get("/search", response_model=MovieListResponse)
+def search_movies(
+    q: str = Query(..., min_length=1, description="Palavras do título"),
+    limit: int = Query(10, ge=1, description="Quantidade máxima de resultados"),
+    db: Session = Depends(get_db),
+) -> MovieListResponse:
+    """Busca filmes por palavras do título (a última também como prefixo),
+    ordenados por relevância."""
+    return MovieHandler.search_movies(db, q, limit)
+
+
 @router.get("/{movie_id}", response_model=MovieResponse)
 def get_movie_by_id(movie_id: int, db: Session = Depends(get_db)) -> MovieResponse:
     """Obtém um filme pelo ID."""
@@ -33,10 +72,61 @@ def get_all_movies(
     expand: str = Query(
         None, description="Expandir detalhes (ex: 'producers,studios')"
     ),
-) -> MovieListResponse:
-    """Obtém todos os filmes cadastrados, com opção de expandir
-    produtores e estúdios."""
-    return MovieHandler.get_all_movies(db, expand)
+    limit: Optional[int] = Query(
+        None, ge=1, description="Tamanho da página (limitado pelo servidor)"
+    ),
+    after: Optional[str] = Query(
+        None, description="Cursor retornado em next_cursor na página anterior"
+    ),
+    stream: bool = Query(
+        False, description="Envia a listagem completa em streaming (JSON em blocos)"
+    ),
+    fields: Optional[str] = Query(
+        None, description="Colunas retornadas, separadas por vírgula (ex: 'id,title')"
+    ),
+    year: Optional[int] = Query(None, description="Filmes de um ano específico"),
+    year_from: Optional[int] = Query(None, description="Ano inicial (inclusive)"),
+    year_to: Optional[int] = Query(None, description="Ano final (inclusive)"),
+    winner: Optional[bool] = Query(None, description="Apenas vencedores ou não"),
+    accept: Optional[str] = Header(
+        None, description="Use application/x-ndjson para receber NDJSON"
+    ),
+    if_none_match: Optional[str] = Header(
+        None, description="ETag recebida antes; responde 304 se nada mudou"
+    ),
+    accept_encoding: Optional[str] = Header(
+        None, description="gzip ou br: catálogo completo expandido pré-comprimido"
+    ),
+) -> Response:
+    """Obtém os filmes cadastrados, com opção de expandir
+    produtores e estúdios, de filtrar por ano e vencedor,
+    de paginar por cursor e de receber em streaming."""
+    filters = None
+    if any(value is not None for value in (year, year_from, year_to, winner)):
+        filters = MovieFilter(
+            year=year, year_from=year_from, year_to=year_to, winner=winner
+        )
+    return MovieHandler.get_all_movies(
+        db,
+        expand,
+        limit,
+        after,
+        accept,
+        stream,
+        fields,
+        filters,
+        if_none_match,
+        accept_encoding,
+    )
+
+
+@router.delete("/", response_model=MovieBulkDeleteResponse)
+def delete_movies(
+    ids: str = Query(..., description="IDs separados por vírgula (ex: '1,2,3')"),
+    db: Session = Depends(get_db),
+) -> MovieBulkDeleteResponse:
+    """Deleta vários filmes pelos IDs, com um único DELETE por bloco."""
+    return MovieHandler.delete_movies(db, ids)
 
 
 @router.delete("/{movie_id}", status_code=204)
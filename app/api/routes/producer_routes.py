@@ -1,7 +1,16 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
+from typing import Optional
 from app.db.database import get_db
-from app.schemas.producer import ProducerCreate, ProducerResponse, ProducerListResponse
+from app.schemas.batch import BatchGetRequest
+from app.schemas.movie import MovieListResponse
+from app.schemas.producer import (
+    ProducerBatchGetResponse,
+    ProducerCreate,
+    ProducerListResponse,
+    ProducerResponse,
+)
 from app.api.handlers.producer_handler import ProducerHandler
 
 router = APIRouter(prefix="/producers", tags=["Producers"])
@@ -15,6 +24,24 @@ def create_producer(
     return ProducerHandler.create_producer(db, producer_data)
 
 
+@router.post("/batch-get", response_model=ProducerBatchGetResponse)
+def batch_get_producers(
+    request: BatchGetRequest, db: Session = Depends(get_db)
+) -> ProducerBatchGetResponse:
+    """Busca vários produtores por IDs ou nomes em uma única requisição."""
+    return ProducerHandler.batch_get_producers(db, request)
+
+
+@router.get("/search", response_model=ProducerListResponse)
+def search_producers(
+    q: str = Query(..., min_length=1, description="Início do nome (sem acentos)"),
+    limit: int = Query(10, ge=1, description="Quantidade máxima de resultados"),
+    db: Session = Depends(get_db),
+) -> ProducerListResponse:
+    """Busca produtores pelo início do nome, ignorando maiúsculas e acentos."""
+    return ProducerHandler.search_producers(db, q, limit)
+
+
 @router.get("/{producer_id}", response_model=ProducerResponse)
 def get_producer_by_id(
     producer_id: int, db: Session = Depends(get_db)
@@ -23,6 +50,22 @@ def get_producer_by_id(
     return ProducerHandler.get_producer_by_id(db, producer_id)
 
 
+@router.get("/{producer_id}/movies", response_model=MovieListResponse)
+def get_producer_movies(
+    producer_id: int,
+    db: Session = Depends(get_db),
+    limit: Optional[int] = Query(
+        None, ge=1, description="Tamanho da página (limitado pelo servidor)"
+    ),
+    after: Optional[str] = Query(
+        None, description="Cursor retornado em next_cursor na página anterior"
+    ),
+    winner: Optional[bool] = Query(None, description="Apenas vencedores ou não"),
+) -> Response:
+    """Obtém os filmes de um produtor, com paginação por cursor."""
+    return ProducerHandler.get_producer_movies(db, producer_id, limit, after, winner)
+
+
 @router.get("/name/{name}", response_model=ProducerResponse)
 def get_producer_by_name(name: str, db: Session = Depends(get_db)) -> ProducerResponse:
     """Obtém um produtor pelo nome."""
@@ -30,9 +73,32 @@ def get_producer_by_name(name: str, db: Session = Depends(get_db)) -> ProducerRe
 
 
 @router.get("/", response_model=ProducerListResponse)
-def get_all_producers(db: Session = Depends(get_db)) -> ProducerListResponse:
-    """Obtém todos os produtores cadastrados."""
-    return ProducerHandler.get_all_producers(db)
+def get_all_producers(
+    db: Session = Depends(get_db),
+    limit: Optional[int] = Query(
+        None, ge=1, description="Tamanho da página (limitado pelo servidor)"
+    ),
+    after: Optional[str] = Query(
+        None, description="Cursor retornado em next_cursor na página anterior"
+    ),
+    stream: bool = Query(
+        False, description="Envia a listagem completa em streaming (JSON em blocos)"
+    ),
+    fields: Optional[str] = Query(
+        None, description="Colunas retornadas, separadas por vírgula (ex: 'id,name')"
+    ),
+    accept: Optional[str] = Header(
+        None, description="Use application/x-ndjson para receber NDJSON"
+    ),
+    if_none_match: Optional[str] = Header(
+        None, description="ETag recebida antes; responde 304 se nada mudou"
+    ),
+) -> Response:
+    """Obtém os produtores cadastrados, com paginação opcional por cursor
+    ou envio em streaming."""
+    return ProducerHandler.get_all_producers(
+        db, limit, after, accept, stream, fields, if_none_match
+    )
 
 
 @router.delete("/{producer_id}", status_code=204)
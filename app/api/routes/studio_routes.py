@@ -1,7 +1,16 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
+from typing import Optional
 from app.db.database import get_db
-from app.schemas.studio import StudioCreate, StudioResponse, StudioListResponse
+from app.schemas.batch import BatchGetRequest
+from app.schemas.movie import MovieListResponse
+from app.schemas.studio import (
+    StudioBatchGetResponse,
+    StudioCreate,
+    StudioListResponse,
+    StudioResponse,
+)
 from app.api.handlers.studio_handler import StudioHandler
 
 router = APIRouter(prefix="/studios", tags=["Studios"])
@@ -15,12 +24,46 @@ def create_studio(
     return StudioHandler.create_studio(db, studio_data)
 
 
+@router.post("/batch-get", response_model=StudioBatchGetResponse)
+def batch_get_studios(
+    request: BatchGetRequest, db: Session = Depends(get_db)
+) -> StudioBatchGetResponse:
+    """Busca vários estúdios por IDs ou nomes em uma única requisição."""
+    return StudioHandler.batch_get_studios(db, request)
+
+
+@router.get("/search", response_model=StudioListResponse)
+def search_studios(
+    q: str = Query(..., min_length=1, description="Início do nome (sem acentos)"),
+    limit: int = Query(10, ge=1, description="Quantidade máxima de resultados"),
+    db: Session = Depends(get_db),
+) -> StudioListResponse:
+    """Busca estúdios pelo início do nome, ignorando maiúsculas e acentos."""
+    return StudioHandler.search_studios(db, q, limit)
+
+
 @router.get("/{studio_id}", response_model=StudioResponse)
 def get_studio_by_id(studio_id: int, db: Session = Depends(get_db)) -> StudioResponse:
     """Obtém um estúdio pelo ID."""
     return StudioHandler.get_studio_by_id(db, studio_id)
 
 
+@router.get("/{studio_id}/movies", response_model=MovieListResponse)
+def get_studio_movies(
+    studio_id: int,
+    db: Session = Depends(get_db),
+    limit: Optional[int] = Query(
+        None, ge=1, description="Tamanho da página (limitado pelo servidor)"
+    ),
+    after: Optional[str] = Query(
+        None, description="Cursor retornado em next_cursor na página anterior"
+    ),
+    winner: Optional[bool] = Query(None, description="Apenas vencedores ou não"),
+) -> Response:
+    """Obtém os filmes de um estúdio, com paginação por cursor."""
+    return StudioHandler.get_studio_movies(db, studio_id, limit, after, winner)
+
+
 @router.get("/name/{name}", response_model=StudioResponse)
 def get_studio_by_name(name: str, db: Session = Depends(get_db)) -> StudioResponse:
     """Obtém um estúdio pelo nome."""
@@ -28,9 +71,32 @@ def get_studio_by_name(name: str, db: Session = Depends(get_db)) -> StudioRespon
 
 
 @router.get("/", response_model=StudioListResponse)
-def get_all_studios(db: Session = Depends(get_db)) -> StudioListResponse:
-    """Obtém todos os estúdios cadastrados."""
-    return StudioHandler.get_all_studios(db)
+def get_all_studios(
+    db: Session = Depends(get_db),
+    limit: Optional[int] = Query(
+        None, ge=1, description="Tamanho da página (limitado pelo servidor)"
+    ),
+    after: Optional[str] = Query(
+        None, description="Cursor retornado em next_cursor na página anterior"
+    ),
+    stream: bool = Query(
+        False, description="Envia a listagem completa em streaming (JSON em blocos)"
+    ),
+    fields: Optional[str] = Query(
+        None, description="Colunas retornadas, separadas por vírgula (ex: 'id,name')"
+    ),
+    accept: Optional[str] = Header(
+        None, description="Use application/x-ndjson para receber NDJSON"
+    ),
+    if_none_match: Optional[str] = Header(
+        None, description="ETag recebida antes; responde 304 se nada mudou"
+    ),
+) -> Response:
+    """Obtém os estúdios cadastrados, com paginação opcional por cursor
+    ou envio em streaming."""
+    return StudioHandler.get_all_studios(
+        db, limit, after, accept, stream, fields, if_none_match
+    )
 
 
 @router.delete("/{studio_id}", status_code=204)
@@ -8,4 +8,51 @@ load_dotenv()
 class Config:
     ENV = os.getenv("ENV", "development")
     DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./gra.db")
+    # Réplicas de leitura, separadas por vírgula (vazio usa só o principal)
+    DATABASE_REPLICA_URLS = [
+        url for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url
+    ]
     CSV_PATH = os.getenv("CSV_PATH", "data/movielist.csv")
+    MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "1000"))
+    STREAM_BATCH_SIZE = int(os.getenv("STREAM_BATCH_SIZE", "500"))
+    IN_CLAUSE_CHUNK_SIZE = int(os.getenv("IN_CLAUSE_CHUNK_SIZE", "500"))
+    MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", "1000"))
+    ENTITY_CACHE_SIZE = int(os.getenv("ENTITY_CACHE_SIZE", "10000"))
+    ENTITY_CACHE_TTL = float(os.getenv("ENTITY_CACHE_TTL", "60"))
+    # Validade dos "não encontrado" em cache: curta, pois uma réplica atrasada
+    # pode responder que não existe algo recém-criado no principal
+    ENTITY_CACHE_NEGATIVE_TTL = float(os.getenv("ENTITY_CACHE_NEGATIVE_TTL", "1"))
+    # Workers do uvicorn (a mesma variável que o uvicorn lê para --workers)
+    WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+    # Validação dos caches em memória pelas gerações do banco, para vários
+    # processos no mesmo banco: segundos entre checagens (0 = a cada
+    # requisição; negativo desativa). Ativa por padrão com mais de um worker
+    CACHE_VALIDATION_INTERVAL = float(
+        os.getenv("CACHE_VALIDATION_INTERVAL", "0" if WEB_CONCURRENCY > 1 else "-1")
+    )
+    # Perfil de PRAGMAs do SQLite: durable, balanced ou bulk-load
+    SQLITE_PROFILE = os.getenv("SQLITE_PROFILE", "balanced")
+    # Sobrescrevem os valores do perfil (0 mantém o valor do perfil)
+    SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", "0")) or None
+    SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", "0")) or None
+    SQLITE_BUSY_TIMEOUT = int(os.getenv("SQLITE_BUSY_TIMEOUT", "0")) or None
+    # Serve o SQLite em arquivo a partir de uma cópia em memória, carregada
+    # na inicialização; as escritas são copiadas de volta para o arquivo
+    SQLITE_IN_MEMORY = os.getenv("SQLITE_IN_MEMORY", "false").lower() == "true"
+    # Segundos para agrupar as escritas em uma única cópia para o arquivo
+    # (0 = copia ao fim de cada transação que escreveu)
+    SQLITE_SAVE_DELAY = float(os.getenv("SQLITE_SAVE_DELAY", "1"))
+    # Artefato SQLite pré-construído (python -m app.db.artifact): na
+    # inicialização substitui a criação das tabelas e a importação do CSV.
+    # "copy" copia o artefato para a DATABASE_URL (aceita escritas);
+    # "readonly" serve o próprio artefato, imutável e somente leitura
+    DATABASE_ARTIFACT = os.getenv("DATABASE_ARTIFACT", "")
+    DATABASE_ARTIFACT_MODE = os.getenv("DATABASE_ARTIFACT_MODE", "copy")
+    # Pool de conexões (ignorado no SQLite em memória)
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    # Rotas async com AsyncSession (aiosqlite/asyncpg) em vez das síncronas
+    ASYNC_DB = os.getenv("ASYNC_DB", "false").lower() == "true"
@@ -0,0 +1,157 @@
+"""
+Artefato SQLite pré-construído a partir dos CSVs.
+
+Uso (etapa de build):
+    python -m app.db.artifact data build/gra.db
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import sys
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker
+
+from app.db.sqlite_profiles import apply_sqlite_profile
+from app.models import Base
+from app.services.csv_importer_service import CSVImporterService
+
+# Marcador gravado ao lado da cópia: checksum do artefato e gerações da cópia
+MARKER_SUFFIX = ".artifact"
+
+
+def build_artifact(csv_directory: str, output: str) -> None:
+    """
+    Importa todos os CSVs do diretório em um SQLite novo, com os índices
+    criados, estatísticas do planejador (`ANALYZE`) e o arquivo compactado
+    (`VACUUM`), e grava o resultado como somente leitura em `output`.
+
+    :param csv_directory: Diretório com os arquivos CSV.
+    :param output: Caminho do artefato gerado (substituído se existir).
+    :raises ValueError: Se o diretório não tiver nenhum CSV.
+    """
+    csv_files = sorted(f for f in os.listdir(csv_directory) if f.endswith(".csv"))
+    if not csv_files:
+        raise ValueError(f"Nenhum arquivo CSV encontrado em '{csv_directory}'.")
+
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    building = f"{output}.building"
+    if os.path.exists(building):
+        os.remove(building)
+
+    engine = create_engine(f"sqlite:///{building}")
+    apply_sqlite_profile(engine, "bulk-load")
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as db:
+        for csv_file in csv_files:
+            with open(os.path.join(csv_directory, csv_file), encoding="utf-8") as f:
+                CSVImporterService.import_csv(db, f.read())
+
+    with engine.connect() as conn:
+        conn.exec_driver_sql("ANALYZE")
+        # Sem WAL: o artefato é aberto como imutável, sem arquivos -wal/-shm
+        conn.exec_driver_sql("PRAGMA journal_mode=DELETE")
+        conn.exec_driver_sql("VACUUM")
+    engine.dispose()
+
+    os.chmod(building, 0o444)
+    os.replace(building, output)
+    logger.success(f"Artefato gerado em {output} a partir de {len(csv_files)} CSV(s).")
+
+
+def _digest(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _generations(path: str) -> Dict[str, int]:
+    """Contadores de geração do banco, lidos pelo SQLite (incluindo o WAL)."""
+    conn = sqlite3.connect(path)
+    try:
+        rows = conn.execute("SELECT table_name, generation FROM data_generations")
+        return dict(rows.fetchall())
+    finally:
+        conn.close()
+
+
+def _read_marker(target: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(f"{target}{MARKER_SUFFIX}", encoding="utf-8") as f:
+            return dict(json.load(f))
+    except FileNotFoundError:
+        return None
+
+
+def install_artifact(artifact: str, url: str) -> bool:
+    """
+    Copia o artefato para o SQLite em arquivo da URL se o arquivo não existir
+    ou se ainda for a cópia intacta de um artefato anterior. Junto da cópia
+    fica um marcador (`<banco>.artifact`) com o checksum do artefato e os
+    contadores de geração da cópia: se os contadores mudaram, a aplicação
+    escreveu no banco e ele é mantido, mesmo com um artefato mais novo.
+
+    Os arquivos `-wal`/`-shm` nunca são apagados: antes de substituir uma
+    cópia intacta, o WAL é aplicado ao banco com um checkpoint.
+
+    :param artifact: Caminho do artefato.
+    :param url: URL do banco de destino (SQLite em arquivo).
+    :return: True se o artefato foi copiado.
+    :raises ValueError: Se a URL não for de um SQLite em arquivo.
+    """
+    parsed = make_url(url)
+    target = parsed.database
+    if parsed.get_backend_name() != "sqlite" or target in (None, "", ":memory:"):
+        raise ValueError(f"O artefato só pode ser copiado para um SQLite: {url}")
+
+    digest = _digest(artifact)
+    if os.path.exists(target):
+        marker = _read_marker(target)
+        if marker is None:
+            logger.warning(f"{target} não veio de um artefato; cópia não feita.")
+            return False
+        if marker["artifact"] == digest:
+            return False
+        if _generations(target) != marker["generations"]:
+            logger.warning(
+                f"{target} recebeu escritas desde a cópia; artefato {artifact} "
+                "não copiado."
+            )
+            return False
+        if os.path.exists(f"{target}-wal"):
+            conn = sqlite3.connect(target)
+            try:
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            finally:
+                conn.close()
+
+    copying = f"{target}.copying"
+    shutil.copy2(artifact, copying)
+    os.chmod(copying, 0o644)  # a cópia aceita escritas
+    marker = {"artifact": digest, "generations": _generations(copying)}
+    with open(f"{copying}{MARKER_SUFFIX}", "w", encoding="utf-8") as f:
+        json.dump(marker, f)
+    os.replace(copying, target)
+    os.replace(f"{copying}{MARKER_SUFFIX}", f"{target}{MARKER_SUFFIX}")
+    logger.info(f"Artefato {artifact} copiado para {target}.")
+    return True
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("csv_directory", help="Diretório com os arquivos CSV.")
+    parser.add_argument("output", help="Caminho do artefato SQLite gerado.")
+    args = parser.parse_args(argv)
+
+    build_artifact(args.csv_directory, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
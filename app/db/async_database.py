@@ -0,0 +1,78 @@
+from typing import Any, AsyncIterator, Dict, Optional
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.config import Config
+from app.db.database import configure_sqlite, database_url, engine_options
+from app.db.pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool
+
+# Driver async usado para cada banco suportado
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+_engine: Optional[AsyncEngine] = None
+_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+
+
+def async_database_url(url: str) -> str:
+    """
+    Converte a DATABASE_URL para o driver async do mesmo banco
+    (ex: `sqlite:///./gra.db` -> `sqlite+aiosqlite:///./gra.db`).
+
+    :param url: URL de conexão síncrona.
+    :return: URL equivalente com o driver async.
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"Banco sem driver async suportado: {backend}")
+    return parsed.set(
+        drivername=f"{backend}+{ASYNC_DRIVERS[backend]}"
+    ).render_as_string(hide_password=False)
+
+
+def build_async_engine(url: str) -> AsyncEngine:
+    """
+    Cria a engine async com as mesmas opções de pool e PRAGMAs da engine
+    síncrona, trocando o pool pela versão compatível com asyncio.
+    """
+    async_url = async_database_url(url)
+    options: Dict[str, Any] = engine_options(async_url)
+    if options.get("poolclass") is InstrumentedQueuePool:
+        options["poolclass"] = InstrumentedAsyncQueuePool
+
+    engine = create_async_engine(async_url, **options)
+    configure_sqlite(engine.sync_engine)
+    return engine
+
+
+def get_async_engine() -> AsyncEngine:
+    """Engine async da aplicação, criada no primeiro uso (o driver é opcional)."""
+    global _engine, _session_factory
+    if _engine is None:
+        _engine = build_async_engine(database_url())
+        _session_factory = async_sessionmaker(
+            _engine, autoflush=False, expire_on_commit=False
+        )
+    return _engine
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """Retorna uma sessão async de banco de dados."""
+    get_async_engine()
+    assert _session_factory is not None
+    async with _session_factory() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    """Fecha as conexões da engine async, se ela chegou a ser criada."""
+    global _engine, _session_factory
+    if _engine is not None:
+        await _engine.dispose()
+    _engine, _session_factory = None, None
@@ -1,18 +1,142 @@
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
+import fcntl
+import os
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine, make_url
 from loguru import logger
 from app.config import Config
-from typing import Iterator
+from typing import Any, Dict, Iterator
 from sqlalchemy.orm import Session
 
+from app.db.memory_database import MemoryDatabase
+from app.db.pool import InstrumentedQueuePool
+from app.db.routing import routing_sessionmaker
+from app.db.sqlite_profiles import apply_sqlite_profile
 from app.models.base import Base
 
 
+def enable_sqlite_foreign_keys(engine: Engine) -> None:
+    """
+    Ativa `PRAGMA foreign_keys` em cada conexão SQLite da engine, para que o
+    ON DELETE CASCADE das tabelas de associação seja aplicado.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+def engine_options(url: str) -> Dict[str, Any]:
+    """
+    Argumentos de `create_engine` conforme o banco da URL.
+
+    O SQLite precisa de `check_same_thread=False` (a sessão pode ser usada
+    por outra thread do FastAPI); o SQLite em memória mantém o pool padrão,
+    pois cada conexão nova seria um banco vazio. Os demais bancos (ex:
+    Postgres) e o SQLite em arquivo usam o pool limitado da configuração.
+
+    :param url: URL de conexão (DATABASE_URL).
+    :return: Argumentos nomeados para `create_engine`.
+    """
+    parsed = make_url(url)
+    options: Dict[str, Any] = {}
+    if parsed.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+        if parsed.database in (None, "", ":memory:") or "memory" in str(
+            parsed.query.get("mode", "")
+        ):
+            return options
+
+    options.update(
+        poolclass=InstrumentedQueuePool,
+        pool_size=Config.DB_POOL_SIZE,
+        max_overflow=Config.DB_MAX_OVERFLOW,
+        pool_timeout=Config.DB_POOL_TIMEOUT,
+        pool_recycle=Config.DB_POOL_RECYCLE,
+        pool_pre_ping=Config.DB_POOL_PRE_PING,
+    )
+    return options
+
+
+def build_engine(url: str) -> Engine:
+    """Cria a engine com as opções do banco e, no SQLite, os PRAGMAs do perfil."""
+    engine = create_engine(url, **engine_options(url))
+    configure_sqlite(engine)
+    return engine
+
+
+def configure_sqlite(engine: Engine) -> None:
+    """Ativa as chaves estrangeiras e o perfil de PRAGMAs em engines SQLite."""
+    enable_sqlite_foreign_keys(engine)
+    apply_sqlite_profile(
+        engine,
+        Config.SQLITE_PROFILE,
+        {
+            "cache_size": Config.SQLITE_CACHE_SIZE,
+            "mmap_size": Config.SQLITE_MMAP_SIZE,
+            "busy_timeout": Config.SQLITE_BUSY_TIMEOUT,
+        },
+    )
+
+
+def artifact_url(path: str) -> str:
+    """
+    URL de leitura de um artefato pré-construído (ver `app.db.artifact`):
+    somente leitura e `immutable`, para que o SQLite dispense os locks e a
+    checagem de alterações no arquivo.
+    """
+    return f"sqlite:///file:{os.path.abspath(path)}?mode=ro&immutable=1&uri=true"
+
+
+def is_read_only_error(error: Exception) -> bool:
+    """
+    Indica se o erro é de escrita num banco somente leitura (SQLITE_READONLY),
+    como o artefato aberto com DATABASE_ARTIFACT_MODE=readonly.
+    """
+    orig = getattr(error, "orig", error)
+    return str(getattr(orig, "sqlite_errorname", "")).startswith("SQLITE_READONLY")
+
+
+def database_url() -> str:
+    """URL do banco da aplicação: o artefato, no modo somente leitura."""
+    if Config.DATABASE_ARTIFACT and Config.DATABASE_ARTIFACT_MODE == "readonly":
+        return artifact_url(Config.DATABASE_ARTIFACT)
+    return Config.DATABASE_URL
+
+
+def build_memory_database(url: str) -> MemoryDatabase:
+    """
+    Cria a cópia em memória do SQLite em arquivo da URL, com as mesmas opções
+    de pool e PRAGMAs da engine do arquivo (o conteúdo é copiado em `load`).
+    """
+    memory = MemoryDatabase(
+        url,
+        save_delay=Config.SQLITE_SAVE_DELAY,
+        write_timeout=(Config.SQLITE_BUSY_TIMEOUT or 5000) / 1000,
+        **engine_options(url),
+    )
+    configure_sqlite(memory.engine)
+    return memory
+
+
+# Banco em memória copiado do arquivo (opcional, só SQLite)
+memory_database = (
+    build_memory_database(Config.DATABASE_URL) if Config.SQLITE_IN_MEMORY else None
+)
+
 # Criar engine do banco
-engine = create_engine(Config.DATABASE_URL, connect_args={"check_same_thread": False})
+engine = memory_database.engine if memory_database else build_engine(database_url())
+
+# Réplicas de leitura (opcionais)
+replica_engines = [build_engine(url) for url in Config.DATABASE_REPLICA_URLS]
 
-# Criar sessão do banco
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Criar sessão do banco: leituras nas réplicas, escritas no principal
+SessionLocal = routing_sessionmaker(engine, replica_engines)
 
 
 def get_db() -> Iterator[Session]:
@@ -40,3 +164,46 @@ def create_tables() -> None:
     """Cria as tabelas automaticamente, se ainda não existirem."""
     Base.metadata.create_all(bind=engine)
     logger.info("Tabelas criadas com sucesso!")
+
+
+# Chave do advisory lock de inicialização no Postgres
+STARTUP_LOCK_KEY = 7_041_990
+
+
+@contextmanager
+def startup_lock() -> Iterator[None]:
+    """
+    Serializa a inicialização (criação das tabelas e importação do CSV) entre
+    os processos que compartilham o banco, como os workers do uvicorn ou as
+    réplicas do deployment: advisory lock no Postgres e lock de arquivo ao
+    lado do banco no SQLite.
+    """
+    if engine.dialect.name == "postgresql":
+        with engine.connect() as conn:
+            conn.execute(
+                text("SELECT pg_advisory_lock(:key)"), {"key": STARTUP_LOCK_KEY}
+            )
+            try:
+                yield
+            finally:
+                conn.execute(
+                    text("SELECT pg_advisory_unlock(:key)"), {"key": STARTUP_LOCK_KEY}
+                )
+        return
+
+    database = memory_database.path if memory_database else engine.url.database
+    # Artefato somente leitura: não há o que inicializar
+    if (
+        engine.dialect.name != "sqlite"
+        or database in (None, "", ":memory:")
+        or engine.url.query.get("mode") == "ro"
+    ):
+        yield
+        return
+
+    with open(f"{database}.startup.lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
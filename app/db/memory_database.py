@@ -0,0 +1,143 @@
+import sqlite3
+import threading
+import uuid
+from typing import Any, Optional
+
+from loguru import logger
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+
+from app.db.routing import is_read_only_sql
+
+# Instruções de inspeção que não alteram o banco, além das leituras
+# reconhecidas por `is_read_only_sql` (as demais disparam o write-through)
+READ_PREFIXES = ("PRAGMA", "EXPLAIN")
+
+
+class MemoryDatabase:
+    """
+    Cópia em memória (VFS `memdb` do SQLite, compartilhada pelo nome) de um
+    banco SQLite em arquivo, para servir as consultas sem I/O de sistema de
+    arquivos.
+
+    `load` copia o arquivo para a memória com `VACUUM INTO`. O
+    `memdb` usa os locks normais do SQLite (e não os de tabela do cache
+    compartilhado): o `busy_timeout` vale e as leituras só enxergam dados
+    confirmados. As escritas passam por um único escritor por vez, que o
+    guarda até a conexão voltar ao pool. Depois de uma transação que
+    escreveu, o banco em memória inteiro é copiado de volta para o arquivo
+    (write-through); as escritas de cada intervalo de `save_delay` segundos
+    são agrupadas em uma única cópia. Cada cópia grava o banco inteiro
+    (custo proporcional ao tamanho do banco), por isso `save_delay=0`, que
+    copia ao fim de cada transação que escreveu, só serve para bancos
+    pequenos.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        save_delay: float = 1.0,
+        write_timeout: float = 5.0,
+        **engine_kwargs: Any,
+    ) -> None:
+        parsed = make_url(url)
+        if parsed.get_backend_name() != "sqlite" or parsed.database in (
+            None,
+            "",
+            ":memory:",
+        ):
+            raise ValueError(f"O modo em memória exige um SQLite em arquivo: {url}")
+        self.path: str = parsed.database
+        self.uri = f"file:/gra_{uuid.uuid4().hex}?vfs=memdb"
+        self.save_delay = save_delay
+        self.write_timeout = write_timeout
+        # O banco em memória existe enquanto houver uma conexão aberta
+        self._keeper = sqlite3.connect(self.uri, uri=True, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._writer = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._pending = False
+        self.writes_through = 0
+
+        self.engine: Engine = create_engine(
+            "sqlite://", creator=self._connect, **engine_kwargs
+        )
+        event.listen(self.engine, "before_cursor_execute", self._track_writes)
+        event.listen(self.engine, "checkin", self._write_through)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(
+            self.uri, uri=True, check_same_thread=False, timeout=self.write_timeout
+        )
+
+    def _track_writes(self, conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        if statement.lstrip().upper().startswith(READ_PREFIXES):
+            return
+        if is_read_only_sql(statement):
+            return
+        if not conn.info.get("memory_writer"):
+            if not self._writer.acquire(timeout=self.write_timeout):
+                raise sqlite3.OperationalError("database is locked")
+            conn.info["memory_writer"] = True
+        conn.info["memory_dirty"] = True
+
+    def _write_through(self, dbapi_connection: Any, connection_record: Any) -> None:
+        info = connection_record.info
+        try:
+            if info.pop("memory_dirty", False):
+                self._schedule_save()
+        finally:
+            if info.pop("memory_writer", False):
+                self._writer.release()
+
+    def _schedule_save(self) -> None:
+        if self.save_delay <= 0:
+            self.save()
+            return
+        with self._lock:
+            self._pending = True
+            if self._timer is None:
+                self._timer = threading.Timer(self.save_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def load(self) -> None:
+        """Copia o arquivo para a memória, ainda vazia (`VACUUM INTO`)."""
+        with self._lock:
+            disk = sqlite3.connect(self.path)
+            try:
+                # O backup copiaria o cabeçalho de WAL do arquivo, que o
+                # memdb não consegue abrir; o VACUUM INTO grava sem WAL
+                disk.execute("VACUUM INTO ?", (self.uri,))
+            finally:
+                disk.close()
+        logger.info(f"Banco {self.path} carregado em memória.")
+
+    def save(self) -> None:
+        """Grava o conteúdo em memória no arquivo (backup do SQLite)."""
+        with self._lock:
+            self._save()
+
+    def flush(self) -> None:
+        """Grava agora as escritas ainda não copiadas para o arquivo."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._pending:
+                self._save()
+
+    def _save(self) -> None:
+        disk = sqlite3.connect(self.path)
+        try:
+            self._keeper.backup(disk)
+        finally:
+            disk.close()
+        self._pending = False
+        self.writes_through += 1
+
+    def close(self) -> None:
+        """Grava as escritas pendentes, encerra a engine e descarta a memória."""
+        self.flush()
+        self.engine.dispose()
+        self._keeper.close()
@@ -0,0 +1,103 @@
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+# Linha do EXPLAIN QUERY PLAN que percorre uma tabela (ou um índice inteiro).
+# Tabelas virtuais (ex: FTS5) usam os próprios índices e não entram aqui
+SCAN_PATTERN = re.compile(r"^SCAN (\w+)(?: USING (?:COVERING )?INDEX (\w+))?$")
+# Sufixo dos aliases gerados pelo SQLAlchemy (ex: movies_1)
+ALIAS_SUFFIX = re.compile(r"_\d+$")
+# Listas de parâmetros do IN expandido (ex: `IN (?, ?, ?)`)
+IN_PARAMETERS = re.compile(r"\(\?(?:, \?)*\)")
+# Predicado do CREATE INDEX de um índice parcial
+INDEX_PREDICATE = re.compile(r"\bWHERE\s+(.+)$", re.IGNORECASE | re.DOTALL)
+# Qualificador de tabela das colunas (ex: `movies.`)
+TABLE_QUALIFIER = re.compile(r"\b\w+\.")
+
+Statement = Tuple[str, Any]
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Forma canônica da instrução, para agrupar as execuções da mesma consulta:
+    espaços colapsados e listas do IN com um único parâmetro.
+    """
+    return IN_PARAMETERS.sub("(?)", " ".join(sql.split()))
+
+
+def explain(conn: Connection, sql: str, params: Any = ()) -> List[str]:
+    """Linhas de detalhe do `EXPLAIN QUERY PLAN` do SQLite para a instrução."""
+    rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", params)
+    return [row[-1] for row in rows]
+
+
+def table_sizes(conn: Connection) -> Dict[str, int]:
+    """Quantidade de linhas de cada tabela do banco."""
+    return {
+        table: conn.execute(text(f'SELECT COUNT(*) FROM "{table}"')).scalar_one()
+        for table in inspect(conn).get_table_names()
+    }
+
+
+def partial_indexes(conn: Connection) -> Dict[str, str]:
+    """
+    Índices parciais (`CREATE INDEX ... WHERE`) do banco e o predicado de
+    cada um, como escrito no CREATE INDEX (ex: `winner IS 1`).
+    """
+    rows = conn.exec_driver_sql(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+    )
+    predicates: Dict[str, str] = {}
+    for name, sql in rows:
+        match = INDEX_PREDICATE.search(sql)
+        if match:
+            predicates[name] = " ".join(match.group(1).split())
+    return predicates
+
+
+def unqualified(predicate: str) -> str:
+    """Predicado sem os nomes de tabela (`movies.winner IS 1` -> `winner IS 1`)."""
+    return TABLE_QUALIFIER.sub("", predicate)
+
+
+def full_scans(
+    plan: List[str],
+    sizes: Dict[str, int],
+    threshold: int,
+    partial_scans: Optional[Dict[str, str]] = None,
+    sql: str = "",
+) -> List[str]:
+    """
+    Tabelas com pelo menos `threshold` linhas lidas por inteiro no plano.
+
+    A leitura completa de um índice conta como varredura da tabela. A única
+    exceção são os pares índice parcial -> predicado de `partial_scans`,
+    quando a instrução filtra pelo mesmo predicado: o índice só contém as
+    linhas pedidas.
+
+    :param plan: Linhas de detalhe do EXPLAIN QUERY PLAN.
+    :param sizes: Quantidade de linhas por tabela (ver `table_sizes`).
+    :param threshold: Tamanho mínimo para a varredura ser considerada.
+    :param partial_scans: Índice parcial -> predicado (como no SQL emitido,
+        ex: `movies.winner IS 1`) cuja leitura completa é aceita.
+    :param sql: Instrução do plano, onde o predicado é procurado.
+    :return: Nomes das tabelas varridas.
+    """
+    partial_scans = partial_scans or {}
+    statement = " ".join(sql.split())
+    scanned = []
+    for detail in plan:
+        match = SCAN_PATTERN.match(detail)
+        if not match:
+            continue
+        index = match.group(2)
+        if index in partial_scans and partial_scans[index] in statement:
+            continue
+        table = match.group(1)
+        if table not in sizes:
+            table = ALIAS_SUFFIX.sub("", table)
+        if sizes.get(table, 0) >= threshold:
+            scanned.append(table)
+    return scanned
@@ -0,0 +1,123 @@
+import itertools
+import re
+from typing import Any, Iterator, List, Optional, Sequence, Union
+
+from sqlalchemy import TextClause, TextualSelect
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql import ClauseElement
+
+# SQL textual (`text()`) tratado como leitura: um único SELECT (ou `WITH ...
+# SELECT`) sem trava de linhas, `SELECT ... INTO` nem CTE que escreve
+TEXT_SELECT_PATTERN = re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE)
+TEXT_WRITE_PATTERN = re.compile(
+    r"\bFOR\s+(NO\s+KEY\s+)?(UPDATE|SHARE)\b"
+    r"|\b(INTO|INSERT|UPDATE|DELETE|REPLACE)\b|;",
+    re.IGNORECASE,
+)
+
+
+class RoutingSession(Session):
+    """
+    Sessão que envia as consultas de leitura a uma réplica e as escritas ao
+    banco principal.
+
+    A réplica é escolhida em rodízio na primeira leitura da sessão (uma por
+    requisição, para que as leituras vejam o mesmo snapshot). Depois da
+    primeira escrita todas as consultas da sessão vão para o principal, para
+    que a requisição leia o que acabou de gravar. Leituras que decidem uma
+    escrita (read-before-write) chamam `use_primary` antes, para não deixar
+    de ver, numa réplica atrasada, linhas já gravadas.
+    """
+
+    def __init__(
+        self, *args: Any, replicas: Optional[Iterator[Engine]] = None, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._replicas = replicas
+        self._replica: Optional[Engine] = None
+        self._sticky = False
+
+    def get_bind(
+        self,
+        mapper: Optional[Any] = None,
+        *,
+        clause: Optional[ClauseElement] = None,
+        **kwargs: Any,
+    ) -> Union[Engine, Connection]:
+        primary = super().get_bind(mapper, clause=clause, **kwargs)
+        if self._replicas is None or self._sticky:
+            return primary
+        if self._flushing or (clause is not None and not is_read_only(clause)):
+            self._sticky = True
+            return primary
+        if clause is None:
+            return primary  # ex: checagem do dialeto
+        if self._replica is None:
+            self._replica = next(self._replicas)
+        return self._replica
+
+    def use_primary(self) -> None:
+        """Envia ao principal todas as consultas seguintes da sessão."""
+        self._sticky = True
+
+    @property
+    def uses_primary(self) -> bool:
+        """Indica se a sessão já escreveu e passou a ler do principal."""
+        return self._sticky
+
+
+def use_primary(db: Session) -> None:
+    """
+    Faz a sessão consultar o banco principal daqui em diante, antes de uma
+    leitura que decide uma escrita (ex: checar quais nomes já existem antes
+    do INSERT). Em sessões sem roteamento não faz nada.
+    """
+    if isinstance(db, RoutingSession):
+        db.use_primary()
+
+
+def is_read_only(clause: ClauseElement) -> bool:
+    """
+    Indica se a instrução é um SELECT sem `FOR UPDATE`, inclusive em SQL
+    textual (`text("SELECT ...")`).
+    """
+    if isinstance(clause, (TextClause, TextualSelect)):
+        # text() ou text().columns(): classificado pelo próprio SQL
+        sql = (clause.element if isinstance(clause, TextualSelect) else clause).text
+        return is_read_only_sql(sql)
+    return bool(getattr(clause, "is_select", False)) and (
+        getattr(clause, "_for_update_arg", None) is None
+    )
+
+
+def is_read_only_sql(sql: str) -> bool:
+    """
+    Indica se o SQL é uma única leitura (`SELECT` ou `WITH ... SELECT`).
+    Na dúvida responde que não: palavras de escrita em qualquer ponto do
+    texto, inclusive em literais, classificam a instrução como escrita.
+    """
+    if TEXT_WRITE_PATTERN.search(sql):
+        return False
+    return bool(TEXT_SELECT_PATTERN.match(sql))
+
+
+def routing_sessionmaker(
+    primary: Engine, replicas: Sequence[Engine]
+) -> sessionmaker[RoutingSession]:
+    """
+    Cria a fábrica de sessões da aplicação. Sem réplicas as sessões usam
+    apenas o banco principal.
+
+    :param primary: Engine do banco principal (escritas).
+    :param replicas: Engines das réplicas de leitura, usadas em rodízio.
+    :return: Fábrica de RoutingSession.
+    """
+    replica_list: List[Engine] = list(replicas)
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=primary,
+        class_=RoutingSession,
+        replicas=itertools.cycle(replica_list) if replica_list else None,
+    )
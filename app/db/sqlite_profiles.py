@@ -0,0 +1,85 @@
+from typing import Any, Dict, Optional, Union
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+PragmaValue = Union[str, int]
+
+# Perfis de desempenho do SQLite. cache_size negativo é em KiB (ex: -65536 =
+# 64 MiB); mmap_size é em bytes e busy_timeout em milissegundos.
+SQLITE_PROFILES: Dict[str, Dict[str, PragmaValue]] = {
+    # Cada commit é sincronizado em disco; resiste a quedas de energia
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -16384,
+        "mmap_size": 0,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    # WAL com sincronização só nos checkpoints: não corrompe o banco, mas
+    # uma queda de energia pode perder os últimos commits
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -65536,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    # Cargas em massa que podem ser refeitas do zero em caso de falha
+    "bulk-load": {
+        "journal_mode": "MEMORY",
+        "synchronous": "OFF",
+        "cache_size": -262144,
+        "mmap_size": 1073741824,
+        "temp_store": "MEMORY",
+        "busy_timeout": 30000,
+    },
+}
+
+
+def resolve_profile(
+    name: str, overrides: Optional[Dict[str, Optional[PragmaValue]]] = None
+) -> Dict[str, PragmaValue]:
+    """
+    Monta os PRAGMAs de um perfil, aplicando os valores sobrescritos.
+
+    :param name: Nome do perfil (chave de SQLITE_PROFILES).
+    :param overrides: PRAGMAs que substituem os do perfil (None é ignorado).
+    :return: Dicionário PRAGMA -> valor.
+    :raises ValueError: Se o perfil não existir.
+    """
+    if name not in SQLITE_PROFILES:
+        raise ValueError(
+            f"Perfil SQLite inválido: {name}. "
+            f"Use um de: {', '.join(SQLITE_PROFILES)}"
+        )
+    pragmas = dict(SQLITE_PROFILES[name])
+    pragmas.update({k: v for k, v in (overrides or {}).items() if v is not None})
+    return pragmas
+
+
+def apply_sqlite_profile(
+    engine: Engine,
+    name: str,
+    overrides: Optional[Dict[str, Optional[PragmaValue]]] = None,
+) -> None:
+    """
+    Registra um hook de conexão que aplica os PRAGMAs do perfil em cada nova
+    conexão SQLite da engine. Em outros bancos não faz nada.
+
+    :param engine: Engine a configurar.
+    :param name: Nome do perfil.
+    :param overrides: PRAGMAs que substituem os do perfil.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    pragmas = resolve_profile(name, overrides)
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma, value in pragmas.items():
+            cursor.execute(f"PRAGMA {pragma}={value}")
+        cursor.close()
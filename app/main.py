@@ -1,14 +1,40 @@
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
-from fastapi import FastAPI
+from typing import Any, AsyncGenerator
+from fastapi import Depends, FastAPI, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 from app.config import Config
-from app.db.database import SessionLocal, create_tables, test_database_connection
+from app.db.database import (
+    SessionLocal,
+    create_tables,
+    engine,
+    get_db,
+    is_read_only_error,
+    memory_database,
+    replica_engines,
+    startup_lock,
+    test_database_connection,
+)
+from app.db.artifact import install_artifact
+from app.db.async_database import (
+    dispose_async_engine,
+    get_async_db,
+    get_async_engine,
+)
+from app.db.pool import pool_stats
 import os
 import datetime
 import pytz
+from app.utils.cache import cache_stats
 from app.utils.logger import logger
 
 from app.api.routes import (
+    async_award_interval_route,
+    async_movie_routes,
+    async_producer_routes,
+    async_studio_routes,
     csv_importer_routes,
     producer_routes,
     movie_routes,
@@ -16,6 +42,8 @@ from app.api.routes import (
     award_interval_route,
 )
 from app.services.csv_importer_service import CSVImporterService
+from app.services.generation_service import GenerationService
+from app.services.async_generation_service import AsyncGenerationService
 
 
 @asynccontextmanager
@@ -26,17 +54,59 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     TEST_MODE = os.getenv("TEST_MODE", "false").lower() == "true"
 
     if not TEST_MODE:
-        # Criação das tabelas ao iniciar
-        create_tables()
+        # Um processo por vez, quando vários workers compartilham o banco
+        with startup_lock():
+            # Artefato pré-construído: já tem as tabelas e os dados do CSV
+            if Config.DATABASE_ARTIFACT and Config.DATABASE_ARTIFACT_MODE == "copy":
+                install_artifact(Config.DATABASE_ARTIFACT, Config.DATABASE_URL)
+
+            # Modo em memória: parte do conteúdo atual do arquivo
+            if memory_database:
+                memory_database.load()
 
-        # Carregar CSV ao iniciar, se existir
-        db = SessionLocal()
-        CSVImporterService.load_csv_on_startup(db)
-        db.close()
+            if not Config.DATABASE_ARTIFACT:
+                # Criação das tabelas ao iniciar
+                create_tables()
+
+                # Carregar CSV ao iniciar, se existir
+                db = SessionLocal()
+                CSVImporterService.load_csv_on_startup(db)
+                db.close()
 
     yield  # Aqui é o ponto de entrada da aplicação
 
     logger.info("Aplicação finalizando...")
+    await dispose_async_engine()
+    if memory_database:
+        memory_database.close()
+
+
+def validate_caches(db: Session = Depends(get_db)) -> None:
+    """
+    Valida os caches em memória contra as gerações do banco antes de cada
+    requisição (ver CACHE_VALIDATION_INTERVAL); a sessão é a mesma da rota.
+    """
+    GenerationService.validate_caches(db)
+
+
+async def validate_caches_async(db: AsyncSession = Depends(get_async_db)) -> None:
+    """Variante de `validate_caches` para as rotas async (ASYNC_DB=true)."""
+    await AsyncGenerationService.validate_caches(db)
+
+
+def cache_validation(async_db: bool) -> list[Any]:
+    """
+    Dependências de validação dos caches para os routers de dados, com a
+    mesma sessão (síncrona ou async) das rotas. Vazia com a validação
+    desativada, para não abrir uma sessão a mais por requisição; /health e
+    /metrics nunca validam.
+
+    :param async_db: Se os routers usam AsyncSession.
+    :return: Lista para o `dependencies` de `include_router`.
+    """
+    if Config.CACHE_VALIDATION_INTERVAL < 0:
+        return []
+    return [Depends(validate_caches_async if async_db else validate_caches)]
 
 
 TESTS_CACHE_FILE = "tests/.last_test_run"
@@ -65,6 +135,22 @@ app = FastAPI(
 )
 
 
+@app.exception_handler(OperationalError)
+async def read_only_database(request: Request, exc: OperationalError) -> JSONResponse:
+    """
+    Responde 503 às escritas recusadas por um banco somente leitura (artefato
+    com DATABASE_ARTIFACT_MODE=readonly), em vez de um erro interno; os demais
+    erros do banco seguem como 500.
+    """
+    if not is_read_only_error(exc):
+        raise exc
+    logger.warning(f"Escrita recusada pelo banco somente leitura: {request.url.path}")
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Banco somente leitura: escritas desativadas."},
+    )
+
+
 @app.get("/health")
 def health_check() -> dict[str, str | bool]:
     """Retorna informações sobre o estado da API"""
@@ -79,22 +165,50 @@ def health_check() -> dict[str, str | bool]:
     }
 
 
+@app.get("/metrics")
+def metrics() -> dict[str, Any]:
+    """
+    Retorna as métricas dos caches de entidades (tamanho, acertos e faltas) e
+    do pool de conexões (ocupação e tempo de espera no checkout), incluindo
+    os pools das réplicas e o da engine async, quando configurados
+    """
+    stats: dict[str, Any] = {"caches": cache_stats(), "pool": pool_stats(engine)}
+    if replica_engines:
+        stats["replica_pools"] = [pool_stats(replica) for replica in replica_engines]
+    if Config.ASYNC_DB:
+        stats["async_pool"] = pool_stats(get_async_engine().sync_engine)
+    return stats
+
+
 @app.get("/")
 def root() -> dict[str, str]:
     return {"message": "Golden Raspberry Awards API is running!"}
 
 
-# Incluindo as rotas de produtores
-app.include_router(producer_routes.router)
+# Com ASYNC_DB as rotas de leitura e escrita usam AsyncSession; o upload de
+# CSV continua síncrono nos dois modos
+data_dependencies = cache_validation(Config.ASYNC_DB)
+if Config.ASYNC_DB:
+    app.include_router(async_producer_routes.router, dependencies=data_dependencies)
+    app.include_router(async_studio_routes.router, dependencies=data_dependencies)
+    app.include_router(async_movie_routes.router, dependencies=data_dependencies)
+    app.include_router(
+        async_award_interval_route.router, dependencies=data_dependencies
+    )
+else:
+    # Incluindo as rotas de produtores
+    app.include_router(producer_routes.router, dependencies=data_dependencies)
 
-# Registrar rotas de estúdios
-app.include_router(studio_routes.router)
+    # Registrar rotas de estúdios
+    app.include_router(studio_routes.router, dependencies=data_dependencies)
 
-# Registrar rotas de filmes
-app.include_router(movie_routes.router)
+    # Registrar rotas de filmes
+    app.include_router(movie_routes.router, dependencies=data_dependencies)
 
-# Registrar rotas de csv_importer
-app.include_router(csv_importer_routes.router)
+    # Registrar rotas de intervalos
+    app.include_router(award_interval_route.router, dependencies=data_dependencies)
 
-# Registrar rotas de intervalos
-app.include_router(award_interval_route.router)
+# Registrar rotas de csv_importer
+app.include_router(
+    csv_importer_routes.router, dependencies=cache_validation(async_db=False)
+)
@@ -4,3 +4,5 @@ from .producer import Producer
 from .movie import Movie
 from .studio import Studio
 from .movie_studio import movie_studio
+from .movie_search import MOVIES_FTS_TABLE
+from .data_generation import DataGeneration, TRACKED_TABLES
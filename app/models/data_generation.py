@@ -0,0 +1,35 @@
+from typing import Any, cast
+
+from sqlalchemy import Column, DateTime, Integer, String, Table, event, func, insert
+from sqlalchemy.engine import Connection
+
+from app.models.base import Base
+
+# Tabelas cujas listagens têm o contador de geração (ETag)
+TRACKED_TABLES = ("movies", "producers", "studios")
+
+
+class DataGeneration(Base):
+    """
+    Modelo da Tabela data_generations: um contador crescente por tabela,
+    incrementado a cada escrita feita pelos repositories.
+    """
+
+    __tablename__ = "data_generations"
+
+    table_name = Column(String, primary_key=True)
+    generation = Column(Integer, nullable=False, default=0)
+    updated_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+
+def _seed(target: Table, connection: Connection, **kw: Any) -> None:
+    """Cria a linha de cada tabela monitorada logo após criar a tabela."""
+    connection.execute(
+        insert(target),
+        [{"table_name": name, "generation": 0} for name in TRACKED_TABLES],
+    )
+
+
+event.listen(cast(Table, DataGeneration.__table__), "after_create", _seed)
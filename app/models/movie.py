@@ -1,5 +1,5 @@
 from __future__ import annotations
-from sqlalchemy import Boolean, Column, Integer, String
+from sqlalchemy import Boolean, Column, Index, Integer, String
 from sqlalchemy.orm import relationship, Mapped
 from app.models.base import Base
 from app.models.movie_producer import movie_producer
@@ -17,14 +17,47 @@ class Movie(Base):
 
     __tablename__ = "movies"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     title = Column(String, unique=True, nullable=False)
     year = Column(Integer, nullable=False)
     winner = Column(Boolean, nullable=False, default=False)
 
+    __table_args__ = (
+        Index("ix_movies_year_winner", "year", "winner"),
+        # Índice parcial só com os vencedores, ordenado por ano
+        Index(
+            "ix_movies_winners_year",
+            "year",
+            sqlite_where=winner.is_(True),
+            postgresql_where=winner.is_(True),
+        ),
+        # Listagem filtrada por vencedor, na ordem de ID (cursor). Dois índices
+        # parciais, para não disputarem com o de ano na consulta de vencedores
+        Index(
+            "ix_movies_winners_id",
+            "id",
+            sqlite_where=winner.is_(True),
+            postgresql_where=winner.is_(True),
+        ),
+        Index(
+            "ix_movies_nominees_id",
+            "id",
+            sqlite_where=winner.is_(False),
+            postgresql_where=winner.is_(False),
+        ),
+    )
+
     producers: Mapped[List["Producer"]] = relationship(
-        "Producer", secondary=movie_producer, back_populates="movies"
+        "Producer",
+        secondary=movie_producer,
+        back_populates="movies",
+        order_by="Producer.id",
+        passive_deletes=True,
     )
     studios: Mapped[List["Studio"]] = relationship(
-        "Studio", secondary=movie_studio, back_populates="movies"
+        "Studio",
+        secondary=movie_studio,
+        back_populates="movies",
+        order_by="Studio.id",
+        passive_deletes=True,
     )
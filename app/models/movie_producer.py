@@ -1,10 +1,25 @@
-from sqlalchemy import Table, Column, Integer, ForeignKey
+from sqlalchemy import Table, Column, Index, Integer, ForeignKey
 from app.models.base import Base
 
 # Tabela de associação entre filmes e produtores (Many-to-Many)
 movie_producer = Table(
     "movie_producer",
     Base.metadata,
-    Column("movie_id", Integer, ForeignKey("movies.id"), primary_key=True),
-    Column("producer_id", Integer, ForeignKey("producers.id"), primary_key=True),
+    # ON DELETE CASCADE: remover um filme ou produtor apaga as associações no
+    # próprio banco, sem carregar as coleções
+    Column(
+        "movie_id",
+        Integer,
+        ForeignKey("movies.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "producer_id",
+        Integer,
+        ForeignKey("producers.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    # A chave primária começa por movie_id; este índice cobre as buscas a
+    # partir do produtor
+    Index("ix_movie_producer_producer_id_movie_id", "producer_id", "movie_id"),
 )
@@ -0,0 +1,58 @@
+from sqlalchemy import DDL, Table, event
+from typing import cast
+
+from app.models.movie import Movie
+
+# Índice de texto dos títulos. No SQLite é uma tabela FTS5 de conteúdo externo
+# (lê os títulos de `movies`) mantida por triggers; no Postgres, um índice de
+# trigramas (pg_trgm) sobre `movies.title`.
+MOVIES_FTS_TABLE = "movies_fts"
+
+SQLITE_CREATE = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {MOVIES_FTS_TABLE} USING fts5(
+        title,
+        content='movies',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS movies_fts_ai AFTER INSERT ON movies BEGIN
+        INSERT INTO {MOVIES_FTS_TABLE}(rowid, title) VALUES (new.id, new.title);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS movies_fts_ad AFTER DELETE ON movies BEGIN
+        INSERT INTO {MOVIES_FTS_TABLE}({MOVIES_FTS_TABLE}, rowid, title)
+        VALUES ('delete', old.id, old.title);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS movies_fts_au AFTER UPDATE OF title ON movies BEGIN
+        INSERT INTO {MOVIES_FTS_TABLE}({MOVIES_FTS_TABLE}, rowid, title)
+        VALUES ('delete', old.id, old.title);
+        INSERT INTO {MOVIES_FTS_TABLE}(rowid, title) VALUES (new.id, new.title);
+    END
+    """,
+]
+SQLITE_DROP = f"DROP TABLE IF EXISTS {MOVIES_FTS_TABLE}"
+
+POSTGRES_CREATE = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_movies_title_trgm "
+    "ON movies USING gin (title gin_trgm_ops)",
+]
+
+movies_table = cast(Table, Movie.__table__)
+
+for statement in SQLITE_CREATE:
+    event.listen(
+        movies_table, "after_create", DDL(statement).execute_if(dialect="sqlite")
+    )
+event.listen(movies_table, "before_drop", DDL(SQLITE_DROP).execute_if(dialect="sqlite"))
+
+for statement in POSTGRES_CREATE:
+    event.listen(
+        movies_table, "after_create", DDL(statement).execute_if(dialect="postgresql")
+    )
@@ -1,10 +1,25 @@
-from sqlalchemy import Table, Column, Integer, ForeignKey
+from sqlalchemy import Table, Column, Index, Integer, ForeignKey
 from app.models.base import Base
 
 # Tabela de associação entre filmes e estúdios (Many-to-Many)
 movie_studio = Table(
     "movie_studio",
     Base.metadata,
-    Column("movie_id", Integer, ForeignKey("movies.id"), primary_key=True),
-    Column("studio_id", Integer, ForeignKey("studios.id"), primary_key=True),
+    # ON DELETE CASCADE: remover um filme ou estúdio apaga as associações no
+    # próprio banco, sem carregar as coleções
+    Column(
+        "movie_id",
+        Integer,
+        ForeignKey("movies.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "studio_id",
+        Integer,
+        ForeignKey("studios.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    # A chave primária começa por movie_id; este índice cobre as buscas a
+    # partir do estúdio
+    Index("ix_movie_studio_studio_id_movie_id", "studio_id", "movie_id"),
 )
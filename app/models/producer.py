@@ -2,6 +2,7 @@ from __future__ import annotations
 from sqlalchemy import Column, Integer, String
 from sqlalchemy.orm import relationship, Mapped
 from app.models.base import Base
+from app.utils.text import normalize_name
 from app.models.movie_producer import movie_producer
 from typing import List, TYPE_CHECKING
 
@@ -15,9 +16,21 @@ class Producer(Base):
 
     __tablename__ = "producers"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String, unique=True, nullable=False)
+    # Nome sem acentos e em casefold, preenchido a partir de `name`, para busca
+    name_normalized = Column(
+        String,
+        nullable=False,
+        index=True,
+        default=lambda context: normalize_name(
+            context.get_current_parameters()["name"]
+        ),
+    )
 
     movies: Mapped[List["Movie"]] = relationship(
-        "Movie", secondary=movie_producer, back_populates="producers"
+        "Movie",
+        secondary=movie_producer,
+        back_populates="producers",
+        passive_deletes=True,
     )
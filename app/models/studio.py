@@ -1,5 +1,6 @@
 from sqlalchemy import Column, Integer, String
 from app.models.base import Base
+from app.utils.text import normalize_name
 from app.models.movie_studio import movie_studio
 from typing import List, TYPE_CHECKING
 from sqlalchemy.orm import relationship, Mapped
@@ -13,9 +14,18 @@ class Studio(Base):
 
     __tablename__ = "studios"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String, unique=True, nullable=False)
+    # Nome sem acentos e em casefold, preenchido a partir de `name`, para busca
+    name_normalized = Column(
+        String,
+        nullable=False,
+        index=True,
+        default=lambda context: normalize_name(
+            context.get_current_parameters()["name"]
+        ),
+    )
 
     movies: Mapped[List["Movie"]] = relationship(
-        "Movie", secondary=movie_studio, back_populates="studios"
+        "Movie", secondary=movie_studio, back_populates="studios", passive_deletes=True
     )
@@ -1,3 +1,8 @@
 from .producer_repository import ProducerRepository
 from .movie_repository import MovieRepository
 from .studio_repository import StudioRepository
+from .generation_repository import GenerationRepository
+from .async_generation_repository import AsyncGenerationRepository
+from .async_movie_repository import AsyncMovieRepository
+from .async_producer_repository import AsyncProducerRepository
+from .async_studio_repository import AsyncStudioRepository
@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Optional, Sequence, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.generation_repository import GenerationRepository
+
+
+class AsyncGenerationRepository:
+    """
+    Variante async de `GenerationRepository` sobre AsyncSession, com as
+    mesmas consultas.
+    """
+
+    @staticmethod
+    async def bump(db: AsyncSession, *tables: str) -> None:
+        """
+        Incrementa a geração das tabelas informadas, sem commit, para que o
+        incremento faça parte da mesma transação da escrita.
+
+        :param db: Sessão async do banco de dados.
+        :param tables: Nomes das tabelas alteradas.
+        """
+        await db.execute(GenerationRepository._bump_statement(tables))
+
+    @staticmethod
+    async def get(
+        db: AsyncSession, tables: Sequence[str]
+    ) -> Tuple[Tuple[int, ...], Optional[datetime]]:
+        """
+        Lê as gerações das tabelas informadas com uma única consulta Core.
+
+        :param db: Sessão async do banco de dados.
+        :param tables: Nomes das tabelas, na ordem desejada.
+        :return: Gerações na ordem pedida (0 se ausente) e a alteração mais recente.
+        """
+        result = await db.execute(GenerationRepository._select_generations(tables))
+        return GenerationRepository._read_generations(result.all(), tables)
@@ -0,0 +1,294 @@
+from sqlalchemy import CursorResult, Row, delete, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import Config
+from app.models.movie import Movie
+from app.repositories.async_generation_repository import AsyncGenerationRepository
+from app.repositories.movie_repository import MovieRepository
+from app.schemas.movie import MovieFilter
+from app.utils.chunking import chunked
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, cast
+from loguru import logger
+
+
+class AsyncMovieRepository:
+    """
+    Variante async de `MovieRepository` sobre AsyncSession, usada pelas rotas
+    com ASYNC_DB=true. As consultas são as mesmas da versão síncrona; só a
+    execução passa pelo driver async.
+    """
+
+    @staticmethod
+    async def create(db: AsyncSession, title: str, year: int, winner: bool) -> Movie:
+        """
+        Cria um novo filme e o salva no banco de dados.
+
+        :param db: Sessão async do banco de dados.
+        :param title: Título do filme.
+        :param year: Ano de lançamento do filme.
+        :param winner: Indica se o filme foi vencedor do prêmio.
+        :return: Objeto Movie criado ou existente.
+        """
+        movie = Movie(title=title, year=year, winner=winner)
+        db.add(movie)
+        try:
+            await AsyncGenerationRepository.bump(db, "movies")
+            await db.commit()
+            await db.refresh(movie)
+            logger.info(f"Novo filme cadastrado: {title} ({year}) - {winner}")
+            return movie
+        except IntegrityError:
+            await db.rollback()
+            existing_movie = await AsyncMovieRepository.get_by_title(db, title)
+            if existing_movie:
+                logger.warning(
+                    f"Filme '{title}' já existe, retornando instância existente."
+                )
+                return existing_movie
+            logger.error(f"Erro inesperado ao inserir filme '{title}'.")
+            raise ValueError(f"Erro ao criar ou recuperar o filme: {title} ({year})")
+
+    @staticmethod
+    async def get_by_id(db: AsyncSession, movie_id: int) -> Optional[Movie]:
+        """
+        Obtém um filme pelo ID.
+
+        :param db: Sessão async do banco de dados.
+        :param movie_id: ID do filme.
+        :return: O filme encontrado ou None se não existir.
+        """
+        result = await db.scalars(MovieRepository._BY_ID, {"movie_id": movie_id})
+        movie = result.first()
+        if movie is None:
+            logger.warning(f"Filme com ID {movie_id} não encontrado.")
+        return movie
+
+    @staticmethod
+    async def get_by_title(db: AsyncSession, title: str) -> Optional[Movie]:
+        """
+        Busca um filme pelo título.
+
+        :param db: Sessão async do banco de dados.
+        :param title: Título do filme.
+        :return: Objeto Movie se encontrado, caso contrário, None.
+        """
+        result = await db.scalars(MovieRepository._BY_TITLE, {"title": title})
+        return result.first()
+
+    @staticmethod
+    async def get_by_ids(db: AsyncSession, ids: Sequence[int]) -> List[Movie]:
+        """
+        Busca vários filmes pelos IDs, com uma consulta `IN (...)` por bloco.
+
+        :param db: Sessão async do banco de dados.
+        :param ids: IDs procurados (repetições são ignoradas).
+        :return: Filmes encontrados, em qualquer ordem.
+        """
+        found: List[Movie] = []
+        for chunk in chunked(list(dict.fromkeys(ids)), Config.IN_CLAUSE_CHUNK_SIZE):
+            found.extend(await db.scalars(select(Movie).where(Movie.id.in_(chunk))))
+        return found
+
+    @staticmethod
+    async def get_by_titles(db: AsyncSession, titles: Sequence[str]) -> List[Movie]:
+        """
+        Busca vários filmes pelos títulos, com uma consulta `IN (...)` por bloco.
+
+        :param db: Sessão async do banco de dados.
+        :param titles: Títulos procurados (repetições são ignoradas).
+        :return: Filmes encontrados, em qualquer ordem.
+        """
+        found: List[Movie] = []
+        for chunk in chunked(list(dict.fromkeys(titles)), Config.IN_CLAUSE_CHUNK_SIZE):
+            found.extend(await db.scalars(select(Movie).where(Movie.title.in_(chunk))))
+        return found
+
+    @staticmethod
+    async def get_ids_by_titles(
+        db: AsyncSession, titles: Sequence[str]
+    ) -> Dict[str, int]:
+        """
+        Busca os IDs dos filmes pelos títulos, em blocos `IN (...)`.
+
+        :param db: Sessão async do banco de dados.
+        :param titles: Títulos procurados.
+        :return: Dicionário título -> ID dos filmes encontrados.
+        """
+        ids: Dict[str, int] = {}
+        for chunk in chunked(list(dict.fromkeys(titles)), Config.IN_CLAUSE_CHUNK_SIZE):
+            stmt = select(Movie.title, Movie.id).where(Movie.title.in_(chunk))
+            result = await db.execute(stmt)
+            ids.update((str(title), int(id_)) for title, id_ in result)
+        return ids
+
+    @staticmethod
+    async def insert_many(
+        db: AsyncSession, movies: Sequence[Dict[str, Any]]
+    ) -> Dict[str, int]:
+        """
+        Insere vários filmes com um único INSERT em lote, sem commit.
+
+        :param db: Sessão async do banco de dados.
+        :param movies: Dicionários com title, year e winner.
+        :return: Dicionário título -> ID dos filmes inseridos.
+        """
+        await db.execute(insert(Movie), list(movies))
+        await AsyncGenerationRepository.bump(db, "movies")
+        logger.info(f"{len(movies)} filmes cadastrados em lote.")
+        return await AsyncMovieRepository.get_ids_by_titles(
+            db, [m["title"] for m in movies]
+        )
+
+    @staticmethod
+    async def link_many(
+        db: AsyncSession, relation: str, pairs: Sequence[Tuple[int, int]]
+    ) -> None:
+        """
+        Associa filmes a produtores ou estúdios com um único INSERT em lote,
+        sem commit.
+
+        :param db: Sessão async do banco de dados.
+        :param relation: "producers" ou "studios".
+        :param pairs: Pares (movie_id, id do produtor ou estúdio).
+        """
+        if not pairs:
+            return
+        association, _, foreign_key = MovieRepository.RELATIONS[relation]
+        await db.execute(
+            insert(association),
+            [{"movie_id": movie_id, foreign_key.key: id_} for movie_id, id_ in pairs],
+        )
+        await AsyncGenerationRepository.bump(db, "movies")
+
+    @staticmethod
+    async def search_titles(
+        db: AsyncSession, query: str, limit: int
+    ) -> Sequence[Row[Any]]:
+        """
+        Busca filmes por palavras do título, ordenados por relevância (ver
+        `MovieRepository.search_titles`).
+
+        :param db: Sessão async do banco de dados.
+        :param query: Texto digitado pelo usuário.
+        :param limit: Quantidade máxima de resultados.
+        :return: Linhas (title, year, winner, id).
+        """
+        stmt = MovieRepository._search_statement(
+            db.get_bind().dialect.name, query, limit
+        )
+        if stmt is None:
+            return []
+        return (await db.execute(stmt)).all()
+
+    @staticmethod
+    async def get_all_rows(
+        db: AsyncSession,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        columns: Sequence[str] = MovieRepository.COLUMNS,
+        filters: Optional[MovieFilter] = None,
+    ) -> Sequence[Row[Any]]:
+        """
+        Retorna as colunas dos filmes como tuplas, ordenadas por ID, sem
+        instanciar entidades ORM.
+
+        :param db: Sessão async do banco de dados.
+        :param limit: Quantidade máxima de filmes retornados (None para todos).
+        :param after_id: Retorna apenas filmes com ID maior que este valor.
+        :param columns: Colunas selecionadas, na ordem das tuplas retornadas.
+        :param filters: Filtros de ano e vencedor.
+        :return: Lista de linhas.
+        """
+        stmt = MovieRepository._select_rows(limit, after_id, columns, filters)
+        return (await db.execute(stmt)).all()
+
+    @staticmethod
+    async def get_related_rows(
+        db: AsyncSession, relation: str, movie_ids: Optional[Sequence[int]] = None
+    ) -> List[Row[Any]]:
+        """
+        Retorna os produtores ou estúdios associados aos filmes como tuplas
+        (movie_id, id, name), ordenadas por filme e pelo ID do relacionado.
+
+        :param db: Sessão async do banco de dados.
+        :param relation: "producers" ou "studios".
+        :param movie_ids: Filmes de interesse (None para todas as associações).
+        :return: Lista de linhas.
+        """
+        rows: List[Row[Any]] = []
+        for stmt in MovieRepository._related_statements(relation, movie_ids):
+            rows.extend((await db.execute(stmt)).all())
+        return rows
+
+    @staticmethod
+    async def stream_all(
+        db: AsyncSession,
+        expand: List[str] = [],
+        after_id: Optional[int] = None,
+        batch_size: int = 500,
+        filters: Optional[MovieFilter] = None,
+    ) -> AsyncIterator[Movie]:
+        """
+        Percorre os filmes ordenados por ID com um cursor do servidor, em
+        lotes (`yield_per`), sem materializar a tabela inteira em memória.
+
+        :param db: Sessão async do banco de dados.
+        :param expand: Lista de expansões desejadas, ex: ["producers", "studios"]
+        :param after_id: Retorna apenas filmes com ID maior que este valor.
+        :param batch_size: Quantidade de filmes carregados por lote.
+        :param filters: Filtros de ano e vencedor.
+        :return: Iterador async de objetos Movie.
+        """
+        stmt = MovieRepository._select_movies(expand, after_id, filters)
+        result = await db.stream_scalars(stmt.execution_options(yield_per=batch_size))
+        async for movie in result:
+            yield movie
+
+    @staticmethod
+    async def delete(db: AsyncSession, movie_id: int) -> bool:
+        """
+        Remove um filme do banco de dados.
+
+        :param db: Sessão async do banco de dados.
+        :param movie_id: ID do filme a ser removido.
+        :return: True se o filme foi removido, False se não foi encontrado.
+        """
+        if await AsyncMovieRepository.delete_many(db, [movie_id]):
+            logger.info(f"Filme com ID {movie_id} removido com sucesso.")
+            return True
+
+        logger.warning(
+            f"Tentativa de remover filme com ID {movie_id}, mas ele não existe."
+        )
+        return False
+
+    @staticmethod
+    async def delete_many(db: AsyncSession, ids: Sequence[int]) -> int:
+        """
+        Remove vários filmes com um `DELETE ... WHERE id IN (...)` por bloco,
+        sem carregar as entidades, e faz o commit.
+
+        :param db: Sessão async do banco de dados.
+        :param ids: IDs a remover (IDs inexistentes são ignorados).
+        :return: Quantidade de filmes removidos.
+        """
+        deleted = 0
+        for chunk in chunked(list(dict.fromkeys(ids)), Config.IN_CLAUSE_CHUNK_SIZE):
+            result = await db.execute(delete(Movie).where(Movie.id.in_(chunk)))
+            deleted += cast(CursorResult[Any], result).rowcount
+        # As associações saem pelo ON DELETE CASCADE, sem carregar as coleções
+        if deleted:
+            await AsyncGenerationRepository.bump(db, "movies")
+        await db.commit()
+        return deleted
+
+    @staticmethod
+    async def get_winning_movies(db: AsyncSession) -> List[Movie]:
+        """
+        Retorna todos os filmes vencedores, ordenados por ano, com os
+        produtores e estúdios associados.
+
+        :param db: Sessão async do banco de dados.
+        :return: Lista de filmes vencedores.
+        """
+        return list(await db.scalars(MovieRepository._WINNERS))
@@ -0,0 +1,233 @@
+from sqlalchemy import CursorResult, Row, delete, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import Config
+from app.models.producer import Producer
+from app.repositories.async_generation_repository import AsyncGenerationRepository
+from app.repositories.producer_repository import ProducerRepository
+from app.utils.chunking import chunked
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, cast
+from loguru import logger
+
+
+class AsyncProducerRepository:
+    """
+    Variante async de `ProducerRepository` sobre AsyncSession, com as mesmas
+    consultas da versão síncrona.
+    """
+
+    @staticmethod
+    async def create(db: AsyncSession, name: str) -> Producer:
+        """
+        Cria um novo produtor no banco de dados.
+
+        :param db: Sessão async do banco de dados.
+        :param name: Nome do produtor.
+        :return: Objeto Producer criado ou existente.
+        """
+        producer = Producer(name=name)
+        db.add(producer)
+        try:
+            await AsyncGenerationRepository.bump(db, "producers")
+            await db.commit()
+            await db.refresh(producer)
+            logger.info(f"Novo produtor cadastrado: {name}")
+            return producer
+        except IntegrityError:
+            await db.rollback()
+            existing_producer = await AsyncProducerRepository.get_by_name(db, name)
+            if existing_producer is not None:
+                logger.warning(
+                    f"Produtor '{name}' já existe, retornando instância existente."
+                )
+                return existing_producer
+
+            logger.error(f"Erro inesperado ao inserir produtor '{name}'.")
+            raise ValueError(
+                f"Erro ao recuperar produtor '{name}' após IntegrityError."
+            )
+
+    @staticmethod
+    async def get_by_id(db: AsyncSession, producer_id: int) -> Optional[Producer]:
+        """
+        Busca um produtor pelo ID.
+
+        :param db: Sessão async do banco de dados.
+        :param producer_id: ID do produtor.
+        :return: Objeto Producer se encontrado, caso contrário, None.
+        """
+        result = await db.scalars(
+            ProducerRepository._BY_ID, {"producer_id": producer_id}
+        )
+        producer = result.first()
+        if producer is None:
+            logger.warning(f"Produtor com ID {producer_id} não encontrado.")
+        return producer
+
+    @staticmethod
+    async def get_by_name(db: AsyncSession, name: str) -> Optional[Producer]:
+        """
+        Busca um produtor pelo nome.
+
+        :param db: Sessão async do banco de dados.
+        :param name: Nome do produtor.
+        :return: Objeto Producer se encontrado, caso contrário, None.
+        """
+        result = await db.scalars(ProducerRepository._BY_NAME, {"name": name})
+        return result.first()
+
+    @staticmethod
+    async def get_by_ids(db: AsyncSession, ids: Sequence[int]) -> List[Producer]:
+        """
+        Busca vários produtores pelos IDs, com uma consulta `IN (...)` por bloco.
+
+        :param db: Sessão async do banco de dados.
+        :param ids: IDs procurados (repetições são ignoradas).
+        :return: Produtores encontrados, em qualquer ordem.
+        """
+        found: List[Producer] = []
+        for chunk in chunked(list(dict.fromkeys(ids)), Config.IN_CLAUSE_CHUNK_SIZE):
+            found.extend(
+                await db.scalars(select(Producer).where(Producer.id.in_(chunk)))
+            )
+        return found
+
+    @staticmethod
+    async def get_by_names(db: AsyncSession, names: Sequence[str]) -> List[Producer]:
+        """
+        Busca vários produtores pelos nomes, com uma consulta `IN (...)` por bloco.
+
+        :param db: Sessão async do banco de dados.
+        :param names: Nomes procurados (repetições são ignoradas).
+        :return: Produtores encontrados, em qualquer ordem.
+        """
+        found: List[Producer] = []
+        for chunk in chunked(list(dict.fromkeys(names)), Config.IN_CLAUSE_CHUNK_SIZE):
+            found.extend(
+                await db.scalars(select(Producer).where(Producer.name.in_(chunk)))
+            )
+        return found
+
+    @staticmethod
+    async def search(db: AsyncSession, query: str, limit: int) -> Sequence[Row[Any]]:
+        """
+        Busca produtores pelo início do nome, sem diferenciar maiúsculas nem
+        acentos (ver `ProducerRepository.search`).
+
+        :param db: Sessão async do banco de dados.
+        :param query: Prefixo digitado pelo usuário.
+        :param limit: Quantidade máxima de resultados.
+        :return: Linhas (name, id) ordenadas pelo nome normalizado.
+        """
+        stmt = ProducerRepository._search_statement(query, limit)
+        return (await db.execute(stmt)).all()
+
+    @staticmethod
+    async def get_all_rows(
+        db: AsyncSession,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        columns: Sequence[str] = ProducerRepository.COLUMNS,
+    ) -> Sequence[Row[Any]]:
+        """
+        Retorna os produtores como tuplas, ordenadas por ID,
+        sem instanciar entidades ORM.
+
+        :param db: Sessão async do banco de dados.
+        :param limit: Quantidade máxima de registros retornados (None para todos).
+        :param after_id: Retorna apenas registros com ID maior que este valor.
+        :param columns: Colunas selecionadas, na ordem das tuplas retornadas.
+        :return: Lista de linhas.
+        """
+        stmt = ProducerRepository._select_rows(limit, after_id, columns)
+        return (await db.execute(stmt)).all()
+
+    @staticmethod
+    async def stream_all(
+        db: AsyncSession, after_id: Optional[int] = None, batch_size: int = 500
+    ) -> AsyncIterator[Producer]:
+        """
+        Percorre os produtores ordenados por ID com um cursor do servidor, em
+        lotes (`yield_per`), sem materializar a tabela inteira em memória.
+
+        :param db: Sessão async do banco de dados.
+        :param after_id: Retorna apenas registros com ID maior que este valor.
+        :param batch_size: Quantidade de registros carregados por lote.
+        :return: Iterador async de objetos Producer.
+        """
+        stmt = ProducerRepository._select_all(after_id)
+        result = await db.stream_scalars(stmt.execution_options(yield_per=batch_size))
+        async for producer in result:
+            yield producer
+
+    @staticmethod
+    async def resolve_names(db: AsyncSession, names: Sequence[str]) -> Dict[str, int]:
+        """
+        Resolve nomes de produtores em IDs de forma set-based: uma consulta
+        `IN (...)` por bloco e um único INSERT em lote para os nomes que ainda
+        não existem. Não faz commit, para compor uma transação maior.
+
+        :param db: Sessão async do banco de dados.
+        :param names: Nomes a resolver (repetições são ignoradas).
+        :return: Dicionário nome -> ID.
+        """
+        unique = list(dict.fromkeys(names))
+        ids = await AsyncProducerRepository._ids_by_name(db, unique)
+
+        missing = [name for name in unique if name not in ids]
+        if missing:
+            await db.execute(insert(Producer), [{"name": name} for name in missing])
+            await AsyncGenerationRepository.bump(db, "producers")
+            ids.update(await AsyncProducerRepository._ids_by_name(db, missing))
+            logger.info(f"{len(missing)} novos produtores cadastrados em lote.")
+
+        return ids
+
+    @staticmethod
+    async def _ids_by_name(db: AsyncSession, names: Sequence[str]) -> Dict[str, int]:
+        """Busca os IDs dos produtores pelos nomes, em blocos `IN (...)`."""
+        ids: Dict[str, int] = {}
+        for chunk in chunked(names, Config.IN_CLAUSE_CHUNK_SIZE):
+            stmt = select(Producer.name, Producer.id).where(Producer.name.in_(chunk))
+            result = await db.execute(stmt)
+            ids.update((str(name), int(id_)) for name, id_ in result)
+        return ids
+
+    @staticmethod
+    async def delete(db: AsyncSession, producer_id: int) -> bool:
+        """
+        Remove um produtor do banco de dados.
+
+        :param db: Sessão async do banco de dados.
+        :param producer_id: ID do produtor a ser removido.
+        :return: True se o produtor foi removido, False se não foi encontrado.
+        """
+        if await AsyncProducerRepository.delete_many(db, [producer_id]):
+            logger.info(f"Produtor com ID {producer_id} removido com sucesso.")
+            return True
+
+        logger.warning(
+            f"Tentativa de remover produtor com ID {producer_id}, mas ele não existe."
+        )
+        return False
+
+    @staticmethod
+    async def delete_many(db: AsyncSession, ids: Sequence[int]) -> int:
+        """
+        Remove vários produtores com um `DELETE ... WHERE id IN (...)` por bloco,
+        sem carregar as entidades, e faz o commit.
+
+        :param db: Sessão async do banco de dados.
+        :param ids: IDs a remover (IDs inexistentes são ignorados).
+        :return: Quantidade de produtores removidos.
+        """
+        deleted = 0
+        for chunk in chunked(list(dict.fromkeys(ids)), Config.IN_CLAUSE_CHUNK_SIZE):
+            result = await db.execute(delete(Producer).where(Producer.id.in_(chunk)))
+            deleted += cast(CursorResult[Any], result).rowcount
+        # As associações saem pelo ON DELETE CASCADE e alteram a listagem
+        # expandida de filmes
+        if deleted:
+            await AsyncGenerationRepository.bump(db, "producers", "movies")
+        await db.commit()
+        return deleted
@@ -0,0 +1,225 @@
+from sqlalchemy import CursorResult, Row, delete, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import Config
+from app.models.studio import Studio
+from app.repositories.async_generation_repository import AsyncGenerationRepository
+from app.repositories.studio_repository import StudioRepository
+from app.utils.chunking import chunked
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, cast
+from loguru import logger
+
+
+class AsyncStudioRepository:
+    """
+    Variante async de `StudioRepository` sobre AsyncSession, com as mesmas
+    consultas da versão síncrona.
+    """
+
+    @staticmethod
+    async def create(db: AsyncSession, name: str) -> Studio:
+        """
+        Cria um novo estúdio no banco de dados.
+
+        :param db: Sessão async do banco de dados.
+        :param name: Nome do estúdio.
+        :return: Objeto Studio criado ou existente.
+        """
+        studio = Studio(name=name)
+        db.add(studio)
+        try:
+            await AsyncGenerationRepository.bump(db, "studios")
+            await db.commit()
+            await db.refresh(studio)
+            logger.info(f"Novo estúdio cadastrado: {name}")
+            return studio
+        except IntegrityError:
+            await db.rollback()
+            existing_studio = await AsyncStudioRepository.get_by_name(db, name)
+            if existing_studio is not None:
+                logger.warning(
+                    f"Estúdio '{name}' já existe, retornando instância existente."
+                )
+                return existing_studio
+
+            logger.error(f"Erro inesperado ao inserir estúdio '{name}'.")
+            raise ValueError(f"Erro ao recuperar estúdio '{name}' após IntegrityError.")
+
+    @staticmethod
+    async def get_by_id(db: AsyncSession, studio_id: int) -> Optional[Studio]:
+        """
+        Busca um estúdio pelo ID.
+
+        :param db: Sessão async do banco de dados.
+        :param studio_id: ID do estúdio.
+        :return: Objeto Studio se encontrado, caso contrário, None.
+        """
+        result = await db.scalars(StudioRepository._BY_ID, {"studio_id": studio_id})
+        studio = result.first()
+        if studio is None:
+            logger.warning(f"Estúdio com ID {studio_id} não encontrado.")
+        return studio
+
+    @staticmethod
+    async def get_by_name(db: AsyncSession, name: str) -> Optional[Studio]:
+        """
+        Busca um estúdio pelo nome.
+
+        :param db: Sessão async do banco de dados.
+        :param name: Nome do estúdio.
+        :return: Objeto Studio se encontrado, caso contrário, None.
+        """
+        result = await db.scalars(StudioRepository._BY_NAME, {"name": name})
+        return result.first()
+
+    @staticmethod
+    async def get_by_ids(db: AsyncSession, ids: Sequence[int]) -> List[Studio]:
+        """
+        Busca vários estúdios pelos IDs, com uma consulta `IN (...)` por bloco.
+
+        :param db: Sessão async do banco de dados.
+        :param ids: IDs procurados (repetições são ignoradas).
+        :return: Estúdios encontrados, em qualquer ordem.
+        """
+        found: List[Studio] = []
+        for chunk in chunked(list(dict.fromkeys(ids)), Config.IN_CLAUSE_CHUNK_SIZE):
+            found.extend(await db.scalars(select(Studio).where(Studio.id.in_(chunk))))
+        return found
+
+    @staticmethod
+    async def get_by_names(db: AsyncSession, names: Sequence[str]) -> List[Studio]:
+        """
+        Busca vários estúdios pelos nomes, com uma consulta `IN (...)` por bloco.
+
+        :param db: Sessão async do banco de dados.
+        :param names: Nomes procurados (repetições são ignoradas).
+        :return: Estúdios encontrados, em qualquer ordem.
+        """
+        found: List[Studio] = []
+        for chunk in chunked(list(dict.fromkeys(names)), Config.IN_CLAUSE_CHUNK_SIZE):
+            found.extend(await db.scalars(select(Studio).where(Studio.name.in_(chunk))))
+        return found
+
+    @staticmethod
+    async def search(db: AsyncSession, query: str, limit: int) -> Sequence[Row[Any]]:
+        """
+        Busca estúdios pelo início do nome, sem diferenciar maiúsculas nem
+        acentos (ver `StudioRepository.search`).
+
+        :param db: Sessão async do banco de dados.
+        :param query: Prefixo digitado pelo usuário.
+        :param limit: Quantidade máxima de resultados.
+        :return: Linhas (name, id) ordenadas pelo nome normalizado.
+        """
+        stmt = StudioRepository._search_statement(query, limit)
+        return (await db.execute(stmt)).all()
+
+    @staticmethod
+    async def get_all_rows(
+        db: AsyncSession,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        columns: Sequence[str] = StudioRepository.COLUMNS,
+    ) -> Sequence[Row[Any]]:
+        """
+        Retorna os estúdios como tuplas, ordenadas por ID,
+        sem instanciar entidades ORM.
+
+        :param db: Sessão async do banco de dados.
+        :param limit: Quantidade máxima de registros retornados (None para todos).
+        :param after_id: Retorna apenas registros com ID maior que este valor.
+        :param columns: Colunas selecionadas, na ordem das tuplas retornadas.
+        :return: Lista de linhas.
+        """
+        stmt = StudioRepository._select_rows(limit, after_id, columns)
+        return (await db.execute(stmt)).all()
+
+    @staticmethod
+    async def stream_all(
+        db: AsyncSession, after_id: Optional[int] = None, batch_size: int = 500
+    ) -> AsyncIterator[Studio]:
+        """
+        Percorre os estúdios ordenados por ID com um cursor do servidor, em
+        lotes (`yield_per`), sem materializar a tabela inteira em memória.
+
+        :param db: Sessão async do banco de dados.
+        :param after_id: Retorna apenas registros com ID maior que este valor.
+        :param batch_size: Quantidade de registros carregados por lote.
+        :return: Iterador async de objetos Studio.
+        """
+        stmt = StudioRepository._select_all(after_id)
+        result = await db.stream_scalars(stmt.execution_options(yield_per=batch_size))
+        async for studio in result:
+            yield studio
+
+    @staticmethod
+    async def resolve_names(db: AsyncSession, names: Sequence[str]) -> Dict[str, int]:
+        """
+        Resolve nomes de estúdios em IDs de forma set-based: uma consulta
+        `IN (...)` por bloco e um único INSERT em lote para os nomes que ainda
+        não existem. Não faz commit, para compor uma transação maior.
+
+        :param db: Sessão async do banco de dados.
+        :param names: Nomes a resolver (repetições são ignoradas).
+        :return: Dicionário nome -> ID.
+        """
+        unique = list(dict.fromkeys(names))
+        ids = await AsyncStudioRepository._ids_by_name(db, unique)
+
+        missing = [name for name in unique if name not in ids]
+        if missing:
+            await db.execute(insert(Studio), [{"name": name} for name in missing])
+            await AsyncGenerationRepository.bump(db, "studios")
+            ids.update(await AsyncStudioRepository._ids_by_name(db, missing))
+            logger.info(f"{len(missing)} novos estúdios cadastrados em lote.")
+
+        return ids
+
+    @staticmethod
+    async def _ids_by_name(db: AsyncSession, names: Sequence[str]) -> Dict[str, int]:
+        """Busca os IDs dos estúdios pelos nomes, em blocos `IN (...)`."""
+        ids: Dict[str, int] = {}
+        for chunk in chunked(names, Config.IN_CLAUSE_CHUNK_SIZE):
+            stmt = select(Studio.name, Studio.id).where(Studio.name.in_(chunk))
+            result = await db.execute(stmt)
+            ids.update((str(name), int(id_)) for name, id_ in result)
+        return ids
+
+    @staticmethod
+    async def delete(db: AsyncSession, studio_id: int) -> bool:
+        """
+        Remove um estúdio do banco de dados.
+
+        :param db: Sessão async do banco de dados.
+        :param studio_id: ID do estúdio a ser removido.
+        :return: True se o estúdio foi removido, False se não foi encontrado.
+        """
+        if await AsyncStudioRepository.delete_many(db, [studio_id]):
+            logger.info(f"Estúdio com ID {studio_id} removido com sucesso.")
+            return True
+
+        logger.warning(
+            f"Tentativa de remover estúdio com ID {studio_id}, mas ele não existe."
+        )
+        return False
+
+    @staticmethod
+    async def delete_many(db: AsyncSession, ids: Sequence[int]) -> int:
+        """
+        Remove vários estúdios com um `DELETE ... WHERE id IN (...)` por bloco,
+        sem carregar as entidades, e faz o commit.
+
+        :param db: Sessão async do banco de dados.
+        :param ids: IDs a remover (IDs inexistentes são ignorados).
+        :return: Quantidade de estúdios removidos.
+        """
+        deleted = 0
+        for chunk in chunked(list(dict.fromkeys(ids)), Config.IN_CLAUSE_CHUNK_SIZE):
+            result = await db.execute(delete(Studio).where(Studio.id.in_(chunk)))
+            deleted += cast(CursorResult[Any], result).rowcount
+        # As associações saem pelo ON DELETE CASCADE e alteram a listagem
+        # expandida de filmes
+        if deleted:
+            await AsyncGenerationRepository.bump(db, "studios", "movies")
+        await db.commit()
+        return deleted
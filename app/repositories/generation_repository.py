@@ -0,0 +1,75 @@
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple, cast
+
+from sqlalchemy import Row, Select, Table, Update, func, select, update
+from sqlalchemy.orm import Session
+
+from app.models.data_generation import DataGeneration
+
+data_generations = cast(Table, DataGeneration.__table__)
+
+
+class GenerationRepository:
+    """
+    Repository dos contadores de geração por tabela, usados como validadores
+    (ETag/Last-Modified) das listagens. Por ficarem no banco, valem para
+    todos os processos da aplicação.
+    """
+
+    @staticmethod
+    def bump(db: Session, *tables: str) -> None:
+        """
+        Incrementa a geração das tabelas informadas, sem commit, para que o
+        incremento faça parte da mesma transação da escrita.
+
+        :param db: Sessão do banco de dados.
+        :param tables: Nomes das tabelas alteradas.
+        """
+        db.execute(GenerationRepository._bump_statement(tables))
+
+    @staticmethod
+    def _bump_statement(tables: Sequence[str]) -> Update:
+        """UPDATE que incrementa as gerações (compartilhado com a versão async)."""
+        return (
+            update(data_generations)
+            .where(data_generations.c.table_name.in_(tables))
+            .values(
+                generation=data_generations.c.generation + 1,
+                updated_at=func.now(),
+            )
+        )
+
+    @staticmethod
+    def get(
+        db: Session, tables: Sequence[str]
+    ) -> Tuple[Tuple[int, ...], Optional[datetime]]:
+        """
+        Lê as gerações das tabelas informadas com uma única consulta Core.
+
+        :param db: Sessão do banco de dados.
+        :param tables: Nomes das tabelas, na ordem desejada.
+        :return: Gerações na ordem pedida (0 se ausente) e a alteração mais recente.
+        """
+        rows = db.execute(GenerationRepository._select_generations(tables)).all()
+        return GenerationRepository._read_generations(rows, tables)
+
+    @staticmethod
+    def _select_generations(tables: Sequence[str]) -> Select[Any]:
+        """Consulta das gerações das tabelas informadas."""
+        return select(
+            data_generations.c.table_name,
+            data_generations.c.generation,
+            data_generations.c.updated_at,
+        ).where(data_generations.c.table_name.in_(tables))
+
+    @staticmethod
+    def _read_generations(
+        rows: Sequence[Row[Any]], tables: Sequence[str]
+    ) -> Tuple[Tuple[int, ...], Optional[datetime]]:
+        """Gerações na ordem de `tables` (0 se ausente) e a alteração mais recente."""
+        generations = {str(name): int(generation) for name, generation, _ in rows}
+        updated = [updated_at for _, _, updated_at in rows if updated_at is not None]
+        return (
+            tuple(generations.get(table, 0) for table in tables),
+            max(updated) if updated else None,
+        )
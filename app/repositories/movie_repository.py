@@ -1,17 +1,77 @@
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import (
+    Column,
+    CursorResult,
+    Row,
+    Select,
+    Table,
+    Executable,
+    bindparam,
+    delete,
+    func,
+    insert,
+    select,
+    text,
+)
+from sqlalchemy.orm import Query, Session, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
 from sqlalchemy.exc import IntegrityError, NoResultFound
+from app.config import Config
 from app.models.movie import Movie
-from typing import List, Optional
+from app.models.movie_producer import movie_producer
+from app.models.movie_search import MOVIES_FTS_TABLE
+from app.models.movie_studio import movie_studio
+from app.models.producer import Producer
+from app.models.studio import Studio
+from app.repositories.generation_repository import GenerationRepository
+from app.schemas.movie import MovieFilter
+from app.utils.chunking import chunked
+from app.utils.text import fts_query
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 from loguru import logger
 
+Statement = TypeVar("Statement", Select[Any], Query[Movie])
+
 
 class MovieRepository:
     """
     Repository responsável por operações no banco de dados relacionadas a filmes.
     """
 
+    # Colunas na ordem em que aparecem nos schemas de resposta
+    COLUMNS = ("title", "year", "winner", "id")
+
+    # Tabela de associação, modelo e chave estrangeira de cada expansão
+    RELATIONS: Dict[str, Tuple[Table, Type[Producer] | Type[Studio], Column]] = {
+        "producers": (movie_producer, Producer, movie_producer.c.producer_id),
+        "studios": (movie_studio, Studio, movie_studio.c.studio_id),
+    }
+
+    # Consultas das buscas mais frequentes, montadas uma única vez: os valores
+    # entram como parâmetros e o SQL compilado é reaproveitado do cache
+    _BY_ID = select(Movie).where(Movie.id == bindparam("movie_id"))
+    _BY_TITLE = select(Movie).where(Movie.title == bindparam("title")).limit(1)
+    _WINNERS = (
+        select(Movie)
+        .where(Movie.winner.is_(True))
+        .options(selectinload(Movie.producers), selectinload(Movie.studios))
+        .order_by(Movie.year)
+    )
+
     @staticmethod
-    def create(db: Session, title: str, year: int, winner: bool) -> Movie:
+    def create(
+        db: Session, title: str, year: int, winner: bool, bump: bool = True
+    ) -> Movie:
         """
          Cria um novo filme e o salva no banco de dados.
 
@@ -20,6 +80,8 @@ class MovieRepository:
             title (str): Título do filme.
             year (int): Ano de lançamento do filme.
             winner (bool): Indica se o filme foi vencedor do prêmio.
+            bump (bool): Incrementa a geração de movies; a importação de CSV
+                desliga e incrementa uma única vez ao final.
 
         Returns:
             Movie: Objeto Movie criado ou existente.
@@ -27,6 +89,8 @@ class MovieRepository:
         movie = Movie(title=title, year=year, winner=winner)
         db.add(movie)
         try:
+            if bump:
+                GenerationRepository.bump(db, "movies")
             db.commit()
             db.refresh(movie)
             logger.info(f"Novo filme cadastrado: {title} ({year}) - {winner}")
@@ -57,11 +121,10 @@ class MovieRepository:
         Returns:
             Optional[Movie]: O filme encontrado ou None se não existir.
         """
-        try:
-            return db.query(Movie).filter(Movie.id == movie_id).one()
-        except NoResultFound:
+        movie = db.scalars(MovieRepository._BY_ID, {"movie_id": movie_id}).first()
+        if movie is None:
             logger.warning(f"Filme com ID {movie_id} não encontrado.")
-            return None
+        return movie
 
     @staticmethod
     def get_by_title(db: Session, title: str) -> Optional[Movie]:
@@ -72,26 +135,321 @@ class MovieRepository:
         :param title: Título do filme.
         :return: Objeto Movie se encontrado, caso contrário, None.
         """
-        return db.query(Movie).filter(Movie.title == title).first()
+        return db.scalars(MovieRepository._BY_TITLE, {"title": title}).first()
 
     @staticmethod
-    def get_all(db: Session, expand: List[str] = []) -> List[Movie]:
+    def get_by_ids(db: Session, ids: Sequence[int]) -> List[Movie]:
         """
-        Retorna todos os filmes do banco, podendo opcionalmente carregar
-        produtores e estúdios.
+        Busca vários filmes pelos IDs, com uma consulta `IN (...)` por bloco.
 
         :param db: Sessão do banco de dados.
-        :param expand: Lista de expansões desejadas, ex: ["producers", "studios"]
-        :return: Lista de objetos Movie.
+        :param ids: IDs procurados (repetições são ignoradas).
+        :return: Filmes encontrados, em qualquer ordem.
+        """
+        found: List[Movie] = []
+        for chunk in chunked(list(dict.fromkeys(ids)), Config.IN_CLAUSE_CHUNK_SIZE):
+            found.extend(db.scalars(select(Movie).where(Movie.id.in_(chunk))))
+        return found
+
+    @staticmethod
+    def get_by_titles(db: Session, titles: Sequence[str]) -> List[Movie]:
+        """
+        Busca vários filmes pelos títulos, com uma consulta `IN (...)` por bloco.
+
+        :param db: Sessão do banco de dados.
+        :param titles: Títulos procurados (repetições são ignoradas).
+        :return: Filmes encontrados, em qualquer ordem.
+        """
+        found: List[Movie] = []
+        for chunk in chunked(list(dict.fromkeys(titles)), Config.IN_CLAUSE_CHUNK_SIZE):
+            found.extend(db.scalars(select(Movie).where(Movie.title.in_(chunk))))
+        return found
+
+    @staticmethod
+    def get_ids_by_titles(db: Session, titles: Sequence[str]) -> Dict[str, int]:
+        """
+        Busca os IDs dos filmes pelos títulos, em blocos `IN (...)`.
+
+        :param db: Sessão do banco de dados.
+        :param titles: Títulos procurados.
+        :return: Dicionário título -> ID dos filmes encontrados.
+        """
+        ids: Dict[str, int] = {}
+        for chunk in chunked(list(dict.fromkeys(titles)), Config.IN_CLAUSE_CHUNK_SIZE):
+            stmt = select(Movie.title, Movie.id).where(Movie.title.in_(chunk))
+            ids.update((str(title), int(id_)) for title, id_ in db.execute(stmt))
+        return ids
+
+    @staticmethod
+    def insert_many(db: Session, movies: Sequence[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Insere vários filmes com um único INSERT em lote, sem commit.
+
+        :param db: Sessão do banco de dados.
+        :param movies: Dicionários com title, year e winner.
+        :return: Dicionário título -> ID dos filmes inseridos.
+        """
+        db.execute(insert(Movie), list(movies))
+        GenerationRepository.bump(db, "movies")
+        logger.info(f"{len(movies)} filmes cadastrados em lote.")
+        return MovieRepository.get_ids_by_titles(db, [m["title"] for m in movies])
+
+    @staticmethod
+    def link_many(db: Session, relation: str, pairs: Sequence[Tuple[int, int]]) -> None:
+        """
+        Associa filmes a produtores ou estúdios com um único INSERT em lote,
+        sem commit.
+
+        :param db: Sessão do banco de dados.
+        :param relation: "producers" ou "studios".
+        :param pairs: Pares (movie_id, id do produtor ou estúdio).
+        """
+        if not pairs:
+            return
+        association, _, foreign_key = MovieRepository.RELATIONS[relation]
+        db.execute(
+            insert(association),
+            [{"movie_id": movie_id, foreign_key.key: id_} for movie_id, id_ in pairs],
+        )
+        GenerationRepository.bump(db, "movies")
+
+    @staticmethod
+    def search_titles(db: Session, query: str, limit: int) -> Sequence[Row[Any]]:
+        """
+        Busca filmes por palavras do título, ordenados por relevância.
+
+        No SQLite usa a tabela FTS5 `movies_fts` (ranking bm25, última palavra
+        como prefixo); no Postgres, o índice de trigramas com `ILIKE`,
+        ordenando pela similaridade.
+
+        :param db: Sessão do banco de dados.
+        :param query: Texto digitado pelo usuário.
+        :param limit: Quantidade máxima de resultados.
+        :return: Linhas (title, year, winner, id).
         """
-        query = db.query(Movie)
+        stmt = MovieRepository._search_statement(
+            db.get_bind().dialect.name, query, limit
+        )
+        return [] if stmt is None else db.execute(stmt).all()
 
+    @staticmethod
+    def _search_statement(dialect: str, query: str, limit: int) -> Optional[Executable]:
+        """
+        Consulta da busca por título no banco `dialect` (None quando o texto
+        não tem nenhuma palavra pesquisável). Compartilhada com
+        `AsyncMovieRepository`.
+        """
+        if dialect == "sqlite":
+            match = fts_query(query)
+            if not match:
+                return None
+            return (
+                text(
+                    f"SELECT movies.title, movies.year, movies.winner, movies.id "
+                    f"FROM {MOVIES_FTS_TABLE} "
+                    f"JOIN movies ON movies.id = {MOVIES_FTS_TABLE}.rowid "
+                    f"WHERE {MOVIES_FTS_TABLE} MATCH :match "
+                    f"ORDER BY {MOVIES_FTS_TABLE}.rank, movies.id LIMIT :limit"
+                )
+                .columns(Movie.title, Movie.year, Movie.winner, Movie.id)
+                .bindparams(match=match, limit=limit)
+            )
+
+        similar = select(Movie.title, Movie.year, Movie.winner, Movie.id).where(
+            Movie.title.icontains(query, autoescape=True)
+        )
+        if dialect == "postgresql":
+            similar = similar.order_by(func.similarity(Movie.title, query).desc())
+        return similar.order_by(Movie.id).limit(limit)
+
+    @staticmethod
+    def _expand_options(expand: List[str]) -> List[LoaderOption]:
+        """
+        Opções de carregamento para as expansões solicitadas.
+
+        Usa selectinload (uma consulta `IN (...)` por relacionamento) em vez de
+        joinedload: juntar produtores e estúdios na mesma consulta multiplica
+        cada filme por produtores x estúdios.
+        """
+        options: List[LoaderOption] = []
         if "producers" in expand:
-            query = query.options(joinedload(Movie.producers))
+            options.append(selectinload(Movie.producers))
         if "studios" in expand:
-            query = query.options(joinedload(Movie.studios))
+            options.append(selectinload(Movie.studios))
+        return options
+
+    @staticmethod
+    def _apply_filters(stmt: Statement, filters: Optional[MovieFilter]) -> Statement:
+        """
+        Aplica os filtros de ano, vencedor, produtor e estúdio na consulta.
+
+        O filtro de vencedor usa `IS` para coincidir com o predicado do índice
+        parcial `ix_movies_winners_year`.
+        """
+        if filters is None:
+            return stmt
+        if filters.year is not None:
+            stmt = stmt.where(Movie.year == filters.year)
+        if filters.year_from is not None:
+            stmt = stmt.where(Movie.year >= filters.year_from)
+        if filters.year_to is not None:
+            stmt = stmt.where(Movie.year <= filters.year_to)
+        if filters.winner is not None:
+            stmt = stmt.where(Movie.winner.is_(filters.winner))
+        for relation, related_id in (
+            ("producers", filters.producer_id),
+            ("studios", filters.studio_id),
+        ):
+            if related_id is not None:
+                # Usa o índice (producer_id, movie_id) / (studio_id, movie_id)
+                association, _, foreign_key = MovieRepository.RELATIONS[relation]
+                stmt = stmt.where(
+                    Movie.id.in_(
+                        select(association.c.movie_id).where(foreign_key == related_id)
+                    )
+                )
+        return stmt
+
+    @staticmethod
+    def _select_movies(
+        expand: List[str],
+        after_id: Optional[int] = None,
+        filters: Optional[MovieFilter] = None,
+    ) -> Select[Tuple[Movie]]:
+        """Consulta dos filmes ordenados por ID, com expansões, filtros e cursor."""
+        stmt = select(Movie).options(*MovieRepository._expand_options(expand))
+        stmt = MovieRepository._apply_filters(stmt, filters)
+        if after_id is not None:
+            stmt = stmt.where(Movie.id > after_id)
+        return stmt.order_by(Movie.id)
+
+    @staticmethod
+    def get_all(
+        db: Session,
+        expand: List[str] = [],
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        filters: Optional[MovieFilter] = None,
+    ) -> List[Movie]:
+        """
+        Retorna os filmes do banco ordenados por ID, podendo opcionalmente
+        carregar produtores e estúdios, filtrar e paginar por cursor (keyset).
+
+        :param db: Sessão do banco de dados.
+        :param expand: Lista de expansões desejadas, ex: ["producers", "studios"]
+        :param limit: Quantidade máxima de filmes retornados (None para todos).
+        :param after_id: Retorna apenas filmes com ID maior que este valor.
+        :param filters: Filtros de ano e vencedor.
+        :return: Lista de objetos Movie.
+        """
+        stmt = MovieRepository._select_movies(expand, after_id, filters)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return list(db.scalars(stmt))
+
+    @staticmethod
+    def get_all_rows(
+        db: Session,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        columns: Sequence[str] = COLUMNS,
+        filters: Optional[MovieFilter] = None,
+    ) -> Sequence[Row[Any]]:
+        """
+        Retorna as colunas dos filmes como tuplas, ordenadas por ID, sem
+        instanciar entidades ORM.
+
+        :param db: Sessão do banco de dados.
+        :param limit: Quantidade máxima de filmes retornados (None para todos).
+        :param after_id: Retorna apenas filmes com ID maior que este valor.
+        :param columns: Colunas selecionadas, na ordem das tuplas retornadas.
+        :param filters: Filtros de ano e vencedor.
+        :return: Lista de linhas.
+        """
+        return db.execute(
+            MovieRepository._select_rows(limit, after_id, columns, filters)
+        ).all()
+
+    @staticmethod
+    def _select_rows(
+        limit: Optional[int],
+        after_id: Optional[int],
+        columns: Sequence[str],
+        filters: Optional[MovieFilter],
+    ) -> Select[Any]:
+        """Consulta das colunas dos filmes ordenadas por ID (ver `get_all_rows`)."""
+        stmt = select(*(getattr(Movie, column) for column in columns))
+        stmt = MovieRepository._apply_filters(stmt, filters)
+        if after_id is not None:
+            stmt = stmt.where(Movie.id > after_id)
+
+        stmt = stmt.order_by(Movie.id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return stmt
+
+    @staticmethod
+    def get_related_rows(
+        db: Session, relation: str, movie_ids: Optional[Sequence[int]] = None
+    ) -> List[Row[Any]]:
+        """
+        Retorna os produtores ou estúdios associados aos filmes como tuplas
+        (movie_id, id, name), ordenadas por filme e pelo ID do relacionado.
+
+        :param db: Sessão do banco de dados.
+        :param relation: "producers" ou "studios".
+        :param movie_ids: Filmes de interesse (None para todas as associações).
+        :return: Lista de linhas.
+        """
+        rows: List[Row[Any]] = []
+        for stmt in MovieRepository._related_statements(relation, movie_ids):
+            rows.extend(db.execute(stmt).all())
+        return rows
+
+    @staticmethod
+    def _related_statements(
+        relation: str, movie_ids: Optional[Sequence[int]]
+    ) -> List[Select[Any]]:
+        """
+        Consultas de `get_related_rows`: uma só para todas as associações ou
+        uma `IN (...)` por bloco de filmes.
+        """
+        association, model, foreign_key = MovieRepository.RELATIONS[relation]
+        stmt = (
+            select(association.c.movie_id, model.id, model.name)
+            .join(model, model.id == foreign_key)
+            .order_by(association.c.movie_id, model.id)
+        )
+
+        if movie_ids is None:
+            return [stmt]
+        return [
+            stmt.where(association.c.movie_id.in_(chunk))
+            for chunk in chunked(movie_ids, Config.IN_CLAUSE_CHUNK_SIZE)
+        ]
+
+    @staticmethod
+    def iter_all(
+        db: Session,
+        expand: List[str] = [],
+        after_id: Optional[int] = None,
+        batch_size: int = 500,
+        filters: Optional[MovieFilter] = None,
+    ) -> Iterator[Movie]:
+        """
+        Percorre os filmes ordenados por ID em lotes (`yield_per`), sem
+        materializar a tabela inteira em memória.
 
-        return query.all()
+        :param db: Sessão do banco de dados.
+        :param expand: Lista de expansões desejadas, ex: ["producers", "studios"]
+        :param after_id: Retorna apenas filmes com ID maior que este valor.
+        :param batch_size: Quantidade de filmes carregados por lote.
+        :param filters: Filtros de ano e vencedor.
+        :return: Iterador de objetos Movie.
+        """
+        stmt = MovieRepository._select_movies(expand, after_id, filters)
+        return iter(db.scalars(stmt.execution_options(yield_per=batch_size)))
 
     @staticmethod
     def delete(db: Session, movie_id: int) -> bool:
@@ -102,11 +460,8 @@ class MovieRepository:
         :param movie_id: ID do filme a ser removido.
         :return: True se o filme foi removido, False se não foi encontrado.
         """
-        movie = db.query(Movie).filter(Movie.id == movie_id).first()
-        if movie:
-            db.delete(movie)
-            db.commit()
-            logger.info(f"Filme '{movie.title}' removido com sucesso.")
+        if MovieRepository.delete_many(db, [movie_id]):
+            logger.info(f"Filme com ID {movie_id} removido com sucesso.")
             return True
 
         logger.warning(
@@ -114,19 +469,36 @@ class MovieRepository:
         )
         return False
 
+    @staticmethod
+    def delete_many(db: Session, ids: Sequence[int]) -> int:
+        """
+        Remove vários filmes com um `DELETE ... WHERE id IN (...)` por bloco,
+        sem carregar as entidades, e faz o commit.
+
+        :param db: Sessão do banco de dados.
+        :param ids: IDs a remover (IDs inexistentes são ignorados).
+        :return: Quantidade de filmes removidos.
+        """
+        deleted = 0
+        for chunk in chunked(list(dict.fromkeys(ids)), Config.IN_CLAUSE_CHUNK_SIZE):
+            result = db.execute(delete(Movie).where(Movie.id.in_(chunk)))
+            deleted += cast(CursorResult[Any], result).rowcount
+        # As associações saem pelo ON DELETE CASCADE, sem carregar as coleções
+        if deleted:
+            GenerationRepository.bump(db, "movies")
+        db.commit()
+        return deleted
+
     @staticmethod
     def get_winning_movies(db: Session) -> List[Movie]:
         """
         Retorna todos os filmes vencedores e
         inclui os produtores e estúdios associados.
 
+        Usa o índice parcial `ix_movies_winners_year`, que já entrega os
+        vencedores ordenados por ano.
+
         :param db: Sessão do banco de dados.
         :return: Lista de filmes vencedores.
         """
-        return (
-            db.query(Movie)
-            .filter(Movie.winner.is_(True))
-            .options(joinedload(Movie.producers), joinedload(Movie.studios))
-            .order_by(Movie.year)
-            .all()
-        )
+        return list(db.scalars(MovieRepository._WINNERS))
@@ -1,6 +1,12 @@
+from sqlalchemy import CursorResult, Row, Select, bindparam, delete, insert, select
 from sqlalchemy.orm import Session
+from app.config import Config
+from app.db.routing import use_primary
 from app.models.producer import Producer
-from typing import List, Optional
+from app.repositories.generation_repository import GenerationRepository
+from app.utils.chunking import chunked
+from app.utils.text import normalize_name, prefix_upper_bound
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, cast
 from sqlalchemy.exc import IntegrityError, NoResultFound
 from loguru import logger
 
@@ -10,18 +16,29 @@ class ProducerRepository:
     Repository responsável por operações no banco de dados relacionadas aos produtores.
     """
 
+    # Colunas na ordem em que aparecem nos schemas de resposta
+    COLUMNS = ("name", "id")
+
+    # Buscas por ID e nome montadas uma única vez (SQL compilado reaproveitado)
+    _BY_ID = select(Producer).where(Producer.id == bindparam("producer_id"))
+    _BY_NAME = select(Producer).where(Producer.name == bindparam("name")).limit(1)
+
     @staticmethod
-    def create(db: Session, name: str) -> Producer:
+    def create(db: Session, name: str, bump: bool = True) -> Producer:
         """
         Cria um novo produtor no banco de dados.
 
         :param db: Sessão do banco de dados.
         :param name: Nome do produtor.
+        :param bump: Incrementa a geração de producers; a importação de CSV
+            desliga e incrementa uma única vez ao final.
         :return: Objeto Producer.
         """
         producer = Producer(name=name)
         db.add(producer)
         try:
+            if bump:
+                GenerationRepository.bump(db, "producers")
             db.commit()
             db.refresh(producer)
             logger.info(f"Novo produtor cadastrado: {name}")
@@ -49,11 +66,12 @@ class ProducerRepository:
         :param producer_id: ID do produtor.
         :return: Objeto Producer se encontrado, caso contrário, None.
         """
-        try:
-            return db.query(Producer).filter(Producer.id == producer_id).one()
-        except NoResultFound:
+        producer = db.scalars(
+            ProducerRepository._BY_ID, {"producer_id": producer_id}
+        ).first()
+        if producer is None:
             logger.warning(f"Produtor com ID {producer_id} não encontrado.")
-            return None
+        return producer
 
     @staticmethod
     def get_by_name(db: Session, name: str) -> Optional[Producer]:
@@ -64,32 +82,192 @@ class ProducerRepository:
         :param name: Nome do produtor.
         :return: Objeto Producer se encontrado, caso contrário, None.
         """
-        return db.query(Producer).filter(Producer.name == name).first()
+        return db.scalars(ProducerRepository._BY_NAME, {"name": name}).first()
+
+    @staticmethod
+    def get_by_ids(db: Session, ids: Sequence[int]) -> List[Producer]:
+        """
+        Busca vários produtores pelos IDs, com uma consulta `IN (...)` por bloco.
+
+        :param db: Sessão do banco de dados.
+        :param ids: IDs procurados (repetições são ignoradas).
+        :return: Produtores encontrados, em qualquer ordem.
+        """
+        found: List[Producer] = []
+        for chunk in chunked(list(dict.fromkeys(ids)), Config.IN_CLAUSE_CHUNK_SIZE):
+            found.extend(db.scalars(select(Producer).where(Producer.id.in_(chunk))))
+        return found
+
+    @staticmethod
+    def get_by_names(db: Session, names: Sequence[str]) -> List[Producer]:
+        """
+        Busca vários produtores pelos nomes, com uma consulta `IN (...)` por bloco.
+
+        :param db: Sessão do banco de dados.
+        :param names: Nomes procurados (repetições são ignoradas).
+        :return: Produtores encontrados, em qualquer ordem.
+        """
+        found: List[Producer] = []
+        for chunk in chunked(list(dict.fromkeys(names)), Config.IN_CLAUSE_CHUNK_SIZE):
+            found.extend(db.scalars(select(Producer).where(Producer.name.in_(chunk))))
+        return found
 
     @staticmethod
-    def get_all(db: Session) -> List[Producer]:
+    def search(db: Session, query: str, limit: int) -> Sequence[Row[Any]]:
         """
-        Retorna todos os produtores cadastrados no banco.
+        Busca produtores pelo início do nome, sem diferenciar maiúsculas nem
+        acentos. A busca é um intervalo sobre `name_normalized`
+        (`>= prefixo AND < limite`), que percorre apenas o trecho do índice
+        com os nomes procurados, já na ordem do resultado.
 
         :param db: Sessão do banco de dados.
+        :param query: Prefixo digitado pelo usuário.
+        :param limit: Quantidade máxima de resultados.
+        :return: Linhas (name, id) ordenadas pelo nome normalizado.
+        """
+        return db.execute(ProducerRepository._search_statement(query, limit)).all()
+
+    @staticmethod
+    def _search_statement(query: str, limit: int) -> Select[Any]:
+        """Consulta da busca por prefixo do nome (ver `search`)."""
+        prefix = normalize_name(query)
+        stmt = select(Producer.name, Producer.id).where(
+            Producer.name_normalized >= prefix
+        )
+        upper = prefix_upper_bound(prefix)
+        if upper is not None:
+            stmt = stmt.where(Producer.name_normalized < upper)
+
+        return stmt.order_by(Producer.name_normalized, Producer.id).limit(limit)
+
+    @staticmethod
+    def _select_all(after_id: Optional[int] = None) -> Select[Tuple[Producer]]:
+        """Consulta das entidades ordenadas por ID, a partir do cursor."""
+        stmt = select(Producer)
+        if after_id is not None:
+            stmt = stmt.where(Producer.id > after_id)
+        return stmt.order_by(Producer.id)
+
+    @staticmethod
+    def get_all(
+        db: Session, limit: Optional[int] = None, after_id: Optional[int] = None
+    ) -> List[Producer]:
+        """
+        Retorna os produtores cadastrados no banco ordenados por ID,
+        com paginação opcional por cursor (keyset).
+
+        :param db: Sessão do banco de dados.
+        :param limit: Quantidade máxima de registros retornados (None para todos).
+        :param after_id: Retorna apenas registros com ID maior que este valor.
         :return: Lista de objetos Producer.
         """
-        return db.query(Producer).all()
+        stmt = ProducerRepository._select_all(after_id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return list(db.scalars(stmt))
+
+    @staticmethod
+    def get_all_rows(
+        db: Session,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        columns: Sequence[str] = COLUMNS,
+    ) -> Sequence[Row[Any]]:
+        """
+        Retorna os produtores como tuplas, ordenadas por ID,
+        sem instanciar entidades ORM.
+
+        :param db: Sessão do banco de dados.
+        :param limit: Quantidade máxima de registros retornados (None para todos).
+        :param after_id: Retorna apenas registros com ID maior que este valor.
+        :param columns: Colunas selecionadas, na ordem das tuplas retornadas.
+        :return: Lista de linhas.
+        """
+        return db.execute(
+            ProducerRepository._select_rows(limit, after_id, columns)
+        ).all()
+
+    @staticmethod
+    def _select_rows(
+        limit: Optional[int], after_id: Optional[int], columns: Sequence[str]
+    ) -> Select[Any]:
+        """Consulta das colunas ordenadas por ID (ver `get_all_rows`)."""
+        stmt = select(*(getattr(Producer, column) for column in columns))
+        if after_id is not None:
+            stmt = stmt.where(Producer.id > after_id)
+
+        stmt = stmt.order_by(Producer.id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return stmt
+
+    @staticmethod
+    def iter_all(
+        db: Session, after_id: Optional[int] = None, batch_size: int = 500
+    ) -> Iterator[Producer]:
+        """
+        Percorre os produtores ordenados por ID em lotes (`yield_per`), sem
+        materializar a tabela inteira em memória.
+
+        :param db: Sessão do banco de dados.
+        :param after_id: Retorna apenas registros com ID maior que este valor.
+        :param batch_size: Quantidade de registros carregados por lote.
+        :return: Iterador de objetos Producer.
+        """
+        stmt = ProducerRepository._select_all(after_id)
+        return iter(db.scalars(stmt.execution_options(yield_per=batch_size)))
+
+    @staticmethod
+    def resolve_names(db: Session, names: Sequence[str]) -> Dict[str, int]:
+        """
+        Resolve nomes de produtores em IDs de forma set-based: uma consulta
+        `IN (...)` por bloco e um único INSERT em lote para os nomes que ainda
+        não existem. Não faz commit, para compor uma transação maior.
+
+        :param db: Sessão do banco de dados.
+        :param names: Nomes a resolver (repetições são ignoradas).
+        :return: Dicionário nome -> ID.
+        """
+        unique = list(dict.fromkeys(names))
+        use_primary(db)  # a busca decide o INSERT dos que faltam
+        ids = ProducerRepository._ids_by_name(db, unique)
+
+        missing = [name for name in unique if name not in ids]
+        if missing:
+            db.execute(insert(Producer), [{"name": name} for name in missing])
+            GenerationRepository.bump(db, "producers")
+            ids.update(ProducerRepository._ids_by_name(db, missing))
+            logger.info(f"{len(missing)} novos produtores cadastrados em lote.")
+
+        return ids
+
+    @staticmethod
+    def _ids_by_name(db: Session, names: Sequence[str]) -> Dict[str, int]:
+        """Busca os IDs dos produtores pelos nomes, em blocos `IN (...)`."""
+        ids: Dict[str, int] = {}
+        for chunk in chunked(names, Config.IN_CLAUSE_CHUNK_SIZE):
+            stmt = select(Producer.name, Producer.id).where(Producer.name.in_(chunk))
+            ids.update((str(name), int(id_)) for name, id_ in db.execute(stmt))
+        return ids
 
     @classmethod
-    def create_multiple(cls, db: Session, producer_names: List[str]) -> List[Producer]:
+    def create_multiple(
+        cls, db: Session, producer_names: List[str], bump: bool = True
+    ) -> List[Producer]:
         """
         Busca ou cria múltiplos produtores de uma só vez.
 
         :param db: Sessão do banco de dados.
         :param producer_names: Lista de nomes dos produtores.
+        :param bump: Incrementa a geração a cada produtor criado.
         :return: Lista de objetos Producer.
         """
         producers = []
 
         for name in set(producer_names):  # Remove duplicados da lista de entrada
             try:
-                producer = cls.create(db, name)
+                producer = cls.create(db, name, bump)
                 producers.append(producer)
             except Exception as e:
                 logger.error(f"Erro ao processar produtor '{name}': {e}")
@@ -105,14 +283,32 @@ class ProducerRepository:
         :param producer_id: ID do produtor a ser removido.
         :return: True se o produtor foi removido, False se não foi encontrado.
         """
-        producer = db.query(Producer).filter(Producer.id == producer_id).first()
-        if producer:
-            db.delete(producer)
-            db.commit()
-            logger.info(f"Produtor '{producer.name}' removido com sucesso.")
+        if ProducerRepository.delete_many(db, [producer_id]):
+            logger.info(f"Produtor com ID {producer_id} removido com sucesso.")
             return True
 
         logger.warning(
             f"Tentativa de remover produtor com ID {producer_id}, mas ele não existe."
         )
         return False
+
+    @staticmethod
+    def delete_many(db: Session, ids: Sequence[int]) -> int:
+        """
+        Remove vários produtores com um `DELETE ... WHERE id IN (...)` por bloco,
+        sem carregar as entidades, e faz o commit.
+
+        :param db: Sessão do banco de dados.
+        :param ids: IDs a remover (IDs inexistentes são ignorados).
+        :return: Quantidade de produtores removidos.
+        """
+        deleted = 0
+        for chunk in chunked(list(dict.fromkeys(ids)), Config.IN_CLAUSE_CHUNK_SIZE):
+            result = db.execute(delete(Producer).where(Producer.id.in_(chunk)))
+            deleted += cast(CursorResult[Any], result).rowcount
+        # As associações saem pelo ON DELETE CASCADE e alteram a listagem
+        # expandida de filmes
+        if deleted:
+            GenerationRepository.bump(db, "producers", "movies")
+        db.commit()
+        return deleted
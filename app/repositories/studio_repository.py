@@ -1,6 +1,12 @@
+from sqlalchemy import CursorResult, Row, Select, bindparam, delete, insert, select
 from sqlalchemy.orm import Session
+from app.config import Config
+from app.db.routing import use_primary
 from app.models.studio import Studio
-from typing import List, Optional
+from app.repositories.generation_repository import GenerationRepository
+from app.utils.chunking import chunked
+from app.utils.text import normalize_name, prefix_upper_bound
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, cast
 from sqlalchemy.exc import IntegrityError, NoResultFound
 from loguru import logger
 
@@ -10,18 +16,29 @@ class StudioRepository:
     Repository responsável por operações no banco de dados relacionadas aos estúdios.
     """
 
+    # Colunas na ordem em que aparecem nos schemas de resposta
+    COLUMNS = ("name", "id")
+
+    # Buscas por ID e nome montadas uma única vez (SQL compilado reaproveitado)
+    _BY_ID = select(Studio).where(Studio.id == bindparam("studio_id"))
+    _BY_NAME = select(Studio).where(Studio.name == bindparam("name")).limit(1)
+
     @staticmethod
-    def create(db: Session, name: str) -> Studio:
+    def create(db: Session, name: str, bump: bool = True) -> Studio:
         """
         Cria um novo estúdio no banco de dados.
 
         :param db: Sessão do banco de dados.
         :param name: Nome do estúdio.
+        :param bump: Incrementa a geração de studios; a importação de CSV
+            desliga e incrementa uma única vez ao final.
         :return: Objeto Studio.
         """
         studio = Studio(name=name)
         db.add(studio)
         try:
+            if bump:
+                GenerationRepository.bump(db, "studios")
             db.commit()
             db.refresh(studio)
             logger.info(f"Novo estúdio cadastrado: {name}")
@@ -47,11 +64,10 @@ class StudioRepository:
         :param studio_id: ID do estúdio.
         :return: Objeto Studio se encontrado, caso contrário, None.
         """
-        try:
-            return db.query(Studio).filter(Studio.id == studio_id).one()
-        except NoResultFound:
+        studio = db.scalars(StudioRepository._BY_ID, {"studio_id": studio_id}).first()
+        if studio is None:
             logger.warning(f"Estúdio com ID {studio_id} não encontrado.")
-            return None
+        return studio
 
     @staticmethod
     def get_by_name(db: Session, name: str) -> Optional[Studio]:
@@ -62,32 +78,188 @@ class StudioRepository:
         :param name: Nome do estúdio.
         :return: Objeto Studio se encontrado, caso contrário, None.
         """
-        return db.query(Studio).filter(Studio.name == name).first()
+        return db.scalars(StudioRepository._BY_NAME, {"name": name}).first()
+
+    @staticmethod
+    def get_by_ids(db: Session, ids: Sequence[int]) -> List[Studio]:
+        """
+        Busca vários estúdios pelos IDs, com uma consulta `IN (...)` por bloco.
+
+        :param db: Sessão do banco de dados.
+        :param ids: IDs procurados (repetições são ignoradas).
+        :return: Estúdios encontrados, em qualquer ordem.
+        """
+        found: List[Studio] = []
+        for chunk in chunked(list(dict.fromkeys(ids)), Config.IN_CLAUSE_CHUNK_SIZE):
+            found.extend(db.scalars(select(Studio).where(Studio.id.in_(chunk))))
+        return found
+
+    @staticmethod
+    def get_by_names(db: Session, names: Sequence[str]) -> List[Studio]:
+        """
+        Busca vários estúdios pelos nomes, com uma consulta `IN (...)` por bloco.
+
+        :param db: Sessão do banco de dados.
+        :param names: Nomes procurados (repetições são ignoradas).
+        :return: Estúdios encontrados, em qualquer ordem.
+        """
+        found: List[Studio] = []
+        for chunk in chunked(list(dict.fromkeys(names)), Config.IN_CLAUSE_CHUNK_SIZE):
+            found.extend(db.scalars(select(Studio).where(Studio.name.in_(chunk))))
+        return found
 
     @staticmethod
-    def get_all(db: Session) -> List[Studio]:
+    def search(db: Session, query: str, limit: int) -> Sequence[Row[Any]]:
         """
-        Retorna todos os estúdios cadastrados no banco.
+        Busca estúdios pelo início do nome, sem diferenciar maiúsculas nem
+        acentos. A busca é um intervalo sobre `name_normalized`
+        (`>= prefixo AND < limite`), que percorre apenas o trecho do índice
+        com os nomes procurados, já na ordem do resultado.
 
         :param db: Sessão do banco de dados.
+        :param query: Prefixo digitado pelo usuário.
+        :param limit: Quantidade máxima de resultados.
+        :return: Linhas (name, id) ordenadas pelo nome normalizado.
+        """
+        return db.execute(StudioRepository._search_statement(query, limit)).all()
+
+    @staticmethod
+    def _search_statement(query: str, limit: int) -> Select[Any]:
+        """Consulta da busca por prefixo do nome (ver `search`)."""
+        prefix = normalize_name(query)
+        stmt = select(Studio.name, Studio.id).where(Studio.name_normalized >= prefix)
+        upper = prefix_upper_bound(prefix)
+        if upper is not None:
+            stmt = stmt.where(Studio.name_normalized < upper)
+
+        return stmt.order_by(Studio.name_normalized, Studio.id).limit(limit)
+
+    @staticmethod
+    def _select_all(after_id: Optional[int] = None) -> Select[Tuple[Studio]]:
+        """Consulta das entidades ordenadas por ID, a partir do cursor."""
+        stmt = select(Studio)
+        if after_id is not None:
+            stmt = stmt.where(Studio.id > after_id)
+        return stmt.order_by(Studio.id)
+
+    @staticmethod
+    def get_all(
+        db: Session, limit: Optional[int] = None, after_id: Optional[int] = None
+    ) -> List[Studio]:
+        """
+        Retorna os estúdios cadastrados no banco ordenados por ID,
+        com paginação opcional por cursor (keyset).
+
+        :param db: Sessão do banco de dados.
+        :param limit: Quantidade máxima de registros retornados (None para todos).
+        :param after_id: Retorna apenas registros com ID maior que este valor.
         :return: Lista de objetos Studio.
         """
-        return db.query(Studio).all()
+        stmt = StudioRepository._select_all(after_id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return list(db.scalars(stmt))
+
+    @staticmethod
+    def get_all_rows(
+        db: Session,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        columns: Sequence[str] = COLUMNS,
+    ) -> Sequence[Row[Any]]:
+        """
+        Retorna os estúdios como tuplas, ordenadas por ID,
+        sem instanciar entidades ORM.
+
+        :param db: Sessão do banco de dados.
+        :param limit: Quantidade máxima de registros retornados (None para todos).
+        :param after_id: Retorna apenas registros com ID maior que este valor.
+        :param columns: Colunas selecionadas, na ordem das tuplas retornadas.
+        :return: Lista de linhas.
+        """
+        return db.execute(StudioRepository._select_rows(limit, after_id, columns)).all()
+
+    @staticmethod
+    def _select_rows(
+        limit: Optional[int], after_id: Optional[int], columns: Sequence[str]
+    ) -> Select[Any]:
+        """Consulta das colunas ordenadas por ID (ver `get_all_rows`)."""
+        stmt = select(*(getattr(Studio, column) for column in columns))
+        if after_id is not None:
+            stmt = stmt.where(Studio.id > after_id)
+
+        stmt = stmt.order_by(Studio.id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return stmt
+
+    @staticmethod
+    def iter_all(
+        db: Session, after_id: Optional[int] = None, batch_size: int = 500
+    ) -> Iterator[Studio]:
+        """
+        Percorre os estúdios ordenados por ID em lotes (`yield_per`), sem
+        materializar a tabela inteira em memória.
+
+        :param db: Sessão do banco de dados.
+        :param after_id: Retorna apenas registros com ID maior que este valor.
+        :param batch_size: Quantidade de registros carregados por lote.
+        :return: Iterador de objetos Studio.
+        """
+        stmt = StudioRepository._select_all(after_id)
+        return iter(db.scalars(stmt.execution_options(yield_per=batch_size)))
+
+    @staticmethod
+    def resolve_names(db: Session, names: Sequence[str]) -> Dict[str, int]:
+        """
+        Resolve nomes de estúdios em IDs de forma set-based: uma consulta
+        `IN (...)` por bloco e um único INSERT em lote para os nomes que ainda
+        não existem. Não faz commit, para compor uma transação maior.
+
+        :param db: Sessão do banco de dados.
+        :param names: Nomes a resolver (repetições são ignoradas).
+        :return: Dicionário nome -> ID.
+        """
+        unique = list(dict.fromkeys(names))
+        use_primary(db)  # a busca decide o INSERT dos que faltam
+        ids = StudioRepository._ids_by_name(db, unique)
+
+        missing = [name for name in unique if name not in ids]
+        if missing:
+            db.execute(insert(Studio), [{"name": name} for name in missing])
+            GenerationRepository.bump(db, "studios")
+            ids.update(StudioRepository._ids_by_name(db, missing))
+            logger.info(f"{len(missing)} novos estúdios cadastrados em lote.")
+
+        return ids
+
+    @staticmethod
+    def _ids_by_name(db: Session, names: Sequence[str]) -> Dict[str, int]:
+        """Busca os IDs dos estúdios pelos nomes, em blocos `IN (...)`."""
+        ids: Dict[str, int] = {}
+        for chunk in chunked(names, Config.IN_CLAUSE_CHUNK_SIZE):
+            stmt = select(Studio.name, Studio.id).where(Studio.name.in_(chunk))
+            ids.update((str(name), int(id_)) for name, id_ in db.execute(stmt))
+        return ids
 
     @classmethod
-    def create_multiple(cls, db: Session, studio_names: List[str]) -> List[Studio]:
+    def create_multiple(
+        cls, db: Session, studio_names: List[str], bump: bool = True
+    ) -> List[Studio]:
         """
         Busca ou cria múltiplos estúdios de uma só vez.
 
         :param db: Sessão do banco de dados.
         :param studio_names: Lista de nomes dos estúdios.
+        :param bump: Incrementa a geração a cada estúdio criado.
         :return: Lista de objetos Studio.
         """
         studios = []
 
         for name in set(studio_names):  # Remove duplicados da lista de entrada
             try:
-                studio = cls.create(db, name)
+                studio = cls.create(db, name, bump)
                 studios.append(studio)
             except Exception as e:
                 logger.error(f"Erro ao processar estúdio '{name}': {e}")
@@ -103,14 +275,32 @@ class StudioRepository:
         :param studio_id: ID do estúdio a ser removido.
         :return: True se o estúdio foi removido, False se não foi encontrado.
         """
-        studio = db.query(Studio).filter(Studio.id == studio_id).first()
-        if studio:
-            db.delete(studio)
-            db.commit()
-            logger.info(f"Estúdio '{studio.name}' removido com sucesso.")
+        if StudioRepository.delete_many(db, [studio_id]):
+            logger.info(f"Estúdio com ID {studio_id} removido com sucesso.")
             return True
 
         logger.warning(
             f"Tentativa de remover estúdio com ID {studio_id}, mas ele não existe."
         )
         return False
+
+    @staticmethod
+    def delete_many(db: Session, ids: Sequence[int]) -> int:
+        """
+        Remove vários estúdios com um `DELETE ... WHERE id IN (...)` por bloco,
+        sem carregar as entidades, e faz o commit.
+
+        :param db: Sessão do banco de dados.
+        :param ids: IDs a remover (IDs inexistentes são ignorados).
+        :return: Quantidade de estúdios removidos.
+        """
+        deleted = 0
+        for chunk in chunked(list(dict.fromkeys(ids)), Config.IN_CLAUSE_CHUNK_SIZE):
+            result = db.execute(delete(Studio).where(Studio.id.in_(chunk)))
+            deleted += cast(CursorResult[Any], result).rowcount
+        # As associações saem pelo ON DELETE CASCADE e alteram a listagem
+        # expandida de filmes
+        if deleted:
+            GenerationRepository.bump(db, "studios", "movies")
+        db.commit()
+        return deleted
@@ -0,0 +1,18 @@
+from pydantic import BaseModel, model_validator
+from typing import List, Optional
+
+
+class BatchGetRequest(BaseModel):
+    """
+    Schema para busca em lote por IDs ou por nomes
+    (títulos, no caso de filmes). Apenas um dos dois deve ser informado.
+    """
+
+    ids: Optional[List[int]] = None
+    names: Optional[List[str]] = None
+
+    @model_validator(mode="after")
+    def check_single_key_list(self) -> "BatchGetRequest":
+        if (self.ids is None) == (self.names is None):
+            raise ValueError("Informe apenas um dos campos: ids ou names.")
+        return self
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, ConfigDict
-from typing import Dict, List, Optional
+from pydantic import BaseModel, ConfigDict, field_validator
+from typing import Dict, List, Literal, Optional, Union
 
 from app.schemas.producer import ProducerResponse
 from app.schemas.studio import StudioResponse
@@ -34,5 +34,73 @@ class MovieDetailedResponse(MovieResponse):
     studios: Optional[List[StudioResponse]] = None
 
 
+class MovieFilter(BaseModel):
+    """Filtros da listagem de filmes, avaliados no banco de dados."""
+
+    year: Optional[int] = None
+    year_from: Optional[int] = None
+    year_to: Optional[int] = None
+    winner: Optional[bool] = None
+    producer_id: Optional[int] = None
+    studio_id: Optional[int] = None
+
+
 class MovieListResponse(BaseModel):
     movies: List[MovieDetailedResponse]
+    next_cursor: Optional[str] = None
+
+
+class MovieBatchGetResponse(BaseModel):
+    """
+    Resposta da busca em lote: resultados na ordem pedida, com null para as
+    chaves não encontradas, que também são listadas em `missing`.
+    """
+
+    movies: List[Optional[MovieResponse]]
+    missing: List[Union[int, str]]
+
+
+MovieBulkStatus = Literal["created", "exists", "duplicate"]
+
+
+class MovieBulkItem(MovieCreate):
+    """Schema de um filme no cadastro em lote, com produtores e estúdios."""
+
+    producers: List[str] = []
+    studios: List[str] = []
+
+    @field_validator("producers", "studios")
+    @classmethod
+    def strip_names(cls, names: List[str]) -> List[str]:
+        """Remove espaços e nomes vazios."""
+        return [name.strip() for name in names if name.strip()]
+
+
+class MovieBulkRequest(BaseModel):
+    """Schema para cadastro de vários filmes em uma única transação."""
+
+    movies: List[MovieBulkItem]
+
+
+class MovieBulkResult(BaseModel):
+    """
+    Situação de cada filme do lote: `created` (cadastrado), `exists` (já
+    existia no banco) ou `duplicate` (repetido no próprio lote).
+    """
+
+    title: str
+    status: MovieBulkStatus
+    id: int
+
+
+class MovieBulkResponse(BaseModel):
+    """Resposta do cadastro em lote, com um resultado por filme, na ordem pedida."""
+
+    created: int
+    results: List[MovieBulkResult]
+
+
+class MovieBulkDeleteResponse(BaseModel):
+    """Resposta da remoção em lote: quantidade de filmes efetivamente removidos."""
+
+    deleted: int
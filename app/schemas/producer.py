@@ -1,4 +1,5 @@
 from pydantic import BaseModel, ConfigDict
+from typing import List, Optional, Union
 
 
 class ProducerBase(BaseModel):
@@ -25,3 +26,14 @@ class ProducerListResponse(BaseModel):
     """Schema para listar múltiplos produtores."""
 
     producers: list[ProducerResponse]
+    next_cursor: Optional[str] = None
+
+
+class ProducerBatchGetResponse(BaseModel):
+    """
+    Resposta da busca em lote: resultados na ordem pedida, com null para as
+    chaves não encontradas, que também são listadas em `missing`.
+    """
+
+    producers: List[Optional[ProducerResponse]]
+    missing: List[Union[int, str]]
@@ -1,4 +1,5 @@
 from pydantic import BaseModel, ConfigDict
+from typing import List, Optional, Union
 
 
 class StudioBase(BaseModel):
@@ -25,3 +26,14 @@ class StudioListResponse(BaseModel):
     """Schema para listar múltiplos estúdios."""
 
     studios: list[StudioResponse]
+    next_cursor: Optional[str] = None
+
+
+class StudioBatchGetResponse(BaseModel):
+    """
+    Resposta da busca em lote: resultados na ordem pedida, com null para as
+    chaves não encontradas, que também são listadas em `missing`.
+    """
+
+    studios: List[Optional[StudioResponse]]
+    missing: List[Union[int, str]]
@@ -3,3 +3,7 @@ from .producer_service import ProducerService
 from .movie_service import MovieService
 from .studio_service import StudioService
 from .award_interval_service import AwardIntervalService
+from .async_producer_service import AsyncProducerService
+from .async_movie_service import AsyncMovieService
+from .async_studio_service import AsyncStudioService
+from .async_award_interval_service import AsyncAwardIntervalService
@@ -0,0 +1,37 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.repositories.async_movie_repository import AsyncMovieRepository
+from app.schemas.award_interval import AwardIntervalResponse
+from app.services.award_interval_service import AwardIntervalService
+
+
+class AsyncAwardIntervalService:
+    """
+    Variante async de `AwardIntervalService`: só a leitura dos vencedores é
+    async; o cálculo e o cache são os da versão síncrona.
+    """
+
+    @staticmethod
+    async def calculate_award_intervals(db: AsyncSession) -> AwardIntervalResponse:
+        """
+        Calcula os intervalos de prêmios consecutivos para produtores.
+
+        :param db: Sessão async do banco de dados.
+        :return: AwardIntervalResponse contendo os produtores com maior
+        e menor intervalo entre prêmios.
+        """
+        movies = await AsyncMovieRepository.get_winning_movies(db)
+        return AwardIntervalService._to_response(
+            AwardIntervalService._win_years(movies)
+        )
+
+    @staticmethod
+    async def calculate_award_intervals_cached(
+        db: AsyncSession,
+    ) -> AwardIntervalResponse:
+        """
+        Calcula os intervalos de prêmios consecutivos e armazena o resultado em cache.
+        """
+        return await AwardIntervalService.CACHE.get_or_load_async(
+            "intervals",
+            lambda: AsyncAwardIntervalService.calculate_award_intervals(db),
+        )
@@ -0,0 +1,63 @@
+import asyncio
+import weakref
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.async_movie_service import AsyncMovieService
+from app.services.catalog_snapshot_service import CatalogSnapshotService
+from app.utils.compression import compress
+from app.utils.logger import logger
+
+
+class AsyncCatalogSnapshotService:
+    """
+    Variante async de `CatalogSnapshotService`, com o mesmo cache de
+    snapshots: um snapshot gerado num modo é servido pelo outro.
+    """
+
+    # Um lock por event loop: um asyncio.Lock fica preso ao loop em que
+    # esperou pela primeira vez
+    _build_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]"
+    _build_locks = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    async def get_catalog(db: AsyncSession, etag: str, encoding: str) -> bytes:
+        """
+        Retorna o catálogo comprimido da ETag informada, gerando o snapshot
+        quando a geração dos dados mudou.
+
+        :param db: Sessão async do banco de dados.
+        :param etag: ETag atual da listagem (identifica a geração dos dados e
+            a codificação).
+        :param encoding: Codificação negociada ("br" ou "gzip").
+        :return: Corpo comprimido pronto para envio.
+        """
+        found, snapshot = CatalogSnapshotService.CACHE.get(etag)
+        if not found:
+            # Evita que requisições simultâneas gerem o mesmo snapshot; quem
+            # espera cede o event loop em vez de bloqueá-lo
+            lock = AsyncCatalogSnapshotService._build_locks.setdefault(
+                asyncio.get_running_loop(), asyncio.Lock()
+            )
+            async with lock:
+                found, snapshot = CatalogSnapshotService.CACHE.get(etag)
+                if not found:
+                    snapshot = await AsyncCatalogSnapshotService._build(db, encoding)
+                    CatalogSnapshotService.CACHE.set(etag, snapshot)
+        return bytes(snapshot)
+
+    @staticmethod
+    async def _build(db: AsyncSession, encoding: str) -> bytes:
+        """
+        Codifica o catálogo completo e o comprime numa thread, para a
+        compressão do catálogo inteiro não parar o event loop.
+        """
+        body = await AsyncMovieService.get_all_movies_json(
+            db, CatalogSnapshotService.EXPAND
+        )
+        snapshot = await asyncio.to_thread(compress, body, encoding)
+        logger.info(
+            f"Snapshot do catálogo gerado ({encoding}): "
+            f"{len(body)} -> {len(snapshot)} bytes."
+        )
+        return snapshot
@@ -0,0 +1,49 @@
+from typing import Dict, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.data_generation import TRACKED_TABLES
+from app.repositories.async_generation_repository import AsyncGenerationRepository
+from app.services.generation_service import GenerationService
+from app.utils.conditional import entity_tag, validator_headers
+
+
+class AsyncGenerationService:
+    """
+    Variante async de `GenerationService` sobre AsyncSession; o intervalo
+    entre validações é compartilhado com a versão síncrona.
+    """
+
+    @staticmethod
+    async def list_validators(
+        db: AsyncSession, name: str, tables: Sequence[str], variant: str
+    ) -> Dict[str, str]:
+        """
+        Calcula ETag e Last-Modified de uma listagem com uma única consulta à
+        tabela de gerações (ver `GenerationService.list_validators`).
+
+        :param db: Sessão async do banco de dados.
+        :param name: Nome da listagem (ex: "movies").
+        :param tables: Tabelas de que a listagem depende.
+        :param variant: Representação enviada (ex: "json" ou "ndjson").
+        :return: Cabeçalhos de validação da resposta.
+        """
+        generations, updated_at = await AsyncGenerationRepository.get(db, tables)
+        return validator_headers(entity_tag(name, generations, variant), updated_at)
+
+    @staticmethod
+    async def validate_caches(
+        db: AsyncSession, interval: Optional[float] = None
+    ) -> None:
+        """
+        Esvazia os caches em memória cujas tabelas tiveram escrita desde a
+        última checagem (ver `GenerationService.validate_caches`).
+
+        :param db: Sessão async do banco de dados.
+        :param interval: Segundos entre checagens (padrão da configuração);
+            0 checa sempre e um valor negativo desativa a validação.
+        """
+        if not GenerationService._validation_due(interval):
+            return
+        generations, _ = await AsyncGenerationRepository.get(db, TRACKED_TABLES)
+        GenerationService._apply_generations(generations)
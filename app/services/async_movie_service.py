@@ -0,0 +1,253 @@
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import Config
+from app.repositories.async_movie_repository import AsyncMovieRepository
+from app.repositories.async_producer_repository import AsyncProducerRepository
+from app.repositories.async_studio_repository import AsyncStudioRepository
+from app.schemas.batch import BatchGetRequest
+from app.schemas.movie import (
+    MovieBatchGetResponse,
+    MovieBulkDeleteResponse,
+    MovieBulkRequest,
+    MovieBulkResponse,
+    MovieCreate,
+    MovieFilter,
+    MovieListResponse,
+    MovieResponse,
+)
+from app.services.award_interval_service import AwardIntervalService
+from app.services.movie_service import MovieService
+from app.utils.cache import clear_caches
+from app.utils.logger import logger
+from app.utils.pagination import build_page
+from app.utils.streaming import (
+    buffered_async,
+    json_list_envelope_async,
+    ndjson_lines_async,
+)
+from typing import AsyncIterator, Dict, List, Optional, Union, cast
+
+
+class AsyncMovieService:
+    """
+    Variante async de `MovieService` sobre AsyncSession. Usa o mesmo cache e
+    as mesmas conversões da versão síncrona, então as respostas são iguais
+    nos dois modos.
+    """
+
+    @staticmethod
+    async def create_movie(db: AsyncSession, movie_data: MovieCreate) -> MovieResponse:
+        """Cria um novo filme e retorna os dados formatados."""
+        movie = await AsyncMovieRepository.create(
+            db, movie_data.title, movie_data.year, movie_data.winner
+        )
+
+        MovieService.CACHE.delete(("id", movie.id), ("title", movie.title))
+        return cast(MovieResponse, MovieService._to_response(movie))
+
+    @staticmethod
+    async def bulk_create_movies(
+        db: AsyncSession, request: MovieBulkRequest
+    ) -> MovieBulkResponse:
+        """
+        Cadastra vários filmes, com produtores e estúdios, em uma única
+        transação (ver `MovieService.bulk_create_movies`).
+
+        :param db: Sessão async do banco de dados.
+        :param request: Filmes a cadastrar.
+        :return: Situação de cada filme, na ordem pedida.
+        """
+        existing = await AsyncMovieRepository.get_ids_by_titles(
+            db, [movie.title for movie in request.movies]
+        )
+        new_movies, statuses = MovieService._classify_bulk(request, existing)
+
+        movie_ids: Dict[str, int] = {}
+        try:
+            if new_movies:
+                movie_ids = await AsyncMovieRepository.insert_many(
+                    db,
+                    [
+                        {"title": m.title, "year": m.year, "winner": m.winner}
+                        for m in new_movies.values()
+                    ],
+                )
+                for relation, repository in (
+                    ("producers", AsyncProducerRepository),
+                    ("studios", AsyncStudioRepository),
+                ):
+                    names = MovieService._related_names(new_movies, relation)
+                    ids = await repository.resolve_names(
+                        db, [name for group in names.values() for name in group]
+                    )
+                    await AsyncMovieRepository.link_many(
+                        db, relation, MovieService._link_pairs(names, movie_ids, ids)
+                    )
+            await db.commit()
+        except SQLAlchemyError:
+            await db.rollback()
+            raise
+
+        if new_movies:
+            logger.info(
+                "Novos filmes inseridos. Invalidando cache dos cálculos de prêmios."
+            )
+            AwardIntervalService.invalidate_cache()
+            clear_caches()
+
+        return MovieService._bulk_response(
+            request, statuses, {**existing, **movie_ids}, len(new_movies)
+        )
+
+    @staticmethod
+    async def get_movie_by_id(
+        db: AsyncSession, movie_id: int
+    ) -> Optional[MovieResponse]:
+        """Obtém um filme pelo ID, passando pelo cache de entidades."""
+
+        async def load() -> Optional[MovieResponse]:
+            movie = await AsyncMovieRepository.get_by_id(db, movie_id)
+            return MovieService._to_response(movie)
+
+        return await MovieService.CACHE.get_or_load_async(("id", movie_id), load)
+
+    @staticmethod
+    async def get_movie_by_title(
+        db: AsyncSession, title: str
+    ) -> Optional[MovieResponse]:
+        """Obtém um filme pelo título, passando pelo cache de entidades."""
+
+        async def load() -> Optional[MovieResponse]:
+            movie = await AsyncMovieRepository.get_by_title(db, title)
+            return MovieService._to_response(movie)
+
+        return await MovieService.CACHE.get_or_load_async(("title", title), load)
+
+    @staticmethod
+    async def batch_get_movies(
+        db: AsyncSession, request: BatchGetRequest
+    ) -> MovieBatchGetResponse:
+        """
+        Busca vários filmes por IDs ou títulos, preservando a ordem pedida.
+        """
+        keys: List[Union[int, str]]
+        if request.ids is not None:
+            keys = list(request.ids)
+            items = await AsyncMovieRepository.get_by_ids(db, request.ids)
+        else:
+            keys = list(request.names or [])
+            items = await AsyncMovieRepository.get_by_titles(db, request.names or [])
+
+        return MovieService._batch_response(request, keys, items)
+
+    @staticmethod
+    async def search_movies(
+        db: AsyncSession, query: str, limit: int
+    ) -> MovieListResponse:
+        """Busca filmes por palavras do título, dos mais aos menos relevantes."""
+        return MovieService._search_response(
+            await AsyncMovieRepository.search_titles(db, query, limit)
+        )
+
+    @staticmethod
+    async def get_all_movies_json(
+        db: AsyncSession,
+        expand: List[str],
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        filters: Optional[MovieFilter] = None,
+    ) -> bytes:
+        """
+        Caminho rápido da listagem: seleciona apenas colunas e codifica direto
+        para JSON com orjson, byte a byte igual a `MovieService.get_all_movies_json`.
+
+        :param db: Sessão async do banco de dados.
+        :param expand: Lista de expansões desejadas, ex: ["producers", "studios"]
+        :param limit: Tamanho da página (None para todos os filmes).
+        :param after_id: ID do último filme da página anterior.
+        :param fields: Colunas desejadas, ex: ["id", "title"] (None para todas).
+        :param filters: Filtros de ano e vencedor.
+        :return: Corpo JSON da resposta.
+        """
+        columns, selected, id_index = MovieService._listing_columns(fields)
+        rows, next_cursor = build_page(
+            list(
+                await AsyncMovieRepository.get_all_rows(
+                    db, limit + 1 if limit else None, after_id, selected, filters
+                )
+            ),
+            limit,
+            lambda row: cast(int, row[id_index]),
+        )
+
+        movie_ids = MovieService._related_movie_ids(rows, id_index, limit, filters)
+        related = {
+            relation: await AsyncMovieRepository.get_related_rows(
+                db, relation, movie_ids
+            )
+            for relation in MovieService.EXPAND_ORDER
+            if relation in expand
+        }
+        return MovieService._encode_listing(
+            columns, id_index, rows, next_cursor, related, fields
+        )
+
+    @staticmethod
+    def stream_movies(
+        db: AsyncSession,
+        expand: List[str],
+        after_id: Optional[int] = None,
+        ndjson: bool = True,
+        filters: Optional[MovieFilter] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Serializa os filmes à medida que são lidos do cursor, em lotes.
+
+        :param db: Sessão async do banco de dados.
+        :param expand: Lista de expansões desejadas, ex: ["producers", "studios"]
+        :param after_id: ID a partir do qual os filmes são retornados.
+        :param ndjson: True para NDJSON, False para o mesmo JSON da listagem.
+        :param filters: Filtros de ano e vencedor.
+        :return: Iterador async com os blocos de bytes da resposta.
+        """
+        movies = (
+            MovieService._to_detailed_response(m, expand)
+            async for m in AsyncMovieRepository.stream_all(
+                db, expand, after_id, Config.STREAM_BATCH_SIZE, filters
+            )
+        )
+        if ndjson:
+            return buffered_async(ndjson_lines_async(movies))
+        return buffered_async(json_list_envelope_async("movies", movies))
+
+    @staticmethod
+    async def delete_movie(db: AsyncSession, movie_id: int) -> bool:
+        """Deleta um filme pelo ID e remove suas entradas do cache."""
+        movie = await AsyncMovieService.get_movie_by_id(db, movie_id)
+        deleted = await AsyncMovieRepository.delete(db, movie_id)
+        MovieService.CACHE.delete(("id", movie_id))
+        if movie is not None:
+            MovieService.CACHE.delete(("title", movie.title))
+        if deleted:
+            AwardIntervalService.invalidate_cache()
+        return deleted
+
+    @staticmethod
+    async def delete_movies(
+        db: AsyncSession, ids: List[int]
+    ) -> MovieBulkDeleteResponse:
+        """
+        Deleta vários filmes com `DELETE ... WHERE id IN (...)`, sem carregá-los,
+        e esvazia o cache de filmes.
+
+        :param db: Sessão async do banco de dados.
+        :param ids: IDs dos filmes (inexistentes são ignorados).
+        :return: Quantidade de filmes removidos.
+        """
+        deleted = await AsyncMovieRepository.delete_many(db, ids)
+        if deleted:
+            logger.info(f"{deleted} filmes removidos em lote.")
+            MovieService.CACHE.clear()
+            AwardIntervalService.invalidate_cache()
+        return MovieBulkDeleteResponse(deleted=deleted)
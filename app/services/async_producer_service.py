@@ -0,0 +1,142 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import Config
+from app.repositories.async_producer_repository import AsyncProducerRepository
+from app.schemas.batch import BatchGetRequest
+from app.schemas.producer import (
+    ProducerBatchGetResponse,
+    ProducerCreate,
+    ProducerListResponse,
+    ProducerResponse,
+)
+from app.services.award_interval_service import AwardIntervalService
+from app.services.producer_service import ProducerService
+from app.utils.pagination import build_page
+from app.utils.streaming import (
+    buffered_async,
+    json_list_envelope_async,
+    ndjson_lines_async,
+)
+from typing import AsyncIterator, List, Optional, Union, cast
+
+
+class AsyncProducerService:
+    """
+    Variante async de `ProducerService` sobre AsyncSession, com o mesmo cache
+    e as mesmas conversões da versão síncrona.
+    """
+
+    @staticmethod
+    async def create_producer(
+        db: AsyncSession, producer_data: ProducerCreate
+    ) -> ProducerResponse:
+        """Cria um novo produtor e retorna os dados formatados."""
+        producer = await AsyncProducerRepository.create(db, producer_data.name)
+
+        ProducerService.CACHE.delete(("id", producer.id), ("name", producer.name))
+        return ProducerResponse(id=cast(int, producer.id), name=str(producer.name))
+
+    @staticmethod
+    async def get_producer_by_id(
+        db: AsyncSession, producer_id: int
+    ) -> Optional[ProducerResponse]:
+        """Obtém um produtor pelo ID, passando pelo cache de entidades."""
+
+        async def load() -> Optional[ProducerResponse]:
+            producer = await AsyncProducerRepository.get_by_id(db, int(producer_id))
+            return ProducerService._to_response(producer)
+
+        return await ProducerService.CACHE.get_or_load_async(
+            ("id", int(producer_id)), load
+        )
+
+    @staticmethod
+    async def get_producer_by_name(
+        db: AsyncSession, name: str
+    ) -> Optional[ProducerResponse]:
+        """Obtém um produtor pelo nome, passando pelo cache de entidades."""
+
+        async def load() -> Optional[ProducerResponse]:
+            producer = await AsyncProducerRepository.get_by_name(db, name)
+            return ProducerService._to_response(producer)
+
+        return await ProducerService.CACHE.get_or_load_async(("name", name), load)
+
+    @staticmethod
+    async def batch_get_producers(
+        db: AsyncSession, request: BatchGetRequest
+    ) -> ProducerBatchGetResponse:
+        """
+        Busca vários produtores por IDs ou nomes, preservando a ordem pedida.
+        """
+        keys: List[Union[int, str]]
+        if request.ids is not None:
+            keys = list(request.ids)
+            items = await AsyncProducerRepository.get_by_ids(db, request.ids)
+        else:
+            keys = list(request.names or [])
+            items = await AsyncProducerRepository.get_by_names(db, request.names or [])
+
+        return ProducerService._batch_response(request, keys, items)
+
+    @staticmethod
+    async def search_producers(
+        db: AsyncSession, query: str, limit: int
+    ) -> ProducerListResponse:
+        """Busca produtores pelo início do nome (sem acentos nem maiúsculas)."""
+        return ProducerService._search_response(
+            await AsyncProducerRepository.search(db, query, limit)
+        )
+
+    @staticmethod
+    async def get_all_producers_json(
+        db: AsyncSession,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+    ) -> bytes:
+        """
+        Caminho rápido da listagem: seleciona apenas colunas e codifica direto
+        para JSON com orjson (ver `ProducerService.get_all_producers_json`).
+        """
+        columns, selected, id_index = ProducerService._listing_columns(fields)
+        rows, next_cursor = build_page(
+            list(
+                await AsyncProducerRepository.get_all_rows(
+                    db, limit + 1 if limit else None, after_id, selected
+                )
+            ),
+            limit,
+            lambda row: cast(int, row[id_index]),
+        )
+        return ProducerService._encode_listing(columns, rows, next_cursor)
+
+    @staticmethod
+    def stream_producers(
+        db: AsyncSession, after_id: Optional[int] = None, ndjson: bool = True
+    ) -> AsyncIterator[bytes]:
+        """Serializa os produtores à medida que são lidos do cursor, em lotes."""
+        producers = (
+            ProducerResponse(id=cast(int, p.id), name=str(p.name))
+            async for p in AsyncProducerRepository.stream_all(
+                db, after_id, Config.STREAM_BATCH_SIZE
+            )
+        )
+        if ndjson:
+            return buffered_async(ndjson_lines_async(producers))
+        return buffered_async(json_list_envelope_async("producers", producers))
+
+    @staticmethod
+    async def delete_producer(db: AsyncSession, producer_id: int) -> bool:
+        """
+        Deleta um produtor pelo ID e remove suas entradas do cache. As
+        associações saem em cascata, então o cálculo de prêmios também é
+        invalidado.
+        """
+        producer = await AsyncProducerService.get_producer_by_id(db, producer_id)
+        deleted = await AsyncProducerRepository.delete(db, int(producer_id))
+        ProducerService.CACHE.delete(("id", int(producer_id)))
+        if producer is not None:
+            ProducerService.CACHE.delete(("name", producer.name))
+        if deleted:
+            AwardIntervalService.invalidate_cache()
+        return deleted
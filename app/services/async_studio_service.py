@@ -0,0 +1,133 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import Config
+from app.repositories.async_studio_repository import AsyncStudioRepository
+from app.schemas.batch import BatchGetRequest
+from app.schemas.studio import (
+    StudioBatchGetResponse,
+    StudioCreate,
+    StudioListResponse,
+    StudioResponse,
+)
+from app.services.studio_service import StudioService
+from app.utils.pagination import build_page
+from app.utils.streaming import (
+    buffered_async,
+    json_list_envelope_async,
+    ndjson_lines_async,
+)
+from typing import AsyncIterator, List, Optional, Union, cast
+
+
+class AsyncStudioService:
+    """
+    Variante async de `StudioService` sobre AsyncSession, com o mesmo cache
+    e as mesmas conversões da versão síncrona.
+    """
+
+    @staticmethod
+    async def create_studio(
+        db: AsyncSession, studio_data: StudioCreate
+    ) -> StudioResponse:
+        """Cria um novo estúdio e retorna os dados formatados."""
+        studio = await AsyncStudioRepository.create(db, studio_data.name)
+
+        StudioService.CACHE.delete(("id", studio.id), ("name", studio.name))
+        return StudioResponse(id=cast(int, studio.id), name=str(studio.name))
+
+    @staticmethod
+    async def get_studio_by_id(
+        db: AsyncSession, studio_id: int
+    ) -> Optional[StudioResponse]:
+        """Obtém um estúdio pelo ID, passando pelo cache de entidades."""
+
+        async def load() -> Optional[StudioResponse]:
+            studio = await AsyncStudioRepository.get_by_id(db, int(studio_id))
+            return StudioService._to_response(studio)
+
+        return await StudioService.CACHE.get_or_load_async(("id", int(studio_id)), load)
+
+    @staticmethod
+    async def get_studio_by_name(
+        db: AsyncSession, name: str
+    ) -> Optional[StudioResponse]:
+        """Obtém um estúdio pelo nome, passando pelo cache de entidades."""
+
+        async def load() -> Optional[StudioResponse]:
+            studio = await AsyncStudioRepository.get_by_name(db, name)
+            return StudioService._to_response(studio)
+
+        return await StudioService.CACHE.get_or_load_async(("name", name), load)
+
+    @staticmethod
+    async def batch_get_studios(
+        db: AsyncSession, request: BatchGetRequest
+    ) -> StudioBatchGetResponse:
+        """
+        Busca vários estúdios por IDs ou nomes, preservando a ordem pedida.
+        """
+        keys: List[Union[int, str]]
+        if request.ids is not None:
+            keys = list(request.ids)
+            items = await AsyncStudioRepository.get_by_ids(db, request.ids)
+        else:
+            keys = list(request.names or [])
+            items = await AsyncStudioRepository.get_by_names(db, request.names or [])
+
+        return StudioService._batch_response(request, keys, items)
+
+    @staticmethod
+    async def search_studios(
+        db: AsyncSession, query: str, limit: int
+    ) -> StudioListResponse:
+        """Busca estúdios pelo início do nome (sem acentos nem maiúsculas)."""
+        return StudioService._search_response(
+            await AsyncStudioRepository.search(db, query, limit)
+        )
+
+    @staticmethod
+    async def get_all_studios_json(
+        db: AsyncSession,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+    ) -> bytes:
+        """
+        Caminho rápido da listagem: seleciona apenas colunas e codifica direto
+        para JSON com orjson (ver `StudioService.get_all_studios_json`).
+        """
+        columns, selected, id_index = StudioService._listing_columns(fields)
+        rows, next_cursor = build_page(
+            list(
+                await AsyncStudioRepository.get_all_rows(
+                    db, limit + 1 if limit else None, after_id, selected
+                )
+            ),
+            limit,
+            lambda row: cast(int, row[id_index]),
+        )
+        return StudioService._encode_listing(columns, rows, next_cursor)
+
+    @staticmethod
+    def stream_studios(
+        db: AsyncSession, after_id: Optional[int] = None, ndjson: bool = True
+    ) -> AsyncIterator[bytes]:
+        """Serializa os estúdios à medida que são lidos do cursor, em lotes."""
+        studios = (
+            StudioResponse(id=cast(int, p.id), name=str(p.name))
+            async for p in AsyncStudioRepository.stream_all(
+                db, after_id, Config.STREAM_BATCH_SIZE
+            )
+        )
+        if ndjson:
+            return buffered_async(ndjson_lines_async(studios))
+        return buffered_async(json_list_envelope_async("studios", studios))
+
+    @staticmethod
+    async def delete_studio(db: AsyncSession, studio_id: int) -> bool:
+        """Deleta um estúdio pelo ID e remove suas entradas do cache."""
+        studio = await AsyncStudioService.get_studio_by_id(db, studio_id)
+        deleted = await AsyncStudioRepository.delete(db, int(studio_id))
+        StudioService.CACHE.delete(("id", int(studio_id)))
+        if studio is not None:
+            StudioService.CACHE.delete(("name", studio.name))
+        return deleted
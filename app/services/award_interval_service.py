@@ -1,10 +1,11 @@
-from functools import lru_cache
 from sqlalchemy.orm import Session
 from app.schemas.award_interval import AwardInterval, AwardIntervalResponse
+from app.models.movie import Movie
 from app.repositories.movie_repository import MovieRepository
 from collections import defaultdict
-from typing import List, Dict, cast
+from typing import List, Dict, Sequence, cast
 from app.db.database import get_db
+from app.utils.cache import register_cache
 
 
 class AwardIntervalService:
@@ -12,6 +13,11 @@ class AwardIntervalService:
     Serviço para calcular os produtores com maior e menor intervalo entre prêmios.
     """
 
+    # Resultado do cálculo; validado pela geração de movies entre processos
+    CACHE = register_cache(
+        "award_intervals", maxsize=1, ttl=float("inf"), tables=("movies",)
+    )
+
     @staticmethod
     def get_producer_win_years(db: Session) -> Dict[str, List[int]]:
         """
@@ -21,8 +27,11 @@ class AwardIntervalService:
         :return: Dicionário onde a chave é o nome do produtor
         e o valor é a lista de anos que ele venceu.
         """
-        movies = MovieRepository.get_winning_movies(db)
+        return AwardIntervalService._win_years(MovieRepository.get_winning_movies(db))
 
+    @staticmethod
+    def _win_years(movies: Sequence[Movie]) -> Dict[str, List[int]]:
+        """Agrupa os anos dos filmes vencedores (já ordenados) por produtor."""
         producer_wins: Dict[str, List[int]] = defaultdict(list)
 
         for movie in movies:
@@ -101,7 +110,13 @@ class AwardIntervalService:
         :return: AwardIntervalResponse contendo os produtores com maior
         e menor intervalo entre prêmios.
         """
-        producer_wins = AwardIntervalService.get_producer_win_years(db)
+        return AwardIntervalService._to_response(
+            AwardIntervalService.get_producer_win_years(db)
+        )
+
+    @staticmethod
+    def _to_response(producer_wins: Dict[str, List[int]]) -> AwardIntervalResponse:
+        """Calcula os menores e maiores intervalos a partir dos anos de vitória."""
         intervals = AwardIntervalService.calculate_intervals(producer_wins)
 
         return AwardIntervalResponse(
@@ -110,16 +125,17 @@ class AwardIntervalService:
         )
 
     @staticmethod
-    @lru_cache(maxsize=1)
     def calculate_award_intervals_cached(db: Session) -> AwardIntervalResponse:
         """
         Calcula os intervalos de prêmios consecutivos e armazena o resultado em cache.
         """
-        return AwardIntervalService.calculate_award_intervals(db)
+        return AwardIntervalService.CACHE.get_or_load(
+            "intervals", lambda: AwardIntervalService.calculate_award_intervals(db)
+        )
 
     @staticmethod
     def invalidate_cache() -> None:
         """
         Invalida o cache armazenado.
         """
-        AwardIntervalService.calculate_award_intervals_cached.cache_clear()
+        AwardIntervalService.CACHE.clear()
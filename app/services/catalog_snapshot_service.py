@@ -0,0 +1,55 @@
+import threading
+
+from sqlalchemy.orm import Session
+
+from app.services.movie_service import MovieService
+from app.utils.cache import register_cache
+from app.utils.compression import available_encodings, compress
+from app.utils.logger import logger
+
+
+class CatalogSnapshotService:
+    """
+    Mantém o catálogo completo de filmes (com produtores e estúdios) já
+    codificado e comprimido, para ser enviado sem consulta nem compressão.
+    """
+
+    EXPAND = ["producers", "studios"]
+    # Um snapshot por codificação, da ETag atual; vale até a próxima escrita
+    CACHE = register_cache(
+        "catalog_snapshot", maxsize=len(available_encodings()), ttl=float("inf")
+    )
+    _build_lock = threading.Lock()
+
+    @staticmethod
+    def get_catalog(db: Session, etag: str, encoding: str) -> bytes:
+        """
+        Retorna o catálogo comprimido da ETag informada, gerando o snapshot
+        quando a geração dos dados mudou.
+
+        :param db: Sessão do banco de dados.
+        :param etag: ETag atual da listagem (identifica a geração dos dados e
+            a codificação).
+        :param encoding: Codificação negociada ("br" ou "gzip").
+        :return: Corpo comprimido pronto para envio.
+        """
+        found, snapshot = CatalogSnapshotService.CACHE.get(etag)
+        if not found:
+            # Evita que requisições simultâneas gerem o mesmo snapshot
+            with CatalogSnapshotService._build_lock:
+                found, snapshot = CatalogSnapshotService.CACHE.get(etag)
+                if not found:
+                    snapshot = CatalogSnapshotService._build(db, encoding)
+                    CatalogSnapshotService.CACHE.set(etag, snapshot)
+        return bytes(snapshot)
+
+    @staticmethod
+    def _build(db: Session, encoding: str) -> bytes:
+        """Codifica o catálogo completo e o comprime."""
+        body = MovieService.get_all_movies_json(db, CatalogSnapshotService.EXPAND)
+        snapshot = compress(body, encoding)
+        logger.info(
+            f"Snapshot do catálogo gerado ({encoding}): "
+            f"{len(body)} -> {len(snapshot)} bytes."
+        )
+        return snapshot
@@ -5,8 +5,14 @@ import pandas as pd
 from typing import List
 from sqlalchemy.orm import Session
 from app.schemas.csv_importer import CSVImportRequest, CSVImportResponse
-from app.repositories import MovieRepository, ProducerRepository, StudioRepository
+from app.repositories import (
+    GenerationRepository,
+    MovieRepository,
+    ProducerRepository,
+    StudioRepository,
+)
 from app.services.award_interval_service import AwardIntervalService
+from app.utils.cache import clear_caches
 from app.utils.logger import logger
 
 
@@ -167,20 +173,25 @@ class CSVImporterService:
         os ignorados por duplicação."""
         cls.ignored_count = 0  # Contador de filmes ignorados
 
+        # As gerações são incrementadas uma única vez, ao final da importação
         for movie_data in movies_data:
             try:
                 # Tenta criar o filme, se já existir a exceção é capturada
                 movie = MovieRepository.create(
-                    db, movie_data.title, movie_data.year, movie_data.winner
+                    db, movie_data.title, movie_data.year, movie_data.winner, False
                 )
 
                 # Criar produtores e associar ao filme
-                producers = ProducerRepository.create_multiple(db, movie_data.producers)
+                producers = ProducerRepository.create_multiple(
+                    db, movie_data.producers, bump=False
+                )
                 movie.producers.extend(producers)
                 db.commit()  # Salva no banco
 
                 # Criar estúdios e associar ao filme
-                studios = StudioRepository.create_multiple(db, movie_data.studios)
+                studios = StudioRepository.create_multiple(
+                    db, movie_data.studios, bump=False
+                )
                 movie.studios.extend(studios)
                 db.commit()  # Salva no banco
 
@@ -200,7 +211,11 @@ class CSVImporterService:
         )
 
         if cls.total_inserted > 0:
+            # Uma geração para a importação inteira, incluindo as associações
+            GenerationRepository.bump(db, "movies", "producers", "studios")
+            db.commit()
             logger.info(
                 "Novos filmes inseridos. Invalidando cache dos cálculos de prêmios."
             )
             AwardIntervalService.invalidate_cache()
+            clear_caches()
@@ -0,0 +1,77 @@
+import time
+from typing import Dict, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from app.config import Config
+from app.models.data_generation import TRACKED_TABLES
+from app.repositories.generation_repository import GenerationRepository
+from app.utils.cache import validate_caches
+from app.utils.conditional import entity_tag, validator_headers
+from app.utils.logger import logger
+
+
+class GenerationService:
+    """
+    Camada de serviço dos validadores de cache HTTP das listagens e da
+    validação dos caches em memória entre processos.
+    """
+
+    _last_validation = float("-inf")
+
+    @staticmethod
+    def list_validators(
+        db: Session, name: str, tables: Sequence[str], variant: str
+    ) -> Dict[str, str]:
+        """
+        Calcula ETag e Last-Modified de uma listagem com uma única consulta à
+        tabela de gerações, sem carregar nenhuma entidade.
+
+        A geração é lida antes dos dados: se houver escrita entre as duas
+        leituras, a ETag fica desatualizada e o cliente apenas baixa a
+        listagem de novo na próxima vez.
+
+        :param db: Sessão do banco de dados.
+        :param name: Nome da listagem (ex: "movies").
+        :param tables: Tabelas de que a listagem depende.
+        :param variant: Representação enviada (ex: "json" ou "ndjson").
+        :return: Cabeçalhos de validação da resposta.
+        """
+        generations, updated_at = GenerationRepository.get(db, tables)
+        return validator_headers(entity_tag(name, generations, variant), updated_at)
+
+    @staticmethod
+    def validate_caches(db: Session, interval: Optional[float] = None) -> None:
+        """
+        Esvazia os caches em memória cujas tabelas tiveram escrita desde a
+        última checagem, inclusive escritas feitas por outros processos
+        (workers ou réplicas) no mesmo banco. Custa uma consulta às gerações.
+
+        :param db: Sessão do banco de dados.
+        :param interval: Segundos entre checagens (padrão da configuração);
+            0 checa sempre e um valor negativo desativa a validação.
+        """
+        if not GenerationService._validation_due(interval):
+            return
+        generations, _ = GenerationRepository.get(db, TRACKED_TABLES)
+        GenerationService._apply_generations(generations)
+
+    @staticmethod
+    def _validation_due(interval: Optional[float]) -> bool:
+        """
+        Indica se já passou o intervalo desde a última validação e, se sim,
+        registra a validação atual.
+        """
+        interval = Config.CACHE_VALIDATION_INTERVAL if interval is None else interval
+        now = time.monotonic()
+        if interval < 0 or now - GenerationService._last_validation < interval:
+            return False
+        GenerationService._last_validation = now
+        return True
+
+    @staticmethod
+    def _apply_generations(generations: Sequence[int]) -> None:
+        """Esvazia os caches cujas tabelas mudaram de geração."""
+        invalidated = validate_caches(dict(zip(TRACKED_TABLES, generations)))
+        if invalidated:
+            logger.info(f"Caches invalidados por escrita: {', '.join(invalidated)}")
@@ -1,20 +1,48 @@
+import orjson
+from sqlalchemy import Row
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
+from app.config import Config
+from app.db.routing import use_primary
+from app.models.movie import Movie
 from app.repositories.movie_repository import MovieRepository
+from app.repositories.producer_repository import ProducerRepository
+from app.repositories.studio_repository import StudioRepository
 from app.schemas.movie import (
+    MovieBatchGetResponse,
+    MovieBulkDeleteResponse,
+    MovieBulkItem,
+    MovieBulkRequest,
+    MovieBulkResponse,
+    MovieBulkResult,
+    MovieBulkStatus,
     MovieCreate,
     MovieDetailedResponse,
+    MovieFilter,
     MovieResponse,
     MovieListResponse,
 )
-from typing import List, Optional, cast
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union, cast
 
 from app.schemas.producer import ProducerResponse
 from app.schemas.studio import StudioResponse
+from app.schemas.batch import BatchGetRequest
+from app.utils.batch import align_to_keys
+from app.utils.cache import clear_caches, register_cache
+from app.services.award_interval_service import AwardIntervalService
+from app.utils.logger import logger
+from app.utils.pagination import build_page
+from app.utils.streaming import buffered, json_list_envelope, ndjson_lines
 
 
 class MovieService:
     """Camada de serviço para Movies, aplicando regras de negócio."""
 
+    EXPAND_ORDER = ("producers", "studios")
+    # Respostas de busca por ID e título, incluindo os não encontrados (None)
+    CACHE = register_cache("movies", tables=("movies",))
+
     @staticmethod
     def create_movie(db: Session, movie_data: MovieCreate) -> MovieResponse:
         """Cria um novo filme e retorna os dados formatados."""
@@ -25,6 +53,7 @@ class MovieService:
         if movie is None:
             raise ValueError("Erro ao criar o filme. O repositório retornou None.")
 
+        MovieService.CACHE.delete(("id", movie.id), ("title", movie.title))
         return MovieResponse(
             id=cast(int, movie.id),
             title=cast(str, movie.title),
@@ -33,22 +62,142 @@ class MovieService:
         )
 
     @staticmethod
-    def get_movie_by_id(db: Session, movie_id: int) -> Optional[MovieResponse]:
-        """Obtém um filme pelo ID, retornando no formato correto."""
-        movie = MovieRepository.get_by_id(db, movie_id)
-        if movie:
-            return MovieResponse(
-                id=cast(int, movie.id),
-                title=cast(str, movie.title),
-                year=cast(int, movie.year),
-                winner=cast(bool, movie.winner),
+    def bulk_create_movies(db: Session, request: MovieBulkRequest) -> MovieBulkResponse:
+        """
+        Cadastra vários filmes, com produtores e estúdios, em uma única transação.
+
+        Os nomes são resolvidos de forma set-based (uma consulta por bloco e um
+        INSERT em lote para os novos) e filmes e associações são inseridos em
+        lote. Filmes já existentes ou repetidos no lote não são alterados.
+
+        :param db: Sessão do banco de dados.
+        :param request: Filmes a cadastrar.
+        :return: Situação de cada filme, na ordem pedida.
+        """
+        # A checagem decide o INSERT: numa réplica atrasada perderia filmes
+        use_primary(db)
+        existing = MovieRepository.get_ids_by_titles(
+            db, [movie.title for movie in request.movies]
+        )
+
+        new_movies, statuses = MovieService._classify_bulk(request, existing)
+        movie_ids: Dict[str, int] = {}
+        try:
+            if new_movies:
+                movie_ids = MovieRepository.insert_many(
+                    db,
+                    [
+                        {"title": m.title, "year": m.year, "winner": m.winner}
+                        for m in new_movies.values()
+                    ],
+                )
+                for relation, repository in (
+                    ("producers", ProducerRepository),
+                    ("studios", StudioRepository),
+                ):
+                    names = MovieService._related_names(new_movies, relation)
+                    ids = repository.resolve_names(
+                        db, [name for group in names.values() for name in group]
+                    )
+                    MovieRepository.link_many(
+                        db, relation, MovieService._link_pairs(names, movie_ids, ids)
+                    )
+            db.commit()
+        except SQLAlchemyError:
+            db.rollback()
+            raise
+
+        if new_movies:
+            logger.info(
+                "Novos filmes inseridos. Invalidando cache dos cálculos de prêmios."
             )
-        return None
+            AwardIntervalService.invalidate_cache()
+            clear_caches()
+
+        return MovieService._bulk_response(
+            request, statuses, {**existing, **movie_ids}, len(new_movies)
+        )
+
+    @staticmethod
+    def _classify_bulk(
+        request: MovieBulkRequest, existing: Dict[str, int]
+    ) -> Tuple[Dict[str, MovieBulkItem], List[MovieBulkStatus]]:
+        """
+        Separa os filmes novos do lote e calcula a situação de cada item:
+        já cadastrado, repetido no lote ou a criar.
+        """
+        new_movies: Dict[str, MovieBulkItem] = {}
+        statuses: List[MovieBulkStatus] = []
+        for movie in request.movies:
+            if movie.title in existing:
+                statuses.append("exists")
+            elif movie.title in new_movies:
+                statuses.append("duplicate")
+            else:
+                new_movies[movie.title] = movie
+                statuses.append("created")
+        return new_movies, statuses
+
+    @staticmethod
+    def _related_names(
+        new_movies: Dict[str, MovieBulkItem], relation: str
+    ) -> Dict[str, List[str]]:
+        """Nomes de produtores ou estúdios de cada filme novo, sem repetições."""
+        return {
+            title: list(dict.fromkeys(getattr(movie, relation)))
+            for title, movie in new_movies.items()
+        }
+
+    @staticmethod
+    def _link_pairs(
+        names: Dict[str, List[str]], movie_ids: Dict[str, int], ids: Dict[str, int]
+    ) -> List[Tuple[int, int]]:
+        """Pares (movie_id, id do relacionado) das associações a inserir."""
+        return [
+            (movie_ids[title], ids[name])
+            for title, group in names.items()
+            for name in group
+        ]
+
+    @staticmethod
+    def _bulk_response(
+        request: MovieBulkRequest,
+        statuses: List[MovieBulkStatus],
+        ids_by_title: Dict[str, int],
+        created: int,
+    ) -> MovieBulkResponse:
+        """Monta a resposta do cadastro em lote, na ordem pedida."""
+        return MovieBulkResponse(
+            created=created,
+            results=[
+                MovieBulkResult(
+                    title=movie.title,
+                    status=status,
+                    id=ids_by_title[movie.title],
+                )
+                for movie, status in zip(request.movies, statuses)
+            ],
+        )
+
+    @staticmethod
+    def get_movie_by_id(db: Session, movie_id: int) -> Optional[MovieResponse]:
+        """Obtém um filme pelo ID, passando pelo cache de entidades."""
+        return MovieService.CACHE.get_or_load(
+            ("id", movie_id),
+            lambda: MovieService._to_response(MovieRepository.get_by_id(db, movie_id)),
+        )
 
     @staticmethod
     def get_movie_by_title(db: Session, title: str) -> Optional[MovieResponse]:
-        """Obtém um filme pelo título."""
-        movie = MovieRepository.get_by_title(db, title)
+        """Obtém um filme pelo título, passando pelo cache de entidades."""
+        return MovieService.CACHE.get_or_load(
+            ("title", title),
+            lambda: MovieService._to_response(MovieRepository.get_by_title(db, title)),
+        )
+
+    @staticmethod
+    def _to_response(movie: Optional[Movie]) -> Optional[MovieResponse]:
+        """Converte o modelo em resposta (None quando não encontrado)."""
         if movie is None:
             return None
         return MovieResponse(
@@ -59,45 +208,282 @@ class MovieService:
         )
 
     @staticmethod
-    def get_all_movies(db: Session, expand: List[str]) -> MovieListResponse:
+    def batch_get_movies(
+        db: Session, request: BatchGetRequest
+    ) -> MovieBatchGetResponse:
+        """
+        Busca vários filmes por IDs ou títulos, preservando a ordem pedida.
+        """
+        keys: List[Union[int, str]]
+        if request.ids is not None:
+            keys = list(request.ids)
+            items = MovieRepository.get_by_ids(db, request.ids)
+        else:
+            keys = list(request.names or [])
+            items = MovieRepository.get_by_titles(db, request.names or [])
+
+        return MovieService._batch_response(request, keys, items)
+
+    @staticmethod
+    def _batch_response(
+        request: BatchGetRequest, keys: List[Union[int, str]], items: List[Movie]
+    ) -> MovieBatchGetResponse:
+        """Alinha os filmes encontrados às chaves pedidas (None se ausente)."""
+        results, missing = align_to_keys(
+            keys,
+            items,
+            lambda item: (
+                cast(int, item.id) if request.ids is not None else str(item.title)
+            ),
+        )
+
+        return MovieBatchGetResponse(
+            movies=[
+                MovieResponse.model_validate(item) if item is not None else None
+                for item in results
+            ],
+            missing=missing,
+        )
+
+    @staticmethod
+    def search_movies(db: Session, query: str, limit: int) -> MovieListResponse:
+        """Busca filmes por palavras do título, dos mais aos menos relevantes."""
+        return MovieService._search_response(
+            MovieRepository.search_titles(db, query, limit)
+        )
+
+    @staticmethod
+    def _search_response(rows: Sequence[Row[Any]]) -> MovieListResponse:
+        """Converte as linhas (title, year, winner, id) da busca em resposta."""
+        return MovieListResponse(
+            movies=[
+                MovieDetailedResponse(title=title, year=year, winner=winner, id=id_)
+                for title, year, winner, id_ in rows
+            ]
+        )
+
+    @staticmethod
+    def get_all_movies(
+        db: Session,
+        expand: List[str],
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        filters: Optional[MovieFilter] = None,
+    ) -> MovieListResponse:
         """
-        Obtém todos os filmes, permitindo expandir os relacionamentos.
+        Obtém os filmes, permitindo expandir os relacionamentos, filtrar e paginar.
 
         :param db: Sessão do banco de dados.
         :param expand: Lista de expansões desejadas, ex: ["producers", "studios"]
+        :param limit: Tamanho da página (None para todos os filmes).
+        :param after_id: ID do último filme da página anterior.
+        :param filters: Filtros de ano e vencedor.
         :return: Lista de filmes com ou sem os relacionamentos.
         """
-        movies = MovieRepository.get_all(db, expand)
+        movies, next_cursor = build_page(
+            MovieRepository.get_all(
+                db, expand, limit + 1 if limit else None, after_id, filters
+            ),
+            limit,
+            lambda m: cast(int, m.id),
+        )
 
         return MovieListResponse(
-            movies=[
-                MovieDetailedResponse(
-                    id=cast(int, m.id),
-                    title=cast(str, m.title),
-                    year=cast(int, m.year),
-                    winner=cast(bool, m.winner),
-                    producers=(
-                        [
-                            ProducerResponse(id=cast(int, p.id), name=str(p.name))
-                            for p in m.producers
-                        ]
-                        if "producers" in expand
-                        else None
-                    ),
-                    studios=(
-                        [
-                            StudioResponse(id=cast(int, s.id), name=str(s.name))
-                            for s in m.studios
-                        ]
-                        if "studios" in expand
-                        else None
-                    ),
+            movies=[MovieService._to_detailed_response(m, expand) for m in movies],
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def get_all_movies_json(
+        db: Session,
+        expand: List[str],
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        filters: Optional[MovieFilter] = None,
+    ) -> bytes:
+        """
+        Caminho rápido da listagem: seleciona apenas colunas (sem entidades
+        ORM nem modelos pydantic) e codifica direto para JSON com orjson.
+
+        Sem `fields` o resultado é idêntico, byte a byte, ao de
+        `get_all_movies` serializado pelo FastAPI. Com `fields` apenas as
+        colunas pedidas (e as expansões) são selecionadas e serializadas.
+
+        :param db: Sessão do banco de dados.
+        :param expand: Lista de expansões desejadas, ex: ["producers", "studios"]
+        :param limit: Tamanho da página (None para todos os filmes).
+        :param after_id: ID do último filme da página anterior.
+        :param fields: Colunas desejadas, ex: ["id", "title"] (None para todas).
+        :param filters: Filtros de ano e vencedor.
+        :return: Corpo JSON da resposta.
+        """
+        columns, selected, id_index = MovieService._listing_columns(fields)
+        rows, next_cursor = build_page(
+            list(
+                MovieRepository.get_all_rows(
+                    db, limit + 1 if limit else None, after_id, selected, filters
                 )
-                for m in movies
-            ]
+            ),
+            limit,
+            lambda row: cast(int, row[id_index]),
+        )
+
+        movie_ids = MovieService._related_movie_ids(rows, id_index, limit, filters)
+        related = {
+            relation: MovieRepository.get_related_rows(db, relation, movie_ids)
+            for relation in MovieService.EXPAND_ORDER
+            if relation in expand
+        }
+        return MovieService._encode_listing(
+            columns, id_index, rows, next_cursor, related, fields
+        )
+
+    @staticmethod
+    def _listing_columns(
+        fields: Optional[List[str]],
+    ) -> Tuple[List[str], List[str], int]:
+        """
+        Colunas da listagem: as retornadas, as selecionadas (com o ID, que é
+        sempre lido por ser o cursor e a chave das expansões) e a posição do
+        ID nas linhas.
+        """
+        columns = [c for c in MovieRepository.COLUMNS if fields is None or c in fields]
+        selected = columns if "id" in columns else [*columns, "id"]
+        return columns, selected, selected.index("id")
+
+    @staticmethod
+    def _related_movie_ids(
+        rows: List[Row[Any]],
+        id_index: int,
+        limit: Optional[int],
+        filters: Optional[MovieFilter],
+    ) -> Optional[List[int]]:
+        """
+        Filmes cujas associações são lidas; sem paginação nem filtros todas
+        as associações são lidas (None), sem IN (...).
+        """
+        if limit is None and filters is None:
+            return None
+        return [row[id_index] for row in rows]
+
+    @staticmethod
+    def _encode_listing(
+        columns: List[str],
+        id_index: int,
+        rows: List[Row[Any]],
+        next_cursor: Optional[str],
+        related_rows: Dict[str, List[Row[Any]]],
+        fields: Optional[List[str]],
+    ) -> bytes:
+        """
+        Codifica a página da listagem com orjson, agrupando as linhas
+        (movie_id, id, name) de cada expansão pelo filme.
+        """
+        related: Dict[str, Dict[int, List[Dict[str, Any]]]] = {}
+        for relation, relation_rows in related_rows.items():
+            related[relation] = defaultdict(list)
+            for movie_id, related_id, name in relation_rows:
+                related[relation][movie_id].append({"name": name, "id": related_id})
+
+        # Sem `fields` as expansões não solicitadas saem como null (schema)
+        relations = [
+            r for r in MovieService.EXPAND_ORDER if fields is None or r in related
+        ]
+
+        movies = []
+        for row in rows:
+            movie: Dict[str, Any] = dict(zip(columns, row))
+            for relation in relations:
+                movie[relation] = (
+                    related[relation].get(row[id_index], [])
+                    if relation in related
+                    else None
+                )
+            movies.append(movie)
+
+        return orjson.dumps({"movies": movies, "next_cursor": next_cursor})
+
+    @staticmethod
+    def stream_movies(
+        db: Session,
+        expand: List[str],
+        after_id: Optional[int] = None,
+        ndjson: bool = True,
+        filters: Optional[MovieFilter] = None,
+    ) -> Iterator[bytes]:
+        """
+        Serializa os filmes à medida que são lidos do banco, em lotes.
+
+        :param db: Sessão do banco de dados.
+        :param expand: Lista de expansões desejadas, ex: ["producers", "studios"]
+        :param after_id: ID a partir do qual os filmes são retornados.
+        :param ndjson: True para NDJSON, False para o mesmo JSON da listagem.
+        :param filters: Filtros de ano e vencedor.
+        :return: Iterador com os blocos de bytes da resposta.
+        """
+        movies = (
+            MovieService._to_detailed_response(m, expand)
+            for m in MovieRepository.iter_all(
+                db, expand, after_id, Config.STREAM_BATCH_SIZE, filters
+            )
+        )
+        if ndjson:
+            return buffered(ndjson_lines(movies))
+        return buffered(json_list_envelope("movies", movies))
+
+    @staticmethod
+    def _to_detailed_response(movie: Movie, expand: List[str]) -> MovieDetailedResponse:
+        """Converte um Movie no schema detalhado, conforme as expansões."""
+        return MovieDetailedResponse(
+            id=cast(int, movie.id),
+            title=cast(str, movie.title),
+            year=cast(int, movie.year),
+            winner=cast(bool, movie.winner),
+            producers=(
+                [
+                    ProducerResponse(id=cast(int, p.id), name=str(p.name))
+                    for p in movie.producers
+                ]
+                if "producers" in expand
+                else None
+            ),
+            studios=(
+                [
+                    StudioResponse(id=cast(int, s.id), name=str(s.name))
+                    for s in movie.studios
+                ]
+                if "studios" in expand
+                else None
+            ),
         )
 
     @staticmethod
     def delete_movie(db: Session, movie_id: int) -> bool:
-        """Deleta um filme pelo ID."""
-        return MovieRepository.delete(db, movie_id)
+        """Deleta um filme pelo ID e remove suas entradas do cache."""
+        movie = MovieService.get_movie_by_id(db, movie_id)
+        deleted = MovieRepository.delete(db, movie_id)
+        MovieService.CACHE.delete(("id", movie_id))
+        if movie is not None:
+            MovieService.CACHE.delete(("title", movie.title))
+        if deleted:
+            AwardIntervalService.invalidate_cache()
+        return deleted
+
+    @staticmethod
+    def delete_movies(db: Session, ids: List[int]) -> MovieBulkDeleteResponse:
+        """
+        Deleta vários filmes com `DELETE ... WHERE id IN (...)`, sem carregá-los.
+
+        Como os títulos removidos não são lidos, o cache de filmes é esvaziado.
+
+        :param db: Sessão do banco de dados.
+        :param ids: IDs dos filmes (inexistentes são ignorados).
+        :return: Quantidade de filmes removidos.
+        """
+        deleted = MovieRepository.delete_many(db, ids)
+        if deleted:
+            logger.info(f"{deleted} filmes removidos em lote.")
+            MovieService.CACHE.clear()
+            AwardIntervalService.invalidate_cache()
+        return MovieBulkDeleteResponse(deleted=deleted)
@@ -1,12 +1,30 @@
+import orjson
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
+from app.models.producer import Producer
+from app.config import Config
 from app.repositories.producer_repository import ProducerRepository
-from app.schemas.producer import ProducerCreate, ProducerResponse, ProducerListResponse
-from typing import Optional, cast
+from app.schemas.producer import (
+    ProducerBatchGetResponse,
+    ProducerCreate,
+    ProducerListResponse,
+    ProducerResponse,
+)
+from app.schemas.batch import BatchGetRequest
+from app.services.award_interval_service import AwardIntervalService
+from app.utils.batch import align_to_keys
+from app.utils.cache import register_cache
+from app.utils.pagination import build_page
+from app.utils.streaming import buffered, json_list_envelope, ndjson_lines
+from typing import Any, Iterator, List, Optional, Sequence, Tuple, Union, cast
 
 
 class ProducerService:
     """Camada de serviço para Producers, aplicando regras de negócio."""
 
+    # Respostas de busca por ID e nome, incluindo os não encontrados (None)
+    CACHE = register_cache("producers", tables=("producers",))
+
     @staticmethod
     def create_producer(db: Session, producer_data: ProducerCreate) -> ProducerResponse:
         """Cria um novo produtor e retorna os dados formatados."""
@@ -14,36 +32,181 @@ class ProducerService:
         if producer is None:
             raise ValueError("Erro: Erro ao criar o Produtor.")
 
+        ProducerService.CACHE.delete(("id", producer.id), ("name", producer.name))
         return ProducerResponse(id=cast(int, producer.id), name=str(producer.name))
 
     @staticmethod
     def get_producer_by_id(db: Session, producer_id: int) -> Optional[ProducerResponse]:
-        """Obtém um produtor pelo ID, retornando no formato correto."""
-        producer = ProducerRepository.get_by_id(db, int(producer_id))
-        if producer:
-            return ProducerResponse(id=cast(int, producer.id), name=str(producer.name))
-        return None
+        """Obtém um produtor pelo ID, passando pelo cache de entidades."""
+        return ProducerService.CACHE.get_or_load(
+            ("id", int(producer_id)),
+            lambda: ProducerService._to_response(
+                ProducerRepository.get_by_id(db, int(producer_id))
+            ),
+        )
 
     @staticmethod
     def get_producer_by_name(db: Session, name: str) -> Optional[ProducerResponse]:
-        """Obtém um produtor pelo nome."""
-        producer = ProducerRepository.get_by_name(db, name)
-        if producer:
-            return ProducerResponse(id=cast(int, producer.id), name=str(producer.name))
-        return None
+        """Obtém um produtor pelo nome, passando pelo cache de entidades."""
+        return ProducerService.CACHE.get_or_load(
+            ("name", name),
+            lambda: ProducerService._to_response(
+                ProducerRepository.get_by_name(db, name)
+            ),
+        )
+
+    @staticmethod
+    def _to_response(producer: Optional[Producer]) -> Optional[ProducerResponse]:
+        """Converte o modelo em resposta (None quando não encontrado)."""
+        if producer is None:
+            return None
+        return ProducerResponse(id=cast(int, producer.id), name=str(producer.name))
+
+    @staticmethod
+    def batch_get_producers(
+        db: Session, request: BatchGetRequest
+    ) -> ProducerBatchGetResponse:
+        """
+        Busca vários produtores por IDs ou nomes, preservando a ordem pedida.
+        """
+        keys: List[Union[int, str]]
+        if request.ids is not None:
+            keys = list(request.ids)
+            items = ProducerRepository.get_by_ids(db, request.ids)
+        else:
+            keys = list(request.names or [])
+            items = ProducerRepository.get_by_names(db, request.names or [])
+
+        return ProducerService._batch_response(request, keys, items)
 
     @staticmethod
-    def get_all_producers(db: Session) -> ProducerListResponse:
-        """Obtém todos os produtores cadastrados no banco."""
-        producers = ProducerRepository.get_all(db)
+    def _batch_response(
+        request: BatchGetRequest, keys: List[Union[int, str]], items: List[Producer]
+    ) -> ProducerBatchGetResponse:
+        """Alinha os registros encontrados às chaves pedidas (None se ausente)."""
+        results, missing = align_to_keys(
+            keys,
+            items,
+            lambda item: (
+                cast(int, item.id) if request.ids is not None else str(item.name)
+            ),
+        )
+
+        return ProducerBatchGetResponse(
+            producers=[
+                ProducerResponse.model_validate(item) if item is not None else None
+                for item in results
+            ],
+            missing=missing,
+        )
+
+    @staticmethod
+    def search_producers(db: Session, query: str, limit: int) -> ProducerListResponse:
+        """Busca produtores pelo início do nome (sem acentos nem maiúsculas)."""
+        return ProducerService._search_response(
+            ProducerRepository.search(db, query, limit)
+        )
+
+    @staticmethod
+    def _search_response(rows: Sequence[Row[Any]]) -> ProducerListResponse:
+        """Converte as linhas (name, id) da busca em resposta."""
+        return ProducerListResponse(
+            producers=[ProducerResponse(id=id_, name=name) for name, id_ in rows]
+        )
+
+    @staticmethod
+    def get_all_producers(
+        db: Session, limit: Optional[int] = None, after_id: Optional[int] = None
+    ) -> ProducerListResponse:
+        """Obtém os produtores cadastrados no banco, com paginação opcional."""
+        producers, next_cursor = build_page(
+            ProducerRepository.get_all(db, limit + 1 if limit else None, after_id),
+            limit,
+            lambda p: cast(int, p.id),
+        )
         return ProducerListResponse(
             producers=[
                 ProducerResponse(id=cast(int, p.id), name=str(p.name))
                 for p in producers
-            ]
+            ],
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def get_all_producers_json(
+        db: Session,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+    ) -> bytes:
+        """
+        Caminho rápido da listagem: seleciona apenas colunas e codifica direto
+        para JSON com orjson, no mesmo formato de `get_all_producers`. Com `fields`
+        apenas as colunas pedidas são selecionadas e serializadas.
+        """
+        columns, selected, id_index = ProducerService._listing_columns(fields)
+        rows, next_cursor = build_page(
+            list(
+                ProducerRepository.get_all_rows(
+                    db, limit + 1 if limit else None, after_id, selected
+                )
+            ),
+            limit,
+            lambda row: cast(int, row[id_index]),
+        )
+        return ProducerService._encode_listing(columns, rows, next_cursor)
+
+    @staticmethod
+    def _listing_columns(
+        fields: Optional[List[str]],
+    ) -> Tuple[List[str], List[str], int]:
+        """
+        Colunas da listagem: as retornadas, as selecionadas (com o ID, que é
+        sempre lido por ser o cursor da próxima página) e a posição do ID.
+        """
+        columns = [
+            c for c in ProducerRepository.COLUMNS if fields is None or c in fields
+        ]
+        selected = columns if "id" in columns else [*columns, "id"]
+        return columns, selected, selected.index("id")
+
+    @staticmethod
+    def _encode_listing(
+        columns: List[str], rows: List[Row[Any]], next_cursor: Optional[str]
+    ) -> bytes:
+        """Codifica a página da listagem com orjson."""
+        return orjson.dumps(
+            {
+                "producers": [dict(zip(columns, row)) for row in rows],
+                "next_cursor": next_cursor,
+            }
+        )
+
+    @staticmethod
+    def stream_producers(
+        db: Session, after_id: Optional[int] = None, ndjson: bool = True
+    ) -> Iterator[bytes]:
+        """Serializa os produtores à medida que são lidos do banco, em lotes."""
+        producers = (
+            ProducerResponse(id=cast(int, p.id), name=str(p.name))
+            for p in ProducerRepository.iter_all(db, after_id, Config.STREAM_BATCH_SIZE)
         )
+        if ndjson:
+            return buffered(ndjson_lines(producers))
+        return buffered(json_list_envelope("producers", producers))
 
     @staticmethod
     def delete_producer(db: Session, producer_id: int) -> bool:
-        """Deleta um produtor pelo ID."""
-        return ProducerRepository.delete(db, int(producer_id))
+        """
+        Deleta um produtor pelo ID e remove suas entradas do cache. As
+        associações saem em cascata, então o cálculo de prêmios também é
+        invalidado.
+        """
+        producer = ProducerService.get_producer_by_id(db, producer_id)
+        deleted = ProducerRepository.delete(db, int(producer_id))
+        ProducerService.CACHE.delete(("id", int(producer_id)))
+        if producer is not None:
+            ProducerService.CACHE.delete(("name", producer.name))
+        if deleted:
+            AwardIntervalService.invalidate_cache()
+        return deleted
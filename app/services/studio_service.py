@@ -1,12 +1,29 @@
+import orjson
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
+from app.models.studio import Studio
+from app.config import Config
 from app.repositories.studio_repository import StudioRepository
-from app.schemas.studio import StudioCreate, StudioResponse, StudioListResponse
-from typing import Optional, cast
+from app.schemas.studio import (
+    StudioBatchGetResponse,
+    StudioCreate,
+    StudioListResponse,
+    StudioResponse,
+)
+from app.schemas.batch import BatchGetRequest
+from app.utils.batch import align_to_keys
+from app.utils.cache import register_cache
+from app.utils.pagination import build_page
+from app.utils.streaming import buffered, json_list_envelope, ndjson_lines
+from typing import Any, Iterator, List, Optional, Sequence, Tuple, Union, cast
 
 
 class StudioService:
     """Camada de serviço para Studios, aplicando regras de negócio."""
 
+    # Respostas de busca por ID e nome, incluindo os não encontrados (None)
+    CACHE = register_cache("studios", tables=("studios",))
+
     @staticmethod
     def create_studio(db: Session, studio_data: StudioCreate) -> StudioResponse:
         """Cria um novo estúdio e retorna os dados formatados."""
@@ -14,35 +31,168 @@ class StudioService:
         if studio is None:
             raise ValueError("Erro: Erro ao criar o Estúdio.")
 
+        StudioService.CACHE.delete(("id", studio.id), ("name", studio.name))
         return StudioResponse(id=cast(int, studio.id), name=str(studio.name))
 
     @staticmethod
     def get_studio_by_id(db: Session, studio_id: int) -> Optional[StudioResponse]:
-        """Obtém um estúdio pelo ID, retornando no formato correto."""
-        studio = StudioRepository.get_by_id(db, int(studio_id))
-        if studio:
-            return StudioResponse(id=cast(int, studio.id), name=str(studio.name))
-        return None
+        """Obtém um estúdio pelo ID, passando pelo cache de entidades."""
+        return StudioService.CACHE.get_or_load(
+            ("id", int(studio_id)),
+            lambda: StudioService._to_response(
+                StudioRepository.get_by_id(db, int(studio_id))
+            ),
+        )
 
     @staticmethod
     def get_studio_by_name(db: Session, name: str) -> Optional[StudioResponse]:
-        """Obtém um estúdio pelo nome."""
-        studio = StudioRepository.get_by_name(db, name)
-        if studio:
-            return StudioResponse(id=cast(int, studio.id), name=str(studio.name))
-        return None
+        """Obtém um estúdio pelo nome, passando pelo cache de entidades."""
+        return StudioService.CACHE.get_or_load(
+            ("name", name),
+            lambda: StudioService._to_response(StudioRepository.get_by_name(db, name)),
+        )
+
+    @staticmethod
+    def _to_response(studio: Optional[Studio]) -> Optional[StudioResponse]:
+        """Converte o modelo em resposta (None quando não encontrado)."""
+        if studio is None:
+            return None
+        return StudioResponse(id=cast(int, studio.id), name=str(studio.name))
+
+    @staticmethod
+    def batch_get_studios(
+        db: Session, request: BatchGetRequest
+    ) -> StudioBatchGetResponse:
+        """
+        Busca vários estúdios por IDs ou nomes, preservando a ordem pedida.
+        """
+        keys: List[Union[int, str]]
+        if request.ids is not None:
+            keys = list(request.ids)
+            items = StudioRepository.get_by_ids(db, request.ids)
+        else:
+            keys = list(request.names or [])
+            items = StudioRepository.get_by_names(db, request.names or [])
+
+        return StudioService._batch_response(request, keys, items)
+
+    @staticmethod
+    def _batch_response(
+        request: BatchGetRequest, keys: List[Union[int, str]], items: List[Studio]
+    ) -> StudioBatchGetResponse:
+        """Alinha os registros encontrados às chaves pedidas (None se ausente)."""
+        results, missing = align_to_keys(
+            keys,
+            items,
+            lambda item: (
+                cast(int, item.id) if request.ids is not None else str(item.name)
+            ),
+        )
+
+        return StudioBatchGetResponse(
+            studios=[
+                StudioResponse.model_validate(item) if item is not None else None
+                for item in results
+            ],
+            missing=missing,
+        )
+
+    @staticmethod
+    def search_studios(db: Session, query: str, limit: int) -> StudioListResponse:
+        """Busca estúdios pelo início do nome (sem acentos nem maiúsculas)."""
+        return StudioService._search_response(StudioRepository.search(db, query, limit))
 
     @staticmethod
-    def get_all_studios(db: Session) -> StudioListResponse:
-        """Obtém todos os estúdios cadastrados no banco."""
-        studios = StudioRepository.get_all(db)
+    def _search_response(rows: Sequence[Row[Any]]) -> StudioListResponse:
+        """Converte as linhas (name, id) da busca em resposta."""
+        return StudioListResponse(
+            studios=[StudioResponse(id=id_, name=name) for name, id_ in rows]
+        )
+
+    @staticmethod
+    def get_all_studios(
+        db: Session, limit: Optional[int] = None, after_id: Optional[int] = None
+    ) -> StudioListResponse:
+        """Obtém os estúdios cadastrados no banco, com paginação opcional."""
+        studios, next_cursor = build_page(
+            StudioRepository.get_all(db, limit + 1 if limit else None, after_id),
+            limit,
+            lambda s: cast(int, s.id),
+        )
         return StudioListResponse(
             studios=[
                 StudioResponse(id=cast(int, s.id), name=str(s.name)) for s in studios
-            ]
+            ],
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def get_all_studios_json(
+        db: Session,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+    ) -> bytes:
+        """
+        Caminho rápido da listagem: seleciona apenas colunas e codifica direto
+        para JSON com orjson, no mesmo formato de `get_all_studios`. Com `fields`
+        apenas as colunas pedidas são selecionadas e serializadas.
+        """
+        columns, selected, id_index = StudioService._listing_columns(fields)
+        rows, next_cursor = build_page(
+            list(
+                StudioRepository.get_all_rows(
+                    db, limit + 1 if limit else None, after_id, selected
+                )
+            ),
+            limit,
+            lambda row: cast(int, row[id_index]),
+        )
+        return StudioService._encode_listing(columns, rows, next_cursor)
+
+    @staticmethod
+    def _listing_columns(
+        fields: Optional[List[str]],
+    ) -> Tuple[List[str], List[str], int]:
+        """
+        Colunas da listagem: as retornadas, as selecionadas (com o ID, que é
+        sempre lido por ser o cursor da próxima página) e a posição do ID.
+        """
+        columns = [c for c in StudioRepository.COLUMNS if fields is None or c in fields]
+        selected = columns if "id" in columns else [*columns, "id"]
+        return columns, selected, selected.index("id")
+
+    @staticmethod
+    def _encode_listing(
+        columns: List[str], rows: List[Row[Any]], next_cursor: Optional[str]
+    ) -> bytes:
+        """Codifica a página da listagem com orjson."""
+        return orjson.dumps(
+            {
+                "studios": [dict(zip(columns, row)) for row in rows],
+                "next_cursor": next_cursor,
+            }
+        )
+
+    @staticmethod
+    def stream_studios(
+        db: Session, after_id: Optional[int] = None, ndjson: bool = True
+    ) -> Iterator[bytes]:
+        """Serializa os estúdios à medida que são lidos do banco, em lotes."""
+        studios = (
+            StudioResponse(id=cast(int, s.id), name=str(s.name))
+            for s in StudioRepository.iter_all(db, after_id, Config.STREAM_BATCH_SIZE)
         )
+        if ndjson:
+            return buffered(ndjson_lines(studios))
+        return buffered(json_list_envelope("studios", studios))
 
     @staticmethod
     def delete_studio(db: Session, studio_id: int) -> bool:
-        """Deleta um estúdio pelo ID."""
-        return StudioRepository.delete(db, int(studio_id))
+        """Deleta um estúdio pelo ID e remove suas entradas do cache."""
+        studio = StudioService.get_studio_by_id(db, studio_id)
+        deleted = StudioRepository.delete(db, int(studio_id))
+        StudioService.CACHE.delete(("id", int(studio_id)))
+        if studio is not None:
+            StudioService.CACHE.delete(("name", studio.name))
+        return deleted
@@ -0,0 +1,31 @@
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+def align_to_keys(
+    keys: Sequence[K], items: Iterable[T], get_key: Callable[[T], K]
+) -> Tuple[List[Optional[T]], List[K]]:
+    """
+    Ordena os itens encontrados na mesma ordem das chaves pedidas.
+
+    :param keys: Chaves na ordem da requisição (repetições são mantidas).
+    :param items: Itens encontrados no banco, em qualquer ordem.
+    :param get_key: Função que extrai a chave de um item.
+    :return: Tupla (resultados alinhados com None nas ausências, chaves ausentes).
+    """
+    found: Dict[K, T] = {get_key(item): item for item in items}
+    results = [found.get(key) for key in keys]
+    missing = [key for key, item in zip(keys, results) if item is None]
+    return results, missing
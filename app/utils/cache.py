@@ -0,0 +1,227 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from app.config import Config
+
+T = TypeVar("T")
+
+
+class TTLCache:
+    """
+    Cache em memória limitado (LRU) com expiração por tempo (TTL).
+
+    Também guarda resultados negativos (ex: None para um ID inexistente),
+    por `negative_ttl`, e conta acertos, faltas e remoções para as métricas.
+    Com `tables`, o cache é esvaziado quando a geração de uma dessas tabelas
+    muda (ver `validate`).
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+        tables: Tuple[str, ...] = (),
+        negative_ttl: Optional[float] = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = ttl if negative_ttl is None else min(negative_ttl, ttl)
+        self.timer = timer
+        self.tables = tables
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._generations: Optional[Tuple[int, ...]] = None
+        # Incrementada a cada remoção, para descartar cargas iniciadas antes dela
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Busca uma chave no cache.
+
+        :param key: Chave procurada.
+        :return: Tupla (encontrado, valor); o valor pode ser None (negativo).
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > self.timer():
+                self._data.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return False, None
+
+    def set(self, key: Hashable, value: Any, version: Optional[int] = None) -> None:
+        """
+        Grava um valor (None vale por `negative_ttl`), descartando o item
+        usado há mais tempo se cheio.
+
+        :param key: Chave do valor.
+        :param value: Valor a gravar.
+        :param version: Versão lida antes de carregar o valor (ver `version`);
+            se houve remoção depois dela, o valor pode estar desatualizado e
+            não é gravado.
+        """
+        with self._lock:
+            if version is not None and version != self._version:
+                return
+            ttl = self.negative_ttl if value is None else self.ttl
+            self._data[key] = (self.timer() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    @property
+    def version(self) -> int:
+        """Versão atual, incrementada a cada `delete`, `clear` ou invalidação."""
+        with self._lock:
+            return self._version
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], T]) -> T:
+        """
+        Retorna o valor em cache ou carrega com `loader` e grava o resultado,
+        inclusive quando ele é None. Se uma remoção acontecer durante a carga,
+        o resultado é retornado mas não é gravado.
+        """
+        version = self.version
+        found, value = self.get(key)
+        if found:
+            return value  # type: ignore[no-any-return]
+        value = loader()
+        self.set(key, value, version)
+        return value
+
+    async def get_or_load_async(
+        self, key: Hashable, loader: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Variante de `get_or_load` para carregadores async (AsyncSession)."""
+        version = self.version
+        found, value = self.get(key)
+        if found:
+            return value  # type: ignore[no-any-return]
+        value = await loader()
+        self.set(key, value, version)
+        return value
+
+    def delete(self, *keys: Hashable) -> None:
+        """Remove as chaves informadas, se existirem."""
+        with self._lock:
+            self._version += 1
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove todas as entradas (os contadores são mantidos)."""
+        with self._lock:
+            self._version += 1
+            self._data.clear()
+
+    def validate(self, generations: Dict[str, int]) -> bool:
+        """
+        Compara as gerações das tabelas do cache com as últimas vistas e
+        esvazia o cache se alguma mudou (ex: escrita feita por outro processo).
+        A primeira validação também esvazia, pois não há geração de referência.
+
+        :param generations: Geração atual de cada tabela, lida do banco.
+        :return: True se o cache foi esvaziado.
+        """
+        if not self.tables:
+            return False
+        current = tuple(generations.get(table, 0) for table in self.tables)
+        with self._lock:
+            changed = current != self._generations
+            self._generations = current
+            if changed:
+                self._version += 1
+                self._data.clear()
+                self.invalidations += 1
+        return changed
+
+    def stats(self) -> Dict[str, float | int]:
+        """Contadores e taxa de acerto do cache."""
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_ratio": round(self.hits / requests, 4) if requests else 0.0,
+            }
+
+
+CACHES: Dict[str, TTLCache] = {}
+
+
+def register_cache(
+    name: str,
+    maxsize: Optional[int] = None,
+    ttl: Optional[float] = None,
+    tables: Tuple[str, ...] = (),
+    negative_ttl: Optional[float] = None,
+) -> TTLCache:
+    """
+    Cria (ou retorna) o cache nomeado, por padrão com tamanho e TTLs da
+    configuração.
+
+    :param name: Nome do cache, usado nas métricas.
+    :param maxsize: Quantidade máxima de entradas.
+    :param ttl: Validade das entradas, em segundos.
+    :param tables: Tabelas cujas gerações validam o cache entre processos.
+    :param negative_ttl: Validade dos resultados None, em segundos.
+    :return: Instância do cache.
+    """
+    if name not in CACHES:
+        CACHES[name] = TTLCache(
+            Config.ENTITY_CACHE_SIZE if maxsize is None else maxsize,
+            Config.ENTITY_CACHE_TTL if ttl is None else ttl,
+            tables=tables,
+            negative_ttl=(
+                Config.ENTITY_CACHE_NEGATIVE_TTL
+                if negative_ttl is None
+                else negative_ttl
+            ),
+        )
+    return CACHES[name]
+
+
+def cache_stats() -> Dict[str, Dict[str, float | int]]:
+    """Métricas de todos os caches registrados."""
+    return {name: cache.stats() for name, cache in CACHES.items()}
+
+
+def clear_caches() -> None:
+    """Esvazia todos os caches registrados."""
+    for cache in CACHES.values():
+        cache.clear()
+
+
+def validate_caches(generations: Dict[str, int]) -> List[str]:
+    """
+    Valida todos os caches registrados contra as gerações lidas do banco.
+
+    :param generations: Geração atual de cada tabela.
+    :return: Nomes dos caches esvaziados.
+    """
+    return [name for name, cache in CACHES.items() if cache.validate(generations)]
@@ -0,0 +1,20 @@
+from typing import Iterator, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+def chunked(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """
+    Divide uma sequência em blocos de até `size` itens.
+
+    Usado para limitar a quantidade de parâmetros em consultas `IN (...)`.
+
+    :param items: Sequência a ser dividida.
+    :param size: Tamanho máximo de cada bloco.
+    :return: Iterador com os blocos.
+    :raises ValueError: Se `size` não for positivo.
+    """
+    if size < 1:
+        raise ValueError("O tamanho do bloco deve ser positivo.")
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
@@ -0,0 +1,60 @@
+import gzip
+from typing import Dict, Optional, Tuple
+
+import brotli
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+# Codificações suportadas, na ordem de preferência do servidor
+ENCODINGS = ("br", "gzip")
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """Codificações suportadas, na ordem de preferência do servidor."""
+    return ENCODINGS
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """
+    Comprime o corpo com a codificação informada, no nível máximo, já que o
+    resultado é gerado uma vez e reaproveitado.
+
+    :param body: Conteúdo original.
+    :param encoding: "br" ou "gzip".
+    :return: Conteúdo comprimido.
+    """
+    if encoding == "br":
+        return bytes(brotli.compress(body, quality=BROTLI_QUALITY))
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    raise ValueError(f"Codificação não suportada: {encoding}")
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Escolhe a codificação a partir do cabeçalho Accept-Encoding, respeitando
+    os pesos (q) e, no empate, a preferência do servidor.
+
+    :param accept_encoding: Valor do cabeçalho (None se ausente).
+    :return: Codificação escolhida ou None para enviar sem compressão.
+    """
+    if not accept_encoding:
+        return None
+
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        weight = 1.0
+        if params.strip().startswith("q="):
+            try:
+                weight = float(params.strip()[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+
+    candidates = [
+        (weights.get(encoding, weights.get("*", 0.0)), -index, encoding)
+        for index, encoding in enumerate(available_encodings())
+    ]
+    weight, _, encoding = max(candidates)
+    return encoding if weight > 0 else None
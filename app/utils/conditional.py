@@ -0,0 +1,41 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Dict, Optional, Sequence
+
+
+def entity_tag(name: str, generations: Sequence[int], variant: str) -> str:
+    """
+    Monta a ETag de uma listagem a partir das gerações das tabelas envolvidas.
+
+    :param name: Nome da listagem (ex: "movies").
+    :param generations: Gerações das tabelas de que a listagem depende.
+    :param variant: Representação enviada (ex: "json" ou "ndjson").
+    :return: ETag forte, entre aspas.
+    """
+    return f'"{name}-{variant}-{".".join(str(g) for g in generations)}"'
+
+
+def http_date(value: datetime) -> str:
+    """Formata a data no padrão HTTP (IMF-fixdate), assumindo UTC se ingênua."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Indica se o cabeçalho If-None-Match contém a ETag informada, usando a
+    comparação fraca (o prefixo W/ é ignorado), como pede o RFC 9110.
+    """
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime]) -> Dict[str, str]:
+    """Cabeçalhos de validação (ETag, Last-Modified e Vary) da resposta."""
+    headers = {"ETag": etag, "Vary": "Accept"}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
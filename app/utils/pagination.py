@@ -0,0 +1,83 @@
+import base64
+import binascii
+from typing import Callable, List, Optional, Tuple, TypeVar
+
+from app.config import Config
+
+CURSOR_PREFIX = "id:"
+
+T = TypeVar("T")
+
+
+def encode_cursor(last_id: int) -> str:
+    """
+    Gera um cursor opaco a partir do último ID retornado em uma página.
+
+    :param last_id: ID do último registro da página.
+    :return: Cursor codificado em base64 (url-safe, sem padding).
+    """
+    raw = f"{CURSOR_PREFIX}{last_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    Recupera o ID contido em um cursor gerado por `encode_cursor`.
+
+    :param cursor: Cursor recebido do cliente.
+    :return: ID a partir do qual a próxima página deve começar.
+    :raises ValueError: Se o cursor for inválido.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError(f"Cursor inválido: {cursor}")
+
+    if not raw.startswith(CURSOR_PREFIX) or not raw[len(CURSOR_PREFIX) :].isdigit():
+        raise ValueError(f"Cursor inválido: {cursor}")
+
+    return int(raw[len(CURSOR_PREFIX) :])
+
+
+def resolve_page(
+    limit: Optional[int], after: Optional[str]
+) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Normaliza os parâmetros de paginação recebidos na requisição.
+
+    Sem `limit` e sem `after` a listagem continua completa (compatibilidade).
+    Quando informado, `limit` é limitado a `Config.MAX_PAGE_SIZE`.
+
+    :param limit: Tamanho de página solicitado.
+    :param after: Cursor opaco da página anterior.
+    :return: Tupla (limit efetivo, ID a partir do qual buscar).
+    :raises ValueError: Se o cursor ou o limite forem inválidos.
+    """
+    if limit is not None and limit < 1:
+        raise ValueError("O parâmetro limit deve ser maior que zero.")
+
+    after_id = decode_cursor(after) if after else None
+
+    if limit is None and after_id is None:
+        return None, None
+
+    return min(limit or Config.MAX_PAGE_SIZE, Config.MAX_PAGE_SIZE), after_id
+
+
+def build_page(
+    items: List[T], limit: Optional[int], get_id: Callable[[T], int]
+) -> Tuple[List[T], Optional[str]]:
+    """
+    Recorta uma página buscada com `limit + 1` itens e gera o próximo cursor.
+
+    :param items: Itens retornados pelo banco (até `limit + 1`).
+    :param limit: Tamanho da página (None quando não há paginação).
+    :param get_id: Função que extrai o ID de um item.
+    :return: Tupla (itens da página, cursor da próxima página ou None).
+    """
+    if limit is None or len(items) <= limit:
+        return items, None
+
+    page = items[:limit]
+    return page, encode_cursor(get_id(page[-1]))
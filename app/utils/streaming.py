@@ -0,0 +1,107 @@
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, Optional
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+JSON_MEDIA_TYPE = "application/json"
+
+# Tamanho mínimo dos blocos enviados ao cliente durante o streaming
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def wants_ndjson(accept: Optional[str]) -> bool:
+    """Indica se o cabeçalho Accept solicita NDJSON."""
+    return bool(accept) and NDJSON_MEDIA_TYPE in str(accept).lower()
+
+
+def ndjson_lines(items: Iterable[BaseModel]) -> Iterator[bytes]:
+    """Codifica cada item como uma linha JSON (NDJSON)."""
+    for item in items:
+        yield item.model_dump_json().encode() + b"\n"
+
+
+def json_list_envelope(key: str, items: Iterable[BaseModel]) -> Iterator[bytes]:
+    """
+    Codifica os itens no mesmo formato das respostas de listagem
+    (`{"<key>": [...], "next_cursor": null}`), item a item.
+
+    :param key: Nome da lista no envelope (ex: "movies").
+    :param items: Itens a serem serializados.
+    :return: Iterador com os fragmentos do documento JSON.
+    """
+    yield b'{"' + key.encode() + b'":['
+    separator = b""
+    for item in items:
+        yield separator + item.model_dump_json().encode()
+        separator = b","
+    yield b'],"next_cursor":null}'
+
+
+def buffered(chunks: Iterable[bytes], size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """Agrupa fragmentos pequenos em blocos de até `size` bytes."""
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        if len(buffer) >= size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def close_session_after(db: Session, chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Repassa os blocos e fecha a sessão ao fim do streaming.
+
+    As dependências com `yield` encerram antes do envio do corpo de uma
+    StreamingResponse, então a conexão usada pelo cursor é liberada aqui.
+    """
+    try:
+        yield from chunks
+    finally:
+        db.close()
+
+
+async def ndjson_lines_async(items: AsyncIterable[BaseModel]) -> AsyncIterator[bytes]:
+    """Variante de `ndjson_lines` para itens lidos de uma AsyncSession."""
+    async for item in items:
+        yield item.model_dump_json().encode() + b"\n"
+
+
+async def json_list_envelope_async(
+    key: str, items: AsyncIterable[BaseModel]
+) -> AsyncIterator[bytes]:
+    """Variante de `json_list_envelope` para itens lidos de uma AsyncSession."""
+    yield b'{"' + key.encode() + b'":['
+    separator = b""
+    async for item in items:
+        yield separator + item.model_dump_json().encode()
+        separator = b","
+    yield b'],"next_cursor":null}'
+
+
+async def buffered_async(
+    chunks: AsyncIterable[bytes], size: int = STREAM_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Variante de `buffered` para fragmentos produzidos de forma async."""
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer += chunk
+        if len(buffer) >= size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+async def close_session_after_async(
+    db: AsyncSession, chunks: AsyncIterable[bytes]
+) -> AsyncIterator[bytes]:
+    """Variante de `close_session_after` para uma AsyncSession."""
+    try:
+        async for chunk in chunks:
+            yield chunk
+    finally:
+        await db.close()
@@ -0,0 +1,45 @@
+import re
+import unicodedata
+from typing import Optional
+
+
+def normalize_name(value: str) -> str:
+    """
+    Normaliza um nome para buscas: remove acentos, espaços nas pontas e
+    aplica casefold (ex: " Estúdio Ñ " -> "estudio n").
+
+    :param value: Nome original.
+    :return: Nome normalizado.
+    """
+    decomposed = unicodedata.normalize("NFKD", value.strip())
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return stripped.casefold()
+
+
+def prefix_upper_bound(prefix: str) -> Optional[str]:
+    """
+    Menor string maior que todas as que começam com `prefix`, para buscas por
+    intervalo (`>= prefix AND < limite`) que aproveitam o índice.
+
+    :param prefix: Prefixo já normalizado.
+    :return: Limite superior exclusivo ou None se não houver (sem limite).
+    """
+    chars = prefix.rstrip(chr(0x10FFFF))
+    if not chars:
+        return None
+    return chars[:-1] + chr(ord(chars[-1]) + 1)
+
+
+def fts_query(value: str) -> str:
+    """
+    Monta uma consulta FTS5 segura a partir do texto digitado: cada palavra
+    vira um termo entre aspas (todas obrigatórias) e a última também casa
+    como prefixo (ex: "lonely lad" -> '"lonely" "lad"*').
+
+    :param value: Texto digitado pelo usuário.
+    :return: Expressão MATCH ou string vazia se não houver palavras.
+    """
+    tokens = re.findall(r"\w+", value)
+    if not tokens:
+        return ""
+    return " ".join(f'"{token}"' for token in tokens) + "*"
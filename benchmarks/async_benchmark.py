@@ -0,0 +1,225 @@
+"""
+Benchmark de latência sob alta concorrência: rotas síncronas x async.
+
+Monta a aplicação com as rotas síncronas (Session na threadpool do anyio) ou
+com as rotas async (AsyncSession com aiosqlite), popula um banco SQLite novo
+e dispara as requisições com até `--concurrency` conexões simultâneas pelo
+transporte ASGI do httpx, medindo p50/p99 de latência, vazão e memória.
+
+Cada modo roda em um processo novo, para que o pico de memória residente
+(que inclui as pilhas das threads da threadpool) não se misture entre eles.
+
+Uso:
+    python -m benchmarks.async_benchmark --concurrency 1000 --requests 20000
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, Iterator, List
+
+import httpx
+from fastapi import FastAPI
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.routes import async_movie_routes, movie_routes
+from app.db.async_database import build_async_engine, get_async_db
+from app.db.database import build_engine, get_db
+from app.models import Base
+from app.utils.cache import clear_caches
+from app.utils.pagination import encode_cursor
+from benchmarks.common import load_baseline, report_against_baseline, save_baseline
+from benchmarks.sqlite_profile_benchmark import seed
+
+DEFAULT_BASELINE = os.path.join("benchmarks", "baselines", "async.json")
+METRICS = ["ops_per_sec", "p99_ms", "rss_growth_bytes"]
+MODES = ["sync", "async"]
+
+
+def build_app(mode: str, url: str) -> FastAPI:
+    """
+    Cria a aplicação só com as rotas de filmes do modo informado.
+
+    :param mode: "sync" ou "async".
+    :param url: URL síncrona do banco (convertida para aiosqlite no modo async).
+    :return: Aplicação com a engine encerrada no fim do lifespan.
+    """
+    if mode == "async":
+        async_engine = build_async_engine(url)
+        async_factory = async_sessionmaker(
+            async_engine, autoflush=False, expire_on_commit=False
+        )
+
+        async def get_session() -> AsyncIterator[AsyncSession]:
+            async with async_factory() as db:
+                yield db
+
+        async def dispose() -> None:
+            await async_engine.dispose()
+
+        router = async_movie_routes.router
+        dependency: Any = get_async_db
+        override: Any = get_session
+    else:
+        engine = build_engine(url)
+        factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        def get_sync_session() -> Iterator[Session]:
+            with factory() as db:
+                yield db
+
+        async def dispose() -> None:
+            engine.dispose()
+
+        router = movie_routes.router
+        dependency = get_db
+        override = get_sync_session
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+        yield
+        await dispose()
+
+    app = FastAPI(lifespan=lifespan)
+    app.include_router(router)
+    app.dependency_overrides[dependency] = override
+    return app
+
+
+def request_paths(requests: int, movies: int) -> List[str]:
+    """Páginas filtradas por ano e por cursor (consultam o banco a cada chamada)."""
+    return [
+        (
+            f"/movies/?limit=20&year={1980 + i % 40}"
+            if i % 2
+            else f"/movies/?limit=20&after={encode_cursor(i % movies)}"
+        )
+        for i in range(requests)
+    ]
+
+
+async def _load(app: FastAPI, paths: List[str], concurrency: int) -> List[float]:
+    """Dispara as requisições com até `concurrency` em andamento."""
+    latencies: List[float] = []
+    slots = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async def call(client: httpx.AsyncClient, path: str) -> None:
+        async with slots:
+            start = time.perf_counter()
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - start)
+            response.raise_for_status()
+
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://bench",
+            limits=limits,
+            timeout=None,
+        ) as client,
+    ):
+        await asyncio.gather(*(call(client, path) for path in paths))
+    return latencies
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Percentil por posição (ex: 0.99 para p99) de uma lista não vazia."""
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def run_mode(
+    mode: str, movies: int, requests: int, concurrency: int, workdir: str
+) -> Dict[str, Any]:
+    """
+    Executa a carga em um banco novo com as rotas do modo informado.
+
+    :param mode: "sync" ou "async".
+    :param movies: Quantidade de filmes pré-cadastrados.
+    :param requests: Total de requisições.
+    :param concurrency: Requisições simultâneas.
+    :param workdir: Diretório temporário para o banco.
+    :return: Métricas coletadas.
+    """
+    logger.disable("app")  # o processo do modo não herda a configuração do pai
+    url = f"sqlite:///{os.path.join(workdir, f'{mode}.db')}"
+    engine = build_engine(url)
+    Base.metadata.create_all(bind=engine)
+    seed(engine, movies)
+    engine.dispose()
+    clear_caches()
+
+    app = build_app(mode, url)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    latencies = asyncio.run(_load(app, request_paths(requests, movies), concurrency))
+    elapsed = time.perf_counter() - start
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return {
+        "requests": requests,
+        "seconds": round(elapsed, 4),
+        "ops_per_sec": round(requests / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 0.5) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        # ru_maxrss é medido em KiB no Linux
+        "peak_rss_bytes": rss_after * 1024,
+        "rss_growth_bytes": (rss_after - rss_before) * 1024,
+    }
+
+
+def run(
+    modes: List[str], movies: int, requests: int, concurrency: int
+) -> Dict[str, Dict[str, Any]]:
+    """Executa a carga para cada modo informado, cada um em um processo novo."""
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as workdir:
+        for mode in modes:
+            key = f"{mode}:{requests}x{concurrency}"
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                results[key] = executor.submit(
+                    run_mode, mode, movies, requests, concurrency, workdir
+                ).result()
+            print(f"{key} -> {results[key]}")
+    return results
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--modes", default=",".join(MODES), help="Modos separados por vírgula."
+    )
+    parser.add_argument("--movies", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=1_000)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    logger.disable("app")
+    modes = [m for m in args.modes.split(",") if m]
+    results = run(modes, args.movies, args.requests, args.concurrency)
+
+    if args.update_baseline:
+        save_baseline(args.baseline, {**load_baseline(args.baseline), **results})
+        print(f"Baseline atualizado em {args.baseline}")
+        return 0
+
+    return report_against_baseline(results, args.baseline, args.tolerance, METRICS)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Métricas em que valores maiores são melhores; nas demais, menores são melhores
+HIGHER_IS_BETTER = {"rows_per_sec", "ops_per_sec"}
+
+
+class QueryCounter:
+    """Conta as idas ao banco (execuções de cursor) feitas por uma engine."""
+
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+        self.count = 0
+
+    def _on_execute(self, *args: Any, **kwargs: Any) -> None:
+        self.count += 1
+
+    @contextmanager
+    def track(self) -> Iterator["QueryCounter"]:
+        """Registra o listener enquanto o bloco estiver em execução."""
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        try:
+            yield self
+        finally:
+            event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+def measure(
+    engine: Engine, rows: int, fn: Callable[[], None]
+) -> Dict[str, float | int]:
+    """
+    Executa `fn` medindo tempo, pico de memória alocada e idas ao banco.
+
+    :param engine: Engine usada por `fn`, para contagem das consultas.
+    :param rows: Quantidade de linhas processadas, para o cálculo de vazão.
+    :param fn: Função a ser medida.
+    :return: Dicionário com as métricas coletadas.
+    """
+    counter = QueryCounter(engine)
+    tracemalloc.start()
+    start = time.perf_counter()
+    with counter.track():
+        fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "rows": rows,
+        "seconds": round(elapsed, 4),
+        "rows_per_sec": round(rows / elapsed, 2) if elapsed else 0.0,
+        "peak_memory_bytes": peak,
+        "db_round_trips": counter.count,
+    }
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, float]]:
+    """Carrega um baseline salvo anteriormente (vazio se não existir)."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        data: Dict[str, Dict[str, float]] = json.load(f)
+    return data
+
+
+def save_baseline(path: str, results: Dict[str, Dict[str, Any]]) -> None:
+    """Grava os resultados como novo baseline."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare_to_baseline(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    tolerance: float,
+    metrics: List[str],
+) -> List[str]:
+    """
+    Compara os resultados com o baseline e lista as regressões encontradas.
+
+    :param results: Métricas atuais por cenário.
+    :param baseline: Métricas de referência por cenário.
+    :param tolerance: Variação relativa aceita (ex: 0.2 para 20%).
+    :param metrics: Métricas a serem comparadas.
+    :return: Lista de mensagens descrevendo cada regressão.
+    """
+    regressions = []
+    for scenario, current in results.items():
+        reference = baseline.get(scenario)
+        if not reference:
+            continue
+        for metric in metrics:
+            if metric not in current or not reference.get(metric):
+                continue
+            before, after = reference[metric], current[metric]
+            if metric in HIGHER_IS_BETTER:
+                regressed = after < before * (1 - tolerance)
+            else:
+                regressed = after > before * (1 + tolerance)
+            if regressed:
+                regressions.append(f"{scenario}: {metric} {before} -> {after}")
+    return regressions
+
+
+def report_against_baseline(
+    results: Dict[str, Dict[str, Any]],
+    path: str,
+    tolerance: float,
+    metrics: List[str],
+) -> int:
+    """
+    Compara os resultados com o baseline gravado em `path` e imprime as
+    regressões. Cenários sem referência no baseline (ou baseline ausente)
+    também falham: sem eles a comparação não verificaria nada.
+
+    :param results: Métricas atuais por cenário.
+    :param path: Caminho do baseline JSON.
+    :param tolerance: Variação relativa aceita (ex: 0.2 para 20%).
+    :param metrics: Métricas a serem comparadas.
+    :return: Código de saída (1 se houver regressão ou cenário sem baseline).
+    """
+    baseline = load_baseline(path)
+    missing = [scenario for scenario in results if scenario not in baseline]
+    for scenario in missing:
+        print(
+            f"SEM BASELINE {scenario} em {path} "
+            "(grave um com --update-baseline a partir da versão de referência)",
+            file=sys.stderr,
+        )
+
+    regressions = compare_to_baseline(results, baseline, tolerance, metrics)
+    for regression in regressions:
+        print(f"REGRESSÃO {regression}")
+    return 1 if regressions or missing else 0
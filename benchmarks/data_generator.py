@@ -0,0 +1,89 @@
+import random
+from typing import Iterator, List
+
+HEADER = "year;title;studios;producers;winner"
+
+# Distribuição aproximada observada em data/movielist.csv
+PRODUCERS_PER_MOVIE = [1, 2, 3, 4]
+PRODUCERS_WEIGHTS = [60, 25, 10, 5]
+STUDIOS_PER_MOVIE = [1, 2]
+STUDIOS_WEIGHTS = [80, 20]
+WINNER_RATIO = 0.2
+FIRST_YEAR = 1980
+LAST_YEAR = 2024
+
+
+def producer_pool_size(rows: int) -> int:
+    """Quantidade de produtores distintos para um dataset com `rows` filmes."""
+    return max(10, int(rows * 1.5))
+
+
+def studio_pool_size(rows: int) -> int:
+    """Quantidade de estúdios distintos para um dataset com `rows` filmes."""
+    return max(5, int(rows**0.5 * 4))
+
+
+def _pick(rng: random.Random, pool: int) -> int:
+    """Escolhe um índice do pool com viés para os primeiros (cauda longa)."""
+    return int(pool * rng.random() ** 2)
+
+
+def _join_producers(names: List[str], rng: random.Random) -> str:
+    """Junta os produtores usando os mesmos separadores do CSV original."""
+    if len(names) == 1:
+        return names[0]
+    if len(names) == 2:
+        return f"{names[0]} and {names[1]}"
+    last_separator = rng.choice([", and ", " and "])
+    return ", ".join(names[:-1]) + last_separator + names[-1]
+
+
+def generate_movie_list(rows: int, seed: int = 42) -> Iterator[str]:
+    """
+    Gera linhas de um CSV sintético no formato de data/movielist.csv.
+
+    :param rows: Quantidade de filmes a serem gerados.
+    :param seed: Semente do gerador pseudoaleatório (resultado determinístico).
+    :return: Iterador com o cabeçalho seguido de uma linha por filme.
+    """
+    rng = random.Random(seed)
+    producers_pool = producer_pool_size(rows)
+    studios_pool = studio_pool_size(rows)
+    years = LAST_YEAR - FIRST_YEAR + 1
+
+    yield HEADER
+    for index in range(rows):
+        year = FIRST_YEAR + index * years // rows
+        producers_count = rng.choices(PRODUCERS_PER_MOVIE, PRODUCERS_WEIGHTS)[0]
+        studios_count = rng.choices(STUDIOS_PER_MOVIE, STUDIOS_WEIGHTS)[0]
+
+        producers = list(
+            dict.fromkeys(
+                f"Producer {_pick(rng, producers_pool):08d}"
+                for _ in range(producers_count)
+            )
+        )
+        studios = list(
+            dict.fromkeys(
+                f"Studio {_pick(rng, studios_pool):06d}" for _ in range(studios_count)
+            )
+        )
+        winner = "yes" if rng.random() < WINNER_RATIO else ""
+
+        yield (
+            f"{year};Movie {index:08d};{', '.join(studios)};"
+            f"{_join_producers(producers, rng)};{winner}"
+        )
+
+
+def write_movie_list(path: str, rows: int, seed: int = 42) -> None:
+    """
+    Grava um CSV sintético em disco sem manter o conteúdo inteiro em memória.
+
+    :param path: Caminho do arquivo de saída.
+    :param rows: Quantidade de filmes a serem gerados.
+    :param seed: Semente do gerador pseudoaleatório.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        for line in generate_movie_list(rows, seed):
+            f.write(line + "\n")
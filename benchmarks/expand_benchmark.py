@@ -0,0 +1,145 @@
+"""
+Benchmark da expansão de produtores e estúdios na listagem de filmes.
+
+Compara o carregamento antigo (joinedload de produtores e estúdios na mesma
+consulta, que multiplica cada filme por produtores x estúdios) com o
+carregamento atual de `MovieRepository.get_all` (selectinload).
+
+Uso:
+    python -m benchmarks.expand_benchmark --movies 2000 --per-movie 5
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from typing import Any, Callable, Dict, List, cast
+
+from sqlalchemy import Table, create_engine, func, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, joinedload, sessionmaker
+
+from app.models import Base, Movie, Producer, Studio, movie_producer, movie_studio
+from app.repositories.movie_repository import MovieRepository
+from benchmarks.common import (
+    load_baseline,
+    measure,
+    report_against_baseline,
+    save_baseline,
+)
+
+DEFAULT_BASELINE = os.path.join("benchmarks", "baselines", "expand.json")
+METRICS = ["rows_per_sec", "peak_memory_bytes", "db_round_trips"]
+EXPAND = ["producers", "studios"]
+
+
+def seed(engine: Engine, movies: int, per_movie: int) -> None:
+    """Cria `movies` filmes, cada um com `per_movie` produtores e estúdios."""
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Movie),
+            [
+                {"id": i, "title": f"Movie {i}", "year": 1980 + i % 40, "winner": False}
+                for i in range(1, movies + 1)
+            ],
+        )
+        conn.execute(
+            insert(Producer),
+            [{"id": i, "name": f"Producer {i}"} for i in range(1, movies + 1)],
+        )
+        conn.execute(
+            insert(Studio),
+            [{"id": i, "name": f"Studio {i}"} for i in range(1, movies + 1)],
+        )
+        links = [
+            (movie_id, (movie_id + offset) % movies + 1)
+            for movie_id in range(1, movies + 1)
+            for offset in range(per_movie)
+        ]
+        conn.execute(
+            insert(movie_producer),
+            [{"movie_id": m, "producer_id": p} for m, p in links],
+        )
+        conn.execute(
+            insert(movie_studio),
+            [{"movie_id": m, "studio_id": s} for m, s in links],
+        )
+
+
+def _joined(db: Session) -> List[Movie]:
+    return (
+        db.query(Movie)
+        .options(joinedload(Movie.producers), joinedload(Movie.studios))
+        .order_by(Movie.id)
+        .all()
+    )
+
+
+def _selectin(db: Session) -> List[Movie]:
+    return MovieRepository.get_all(db, EXPAND)
+
+
+STRATEGIES: Dict[str, Callable[[Session], List[Movie]]] = {
+    "joinedload": _joined,
+    "selectinload": _selectin,
+}
+
+
+def result_rows(db: Session, strategy: str) -> int:
+    """Quantidade de linhas que o banco devolve para a estratégia informada."""
+    movies = cast(Table, Movie.__table__)
+    if strategy == "joinedload":
+        joined = movies.outerjoin(
+            movie_producer, movie_producer.c.movie_id == movies.c.id
+        ).outerjoin(movie_studio, movie_studio.c.movie_id == movies.c.id)
+        return int(db.scalar(select(func.count()).select_from(joined)) or 0)
+
+    return sum(
+        int(db.scalar(select(func.count()).select_from(table)) or 0)
+        for table in (movies, movie_producer, movie_studio)
+    )
+
+
+def run(movies: int, per_movie: int) -> Dict[str, Dict[str, Any]]:
+    """Executa as duas estratégias sobre o mesmo banco populado."""
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = create_engine(f"sqlite:///{os.path.join(workdir, 'expand.db')}")
+        Base.metadata.create_all(bind=engine)
+        seed(engine, movies, per_movie)
+        factory = sessionmaker(bind=engine)
+
+        for name, strategy in STRATEGIES.items():
+            with factory() as db:
+                loaded: List[Movie] = []
+                metrics = measure(engine, movies, lambda: loaded.extend(strategy(db)))
+                assert all(len(m.producers) == per_movie for m in loaded)
+                metrics["result_rows"] = result_rows(db, name)
+            key = f"{name}:{movies}x{per_movie}"
+            results[key] = metrics
+            print(f"{key} -> {metrics}")
+        engine.dispose()
+    return results
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--movies", type=int, default=2000)
+    parser.add_argument("--per-movie", type=int, default=5)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = run(args.movies, args.per_movie)
+
+    if args.update_baseline:
+        save_baseline(args.baseline, {**load_baseline(args.baseline), **results})
+        print(f"Baseline atualizado em {args.baseline}")
+        return 0
+
+    return report_against_baseline(results, args.baseline, args.tolerance, METRICS)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""
+Benchmark de latência: SQLite em arquivo x cópia em memória (SQLITE_IN_MEMORY).
+
+Importa um CSV sintético em um banco SQLite novo e mede p50/p99 de
+`/movies` (páginas por cursor) e `/awards/intervals` servidos direto do
+arquivo ou da cópia em memória carregada com `VACUUM INTO`. O cache do
+cálculo de prêmios é limpo antes de cada chamada, para que toda requisição
+consulte o banco.
+
+Uso:
+    python -m benchmarks.memory_benchmark --movies 10000 --requests 2000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, Iterator, List
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from loguru import logger
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.routes import award_interval_route, movie_routes
+from app.db.database import build_engine, build_memory_database, get_db
+from app.models import Base
+from app.services.award_interval_service import AwardIntervalService
+from app.services.csv_importer_service import CSVImporterService
+from app.utils.cache import clear_caches
+from app.utils.pagination import encode_cursor
+from benchmarks.async_benchmark import percentile
+from benchmarks.common import load_baseline, report_against_baseline, save_baseline
+from benchmarks.data_generator import write_movie_list
+
+DEFAULT_BASELINE = os.path.join("benchmarks", "baselines", "memory.json")
+METRICS = ["p50_ms", "p99_ms"]
+MODES = ["disk", "memory"]
+
+
+def _movies_path(i: int, movies: int) -> str:
+    return (
+        f"/movies/?limit=20&expand=producers,studios&after={encode_cursor(i % movies)}"
+    )
+
+
+def _awards_path(i: int, movies: int) -> str:
+    AwardIntervalService.invalidate_cache()
+    return "/awards/intervals"
+
+
+PATHS: Dict[str, Callable[[int, int], str]] = {
+    "movies": _movies_path,
+    "awards": _awards_path,
+}
+
+
+def build_app(engine: Engine) -> FastAPI:
+    """Cria a aplicação só com as rotas medidas, ligadas à engine informada."""
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def get_session() -> Iterator[Session]:
+        with factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(movie_routes.router)
+    app.include_router(award_interval_route.router)
+    app.dependency_overrides[get_db] = get_session
+    return app
+
+
+def run_mode(mode: str, movies: int, requests: int, workdir: str) -> Dict[str, Any]:
+    """
+    Mede a latência das rotas servidas pelo arquivo ou pela memória.
+
+    :param mode: "disk" ou "memory".
+    :param movies: Quantidade de filmes do CSV sintético.
+    :param requests: Requisições por rota.
+    :param workdir: Diretório temporário para o CSV e o banco.
+    :return: Métricas por rota, indexadas pelo nome da rota.
+    """
+    url = f"sqlite:///{os.path.join(workdir, f'{mode}.db')}"
+    csv_path = os.path.join(workdir, "movielist.csv")
+    if not os.path.exists(csv_path):
+        write_movie_list(csv_path, movies)
+
+    disk = build_engine(url)
+    Base.metadata.create_all(bind=disk)
+    with sessionmaker(bind=disk)() as db, open(csv_path, encoding="utf-8") as f:
+        CSVImporterService.import_csv(db, f.read())
+    clear_caches()
+
+    memory = None
+    if mode == "memory":
+        disk.dispose()
+        memory = build_memory_database(url)
+        memory.load()
+    engine = memory.engine if memory else disk
+
+    results = {}
+    with TestClient(build_app(engine)) as client:
+        for name, path in PATHS.items():
+            client.get(path(0, movies)).raise_for_status()  # aquecimento
+            latencies = []
+            for i in range(requests):
+                request_path = path(i, movies)
+                start = time.perf_counter()
+                client.get(request_path).raise_for_status()
+                latencies.append(time.perf_counter() - start)
+            results[name] = {
+                "requests": requests,
+                "p50_ms": round(percentile(latencies, 0.5) * 1000, 3),
+                "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+            }
+
+    if memory:
+        memory.close()
+    else:
+        disk.dispose()
+    return results
+
+
+def run(modes: List[str], movies: int, requests: int) -> Dict[str, Dict[str, Any]]:
+    """Executa as requisições para cada modo informado."""
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for mode in modes:
+            for name, metrics in run_mode(mode, movies, requests, workdir).items():
+                key = f"{mode}:{name}:{movies}"
+                results[key] = metrics
+                print(f"{key} -> {metrics}")
+    return results
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--modes", default=",".join(MODES), help="Modos separados por vírgula."
+    )
+    parser.add_argument("--movies", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    logger.disable("app")
+    modes = [m for m in args.modes.split(",") if m]
+    results = run(modes, args.movies, args.requests)
+
+    if args.update_baseline:
+        save_baseline(args.baseline, {**load_baseline(args.baseline), **results})
+        print(f"Baseline atualizado em {args.baseline}")
+        return 0
+
+    return report_against_baseline(results, args.baseline, args.tolerance, METRICS)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+"""
+Checagem dos planos de execução das consultas dos repositórios.
+
+Roda os testes dos repositórios e das camadas que os usam registrando, com
+um listener `before_cursor_execute`, todas as instruções emitidas. Depois
+popula um banco SQLite novo com dados sintéticos, criado como o da
+aplicação (perfil de PRAGMAs e chaves estrangeiras), roda `EXPLAIN QUERY
+PLAN` em cada instrução registrada e falha se alguma delas varrer por
+inteiro uma tabela com pelo menos `--threshold` linhas. Instruções sem
+WHERE (listagens completas e primeira página sem filtro) e os filtros de
+ALLOWED_FILTERS leem a tabela inteira por projeto e não são verificados.
+
+Uso:
+    python -m benchmarks.query_plan_check --movies 10000 --threshold 1000
+    python -m benchmarks.query_plan_check tests/repositories
+"""
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+from typing import Any, Dict, List, Sequence
+
+import pytest
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.database import build_engine
+from app.db.query_plans import (
+    Statement,
+    explain,
+    full_scans,
+    normalize_sql,
+    partial_indexes,
+    table_sizes,
+    unqualified,
+)
+from app.models import Base
+from app.services.csv_importer_service import CSVImporterService
+from benchmarks.data_generator import write_movie_list
+
+# Suítes cujas instruções são verificadas
+DEFAULT_TESTS = ["tests/repositories", "tests/services", "tests/api"]
+
+# Instruções verificadas: leituras e escritas (DDL, PRAGMAs e transações, não)
+CHECKED_STATEMENT = re.compile(
+    r"^\s*(SELECT|WITH|INSERT|UPDATE|DELETE)\b", re.IGNORECASE
+)
+# Filtro da instrução (sem a ordenação e a paginação)
+WHERE_CLAUSE = re.compile(r"\bWHERE (.+?)(?: ORDER BY .*)?$")
+
+# Filtros que selecionam boa parte da tabela (intervalo de anos aberto): ler
+# a tabela na ordem de ID sai mais barato que o índice de ano seguido da
+# ordenação de quase todas as linhas
+ALLOWED_FILTERS = {"movies.year >= ?", "movies.year <= ?"}
+
+# Índice parcial -> predicado que a instrução precisa ter para a leitura do
+# índice inteiro ser aceita (ele só contém as linhas do predicado)
+PARTIAL_INDEX_SCANS = {
+    "ix_movies_winners_year": "movies.winner IS 1",
+    "ix_movies_winners_id": "movies.winner IS 1",
+    "ix_movies_nominees_id": "movies.winner IS 0",
+}
+
+
+class StatementRecorder:
+    """
+    Plugin do pytest que registra as instruções de todas as engines durante
+    a sessão de testes, uma por consulta (ver `normalize_sql`), com os
+    parâmetros da primeira execução.
+    """
+
+    def __init__(self) -> None:
+        self.statements: Dict[str, Statement] = {}
+
+    def pytest_sessionstart(self, session: Any) -> None:
+        event.listen(Engine, "before_cursor_execute", self.record)
+
+    def pytest_sessionfinish(self, session: Any, exitstatus: int) -> None:
+        event.remove(Engine, "before_cursor_execute", self.record)
+
+    def record(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        if not CHECKED_STATEMENT.match(statement):
+            return
+        if executemany:
+            parameters = parameters[0]
+        self.statements.setdefault(normalize_sql(statement), (statement, parameters))
+
+
+def collect_statements(paths: Sequence[str]) -> List[Statement]:
+    """
+    Roda os testes de `paths` e retorna as instruções emitidas por eles.
+
+    :param paths: Arquivos ou diretórios de teste.
+    :return: Instruções (SQL e parâmetros), uma por consulta.
+    :raises RuntimeError: Se algum teste falhar.
+    """
+    recorder = StatementRecorder()
+    code = pytest.main([*paths, "-q", "-p", "no:cacheprovider"], plugins=[recorder])
+    if code != 0:
+        raise RuntimeError(f"Os testes de {', '.join(paths)} falharam ({code}).")
+    return list(recorder.statements.values())
+
+
+def seed(engine: Any, movies: int, workdir: str) -> None:
+    """Popula o banco com a importação de um CSV sintético de `movies` filmes."""
+    csv_path = os.path.join(workdir, "movielist.csv")
+    write_movie_list(csv_path, movies)
+    with sessionmaker(bind=engine)() as db, open(csv_path, encoding="utf-8") as f:
+        CSVImporterService.import_csv(db, f.read())
+
+
+def check(
+    db: Session, statements: Sequence[Statement], threshold: int
+) -> Dict[str, List[str]]:
+    """
+    Aponta as instruções com WHERE cujo plano varre uma tabela inteira.
+
+    :param db: Sessão de um banco SQLite já populado.
+    :param statements: Instruções a verificar (ver `collect_statements`).
+    :param threshold: Tamanho mínimo (em linhas) das tabelas verificadas.
+    :return: Instrução -> plano com varredura completa.
+    :raises ValueError: Se um índice de PARTIAL_INDEX_SCANS não existir com
+        o mesmo predicado no banco.
+    """
+    conn = db.connection()
+    sizes, partial = table_sizes(conn), partial_indexes(conn)
+    for index, predicate in PARTIAL_INDEX_SCANS.items():
+        if partial.get(index) != unqualified(predicate):
+            raise ValueError(f"Índice parcial {index} sem o predicado {predicate}.")
+
+    violations: Dict[str, List[str]] = {}
+    for sql, params in statements:
+        statement = " ".join(sql.split())
+        where = WHERE_CLAUSE.search(statement)
+        if not where or where.group(1) in ALLOWED_FILTERS:
+            continue
+        plan = explain(conn, sql, params)
+        if full_scans(plan, sizes, threshold, PARTIAL_INDEX_SCANS, sql):
+            violations[statement] = plan
+    return violations
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("tests", nargs="*", default=DEFAULT_TESTS)
+    parser.add_argument("--movies", type=int, default=10_000)
+    parser.add_argument("--threshold", type=int, default=1_000)
+    args = parser.parse_args(argv)
+
+    statements = collect_statements(args.tests)
+    logger.disable("app")
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = build_engine(f"sqlite:///{os.path.join(workdir, 'plans.db')}")
+        Base.metadata.create_all(bind=engine)
+        seed(engine, args.movies, workdir)
+        with sessionmaker(bind=engine)() as db:
+            violations = check(db, statements, args.threshold)
+        engine.dispose()
+
+    for sql, plan in violations.items():
+        print(f"VARREDURA {sql} -> {plan}")
+    print(f"{len(statements)} instruções verificadas, {len(violations)} com varredura")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
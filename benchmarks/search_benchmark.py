@@ -0,0 +1,102 @@
+"""
+Benchmark da busca por prefixo de produtores.
+
+Popula um banco SQLite com `--producers` nomes sintéticos (com acentos e
+maiúsculas) e mede a latência de `ProducerRepository.search` para prefixos
+aleatórios de 1 a 4 caracteres.
+
+Uso:
+    python -m benchmarks.search_benchmark --producers 1000000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, Producer
+from app.repositories.producer_repository import ProducerRepository
+from app.utils.text import normalize_name
+from benchmarks.common import load_baseline, report_against_baseline, save_baseline
+
+DEFAULT_BASELINE = os.path.join("benchmarks", "baselines", "search.json")
+METRICS = ["p50_ms", "p95_ms"]
+FIRST_NAMES = ["Ana", "Álvaro", "Bruno", "Cécile", "Édouard", "Joël", "Zoë", "Núria"]
+
+
+def seed(engine: Engine, producers: int, batch: int = 50_000) -> None:
+    """Insere `producers` produtores sintéticos em lotes."""
+    rng = random.Random(42)
+    with engine.begin() as conn:
+        for start in range(0, producers, batch):
+            rows = []
+            for i in range(start, min(start + batch, producers)):
+                name = f"{rng.choice(FIRST_NAMES)} {rng.randrange(36**4):x} {i}"
+                rows.append({"name": name, "name_normalized": normalize_name(name)})
+            conn.execute(insert(Producer), rows)
+
+
+def run(producers: int, queries: int, limit: int) -> Dict[str, Dict[str, Any]]:
+    """Mede a latência das buscas por prefixo."""
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = create_engine(f"sqlite:///{os.path.join(workdir, 'search.db')}")
+        Base.metadata.create_all(bind=engine)
+        seed(engine, producers)
+
+        rng = random.Random(7)
+        prefixes = [
+            rng.choice(FIRST_NAMES)[: rng.randint(1, 4)].upper() for _ in range(queries)
+        ]
+        timings: List[float] = []
+        with sessionmaker(bind=engine)() as db:
+            ProducerRepository.search(db, "a", limit)  # aquece a conexão
+            for prefix in prefixes:
+                start = time.perf_counter()
+                ProducerRepository.search(db, prefix, limit)
+                timings.append((time.perf_counter() - start) * 1000)
+        engine.dispose()
+
+    timings.sort()
+    key = f"search:{producers}"
+    results = {
+        key: {
+            "queries": queries,
+            "p50_ms": round(statistics.median(timings), 3),
+            "p95_ms": round(timings[int(len(timings) * 0.95) - 1], 3),
+            "max_ms": round(timings[-1], 3),
+        }
+    }
+    print(f"{key} -> {results[key]}")
+    return results
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--producers", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = run(args.producers, args.queries, args.limit)
+
+    if args.update_baseline:
+        save_baseline(args.baseline, {**load_baseline(args.baseline), **results})
+        print(f"Baseline atualizado em {args.baseline}")
+        return 0
+
+    return report_against_baseline(results, args.baseline, args.tolerance, METRICS)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
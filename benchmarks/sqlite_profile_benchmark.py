@@ -0,0 +1,186 @@
+"""
+Benchmark de vazão mista (leituras e escritas) por perfil do SQLite.
+
+Para cada perfil de `app.db.sqlite_profiles` (e para o SQLite sem PRAGMAs,
+como referência) popula um banco novo e executa, em paralelo, threads de
+leitura (busca por ID e página da listagem) e uma thread de escrita (um
+filme por commit), medindo operações por segundo.
+
+Uso:
+    python -m benchmarks.sqlite_profile_benchmark --movies 20000 --ops 2000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+from loguru import logger
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.database import enable_sqlite_foreign_keys
+from app.db.sqlite_profiles import SQLITE_PROFILES, apply_sqlite_profile
+from app.models import Base, Movie
+from app.repositories.movie_repository import MovieRepository
+from benchmarks.common import load_baseline, report_against_baseline, save_baseline
+
+DEFAULT_BASELINE = os.path.join("benchmarks", "baselines", "sqlite_profiles.json")
+METRICS = ["ops_per_sec"]
+# Referência: conexão sem nenhum PRAGMA de desempenho
+NO_PROFILE = "none"
+
+
+def seed(engine: Engine, movies: int) -> None:
+    """Cria `movies` filmes sintéticos."""
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Movie),
+            [
+                {"title": f"Movie {i}", "year": 1980 + i % 40, "winner": i % 5 == 0}
+                for i in range(1, movies + 1)
+            ],
+        )
+
+
+def _reader(movies: int, seed_value: int) -> Callable[[Session, int], None]:
+    rng = random.Random(seed_value)
+
+    def read(db: Session, _: int) -> None:
+        if rng.random() < 0.8:
+            MovieRepository.get_by_id(db, rng.randint(1, movies))
+        else:
+            list(
+                MovieRepository.get_all_rows(
+                    db, 50, rng.randint(0, max(movies - 50, 0))
+                )
+            )
+        db.rollback()  # encerra a transação de leitura (libera o snapshot do WAL)
+
+    return read
+
+
+def _writer(prefix: str) -> Callable[[Session, int], None]:
+    def write(db: Session, index: int) -> None:
+        MovieRepository.create(db, f"{prefix} {index}", 2024, False)
+
+    return write
+
+
+def _worker(
+    factory: sessionmaker[Session],
+    operation: Callable[[Session, int], None],
+    ops: int,
+    errors: List[int],
+) -> None:
+    with factory() as db:
+        for index in range(ops):
+            try:
+                operation(db, index)
+            except OperationalError:  # ex: "database is locked"
+                db.rollback()
+                errors.append(index)
+
+
+def run_profile(
+    profile: str, movies: int, ops: int, readers: int, workdir: str
+) -> Dict[str, Any]:
+    """
+    Executa a carga mista em um banco novo configurado com o perfil.
+
+    :param profile: Nome do perfil (ou NO_PROFILE).
+    :param movies: Quantidade de filmes pré-cadastrados.
+    :param ops: Operações por thread.
+    :param readers: Quantidade de threads de leitura.
+    :param workdir: Diretório temporário para o banco.
+    :return: Métricas coletadas.
+    """
+    engine = create_engine(
+        f"sqlite:///{os.path.join(workdir, f'{profile}.db')}",
+        connect_args={"check_same_thread": False},
+        pool_size=readers + 1,
+    )
+    enable_sqlite_foreign_keys(engine)
+    if profile != NO_PROFILE:
+        apply_sqlite_profile(engine, profile)
+    Base.metadata.create_all(bind=engine)
+    seed(engine, movies)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    errors: List[int] = []
+    threads = [
+        threading.Thread(
+            target=_worker, args=(factory, _reader(movies, i), ops, errors)
+        )
+        for i in range(readers)
+    ]
+    threads.append(
+        threading.Thread(target=_worker, args=(factory, _writer(profile), ops, errors))
+    )
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    engine.dispose()
+
+    total = ops * len(threads)
+    return {
+        "ops": total,
+        "seconds": round(elapsed, 4),
+        "ops_per_sec": round(total / elapsed, 2) if elapsed else 0.0,
+        "writes_per_sec": round(ops / elapsed, 2) if elapsed else 0.0,
+        "errors": len(errors),
+    }
+
+
+def run(
+    profiles: List[str], movies: int, ops: int, readers: int
+) -> Dict[str, Dict[str, Any]]:
+    """Executa a carga mista para cada perfil informado."""
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for profile in profiles:
+            key = f"{profile}:{movies}x{ops}x{readers}"
+            results[key] = run_profile(profile, movies, ops, readers, workdir)
+            print(f"{key} -> {results[key]}")
+    return results
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--profiles",
+        default=",".join([NO_PROFILE, *SQLITE_PROFILES]),
+        help="Perfis separados por vírgula.",
+    )
+    parser.add_argument("--movies", type=int, default=20_000)
+    parser.add_argument("--ops", type=int, default=2_000, help="Operações por thread.")
+    parser.add_argument("--readers", type=int, default=3)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    logger.disable("app")
+    profiles = [p for p in args.profiles.split(",") if p]
+    results = run(profiles, args.movies, args.ops, args.readers)
+
+    if args.update_baseline:
+        save_baseline(args.baseline, {**load_baseline(args.baseline), **results})
+        print(f"Baseline atualizado em {args.baseline}")
+        return 0
+
+    return report_against_baseline(results, args.baseline, args.tolerance, METRICS)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
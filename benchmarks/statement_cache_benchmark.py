@@ -0,0 +1,145 @@
+"""
+Benchmark do custo por chamada das buscas mais frequentes dos repositórios.
+
+Compara a forma antiga (um `db.query(Model).filter(...)` montado a cada
+chamada) com as consultas `select()` montadas uma única vez nos repositórios,
+medindo microssegundos por chamada e a fração do orçamento de uma
+requisição a 10 mil requisições por segundo (100 µs) que cada busca consome.
+
+Uso:
+    python -m benchmarks.statement_cache_benchmark --calls 10000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+from loguru import logger
+from sqlalchemy.orm import Session, selectinload, sessionmaker
+
+from app.db.database import build_engine
+from app.models import Base, Movie, Producer
+from app.repositories.movie_repository import MovieRepository
+from app.repositories.producer_repository import ProducerRepository
+from benchmarks.common import load_baseline, report_against_baseline, save_baseline
+from benchmarks.sqlite_profile_benchmark import seed
+
+DEFAULT_BASELINE = os.path.join("benchmarks", "baselines", "statement_cache.json")
+METRICS = ["us_per_call"]
+# Orçamento de uma requisição a 10 mil requisições por segundo
+REQUEST_BUDGET_US = 100.0
+
+
+def _legacy_lookups(movies: int) -> Dict[str, Callable[[Session, int], Any]]:
+    """Buscas como eram feitas antes: consulta legada montada a cada chamada."""
+    return {
+        "get_by_id": lambda db, i: db.query(Movie)
+        .filter(Movie.id == i % movies + 1)
+        .one_or_none(),
+        "get_by_title": lambda db, i: db.query(Movie)
+        .filter(Movie.title == f"Movie {i % movies + 1}")
+        .first(),
+        "get_by_name": lambda db, i: db.query(Producer)
+        .filter(Producer.name == f"Producer {i}")
+        .first(),
+        "get_winning_movies": lambda db, i: db.query(Movie)
+        .filter(Movie.winner.is_(True))
+        .options(selectinload(Movie.producers), selectinload(Movie.studios))
+        .order_by(Movie.year)
+        .all(),
+    }
+
+
+def _cached_lookups(movies: int) -> Dict[str, Callable[[Session, int], Any]]:
+    """Buscas atuais dos repositórios, com as consultas já montadas."""
+    return {
+        "get_by_id": lambda db, i: MovieRepository.get_by_id(db, i % movies + 1),
+        "get_by_title": lambda db, i: MovieRepository.get_by_title(
+            db, f"Movie {i % movies + 1}"
+        ),
+        "get_by_name": lambda db, i: ProducerRepository.get_by_name(
+            db, f"Producer {i}"
+        ),
+        "get_winning_movies": lambda db, i: MovieRepository.get_winning_movies(db),
+    }
+
+
+MODES = {"legacy": _legacy_lookups, "cached": _cached_lookups}
+
+
+def run_mode(mode: str, movies: int, calls: int, workdir: str) -> Dict[str, Any]:
+    """
+    Executa cada busca `calls` vezes e mede o custo médio por chamada.
+
+    :param mode: "legacy" ou "cached".
+    :param movies: Quantidade de filmes pré-cadastrados.
+    :param calls: Chamadas por busca.
+    :param workdir: Diretório temporário para o banco.
+    :return: Métricas por busca, indexadas pelo nome da busca.
+    """
+    engine = build_engine(f"sqlite:///{os.path.join(workdir, f'{mode}.db')}")
+    Base.metadata.create_all(bind=engine)
+    seed(engine, movies)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    results = {}
+    with factory() as db:
+        for name, lookup in MODES[mode](movies).items():
+            lookup(db, 0)  # aquece o cache de compilação
+            start = time.perf_counter()
+            for i in range(calls):
+                lookup(db, i)
+                db.expunge_all()  # cada requisição começa com a sessão vazia
+            elapsed = time.perf_counter() - start
+            us_per_call = elapsed / calls * 1_000_000
+            results[name] = {
+                "calls": calls,
+                "us_per_call": round(us_per_call, 2),
+                "ops_per_sec": round(calls / elapsed, 2) if elapsed else 0.0,
+                "budget_share": round(us_per_call / REQUEST_BUDGET_US, 4),
+            }
+    engine.dispose()
+    return results
+
+
+def run(modes: List[str], movies: int, calls: int) -> Dict[str, Dict[str, Any]]:
+    """Executa as buscas para cada modo informado."""
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for mode in modes:
+            for name, metrics in run_mode(mode, movies, calls, workdir).items():
+                key = f"{mode}:{name}:{movies}"
+                results[key] = metrics
+                print(f"{key} -> {metrics}")
+    return results
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--modes", default=",".join(MODES), help="Modos separados por vírgula."
+    )
+    parser.add_argument("--movies", type=int, default=1_000)
+    parser.add_argument("--calls", type=int, default=10_000)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    logger.disable("app")
+    modes = [m for m in args.modes.split(",") if m]
+    results = run(modes, args.movies, args.calls)
+
+    if args.update_baseline:
+        save_baseline(args.baseline, {**load_baseline(args.baseline), **results})
+        print(f"Baseline atualizado em {args.baseline}")
+        return 0
+
+    return report_against_baseline(results, args.baseline, args.tolerance, METRICS)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncIterator, Iterator
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.api.routes import (
+    async_award_interval_route,
+    async_movie_routes,
+    async_producer_routes,
+    async_studio_routes,
+)
+from app.db.async_database import build_async_engine, get_async_db
+from app.repositories.movie_repository import MovieRepository
+from app.repositories.producer_repository import ProducerRepository
+from app.repositories.studio_repository import StudioRepository
+from tests.conftest import TEST_DATABASE_URL
+
+
+def build_async_app() -> FastAPI:
+    """Cria uma aplicação só com as rotas async, ligada ao banco de testes."""
+    engine = build_async_engine(TEST_DATABASE_URL)
+    factory = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+        yield
+        await engine.dispose()
+
+    async def override_get_async_db() -> AsyncIterator[AsyncSession]:
+        async with factory() as db:
+            yield db
+
+    app = FastAPI(lifespan=lifespan)
+    for module in (
+        async_producer_routes,
+        async_studio_routes,
+        async_movie_routes,
+        async_award_interval_route,
+    ):
+        app.include_router(module.router)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    return app
+
+
+@pytest.fixture
+def async_client(db_session: Session) -> Iterator[TestClient]:
+    """Client das rotas async; o banco é criado e limpo por `db_session`."""
+    with TestClient(build_async_app()) as test_client:
+        yield test_client
+
+
+def seed_movie(db: Session, title: str, year: int, producer: str) -> None:
+    """Cadastra um filme vencedor com um produtor e um estúdio."""
+    movie = MovieRepository.create(db, title, year, True)
+    producers = ProducerRepository.create_multiple(db, [producer])
+    studios = StudioRepository.create_multiple(db, ["Uni"])
+    movie.producers.extend(producers)
+    movie.studios.extend(studios)
+    db.commit()
+
+
+class TestAsyncRoutes:
+    """Testes das rotas async (ASYNC_DB=true) sobre AsyncSession."""
+
+    def test_producer_crud(self, async_client: TestClient) -> None:
+        """Testa criação, buscas, listagem e exclusão de produtores."""
+        created = async_client.post("/producers/", json={"name": "Allan Carr"})
+        producer_id = created.json()["id"]
+
+        assert created.status_code == 201
+        assert async_client.get(f"/producers/{producer_id}").json() == {
+            "id": producer_id,
+            "name": "Allan Carr",
+        }
+        assert async_client.get("/producers/name/Allan Carr").status_code == 200
+        assert async_client.get("/producers/").json()["producers"] == [
+            {"name": "Allan Carr", "id": producer_id}
+        ]
+        assert async_client.delete(f"/producers/{producer_id}").status_code == 204
+        assert async_client.get(f"/producers/{producer_id}").status_code == 404
+
+    def test_movies_listing_and_streaming(
+        self, async_client: TestClient, db_session: Session
+    ) -> None:
+        """Testa a listagem expandida, o NDJSON e o catálogo comprimido."""
+        seed_movie(db_session, "Cats", 2019, "Tom")
+        seed_movie(db_session, "Dogs", 2020, "Ann")
+
+        listing = async_client.get("/movies/?expand=producers,studios")
+        ndjson = async_client.get(
+            "/movies/?expand=producers,studios",
+            headers={"Accept": "application/x-ndjson"},
+        )
+        catalog = async_client.get(
+            "/movies/?expand=producers,studios",
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        movies = listing.json()["movies"]
+        assert [m["title"] for m in movies] == ["Cats", "Dogs"]
+        assert [json.loads(line) for line in ndjson.text.splitlines()] == movies
+        assert catalog.headers["content-encoding"] == "gzip"
+        assert catalog.json()["movies"] == movies
+
+    def test_award_intervals(
+        self, async_client: TestClient, db_session: Session
+    ) -> None:
+        """Testa o cálculo de intervalos pela rota async."""
+        seed_movie(db_session, "Movie A", 1990, "Producer A")
+        seed_movie(db_session, "Movie B", 1995, "Producer A")
+
+        response = async_client.get("/awards/intervals")
+
+        assert response.status_code == 200
+        assert response.json()["min"][0]["interval"] == 5
+
+    async def test_concurrent_requests(self, db_session: Session) -> None:
+        """Testa requisições simultâneas no mesmo event loop, sem threadpool."""
+        seed_movie(db_session, "Cats", 2019, "Tom")
+        app = build_async_app()
+        transport = httpx.ASGITransport(app=app)
+
+        async with (
+            app.router.lifespan_context(app),
+            httpx.AsyncClient(transport=transport, base_url="http://test") as client,
+        ):
+            responses = await asyncio.gather(
+                *(
+                    client.get(
+                        "/movies/?expand=producers,studios",
+                        headers={"Accept-Encoding": "gzip"},
+                    )
+                    for _ in range(20)
+                ),
+                *(client.get("/producers/1") for _ in range(20)),
+            )
+
+        assert {response.status_code for response in responses} == {200}
+
+    def test_movie_routes(self, async_client: TestClient, db_session: Session) -> None:
+        """Testa cadastro, lote, buscas e remoções de filmes pelas rotas async."""
+        seed_movie(db_session, "Cats", 2019, "Tom")
+        created = async_client.post(
+            "/movies/", json={"title": "Cat People", "year": 1982, "winner": False}
+        )
+        bulk = async_client.post(
+            "/movies/bulk",
+            json={
+                "movies": [
+                    {
+                        "title": "Dogs",
+                        "year": 2020,
+                        "winner": True,
+                        "producers": ["Ann"],
+                    },
+                    {"title": "Cats", "year": 2019, "winner": True},
+                ]
+            },
+        )
+
+        assert created.status_code == 201
+        assert [r["status"] for r in bulk.json()["results"]] == ["created", "exists"]
+        assert async_client.get("/movies/title/Dogs").json()["year"] == 2020
+        assert async_client.get("/movies/9999").status_code == 404
+        assert [
+            m["title"] if m else None
+            for m in async_client.post(
+                "/movies/batch-get", json={"names": ["Dogs", "Nope"]}
+            ).json()["movies"]
+        ] == ["Dogs", None]
+        assert [
+            m["title"]
+            for m in async_client.get("/movies/search?q=cat").json()["movies"]
+        ] == ["Cats", "Cat People"]
+        assert async_client.get("/movies/?winner=true&fields=title").json()[
+            "movies"
+        ] == [{"title": "Cats"}, {"title": "Dogs"}]
+        assert async_client.delete(f"/movies/{created.json()['id']}").status_code == 204
+        assert async_client.delete("/movies/?ids=1,3,99").json() == {"deleted": 2}
+
+    def test_studio_routes_and_related_movies(
+        self, async_client: TestClient, db_session: Session
+    ) -> None:
+        """Testa estúdios e os filmes de produtores e estúdios pelas rotas async."""
+        seed_movie(db_session, "Cats", 2019, "Tom")
+        seed_movie(db_session, "Dogs", 2020, "Ann")
+
+        assert async_client.get("/studios/name/Uni").json() == {"id": 1, "name": "Uni"}
+        assert [
+            m["title"] for m in async_client.get("/studios/1/movies").json()["movies"]
+        ] == ["Cats", "Dogs"]
+        assert [
+            m["title"] for m in async_client.get("/producers/2/movies").json()["movies"]
+        ] == ["Dogs"]
+        assert async_client.get("/producers/99/movies").status_code == 404
+        assert [
+            line
+            for line in async_client.get(
+                "/studios/", headers={"Accept": "application/x-ndjson"}
+            ).text.splitlines()
+        ] == ['{"name":"Uni","id":1}']
+        assert async_client.post("/studios/", json={"name": " "}).status_code == 400
+
+    def test_conditional_requests_and_validation(
+        self, async_client: TestClient, db_session: Session
+    ) -> None:
+        """Testa o 304 com a ETag da listagem e os 400 de parâmetros inválidos."""
+        seed_movie(db_session, "Cats", 2019, "Tom")
+        etag = async_client.get("/movies/").headers["etag"]
+
+        assert (
+            async_client.get("/movies/", headers={"If-None-Match": etag}).status_code
+            == 304
+        )
+        async_client.post(
+            "/movies/", json={"title": "Dogs", "year": 2020, "winner": False}
+        )
+        assert (
+            async_client.get("/movies/", headers={"If-None-Match": etag}).status_code
+            == 200
+        )
+        for url in (
+            "/movies/?expand=unknown",
+            "/movies/?after=abc",
+            "/movies/?stream=true&limit=1",
+            "/movies/?year_from=2020&year_to=2000",
+            "/producers/?fields=unknown",
+            "/studios/search?q=%20",
+        ):
+            assert async_client.get(url).status_code == 400, url
+        assert async_client.delete("/movies/?ids=a,b").status_code == 400
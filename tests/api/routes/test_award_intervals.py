@@ -44,6 +44,25 @@ class TestAwardIntervalsAPI:
         assert any(entry["producer"] == "Producer B" for entry in min_intervals)
         assert any(entry["producer"] == "Producer A" for entry in max_intervals)
 
+    def test_delete_producer_invalidates_intervals(
+        self, client: TestClient, csv_content_for_intervals: bytes
+    ) -> None:
+        """
+        Testa se remover um produtor tira seus intervalos do resultado em
+        cache, pois as associações dele saem em cascata.
+        """
+        files = {"file": ("test.csv", BytesIO(csv_content_for_intervals), "text/csv")}
+        client.post("/csv/upload", files=files)
+        before = client.get("/awards/intervals").json()
+        assert any(entry["producer"] == "Producer A" for entry in before["max"])
+
+        producer_id = client.get("/producers/name/Producer A").json()["id"]
+        assert client.delete(f"/producers/{producer_id}").status_code == 204
+
+        after = client.get("/awards/intervals").json()
+        producers = {entry["producer"] for entry in after["min"] + after["max"]}
+        assert "Producer A" not in producers
+
     def test_get_award_intervals_no_data(self, client: TestClient) -> None:
         """
         Testa o endpoint `/awards/intervals` sem importar nenhum dado,
@@ -1,7 +1,11 @@
-from typing import cast
+import json
+from typing import Any, List, cast
 from fastapi.testclient import TestClient
+from pytest_mock import MockFixture
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
+from app.config import Config
 from app.repositories.movie_repository import MovieRepository
 from app.repositories.producer_repository import ProducerRepository
 from app.repositories.studio_repository import StudioRepository
@@ -217,3 +221,398 @@ class TestMovieRoutes:
         assert "studios" in data[0]
         assert len(data[0]["studios"]) == 1
         assert data[0]["studios"][0]["name"] == "Paramount Pictures"
+
+    def test_get_all_movies_paginated(self, client: TestClient) -> None:
+        """Testa a navegação entre páginas usando o cursor next_cursor."""
+        for i in range(5):
+            client.post(
+                "/movies/", json={"title": f"Movie {i}", "year": 2000, "winner": False}
+            )
+
+        titles = []
+        response = client.get("/movies/?limit=2")
+        while True:
+            assert response.status_code == 200
+            body = response.json()
+            assert len(body["movies"]) <= 2
+            titles.extend(m["title"] for m in body["movies"])
+            if body["next_cursor"] is None:
+                break
+            response = client.get(f"/movies/?limit=2&after={body['next_cursor']}")
+
+        assert titles == [f"Movie {i}" for i in range(5)]
+
+    def test_get_all_movies_without_pagination(self, client: TestClient) -> None:
+        """Testa se a listagem sem parâmetros continua retornando tudo."""
+        for i in range(3):
+            client.post(
+                "/movies/", json={"title": f"Movie {i}", "year": 2000, "winner": False}
+            )
+
+        body = client.get("/movies/").json()
+        assert len(body["movies"]) == 3
+        assert body["next_cursor"] is None
+
+    def test_get_all_movies_invalid_cursor(self, client: TestClient) -> None:
+        """Testa erro ao informar um cursor inválido."""
+        response = client.get("/movies/?after=invalido")
+        assert response.status_code == 400
+
+    def test_get_all_movies_ndjson(
+        self, client: TestClient, db_session: Session
+    ) -> None:
+        """Testa a listagem em NDJSON com produtores e estúdios expandidos."""
+        movie = MovieRepository.create(db_session, "Cats", 2019, True)
+        producers = ProducerRepository.create_multiple(db_session, ["Tom"])
+        studios = StudioRepository.create_multiple(db_session, ["Uni"])
+        movie.producers.extend(producers)
+        movie.studios.extend(studios)
+        db_session.commit()
+        MovieRepository.create(db_session, "Dogs", 2020, False)
+
+        response = client.get(
+            "/movies/?expand=producers,studios",
+            headers={"Accept": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [m["title"] for m in lines] == ["Cats", "Dogs"]
+        assert lines[0]["producers"][0]["name"] == "Tom"
+        assert lines[0]["studios"][0]["name"] == "Uni"
+        assert lines[1]["producers"] == []
+
+    def test_get_all_movies_stream_matches_listing(
+        self, client: TestClient, db_session: Session
+    ) -> None:
+        """Testa se stream=true produz o mesmo documento da listagem comum."""
+        for i in range(3):
+            MovieRepository.create(db_session, f"Movie {i}", 2000 + i, i == 1)
+
+        expected = client.get("/movies/?expand=producers").json()
+        response = client.get("/movies/?expand=producers&stream=true")
+
+        assert response.status_code == 200
+        assert response.json() == expected
+
+    def test_get_all_movies_stream_with_limit(self, client: TestClient) -> None:
+        """Testa erro ao combinar streaming com limit."""
+        response = client.get("/movies/?stream=true&limit=10")
+        assert response.status_code == 400
+
+    def test_get_all_movies_with_fields(
+        self, client: TestClient, db_session: Session
+    ) -> None:
+        """Testa se fields restringe as colunas retornadas."""
+        for i in range(3):
+            MovieRepository.create(db_session, f"Movie {i}", 2000 + i, False)
+
+        body = client.get("/movies/?fields=title&limit=2").json()
+
+        assert body["movies"] == [{"title": "Movie 0"}, {"title": "Movie 1"}]
+        assert body["next_cursor"] is not None
+
+    def test_get_all_movies_with_fields_and_expand(
+        self, client: TestClient, db_session: Session
+    ) -> None:
+        """Testa se fields mantém as expansões solicitadas."""
+        producer = ProducerRepository.create(db_session, "Debra Hayward")
+        movie = MovieRepository.create(db_session, "Cats", 2019, True)
+        movie.producers.append(producer)
+        db_session.commit()
+
+        body = client.get("/movies/?fields=id,title&expand=producers").json()
+
+        assert body["movies"] == [
+            {
+                "title": "Cats",
+                "id": movie.id,
+                "producers": [{"name": "Debra Hayward", "id": producer.id}],
+            }
+        ]
+
+    def test_get_all_movies_invalid_fields(self, client: TestClient) -> None:
+        """Testa erro ao solicitar colunas não permitidas ou com streaming."""
+        assert client.get("/movies/?fields=id,budget").status_code == 400
+        assert client.get("/movies/?fields=id&stream=true").status_code == 400
+
+    def test_get_all_movies_with_filters(
+        self, client: TestClient, db_session: Session
+    ) -> None:
+        """Testa os filtros por ano, intervalo de anos e vencedor."""
+        for i in range(6):
+            MovieRepository.create(db_session, f"Movie {i}", 2000 + i % 3, i % 2 == 0)
+
+        def titles(query: str) -> list[str]:
+            response = client.get(f"/movies/?{query}")
+            assert response.status_code == 200
+            return [m["title"] for m in response.json()["movies"]]
+
+        assert titles("year=2001") == ["Movie 1", "Movie 4"]
+        assert titles("year=2001&winner=true") == ["Movie 4"]
+        assert titles("year_from=2001&year_to=2002&winner=false") == [
+            "Movie 1",
+            "Movie 5",
+        ]
+        assert titles("winner=true&expand=producers&limit=2") == ["Movie 0", "Movie 2"]
+
+    def test_get_all_movies_with_filters_streaming(
+        self, client: TestClient, db_session: Session
+    ) -> None:
+        """Testa se os filtros também se aplicam à listagem em streaming."""
+        for i in range(4):
+            MovieRepository.create(db_session, f"Movie {i}", 2000 + i, False)
+
+        response = client.get("/movies/?year_from=2002&stream=true")
+
+        assert [m["title"] for m in response.json()["movies"]] == ["Movie 2", "Movie 3"]
+
+    def test_get_all_movies_invalid_year_range(self, client: TestClient) -> None:
+        """Testa erro ao informar year_from maior que year_to."""
+        response = client.get("/movies/?year_from=2010&year_to=2000")
+        assert response.status_code == 400
+
+    def test_batch_get_movies(self, client: TestClient, db_session: Session) -> None:
+        """Testa a busca em lote por IDs e por títulos, na ordem pedida."""
+        movies = [
+            MovieRepository.create(db_session, f"Movie {i}", 2000, False)
+            for i in range(3)
+        ]
+        ids = [cast(int, m.id) for m in movies]
+
+        response = client.post(
+            "/movies/batch-get", json={"ids": [ids[2], 9999, ids[0], ids[2]]}
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [m and m["title"] for m in body["movies"]] == [
+            "Movie 2",
+            None,
+            "Movie 0",
+            "Movie 2",
+        ]
+        assert body["missing"] == [9999]
+
+        body = client.post(
+            "/movies/batch-get", json={"names": ["Movie 1", "Unknown"]}
+        ).json()
+        assert body["movies"][0]["id"] == ids[1]
+        assert body["missing"] == ["Unknown"]
+
+    def test_batch_get_movies_invalid_request(
+        self, client: TestClient, mocker: MockFixture
+    ) -> None:
+        """Testa erros ao informar ids e names juntos, nenhum deles ou lote grande."""
+        assert client.post("/movies/batch-get", json={}).status_code == 422
+        assert (
+            client.post(
+                "/movies/batch-get", json={"ids": [1], "names": ["A"]}
+            ).status_code
+            == 422
+        )
+
+        mocker.patch.object(Config, "MAX_BATCH_SIZE", 2)
+        response = client.post("/movies/batch-get", json={"ids": [1, 2, 3]})
+        assert response.status_code == 400
+
+    def test_bulk_create_movies(self, client: TestClient, db_session: Session) -> None:
+        """Testa o cadastro em lote com produtores e estúdios e o status por item."""
+        existing = MovieRepository.create(db_session, "Existing", 1999, False)
+        ProducerRepository.create(db_session, "Allan Carr")
+        payload = {
+            "movies": [
+                {
+                    "title": "Movie A",
+                    "year": 1980,
+                    "winner": True,
+                    "producers": ["Allan Carr", " New Producer ", ""],
+                    "studios": ["Studio X"],
+                },
+                {"title": "Existing", "year": 1999, "winner": False},
+                {
+                    "title": "Movie B",
+                    "year": 1981,
+                    "winner": False,
+                    "producers": ["New Producer", "New Producer"],
+                    "studios": ["Studio X", "Studio Y"],
+                },
+                {"title": "Movie A", "year": 1980, "winner": True},
+            ]
+        }
+
+        response = client.post("/movies/bulk", json=payload)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["created"] == 2
+        assert [r["status"] for r in body["results"]] == [
+            "created",
+            "exists",
+            "created",
+            "duplicate",
+        ]
+        assert body["results"][1]["id"] == existing.id
+        assert body["results"][3]["id"] == body["results"][0]["id"]
+
+        movies = client.get("/movies/?expand=producers,studios").json()["movies"]
+        by_title = {m["title"]: m for m in movies}
+        assert [p["name"] for p in by_title["Movie A"]["producers"]] == [
+            "Allan Carr",
+            "New Producer",
+        ]
+        assert [p["name"] for p in by_title["Movie B"]["producers"]] == ["New Producer"]
+        assert [s["name"] for s in by_title["Movie B"]["studios"]] == [
+            "Studio X",
+            "Studio Y",
+        ]
+        assert len(client.get("/producers/").json()["producers"]) == 2
+
+    def test_bulk_create_movies_too_large(
+        self, client: TestClient, mocker: MockFixture
+    ) -> None:
+        """Testa erro ao enviar um lote maior que o permitido."""
+        mocker.patch.object(Config, "MAX_BATCH_SIZE", 1)
+        movies = [{"title": f"M{i}", "year": 2000, "winner": False} for i in range(2)]
+
+        response = client.post("/movies/bulk", json={"movies": movies})
+
+        assert response.status_code == 400
+
+    def test_search_movies(self, client: TestClient, db_session: Session) -> None:
+        """Testa a busca por palavras e prefixo, ignorando acentos e maiúsculas."""
+        for title in ["The Lonely Lady", "Lady in White", "Amélie", "Ladybugs"]:
+            MovieRepository.create(db_session, title, 2000, False)
+
+        def titles(query: str) -> list[str]:
+            response = client.get(f"/movies/search?q={query}")
+            assert response.status_code == 200
+            return [m["title"] for m in response.json()["movies"]]
+
+        assert set(titles("lady")) == {"The Lonely Lady", "Lady in White", "Ladybugs"}
+        assert titles("LONELY lad") == ["The Lonely Lady"]
+        assert titles("amelie") == ["Amélie"]
+        assert titles('lady"') != []
+        assert client.get("/movies/search?q=%22%2A").status_code == 400
+
+    def test_search_movies_follows_updates_and_deletes(
+        self, client: TestClient, db_session: Session
+    ) -> None:
+        """Testa se o índice de busca acompanha inserções em lote e remoções."""
+        client.post(
+            "/movies/bulk",
+            json={"movies": [{"title": "Cruising", "year": 1980, "winner": False}]},
+        )
+        movie_id = client.get("/movies/search?q=cruis").json()["movies"][0]["id"]
+
+        client.delete(f"/movies/{movie_id}")
+
+        assert client.get("/movies/search?q=cruising").json()["movies"] == []
+
+    def test_get_all_movies_not_modified_skips_listing(
+        self, client: TestClient, db_session: Session
+    ) -> None:
+        """Testa se o 304 consulta apenas a tabela de gerações."""
+        client.post("/movies/", json={"title": "Cats", "year": 2019, "winner": True})
+        etag = client.get("/movies/").headers["etag"]
+
+        statements: List[str] = []
+
+        def capture(*args: Any) -> None:
+            statements.append(args[2])
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            response = client.get("/movies/", headers={"If-None-Match": f"W/{etag}"})
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        assert response.status_code == 304
+        assert len(statements) == 1
+        assert "data_generations" in statements[0]
+
+    def test_get_all_movies_etag_per_representation(self, client: TestClient) -> None:
+        """
+        Testa se a ETag muda entre JSON e NDJSON e, com expand, também quando
+        apenas os produtores mudam."""
+        client.post("/movies/", json={"title": "Cats", "year": 2019, "winner": True})
+        plain = client.get("/movies/").headers["etag"]
+        ndjson = client.get(
+            "/movies/", headers={"Accept": "application/x-ndjson"}
+        ).headers["etag"]
+        expanded = client.get("/movies/?expand=producers").headers["etag"]
+        assert len({plain, ndjson, expanded}) == 3
+
+        client.post("/producers/", json={"name": "Tom Hooper"})
+
+        assert client.get("/movies/").headers["etag"] == plain
+        assert client.get("/movies/?expand=producers").headers["etag"] != expanded
+
+    def test_get_full_catalog_from_compressed_snapshot(
+        self, client: TestClient, db_session: Session
+    ) -> None:
+        """
+        Testa se o catálogo completo expandido é enviado do snapshot gzip,
+        sem consultar os filmes de novo, e se é refeito após uma escrita."""
+        client.post("/movies/", json={"title": "Cats", "year": 2019, "winner": True})
+        url = "/movies/?expand=producers,studios"
+        plain = client.get(url, headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in plain.headers
+        assert plain.headers["vary"] == "Accept, Accept-Encoding"
+        assert (
+            client.get("/movies/?limit=1").headers["vary"] == "Accept, Accept-Encoding"
+        )
+
+        brotli = client.get(url, headers={"Accept-Encoding": "br"})
+        assert brotli.headers["content-encoding"] == "br"
+        assert brotli.content == plain.content
+
+        first = client.get(url, headers={"Accept-Encoding": "gzip"})
+        assert first.headers["content-encoding"] == "gzip"
+        assert first.headers["vary"] == "Accept, Accept-Encoding"
+        assert first.content == plain.content
+        assert first.headers["etag"] != plain.headers["etag"]
+
+        statements: List[str] = []
+
+        def capture(*args: Any) -> None:
+            statements.append(args[2])
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            second = client.get(url, headers={"Accept-Encoding": "gzip"})
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+        assert second.content == first.content
+        assert len(statements) == 1
+
+        client.post(
+            "/movies/", json={"title": "Dolittle", "year": 2020, "winner": False}
+        )
+        updated = client.get(url, headers={"Accept-Encoding": "gzip"})
+        assert [m["title"] for m in updated.json()["movies"]] == ["Cats", "Dolittle"]
+
+    def test_delete_movies_in_bulk(self, client: TestClient) -> None:
+        """Testa a remoção em lote por IDs, ignorando os inexistentes."""
+        ids = [
+            client.post(
+                "/movies/", json={"title": f"Movie {i}", "year": 2000, "winner": False}
+            ).json()["id"]
+            for i in range(3)
+        ]
+
+        response = client.delete(f"/movies/?ids={ids[0]},{ids[2]},9999")
+
+        assert response.status_code == 200
+        assert response.json() == {"deleted": 2}
+        assert [m["id"] for m in client.get("/movies/").json()["movies"]] == [ids[1]]
+        assert client.get(f"/movies/{ids[0]}").status_code == 404
+
+    def test_delete_movies_invalid_ids(self, client: TestClient) -> None:
+        """Testa a validação da lista de IDs da remoção em lote."""
+        assert client.delete("/movies/?ids=1,abc").status_code == 400
+        assert client.delete("/movies/?ids=,").status_code == 400
+        assert client.delete("/movies/").status_code == 422
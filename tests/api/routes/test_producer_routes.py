@@ -1,3 +1,4 @@
+import json
 from fastapi.testclient import TestClient
 
 
@@ -69,3 +70,135 @@ class TestProducerRoutes:
 
         assert response.status_code == 404
         assert response.json()["detail"] == "Producer not found"
+
+    def test_get_all_producers_paginated(self, client: TestClient) -> None:
+        """Testa a paginação por cursor na listagem."""
+        for name in ["A", "B", "C"]:
+            client.post("/producers/", json={"name": name})
+
+        first = client.get("/producers/?limit=2").json()
+        assert [p["name"] for p in first["producers"]] == ["A", "B"]
+        assert first["next_cursor"] is not None
+
+        second = client.get(f"/producers/?limit=2&after={first['next_cursor']}").json()
+        assert [p["name"] for p in second["producers"]] == ["C"]
+        assert second["next_cursor"] is None
+
+    def test_get_all_producers_ndjson(self, client: TestClient) -> None:
+        """Testa a listagem em NDJSON e em JSON por streaming."""
+        for name in ["A", "B"]:
+            client.post("/producers/", json={"name": name})
+
+        response = client.get("/producers/", headers={"Accept": "application/x-ndjson"})
+        assert response.status_code == 200
+        assert [json.loads(line)["name"] for line in response.text.splitlines()] == [
+            "A",
+            "B",
+        ]
+
+        streamed = client.get("/producers/?stream=true")
+        assert streamed.json() == client.get("/producers/").json()
+
+    def test_get_all_producers_with_fields(self, client: TestClient) -> None:
+        """Testa se fields restringe as colunas retornadas."""
+        for name in ["A", "B"]:
+            client.post("/producers/", json={"name": name})
+
+        response = client.get("/producers/?fields=name")
+
+        assert response.status_code == 200
+        assert response.json()["producers"] == [{"name": "A"}, {"name": "B"}]
+        assert client.get("/producers/?fields=title").status_code == 400
+
+    def test_batch_get_producers(self, client: TestClient) -> None:
+        """Testa a busca em lote por nomes e por IDs, marcando os ausentes."""
+        ids = [
+            client.post("/producers/", json={"name": name}).json()["id"]
+            for name in ["A", "B"]
+        ]
+
+        body = client.post(
+            "/producers/batch-get", json={"names": ["B", "Z", "A"]}
+        ).json()
+        assert [item and item["id"] for item in body["producers"]] == [
+            ids[1],
+            None,
+            ids[0],
+        ]
+        assert body["missing"] == ["Z"]
+
+        body = client.post("/producers/batch-get", json={"ids": [ids[0], 9999]}).json()
+        assert body["producers"] == [{"name": "A", "id": ids[0]}, None]
+        assert body["missing"] == [9999]
+
+    def test_get_producer_movies(self, client: TestClient) -> None:
+        """Testa a listagem paginada dos filmes de um produtor, com filtro."""
+        movies = [
+            {
+                "title": f"Movie {i}",
+                "year": 2000 + i,
+                "winner": i % 2 == 0,
+                "producers": ["A"] if i < 3 else ["B"],
+            }
+            for i in range(4)
+        ]
+        client.post("/movies/bulk", json={"movies": movies})
+        producer_id = client.get("/producers/name/A").json()["id"]
+
+        first = client.get(f"/producers/{producer_id}/movies?limit=2").json()
+        assert [m["title"] for m in first["movies"]] == ["Movie 0", "Movie 1"]
+        second = client.get(
+            f"/producers/{producer_id}/movies?limit=2&after={first['next_cursor']}"
+        ).json()
+        assert [m["title"] for m in second["movies"]] == ["Movie 2"]
+
+        winners = client.get(f"/producers/{producer_id}/movies?winner=true").json()
+        assert [m["title"] for m in winners["movies"]] == ["Movie 0", "Movie 2"]
+
+    def test_get_producer_movies_not_found(self, client: TestClient) -> None:
+        """Testa erro ao listar filmes de um produtor inexistente."""
+        response = client.get("/producers/9999/movies")
+        assert response.status_code == 404
+
+    def test_search_producers(self, client: TestClient) -> None:
+        """Testa a busca por prefixo sem diferenciar maiúsculas e acentos."""
+        for name in ["Éric Rohmer", "erin brockovich", "Ernst Lubitsch", "Ana"]:
+            client.post("/producers/", json={"name": name})
+
+        response = client.get("/producers/search?q=ER&limit=2")
+
+        assert response.status_code == 200
+        assert [p["name"] for p in response.json()["producers"]] == [
+            "Éric Rohmer",
+            "erin brockovich",
+        ]
+        assert client.get("/producers/search?q=éRN").json()["producers"][0]["name"] == (
+            "Ernst Lubitsch"
+        )
+        assert client.get("/producers/search?q=%20").status_code == 400
+
+    def test_get_all_producers_conditional(self, client: TestClient) -> None:
+        """Testa o 304 com If-None-Match e a troca da ETag após escritas."""
+        client.post("/producers/", json={"name": "Producer A"})
+        response = client.get("/producers/")
+        etag = response.headers["etag"]
+        assert "last-modified" in response.headers
+
+        not_modified = client.get("/producers/", headers={"If-None-Match": etag})
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+        assert not_modified.headers["etag"] == etag
+
+        producer_id = client.post("/producers/", json={"name": "Producer B"}).json()[
+            "id"
+        ]
+        created = client.get("/producers/", headers={"If-None-Match": etag})
+        assert created.status_code == 200
+        assert created.headers["etag"] != etag
+
+        client.delete(f"/producers/{producer_id}")
+        deleted = client.get(
+            "/producers/", headers={"If-None-Match": created.headers["etag"]}
+        )
+        assert deleted.status_code == 200
+        assert [p["name"] for p in deleted.json()["producers"]] == ["Producer A"]
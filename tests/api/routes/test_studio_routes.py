@@ -1,3 +1,4 @@
+import json
 from fastapi.testclient import TestClient
 
 
@@ -69,3 +70,95 @@ class TestStudioRoutes:
 
         assert response.status_code == 404
         assert response.json()["detail"] == "Studio not found"
+
+    def test_get_all_studios_paginated(self, client: TestClient) -> None:
+        """Testa a paginação por cursor na listagem."""
+        for name in ["A", "B", "C"]:
+            client.post("/studios/", json={"name": name})
+
+        first = client.get("/studios/?limit=2").json()
+        assert [p["name"] for p in first["studios"]] == ["A", "B"]
+        assert first["next_cursor"] is not None
+
+        second = client.get(f"/studios/?limit=2&after={first['next_cursor']}").json()
+        assert [p["name"] for p in second["studios"]] == ["C"]
+        assert second["next_cursor"] is None
+
+    def test_get_all_studios_ndjson(self, client: TestClient) -> None:
+        """Testa a listagem em NDJSON e em JSON por streaming."""
+        for name in ["A", "B"]:
+            client.post("/studios/", json={"name": name})
+
+        response = client.get("/studios/", headers={"Accept": "application/x-ndjson"})
+        assert response.status_code == 200
+        assert [json.loads(line)["name"] for line in response.text.splitlines()] == [
+            "A",
+            "B",
+        ]
+
+        streamed = client.get("/studios/?stream=true")
+        assert streamed.json() == client.get("/studios/").json()
+
+    def test_get_all_studios_with_fields(self, client: TestClient) -> None:
+        """Testa se fields restringe as colunas retornadas."""
+        for name in ["A", "B"]:
+            client.post("/studios/", json={"name": name})
+
+        response = client.get("/studios/?fields=name")
+
+        assert response.status_code == 200
+        assert response.json()["studios"] == [{"name": "A"}, {"name": "B"}]
+        assert client.get("/studios/?fields=title").status_code == 400
+
+    def test_batch_get_studios(self, client: TestClient) -> None:
+        """Testa a busca em lote por nomes e por IDs, marcando os ausentes."""
+        ids = [
+            client.post("/studios/", json={"name": name}).json()["id"]
+            for name in ["A", "B"]
+        ]
+
+        body = client.post("/studios/batch-get", json={"names": ["B", "Z", "A"]}).json()
+        assert [item and item["id"] for item in body["studios"]] == [
+            ids[1],
+            None,
+            ids[0],
+        ]
+        assert body["missing"] == ["Z"]
+
+        body = client.post("/studios/batch-get", json={"ids": [ids[0], 9999]}).json()
+        assert body["studios"] == [{"name": "A", "id": ids[0]}, None]
+        assert body["missing"] == [9999]
+
+    def test_get_studio_movies(self, client: TestClient) -> None:
+        """Testa a listagem dos filmes de um estúdio, com filtro de vencedor."""
+        movies = [
+            {"title": "Movie A", "year": 2000, "winner": True, "studios": ["X"]},
+            {"title": "Movie B", "year": 2001, "winner": False, "studios": ["X"]},
+            {"title": "Movie C", "year": 2002, "winner": True, "studios": ["Y"]},
+        ]
+        client.post("/movies/bulk", json={"movies": movies})
+        studio_id = client.get("/studios/name/X").json()["id"]
+
+        body = client.get(f"/studios/{studio_id}/movies").json()
+        assert [m["title"] for m in body["movies"]] == ["Movie A", "Movie B"]
+
+        body = client.get(f"/studios/{studio_id}/movies?winner=false").json()
+        assert [m["title"] for m in body["movies"]] == ["Movie B"]
+        assert client.get("/studios/9999/movies").status_code == 404
+
+    def test_search_studios(self, client: TestClient) -> None:
+        """Testa a busca por prefixo sem diferenciar maiúsculas e acentos."""
+        for name in ["Éric Rohmer", "erin brockovich", "Ernst Lubitsch", "Ana"]:
+            client.post("/studios/", json={"name": name})
+
+        response = client.get("/studios/search?q=ER&limit=2")
+
+        assert response.status_code == 200
+        assert [p["name"] for p in response.json()["studios"]] == [
+            "Éric Rohmer",
+            "erin brockovich",
+        ]
+        assert client.get("/studios/search?q=éRN").json()["studios"][0]["name"] == (
+            "Ernst Lubitsch"
+        )
+        assert client.get("/studios/search?q=%20").status_code == 400
@@ -1,5 +1,11 @@
+import runpy
+
+import pytest
+from fastapi.routing import APIRoute
 from fastapi.testclient import TestClient
-from app.main import app
+from app import config
+from app.config import Config
+from app.main import app, cache_validation, validate_caches, validate_caches_async
 
 client = TestClient(app)
 
@@ -17,3 +23,45 @@ class TestAPI:
         response = client.get("/")
         assert response.status_code == 200
         assert response.json()["message"] == "Golden Raspberry Awards API is running!"
+
+    def test_metrics(self) -> None:
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        caches = response.json()["caches"]
+        assert {"movies", "producers", "studios"} <= caches.keys()
+        assert {"hits", "misses", "hit_ratio"} <= caches["movies"].keys()
+        assert "saturation" in response.json()["pool"]
+
+    def test_health_and_metrics_skip_cache_validation(self) -> None:
+        """/health e /metrics não abrem sessão para validar os caches."""
+        routes = {r.path: r for r in app.routes if isinstance(r, APIRoute)}
+        for path in ("/health", "/metrics", "/"):
+            assert routes[path].dependencies == []
+
+    def test_cache_validation_dependencies(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A validação só é registrada quando ativada, com a sessão da rota."""
+        monkeypatch.setattr(Config, "CACHE_VALIDATION_INTERVAL", -1)
+        assert cache_validation(async_db=False) == []
+        assert cache_validation(async_db=True) == []
+
+        monkeypatch.setattr(Config, "CACHE_VALIDATION_INTERVAL", 0)
+        [sync_dependency] = cache_validation(async_db=False)
+        [async_dependency] = cache_validation(async_db=True)
+        assert sync_dependency.dependency is validate_caches
+        assert async_dependency.dependency is validate_caches_async
+
+    def test_cache_validation_default_follows_workers(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Com mais de um worker (WEB_CONCURRENCY) a validação vem ativada."""
+        monkeypatch.delenv("CACHE_VALIDATION_INTERVAL", raising=False)
+
+        monkeypatch.setenv("WEB_CONCURRENCY", "4")
+        workers = runpy.run_path(config.__file__)["Config"]
+        monkeypatch.setenv("WEB_CONCURRENCY", "1")
+        single = runpy.run_path(config.__file__)["Config"]
+
+        assert workers.CACHE_VALIDATION_INTERVAL == 0
+        assert single.CACHE_VALIDATION_INTERVAL == -1
@@ -0,0 +1,30 @@
+from pathlib import Path
+
+import pytest
+from loguru import logger
+
+from benchmarks.async_benchmark import MODES, percentile, run_mode
+
+
+class TestAsyncBenchmark:
+    """Testes para o benchmark de concorrência das rotas síncronas e async."""
+
+    def test_percentile(self) -> None:
+        """Testa o percentil por posição."""
+        values = [float(v) for v in range(1, 101)]
+
+        assert percentile(values, 0.5) == 51.0
+        assert percentile(values, 0.99) == 100.0
+        assert percentile([3.0], 0.99) == 3.0
+
+    def test_run_mode_small(self, tmp_path: Path) -> None:
+        """Testa se os dois modos atendem todas as requisições."""
+        try:
+            for mode in MODES:
+                metrics = run_mode(mode, 50, 40, 20, str(tmp_path))
+
+                assert metrics["requests"] == 40
+                assert metrics["p99_ms"] >= metrics["p50_ms"] > 0
+                assert metrics["peak_rss_bytes"] > 0
+        finally:
+            logger.enable("app")
@@ -0,0 +1,126 @@
+import os
+import re
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockFixture
+
+from app.services.csv_importer_service import CSVImporterService
+from benchmarks.common import (
+    compare_to_baseline,
+    load_baseline,
+    report_against_baseline,
+    save_baseline,
+)
+from benchmarks.data_generator import HEADER, generate_movie_list
+from benchmarks.import_benchmark import (
+    DEFAULT_BASELINE,
+    SCENARIOS,
+    _run_import_csv,
+    run_scenario,
+)
+
+
+class TestImportBenchmark:
+    """Testes para o gerador de dados sintéticos e o benchmark de importação."""
+
+    def test_generate_movie_list(self) -> None:
+        """Testa se o CSV gerado tem o tamanho e o formato esperados."""
+        lines = list(generate_movie_list(500, seed=1))
+
+        assert lines[0] == HEADER
+        assert len(lines) == 501
+
+        titles = [line.split(";")[1] for line in lines[1:]]
+        assert len(set(titles)) == 500
+
+        producers = [line.split(";")[3] for line in lines[1:]]
+        assert any(" and " in p for p in producers)
+        assert any(re.search(r", [^,]+(,)? and ", p) for p in producers)
+
+    def test_generate_movie_list_is_deterministic(self) -> None:
+        """Testa se a mesma semente gera o mesmo conteúdo."""
+        assert list(generate_movie_list(50, seed=7)) == list(
+            generate_movie_list(50, seed=7)
+        )
+
+    def test_compare_to_baseline_flags_regressions(self) -> None:
+        """Testa se regressões além da tolerância são sinalizadas."""
+        baseline = {
+            "import_csv:10": {
+                "rows_per_sec": 100.0,
+                "peak_memory_bytes": 1000,
+                "db_round_trips": 50,
+            }
+        }
+        results = {
+            "import_csv:10": {
+                "rows_per_sec": 70.0,
+                "peak_memory_bytes": 1100,
+                "db_round_trips": 80,
+            }
+        }
+
+        regressions = compare_to_baseline(
+            results,
+            baseline,
+            tolerance=0.2,
+            metrics=["rows_per_sec", "peak_memory_bytes", "db_round_trips"],
+        )
+
+        assert len(regressions) == 2
+        assert any("rows_per_sec" in r for r in regressions)
+        assert any("db_round_trips" in r for r in regressions)
+
+    def test_save_and_load_baseline(self, tmp_path: Path) -> None:
+        """Testa se o baseline é gravado e lido corretamente."""
+        path = os.path.join(tmp_path, "baselines", "import.json")
+        save_baseline(path, {"import_csv:10": {"rows_per_sec": 1.5}})
+
+        assert load_baseline(path) == {"import_csv:10": {"rows_per_sec": 1.5}}
+        assert load_baseline(os.path.join(tmp_path, "missing.json")) == {}
+
+    def test_missing_baseline_fails(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Testa se um cenário sem baseline falha em vez de passar sem comparar."""
+        path = os.path.join(tmp_path, "import.json")
+        results = {"import_csv:10": {"rows_per_sec": 100.0}}
+
+        assert report_against_baseline(results, path, 0.2, ["rows_per_sec"]) == 1
+        assert "SEM BASELINE import_csv:10" in capsys.readouterr().err
+
+        save_baseline(path, results)
+        assert report_against_baseline(results, path, 0.2, ["rows_per_sec"]) == 0
+
+    def test_committed_baseline(self) -> None:
+        """Testa se o baseline versionado cobre os cenários do benchmark."""
+        baseline = load_baseline(DEFAULT_BASELINE)
+
+        for scenario in SCENARIOS:
+            assert baseline[f"{scenario}:10000"]["rows_per_sec"] > 0
+
+    def test_run_scenario(self, tmp_path: Path) -> None:
+        """Testa a execução de ponta a ponta de um cenário pequeno."""
+        result = run_scenario("load_csv_on_startup", 20, str(tmp_path))
+
+        assert result["rows"] == 20
+        assert result["rows_per_sec"] > 0
+        assert result["peak_memory_bytes"] > 0
+        assert result["db_round_trips"] > 0
+
+    def test_import_csv_reads_file_outside_measurement(
+        self, tmp_path: Path, mocker: MockFixture
+    ) -> None:
+        """Testa se o CSV é lido antes da função medida, e não dentro dela."""
+        path = os.path.join(tmp_path, "movielist.csv")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("conteúdo")
+        import_csv = mocker.patch.object(CSVImporterService, "import_csv")
+        db = mocker.Mock()
+
+        run = _run_import_csv(db, path)
+        os.remove(path)
+        run()
+
+        import_csv.assert_called_once_with(db, "conteúdo")
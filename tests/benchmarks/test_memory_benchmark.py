@@ -0,0 +1,21 @@
+from pathlib import Path
+
+from loguru import logger
+
+from benchmarks.memory_benchmark import MODES, PATHS, run_mode
+
+
+class TestMemoryBenchmark:
+    """Testes para o benchmark de latência do SQLite em arquivo x memória."""
+
+    def test_run_mode_small(self, tmp_path: Path) -> None:
+        """Testa se as rotas respondem nos dois modos."""
+        logger.disable("app")
+        try:
+            for mode in MODES:
+                results = run_mode(mode, 50, 3, str(tmp_path))
+
+                assert results.keys() == PATHS.keys()
+                assert all(m["p50_ms"] > 0 for m in results.values())
+        finally:
+            logger.enable("app")
@@ -0,0 +1,22 @@
+from pathlib import Path
+
+from loguru import logger
+
+from benchmarks.sqlite_profile_benchmark import NO_PROFILE, run_profile
+
+
+class TestSQLiteProfileBenchmark:
+    """Testes para o benchmark de vazão mista por perfil do SQLite."""
+
+    def test_run_profile_small(self, tmp_path: Path) -> None:
+        """Testa se o benchmark executa leituras e escritas sem erros."""
+        logger.disable("app")
+        try:
+            for profile in (NO_PROFILE, "balanced"):
+                metrics = run_profile(profile, 100, 20, 2, str(tmp_path))
+
+                assert metrics["ops"] == 60
+                assert metrics["errors"] == 0
+                assert metrics["ops_per_sec"] > 0
+        finally:
+            logger.enable("app")
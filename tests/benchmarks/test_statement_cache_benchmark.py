@@ -0,0 +1,22 @@
+from pathlib import Path
+
+from loguru import logger
+
+from benchmarks.statement_cache_benchmark import MODES, run_mode
+
+
+class TestStatementCacheBenchmark:
+    """Testes para o benchmark do custo por chamada das buscas."""
+
+    def test_run_mode_small(self, tmp_path: Path) -> None:
+        """Testa se as duas formas executam as mesmas buscas."""
+        logger.disable("app")
+        try:
+            results = {mode: run_mode(mode, 50, 20, str(tmp_path)) for mode in MODES}
+        finally:
+            logger.enable("app")
+
+        assert results["legacy"].keys() == results["cached"].keys()
+        for metrics in results["cached"].values():
+            assert metrics["calls"] == 20
+            assert metrics["us_per_call"] > 0
@@ -7,10 +7,13 @@ import pytest
 import datetime
 import pytz
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
-from app.db.database import get_db
+from app.db.async_database import build_async_engine
+from app.db.database import enable_sqlite_foreign_keys, get_db
 from app.models import Base
-from typing import Iterator, List
+from app.utils.cache import clear_caches
+from typing import AsyncIterator, Iterator, List
 from sqlalchemy.orm import Session
 from app.main import app
 
@@ -33,6 +36,7 @@ def save_test_execution_time() -> None:
 # Criar uma engine temporária para os testes
 TEST_DATABASE_URL = "sqlite:///test.db"
 engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
+enable_sqlite_foreign_keys(engine)
 
 # Criar sessão independente para os testes
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -42,6 +46,7 @@ TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engin
 def db_session() -> Iterator[Session]:
     """Cria um banco em memória e uma sessão isolada para cada teste"""
     Base.metadata.create_all(bind=engine)
+    clear_caches()  # Os IDs se repetem entre testes, pois o banco é recriado
 
     db = TestingSessionLocal()
     yield db  # Retorna a sessão para o teste usar
@@ -51,6 +56,17 @@ def db_session() -> Iterator[Session]:
     Base.metadata.drop_all(bind=engine)  # Remove todas as tabelas ao final do teste
 
 
+@pytest.fixture(scope="function")
+async def async_db_session(db_session: Session) -> AsyncIterator[AsyncSession]:
+    """Sessão async sobre o mesmo banco de testes (criado e limpo por `db_session`)"""
+    async_engine = build_async_engine(TEST_DATABASE_URL)
+    db = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)()
+    yield db
+
+    await db.close()
+    await async_engine.dispose()
+
+
 @pytest.fixture
 def sample_producers() -> list[str]:
     """
@@ -0,0 +1,173 @@
+import os
+import stat
+
+from typing import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.artifact import build_artifact, install_artifact
+from app.db.database import artifact_url, build_engine, get_db, is_read_only_error
+from app.main import app
+from app.models import Base
+from app.repositories.movie_repository import MovieRepository
+from benchmarks.data_generator import write_movie_list
+
+
+@pytest.fixture
+def artifact(tmp_path: os.PathLike) -> str:
+    """Artefato gerado a partir de um CSV sintético com 100 filmes."""
+    csv_directory = os.path.join(tmp_path, "data")
+    os.makedirs(csv_directory)
+    write_movie_list(os.path.join(csv_directory, "movielist.csv"), 100)
+    output = os.path.join(tmp_path, "build", "gra.db")
+    build_artifact(csv_directory, output)
+    return output
+
+
+def rebuild(artifact: str, tmp_path: os.PathLike, movies: int) -> str:
+    """Gera outro artefato, com outra quantidade de filmes."""
+    csv_directory = os.path.join(tmp_path, f"data-{movies}")
+    os.makedirs(csv_directory)
+    write_movie_list(os.path.join(csv_directory, "movielist.csv"), movies)
+    output = os.path.join(tmp_path, f"build-{movies}", "gra.db")
+    build_artifact(csv_directory, output)
+    return output
+
+
+def movie_count(path: str) -> int:
+    """Quantidade de filmes do banco, lida direto do arquivo."""
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.connect() as conn:
+        count = conn.execute(text("SELECT COUNT(*) FROM movies")).scalar()
+    engine.dispose()
+    return int(count or 0)
+
+
+class TestArtifact:
+    """Testes do artefato SQLite pré-construído (DATABASE_ARTIFACT)."""
+
+    def test_build_artifact(self, artifact: str) -> None:
+        """Testa se o artefato tem os dados, as estatísticas e é somente leitura."""
+        assert not os.stat(artifact).st_mode & stat.S_IWUSR
+        assert not os.path.exists(f"{artifact}.building")
+
+        engine = create_engine(f"sqlite:///{artifact}")
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM movies")).scalar() == 100
+            assert conn.execute(text("SELECT COUNT(*) FROM sqlite_stat1")).scalar()
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "delete"
+        engine.dispose()
+
+    def test_build_artifact_without_csv(self, tmp_path: os.PathLike) -> None:
+        """Testa o erro quando o diretório não tem CSVs."""
+        with pytest.raises(ValueError):
+            build_artifact(str(tmp_path), os.path.join(tmp_path, "gra.db"))
+
+    def test_readonly_url(self, artifact: str) -> None:
+        """Testa a leitura do artefato imutável e a recusa de escritas."""
+        engine = build_engine(artifact_url(artifact))
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM movies")).scalar() == 100
+            with pytest.raises(OperationalError):
+                conn.execute(text("DELETE FROM movies"))
+        engine.dispose()
+
+    def test_readonly_writes_return_503(
+        self, artifact: str, csv_content: bytes
+    ) -> None:
+        """Testa se as escritas no artefato somente leitura respondem 503."""
+        engine = build_engine(artifact_url(artifact))
+
+        def override_get_db() -> Iterator[Session]:
+            with sessionmaker(bind=engine)() as db:
+                yield db
+
+        app.dependency_overrides[get_db] = override_get_db
+        try:
+            with TestClient(app) as client:
+                response = client.post("/producers/", json={"name": "New Producer"})
+                assert response.status_code == 503
+                assert "somente leitura" in response.json()["detail"]
+
+                assert client.delete("/movies/1").status_code == 503
+                response = client.post(
+                    "/csv/upload",
+                    files={"file": ("movies.csv", csv_content, "text/csv")},
+                )
+                assert response.status_code == 503
+                assert client.get("/movies/1").status_code == 200
+                response = client.post("/producers/batch-get", json={"ids": [1]})
+                assert response.status_code == 200
+        finally:
+            app.dependency_overrides.clear()
+            engine.dispose()
+
+    def test_is_read_only_error(self, artifact: str) -> None:
+        """Testa a distinção entre o erro de banco somente leitura e os demais."""
+        engine = build_engine(artifact_url(artifact))
+        with engine.connect() as conn:
+            with pytest.raises(OperationalError) as readonly:
+                conn.execute(text("DELETE FROM movies"))
+            with pytest.raises(OperationalError) as missing:
+                conn.execute(text("SELECT * FROM missing_table"))
+        engine.dispose()
+
+        assert is_read_only_error(readonly.value)
+        assert not is_read_only_error(missing.value)
+
+    def test_install_artifact(self, artifact: str, tmp_path: os.PathLike) -> None:
+        """Testa a cópia para o banco da aplicação, feita uma única vez."""
+        target = os.path.join(tmp_path, "live.db")
+        url = f"sqlite:///{target}"
+
+        assert install_artifact(artifact, url)
+        assert not install_artifact(artifact, url)  # já está atualizado
+        assert os.path.exists(f"{target}.artifact")
+
+        with pytest.raises(ValueError):
+            install_artifact(artifact, "sqlite://")
+
+    def test_install_newer_artifact(self, artifact: str, tmp_path: os.PathLike) -> None:
+        """Testa a troca de uma cópia intacta por um artefato novo."""
+        target = os.path.join(tmp_path, "live.db")
+        url = f"sqlite:///{target}"
+        install_artifact(artifact, url)
+
+        newer = rebuild(artifact, tmp_path, 120)
+        assert install_artifact(newer, f"sqlite:///{target}")
+        assert movie_count(target) == 120
+
+    def test_keeps_written_copy(self, artifact: str, tmp_path: os.PathLike) -> None:
+        """Testa se um artefato novo não descarta as escritas da aplicação."""
+        target = os.path.join(tmp_path, "live.db")
+        url = f"sqlite:///{target}"
+        install_artifact(artifact, url)
+
+        # Escrita ainda no WAL (a conexão aberta impede o checkpoint)
+        engine = build_engine(url)
+        with sessionmaker(bind=engine)() as db:
+            assert MovieRepository.delete(db, 1)
+            newer = rebuild(artifact, tmp_path, 120)
+            assert os.path.getsize(f"{target}-wal") > 0
+
+            assert not install_artifact(newer, url)
+            assert os.path.exists(f"{target}-wal")
+        engine.dispose()
+
+        assert movie_count(target) == 99
+
+    def test_keeps_database_without_marker(
+        self, artifact: str, tmp_path: os.PathLike
+    ) -> None:
+        """Testa se um banco que não veio de um artefato nunca é substituído."""
+        target = os.path.join(tmp_path, "live.db")
+        engine = create_engine(f"sqlite:///{target}")
+        Base.metadata.create_all(bind=engine)
+        engine.dispose()
+
+        assert not install_artifact(artifact, f"sqlite:///{target}")
+        assert movie_count(target) == 0
@@ -0,0 +1,152 @@
+import os
+import threading
+import time
+from typing import Iterator
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.db.database import build_memory_database
+from app.db.memory_database import MemoryDatabase
+from app.models import Base
+from app.repositories.movie_repository import MovieRepository
+
+
+@pytest.fixture
+def memory(tmp_path: os.PathLike) -> Iterator[MemoryDatabase]:
+    """Banco em arquivo com um filme, carregado em memória."""
+    url = f"sqlite:///{os.path.join(tmp_path, 'disk.db')}"
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(
+            text("INSERT INTO movies (title, year, winner) VALUES ('Cats', 2019, 1)")
+        )
+    engine.dispose()
+
+    memory = build_memory_database(url)
+    memory.load()
+    yield memory
+    memory.close()
+
+
+def disk_titles(memory: MemoryDatabase) -> list:
+    """Títulos gravados no arquivo, lidos sem passar pela memória."""
+    engine = create_engine(f"sqlite:///{memory.path}")
+    with engine.connect() as conn:
+        titles = conn.execute(text("SELECT title FROM movies ORDER BY id")).scalars()
+        result = list(titles)
+    engine.dispose()
+    return result
+
+
+class TestMemoryDatabase:
+    """Testes do modo em memória (SQLITE_IN_MEMORY) com write-through."""
+
+    def test_load_copies_disk(self, memory: MemoryDatabase) -> None:
+        """Testa se o conteúdo do arquivo é servido pela memória."""
+        with sessionmaker(bind=memory.engine)() as db:
+            assert MovieRepository.get_by_title(db, "Cats") is not None
+
+        assert memory.writes_through == 0
+
+    def test_writes_go_through_to_disk(self, memory: MemoryDatabase) -> None:
+        """Testa se as escritas chegam ao arquivo e as leituras não o regravam."""
+        memory.save_delay = 0
+        factory = sessionmaker(bind=memory.engine)
+        with factory() as db:
+            MovieRepository.create(db, "Dogs", 2020, False)
+
+        assert disk_titles(memory) == ["Cats", "Dogs"]
+        writes = memory.writes_through
+
+        with factory() as db:
+            assert len(MovieRepository.get_all(db)) == 2
+        assert memory.writes_through == writes
+
+    def test_cte_reads_are_not_writes(self, memory: MemoryDatabase) -> None:
+        """Testa se um `WITH ... SELECT` não pega o escritor nem regrava o arquivo."""
+        memory.save_delay = 0
+        with memory.engine.connect() as conn:
+            titles = conn.execute(
+                text("WITH won AS (SELECT title FROM movies) SELECT title FROM won")
+            ).scalars()
+            assert list(titles) == ["Cats"]
+            assert not conn.connection.info.get("memory_writer")
+            assert not memory._writer.locked()
+
+        assert memory.writes_through == 0
+
+    def test_saves_are_batched(self, memory: MemoryDatabase) -> None:
+        """Testa se as escritas do intervalo viram uma única cópia no flush."""
+        memory.save_delay = 60
+        factory = sessionmaker(bind=memory.engine)
+        for title in ("Dogs", "Birds"):
+            with factory() as db:
+                MovieRepository.create(db, title, 2020, False)
+
+        assert disk_titles(memory) == ["Cats"]
+        assert memory.writes_through == 0
+
+        memory.flush()
+        assert disk_titles(memory) == ["Cats", "Dogs", "Birds"]
+        assert memory.writes_through == 1
+
+    def test_reads_wait_for_uncommitted_writes(self, memory: MemoryDatabase) -> None:
+        """Testa se leituras concorrentes não enxergam escritas desfeitas."""
+        factory = sessionmaker(bind=memory.engine)
+        errors: list = []
+        seen: list = []
+
+        def read() -> None:
+            try:
+                with factory() as db:
+                    seen.extend(m.title for m in MovieRepository.get_all(db))
+            except Exception as e:
+                errors.append(e)
+
+        with factory() as writer:
+            writer.execute(
+                text("INSERT INTO movies (title, year, winner) VALUES ('X', 1, 0)")
+            )
+            threads = [threading.Thread(target=read) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            time.sleep(0.1)
+            writer.rollback()
+            for thread in threads:
+                thread.join()
+
+        assert errors == []
+        assert seen == ["Cats"] * 4
+
+    def test_concurrent_writers(self, memory: MemoryDatabase) -> None:
+        """Testa escritas simultâneas de várias threads, uma de cada vez."""
+        factory = sessionmaker(bind=memory.engine)
+        errors: list = []
+
+        def write(worker: int) -> None:
+            for i in range(50):
+                try:
+                    with factory() as db:
+                        MovieRepository.create(db, f"W{worker}-{i}", 2000, False)
+                except Exception as e:
+                    errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(w,)) for w in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        memory.flush()
+
+        assert errors == []
+        assert len(disk_titles(memory)) == 151
+
+    def test_requires_file_database(self) -> None:
+        """Testa a recusa de URLs que não são SQLite em arquivo."""
+        with pytest.raises(ValueError):
+            MemoryDatabase("sqlite://")
+        with pytest.raises(ValueError):
+            MemoryDatabase("postgresql://user@localhost/db")
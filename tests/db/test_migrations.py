@@ -0,0 +1,129 @@
+import os
+
+import pytest
+from alembic import command
+from alembic.config import Config as AlembicConfig
+from sqlalchemy import create_engine, inspect, text
+
+from app.config import Config
+
+
+class TestMigrations:
+    """Testes das migrations do Alembic."""
+
+    def test_upgrade_uses_database_url(
+        self, tmp_path: os.PathLike, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Testa se, sem sqlalchemy.url, as migrations usam a DATABASE_URL."""
+        url = f"sqlite:///{os.path.join(tmp_path, 'app.db')}"
+        monkeypatch.setattr(Config, "DATABASE_URL", url)
+
+        command.upgrade(AlembicConfig("alembic.ini"), "head")
+        engine = create_engine(url)
+        assert "alembic_version" in inspect(engine).get_table_names()
+        engine.dispose()
+
+    def test_upgrade_creates_indexes(self, tmp_path: os.PathLike) -> None:
+        """Testa se as migrations criam (e removem) os índices de consulta."""
+        url = f"sqlite:///{os.path.join(tmp_path, 'migrations.db')}"
+        config = AlembicConfig("alembic.ini")
+        config.set_main_option("sqlalchemy.url", url)
+
+        command.upgrade(config, "head")
+        engine = create_engine(url)
+        indexes = {i["name"] for i in inspect(engine).get_indexes("movies")}
+        assert {"ix_movies_year_winner", "ix_movies_winners_year"} <= indexes
+        assert [
+            i["column_names"] for i in inspect(engine).get_indexes("movie_producer")
+        ] == [["producer_id", "movie_id"]]
+        assert [
+            i["column_names"] for i in inspect(engine).get_indexes("movie_studio")
+        ] == [["studio_id", "movie_id"]]
+
+        command.downgrade(config, "d2851158e412")
+        indexes = {i["name"] for i in inspect(engine).get_indexes("movies")}
+        assert "ix_movies_winners_year" not in indexes
+        engine.dispose()
+
+    def test_upgrade_seeds_data_generations(self, tmp_path: os.PathLike) -> None:
+        """Testa se a migration cria o contador de geração de cada tabela."""
+        url = f"sqlite:///{os.path.join(tmp_path, 'migrations.db')}"
+        config = AlembicConfig("alembic.ini")
+        config.set_main_option("sqlalchemy.url", url)
+
+        command.upgrade(config, "head")
+        engine = create_engine(url)
+        with engine.connect() as conn:
+            rows = conn.execute(
+                text("SELECT table_name, generation FROM data_generations")
+            ).all()
+        assert sorted(rows) == [("movies", 0), ("producers", 0), ("studios", 0)]
+        engine.dispose()
+
+    def test_upgrade_adds_on_delete_cascade(self, tmp_path: os.PathLike) -> None:
+        """Testa se as associações passam a ter ON DELETE CASCADE, sem perder dados."""
+        url = f"sqlite:///{os.path.join(tmp_path, 'migrations.db')}"
+        config = AlembicConfig("alembic.ini")
+        config.set_main_option("sqlalchemy.url", url)
+
+        command.upgrade(config, "3e8a7c5d2f61")
+        engine = create_engine(url)
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "INSERT INTO movies (id, title, year, winner) "
+                    "VALUES (1, 'Movie', 2000, 1)"
+                )
+            )
+            conn.execute(
+                text(
+                    "INSERT INTO producers (id, name, name_normalized) "
+                    "VALUES (1, 'Producer', 'producer')"
+                )
+            )
+            conn.execute(text("INSERT INTO movie_producer VALUES (1, 1)"))
+
+        command.upgrade(config, "head")
+        inspector = inspect(engine)
+        for table in ("movie_producer", "movie_studio"):
+            foreign_keys = inspector.get_foreign_keys(table)
+            assert [fk["options"].get("ondelete") for fk in foreign_keys] == [
+                "CASCADE",
+                "CASCADE",
+            ]
+        assert [i["name"] for i in inspector.get_indexes("movie_producer")] == [
+            "ix_movie_producer_producer_id_movie_id"
+        ]
+
+        with engine.begin() as conn:
+            assert conn.execute(text("SELECT * FROM movie_producer")).all() == [(1, 1)]
+            conn.exec_driver_sql("PRAGMA foreign_keys=ON")
+            conn.execute(text("DELETE FROM producers WHERE id = 1"))
+            assert conn.execute(text("SELECT * FROM movie_producer")).all() == []
+
+        command.downgrade(config, "3e8a7c5d2f61")
+        foreign_keys = inspect(engine).get_foreign_keys("movie_producer")
+        assert all(not fk["options"].get("ondelete") for fk in foreign_keys)
+        engine.dispose()
+
+    def test_upgrade_drops_redundant_id_indexes(self, tmp_path: os.PathLike) -> None:
+        """Testa a troca dos índices ix_*_id (repetem a PK) pelos parciais de ID."""
+        url = f"sqlite:///{os.path.join(tmp_path, 'migrations.db')}"
+        config = AlembicConfig("alembic.ini")
+        config.set_main_option("sqlalchemy.url", url)
+
+        command.upgrade(config, "head")
+        engine = create_engine(url)
+        inspector = inspect(engine)
+        for table in ("movies", "producers", "studios"):
+            indexes = {i["name"] for i in inspector.get_indexes(table)}
+            assert f"ix_{table}_id" not in indexes
+        assert {"ix_movies_winners_id", "ix_movies_nominees_id"} <= {
+            i["name"] for i in inspector.get_indexes("movies")
+        }
+
+        command.downgrade(config, "7a4d2e9c1b58")
+        indexes = {i["name"] for i in inspect(engine).get_indexes("movies")}
+        assert "ix_movies_id" in indexes
+        assert "ix_movies_winners_id" not in indexes
+        engine.dispose()
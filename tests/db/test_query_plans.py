@@ -0,0 +1,211 @@
+import os
+from typing import Any, List, cast
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.database import build_engine
+from app.db.query_plans import full_scans, partial_indexes
+from app.models import Base, Movie, Producer, Studio, movie_producer, movie_studio
+from app.repositories.movie_repository import MovieRepository
+from app.repositories.producer_repository import ProducerRepository
+from app.repositories.studio_repository import StudioRepository
+from app.schemas.movie import MovieFilter
+from app.services.csv_importer_service import CSVImporterService
+from benchmarks.data_generator import generate_movie_list
+from benchmarks.query_plan_check import PARTIAL_INDEX_SCANS, check, collect_statements
+
+
+def query_plan(db: Session, sql: str, params: Any = ()) -> str:
+    """Retorna o plano de execução do SQLite em uma única string."""
+    rows = db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", params)
+    return " ".join(row[-1] for row in rows)
+
+
+class TestQueryPlans:
+    """Confere, com EXPLAIN QUERY PLAN, os índices usados pelas consultas."""
+
+    def test_reverse_lookup_uses_association_indexes(self, db_session: Session) -> None:
+        """Testa se a busca de filmes por produtor/estúdio usa os índices reversos."""
+        for column, index in (
+            ("producer_id", "ix_movie_producer_producer_id_movie_id"),
+            ("studio_id", "ix_movie_studio_studio_id_movie_id"),
+        ):
+            stmt = MovieRepository._apply_filters(
+                select(Movie.id).order_by(Movie.id), MovieFilter(**{column: 1})
+            )
+            sql = str(
+                stmt.compile(
+                    dialect=db_session.get_bind().dialect,
+                    compile_kwargs={"literal_binds": True},
+                )
+            )
+
+            assert f"COVERING INDEX {index}" in query_plan(db_session, sql)
+
+    def test_delete_is_set_based_with_cascade(self, db_session: Session) -> None:
+        """
+        Testa se remover produtores e estúdios emite só o DELETE da entidade
+        (as associações saem pelo ON DELETE CASCADE) e se a busca que o
+        cascade faz nas associações é coberta pelos índices reversos.
+        """
+        movie = Movie(title="Movie", year=2000, winner=True)
+        movie.producers.append(Producer(name="Producer"))
+        movie.studios.append(Studio(name="Studio"))
+        db_session.add(movie)
+        db_session.commit()
+        producer_id, studio_id = movie.producers[0].id, movie.studios[0].id
+
+        statements: List[str] = []
+
+        def capture(*args: Any) -> None:
+            statements.append(args[2])
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            assert ProducerRepository.delete(db_session, cast(int, producer_id))
+            assert StudioRepository.delete(db_session, cast(int, studio_id))
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        assert not any(
+            "movie_producer" in sql or "movie_studio" in sql for sql in statements
+        )
+        assert db_session.execute(select(movie_producer)).all() == []
+        assert db_session.execute(select(movie_studio)).all() == []
+
+        for table, column, index in (
+            ("movie_producer", "producer_id", "ix_movie_producer_producer_id_movie_id"),
+            ("movie_studio", "studio_id", "ix_movie_studio_studio_id_movie_id"),
+        ):
+            plan = query_plan(
+                db_session, f"DELETE FROM {table} WHERE {column} = ?", (1,)
+            )
+            assert index in plan
+
+    def test_award_query_uses_indexes(self, db_session: Session) -> None:
+        """
+        Testa se a busca de vencedores e de seus produtores não varre tabelas
+        (as associações são lidas por movie_id, pela chave primária).
+        """
+        movie = Movie(title="Movie", year=2000, winner=True)
+        movie.producers.append(Producer(name="Producer"))
+        db_session.add(movie)
+        db_session.commit()
+
+        statements: List[str] = []
+
+        def capture(*args: Any) -> None:
+            statements.append(args[2])
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            MovieRepository.get_winning_movies(db_session)
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        plans = [
+            query_plan(db_session, sql, (1,) * sql.count("?")) for sql in statements
+        ]
+        assert all("SCAN movie_" not in plan for plan in plans)
+
+    def test_name_search_is_index_range_scan(self, db_session: Session) -> None:
+        """
+        Testa se a busca por prefixo percorre apenas um intervalo do índice de
+        nome normalizado, sem ordenação extra.
+        """
+        for model, index in (
+            (Producer, "ix_producers_name_normalized"),
+            (Studio, "ix_studios_name_normalized"),
+        ):
+            statements: List[Any] = []
+
+            def capture(*args: Any) -> None:
+                statements.append((args[2], args[3]))
+
+            engine = db_session.get_bind()
+            event.listen(engine, "before_cursor_execute", capture)
+            try:
+                repository = (
+                    ProducerRepository if model is Producer else StudioRepository
+                )
+                repository.search(db_session, "Ab", 10)
+            finally:
+                event.remove(engine, "before_cursor_execute", capture)
+
+            plan = query_plan(db_session, *statements[0])
+            assert f"SEARCH {model.__tablename__} USING INDEX {index}" in plan
+            assert "TEMP B-TREE" not in plan
+
+    def test_full_scans(self) -> None:
+        """Testa a detecção de varreduras completas nas linhas do plano."""
+        sizes = {"movies": 500, "studios": 10}
+        winners = "SELECT id FROM movies WHERE movies.winner IS 1 ORDER BY year"
+
+        assert full_scans(["SCAN movies"], sizes, 100) == ["movies"]
+        assert full_scans(["SCAN movies_1"], sizes, 100) == ["movies"]
+        assert full_scans(
+            ["SCAN movies USING COVERING INDEX sqlite_autoindex_movies_1"], sizes, 100
+        ) == ["movies"]
+        assert not full_scans(["SCAN studios"], sizes, 100)
+        assert not full_scans(
+            ["SCAN movies USING INDEX ix_movies_winners_year"],
+            sizes,
+            100,
+            PARTIAL_INDEX_SCANS,
+            winners,
+        )
+        assert not full_scans(
+            ["SEARCH movies USING INTEGER PRIMARY KEY (rowid=?)"], sizes, 100
+        )
+        assert not full_scans(["SCAN movies_fts VIRTUAL TABLE INDEX 0:M1"], sizes, 100)
+
+    def test_partial_index_scan_needs_its_predicate(self) -> None:
+        """
+        Testa se a leitura inteira de um índice parcial só é aceita com o
+        predicado do par em PARTIAL_INDEX_SCANS.
+        """
+        sizes = {"movies": 500}
+        plan = ["SCAN movies USING INDEX ix_movies_winners_year"]
+        nominees = "SELECT id FROM movies WHERE movies.winner IS 0 ORDER BY year"
+
+        assert full_scans(plan, sizes, 100) == ["movies"]
+        assert full_scans(plan, sizes, 100, PARTIAL_INDEX_SCANS, nominees) == ["movies"]
+        assert full_scans(
+            ["SCAN movies USING INDEX ix_other"],
+            sizes,
+            100,
+            PARTIAL_INDEX_SCANS,
+            "SELECT id FROM movies WHERE movies.winner IS 1",
+        ) == ["movies"]
+
+    def test_partial_indexes(self, db_session: Session) -> None:
+        """Testa a leitura dos índices parciais e dos seus predicados."""
+        assert partial_indexes(db_session.connection()) == {
+            "ix_movies_winners_year": "winner IS 1",
+            "ix_movies_winners_id": "winner IS 1",
+            "ix_movies_nominees_id": "winner IS 0",
+        }
+
+    def test_repository_queries_do_not_scan(self, tmp_path: os.PathLike) -> None:
+        """
+        Testa se nenhuma instrução emitida pelos testes dos repositórios
+        varre tabelas com 100 linhas ou mais, num banco criado como o da
+        aplicação (perfil de PRAGMAs e chaves estrangeiras).
+        """
+        statements = collect_statements(["tests/repositories"])
+        sql = [" ".join(statement.split()) for statement, _ in statements]
+        assert any("WHERE movies.title = ?" in statement for statement in sql)
+
+        engine = build_engine(f"sqlite:///{os.path.join(tmp_path, 'plans.db')}")
+        Base.metadata.create_all(bind=engine)
+        with sessionmaker(bind=engine)() as db:
+            CSVImporterService.import_csv(db, "\n".join(generate_movie_list(500)))
+            assert db.connection().exec_driver_sql("PRAGMA foreign_keys").scalar()
+
+            assert check(db, statements, threshold=100) == {}
+            scan = ("SELECT id FROM movies WHERE title LIKE ?", ("%a%",))
+            assert list(check(db, [scan], threshold=100)) == [scan[0]]
+        engine.dispose()
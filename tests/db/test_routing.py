@@ -0,0 +1,156 @@
+import os
+import sqlite3
+from typing import Iterator, List
+
+import pytest
+from sqlalchemy import create_engine, insert, select, text
+from sqlalchemy.engine import Engine
+
+from app.db.database import enable_sqlite_foreign_keys
+from app.db.routing import is_read_only, routing_sessionmaker
+from app.models import Base, Movie
+from app.repositories.movie_repository import MovieRepository
+from app.repositories.producer_repository import ProducerRepository
+from app.schemas.movie import MovieBulkItem, MovieBulkRequest
+from app.services.movie_service import MovieService
+from app.utils.cache import clear_caches
+
+
+@pytest.fixture
+def database_files(tmp_path: os.PathLike) -> List[str]:
+    """Banco principal e duas réplicas, com as tabelas criadas."""
+    paths = [os.path.join(tmp_path, f"{name}.db") for name in ("primary", "r1", "r2")]
+    for path in paths:
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(bind=engine)
+        engine.dispose()
+    return paths
+
+
+@pytest.fixture
+def engines(database_files: List[str]) -> Iterator[List[Engine]]:
+    """Engines do principal e das réplicas, na ordem de `database_files`."""
+    engines = [create_engine(f"sqlite:///{path}") for path in database_files]
+    for engine in engines:
+        enable_sqlite_foreign_keys(engine)
+    yield engines
+    for engine in engines:
+        engine.dispose()
+
+
+def sync_replicas(database_files: List[str]) -> None:
+    """Copia o banco principal para as réplicas (replicação feita pelo teste)."""
+    primary = sqlite3.connect(database_files[0])
+    for path in database_files[1:]:
+        replica = sqlite3.connect(path)
+        primary.backup(replica)
+        replica.close()
+    primary.close()
+
+
+def add_movie(engine: Engine, title: str) -> None:
+    """Grava um filme direto em um dos bancos."""
+    with engine.begin() as conn:
+        conn.execute(insert(Movie).values(title=title, year=2000, winner=False))
+
+
+class TestRoutingSession:
+    """Testes do roteamento de leituras para réplicas e escritas ao principal."""
+
+    def test_reads_use_replicas_round_robin(self, engines: List[Engine]) -> None:
+        """Testa o rodízio das réplicas entre sessões (uma réplica por sessão)."""
+        primary, r1, r2 = engines
+        add_movie(r1, "Replica 1")
+        add_movie(r2, "Replica 2")
+        factory = routing_sessionmaker(primary, [r1, r2])
+
+        titles = []
+        for _ in range(3):
+            with factory() as db:
+                titles.append([m.title for m in MovieRepository.get_all(db)])
+                assert MovieRepository.get_by_title(db, titles[-1][0]) is not None
+
+        assert titles == [["Replica 1"], ["Replica 2"], ["Replica 1"]]
+
+    def test_read_your_writes(
+        self, engines: List[Engine], database_files: List[str]
+    ) -> None:
+        """Testa a escrita no principal e a leitura dela na mesma sessão."""
+        primary, r1, r2 = engines
+        factory = routing_sessionmaker(primary, [r1, r2])
+
+        with factory() as db:
+            assert MovieRepository.get_by_title(db, "Cats") is None
+            MovieRepository.create(db, "Cats", 2019, True)
+
+            assert db.uses_primary
+            assert MovieRepository.get_by_title(db, "Cats") is not None
+
+        with factory() as db:
+            assert MovieRepository.get_by_title(db, "Cats") is None  # réplica atrasada
+
+        sync_replicas(database_files)
+        with factory() as db:
+            assert MovieRepository.get_by_title(db, "Cats") is not None
+
+    def test_without_replicas_uses_primary(self, engines: List[Engine]) -> None:
+        """Testa que, sem réplicas, todas as consultas vão para o principal."""
+        primary = engines[0]
+        add_movie(primary, "Primary")
+
+        with routing_sessionmaker(primary, [])() as db:
+            assert [m.title for m in MovieRepository.get_all(db)] == ["Primary"]
+
+    def test_read_before_write_uses_primary(self, engines: List[Engine]) -> None:
+        """Testa as checagens de existência do cadastro em lote no principal."""
+        primary, r1, r2 = engines
+        add_movie(primary, "Cats")  # ainda não replicado
+        factory = routing_sessionmaker(primary, [r1, r2])
+        clear_caches()
+
+        request = MovieBulkRequest(
+            movies=[
+                MovieBulkItem(title="Cats", year=2019, winner=True),
+                MovieBulkItem(title="Dogs", year=2020, winner=False, producers=["Ann"]),
+            ]
+        )
+        with factory() as db:
+            response = MovieService.bulk_create_movies(db, request)
+        assert [r.status for r in response.results] == ["exists", "created"]
+
+        with factory() as db:
+            ids = ProducerRepository.resolve_names(db, ["Ann", "Bob"])
+            db.commit()
+        assert set(ids) == {"Ann", "Bob"}
+        with primary.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM producers")).scalar() == 2
+
+    def test_text_selects_use_replica(self, engines: List[Engine]) -> None:
+        """Testa as consultas textuais de leitura (inclusive a busca FTS) na réplica."""
+        primary, r1, r2 = engines
+        add_movie(r1, "Lonely Lad")
+        factory = routing_sessionmaker(primary, [r1, r2])
+
+        with factory() as db:
+            rows = MovieRepository.search_titles(db, "lonely", 5)
+            assert [row.title for row in rows] == ["Lonely Lad"]
+            assert db.execute(text("SELECT title FROM movies")).scalars().all() == [
+                "Lonely Lad"
+            ]
+            assert not db.uses_primary
+
+    def test_is_read_only(self) -> None:
+        """Testa a classificação das instruções em leitura ou escrita."""
+        assert is_read_only(select(Movie))
+        assert not is_read_only(select(Movie).with_for_update())
+        assert not is_read_only(insert(Movie).values(title="X", year=1, winner=False))
+        assert not is_read_only(text("DELETE FROM movies"))
+        assert is_read_only(text("select title FROM movies"))
+        assert is_read_only(text("SELECT title FROM movies").columns(Movie.title))
+        assert not is_read_only(text("SELECT * FROM movies FOR UPDATE"))
+        assert not is_read_only(text("WITH x AS (SELECT 1) DELETE FROM movies"))
+        assert is_read_only(text("WITH x AS (SELECT 1) SELECT * FROM x"))
+        assert not is_read_only(
+            text("WITH x AS (SELECT 1) UPDATE movies SET winner = 1")
+        )
+        assert not is_read_only(text("SELECT 1; DELETE FROM movies"))
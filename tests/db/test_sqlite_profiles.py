@@ -0,0 +1,43 @@
+import os
+
+import pytest
+from sqlalchemy import create_engine
+
+from app.db.sqlite_profiles import (
+    SQLITE_PROFILES,
+    apply_sqlite_profile,
+    resolve_profile,
+)
+
+
+class TestSQLiteProfiles:
+    """Testes dos perfis de PRAGMAs aplicados nas conexões SQLite."""
+
+    @pytest.mark.parametrize("profile", list(SQLITE_PROFILES))
+    def test_profile_applied_on_connect(
+        self, tmp_path: os.PathLike, profile: str
+    ) -> None:
+        """Testa se cada nova conexão recebe os PRAGMAs do perfil."""
+        engine = create_engine(f"sqlite:///{os.path.join(tmp_path, 'profile.db')}")
+        apply_sqlite_profile(engine, profile, {"busy_timeout": 1234})
+        expected = SQLITE_PROFILES[profile]
+
+        with engine.connect() as conn:
+
+            def pragma(name: str) -> object:
+                return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+            assert str(pragma("journal_mode")).upper() == expected["journal_mode"]
+            assert pragma("cache_size") == expected["cache_size"]
+            assert pragma("busy_timeout") == 1234
+            assert pragma("temp_store") == 2  # MEMORY
+        engine.dispose()
+
+    def test_resolve_profile(self) -> None:
+        """Testa os valores sobrescritos e o erro para perfis desconhecidos."""
+        pragmas = resolve_profile("balanced", {"cache_size": -1000, "mmap_size": None})
+
+        assert pragmas["cache_size"] == -1000
+        assert pragmas["mmap_size"] == SQLITE_PROFILES["balanced"]["mmap_size"]
+        with pytest.raises(ValueError):
+            resolve_profile("turbo")
@@ -0,0 +1,199 @@
+from pytest_mock import MockFixture
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.config import Config
+from app.models.movie import Movie
+from app.models.producer import Producer
+from app.models.studio import Studio
+from app.repositories.async_generation_repository import AsyncGenerationRepository
+from app.repositories.async_movie_repository import AsyncMovieRepository
+from app.repositories.async_producer_repository import AsyncProducerRepository
+from app.repositories.async_studio_repository import AsyncStudioRepository
+from app.repositories.generation_repository import GenerationRepository
+from app.repositories.movie_repository import MovieRepository
+from app.schemas.movie import MovieFilter
+from typing import List, cast
+
+
+def seed_movies(db: Session) -> None:
+    """Cadastra três filmes, dois vencedores, com produtores e estúdios."""
+    tom, ann, uni = Producer(name="Tom"), Producer(name="Ann"), Studio(name="Uni")
+    for title, year, winner, producer in (
+        ("Cats", 2019, True, tom),
+        ("Dogs", 2020, False, ann),
+        ("Birds", 2021, True, tom),
+    ):
+        db.add(
+            Movie(
+                title=title,
+                year=year,
+                winner=winner,
+                producers=[producer],
+                studios=[uni],
+            )
+        )
+    db.commit()
+
+
+class TestAsyncMovieRepository:
+    """
+    Testes da repository async de filmes, comparando com a versão síncrona,
+    que compartilha as mesmas consultas.
+    """
+
+    async def test_create_and_get(self, async_db_session: AsyncSession) -> None:
+        """Testa a criação, o título repetido e as buscas por ID e título."""
+        movie = await AsyncMovieRepository.create(async_db_session, "Cats", 2019, True)
+        again = await AsyncMovieRepository.create(async_db_session, "Cats", 2019, True)
+
+        assert again.id == movie.id
+        assert (
+            await AsyncMovieRepository.get_by_id(async_db_session, movie.id)
+        ) is movie
+        assert await AsyncMovieRepository.get_by_id(async_db_session, 9999) is None
+        found = await AsyncMovieRepository.get_by_title(async_db_session, "Cats")
+        assert found is not None and found.year == 2019
+        assert await AsyncGenerationRepository.get(async_db_session, ["movies"]) != (
+            (0,),
+            None,
+        )
+
+    async def test_rows_match_sync(
+        self, db_session: Session, async_db_session: AsyncSession
+    ) -> None:
+        """Testa se linhas, relacionados, busca e vencedores batem com a versão
+        síncrona."""
+        seed_movies(db_session)
+        filters = MovieFilter(winner=True)
+
+        rows = await AsyncMovieRepository.get_all_rows(
+            async_db_session, 2, None, MovieRepository.COLUMNS, filters
+        )
+        assert list(rows) == list(
+            MovieRepository.get_all_rows(
+                db_session, 2, None, MovieRepository.COLUMNS, filters
+            )
+        )
+        for relation in ("producers", "studios"):
+            assert await AsyncMovieRepository.get_related_rows(
+                async_db_session, relation, [1, 3]
+            ) == MovieRepository.get_related_rows(db_session, relation, [1, 3])
+        assert list(
+            await AsyncMovieRepository.search_titles(async_db_session, "cat", 10)
+        ) == list(MovieRepository.search_titles(db_session, "cat", 10))
+        winners = await AsyncMovieRepository.get_winning_movies(async_db_session)
+        assert [(m.title, [p.name for p in m.producers]) for m in winners] == [
+            ("Cats", ["Tom"]),
+            ("Birds", ["Tom"]),
+        ]
+
+    async def test_stream_all_expanded(
+        self, db_session: Session, async_db_session: AsyncSession
+    ) -> None:
+        """Testa o cursor async em lotes com os relacionamentos já carregados."""
+        seed_movies(db_session)
+
+        movies = [
+            (m.title, [p.name for p in m.producers], [s.name for s in m.studios])
+            async for m in AsyncMovieRepository.stream_all(
+                async_db_session, ["producers", "studios"], 1, batch_size=1
+            )
+        ]
+
+        assert movies == [("Dogs", ["Ann"], ["Uni"]), ("Birds", ["Tom"], ["Uni"])]
+
+    async def test_bulk_insert_link_and_delete_many(
+        self,
+        db_session: Session,
+        async_db_session: AsyncSession,
+        mocker: MockFixture,
+    ) -> None:
+        """
+        Testa o INSERT em lote com associações e a remoção em blocos, com as
+        associações saindo pelo ON DELETE CASCADE.
+        """
+        mocker.patch.object(Config, "IN_CLAUSE_CHUNK_SIZE", 2)
+        ids = await AsyncMovieRepository.insert_many(
+            async_db_session,
+            [{"title": f"Movie {i}", "year": 2000, "winner": False} for i in range(5)],
+        )
+        producers = await AsyncProducerRepository.resolve_names(
+            async_db_session, ["Tom", "Ann", "Tom"]
+        )
+        await AsyncMovieRepository.link_many(
+            async_db_session,
+            "producers",
+            [(ids["Movie 0"], producers["Tom"]), (ids["Movie 1"], producers["Ann"])],
+        )
+        await async_db_session.commit()
+
+        deleted = await AsyncMovieRepository.delete_many(
+            async_db_session, [*list(ids.values())[:4], 9999]
+        )
+
+        assert sorted(producers) == ["Ann", "Tom"]
+        assert deleted == 4
+        assert [m.title for m in MovieRepository.get_all(db_session)] == ["Movie 4"]
+        assert db_session.execute(text("SELECT * FROM movie_producer")).all() == []
+        assert await AsyncMovieRepository.delete(async_db_session, 9999) is False
+
+
+class TestAsyncProducerAndStudioRepositories:
+    """Testes das repositories async de produtores e estúdios."""
+
+    async def test_producer_lookups_and_listing(
+        self, async_db_session: AsyncSession
+    ) -> None:
+        """Testa criação, buscas em lote, prefixo, listagem e cursor."""
+        ids: List[int] = [
+            cast(int, (await AsyncProducerRepository.create(async_db_session, name)).id)
+            for name in ("Allan Carr", "Ann Wolf", "Bob Ray")
+        ]
+        again = await AsyncProducerRepository.create(async_db_session, "Allan Carr")
+
+        assert again.id == ids[0]
+        found = await AsyncProducerRepository.get_by_name(async_db_session, "Bob Ray")
+        assert found is not None and found.id == ids[2]
+        assert {
+            p.name
+            for p in await AsyncProducerRepository.get_by_ids(
+                async_db_session, [ids[1], 9999]
+            )
+        } == {"Ann Wolf"}
+        assert [
+            p.name
+            for p in await AsyncProducerRepository.get_by_names(
+                async_db_session, ["Bob Ray"]
+            )
+        ] == ["Bob Ray"]
+        assert list(
+            await AsyncProducerRepository.search(async_db_session, "an", 10)
+        ) == [("Ann Wolf", ids[1])]
+        assert list(
+            await AsyncProducerRepository.get_all_rows(
+                async_db_session, 1, ids[0], ("id", "name")
+            )
+        ) == [(ids[1], "Ann Wolf")]
+        assert [
+            p.name
+            async for p in AsyncProducerRepository.stream_all(async_db_session, ids[1])
+        ] == ["Bob Ray"]
+
+    async def test_delete_bumps_generations(
+        self, db_session: Session, async_db_session: AsyncSession
+    ) -> None:
+        """Testa se remover produtores e estúdios altera também a listagem de
+        filmes."""
+        seed_movies(db_session)
+        before, _ = GenerationRepository.get(db_session, ["producers", "movies"])
+
+        assert await AsyncProducerRepository.delete(async_db_session, 1) is True
+        assert await AsyncStudioRepository.delete_many(async_db_session, [1, 9]) == 1
+        assert await AsyncStudioRepository.delete(async_db_session, 9999) is False
+
+        db_session.expire_all()
+        after, _ = GenerationRepository.get(db_session, ["producers", "movies"])
+        assert after[0] == before[0] + 1
+        assert after[1] == before[1] + 2
+        assert await AsyncStudioRepository.get_by_id(async_db_session, 1) is None
@@ -1,11 +1,15 @@
+from pytest_mock import MockFixture
+from sqlalchemy import event, select, text
 from sqlalchemy.orm import Session
+from app.config import Config
 from app.models.movie import Movie
 from app.models.producer import Producer
 from app.models.studio import Studio
 from app.repositories.movie_repository import MovieRepository
 from app.repositories.producer_repository import ProducerRepository
 from app.repositories.studio_repository import StudioRepository
-from typing import List, cast
+from app.schemas.movie import MovieFilter
+from typing import Any, List, cast
 
 
 class TestMovieRepository:
@@ -139,3 +143,152 @@ class TestMovieRepository:
         Testa a remoção de um filme inexistente.
         """
         assert MovieRepository.delete(db_session, 9999) is False
+
+    def test_delete_many_in_chunks(
+        self, db_session: Session, mocker: MockFixture
+    ) -> None:
+        """
+        Testa a remoção em lote com um DELETE por bloco, sem carregar os filmes,
+        e a remoção das associações pelo ON DELETE CASCADE.
+        """
+        mocker.patch.object(Config, "IN_CLAUSE_CHUNK_SIZE", 2)
+        movies = [
+            MovieRepository.create(db_session, f"Movie {i}", 2000, False)
+            for i in range(5)
+        ]
+        movies[0].producers.append(Producer(name="Producer"))
+        db_session.commit()
+        ids = [cast(int, m.id) for m in movies]
+
+        statements: List[str] = []
+
+        def capture(*args: Any) -> None:
+            statements.append(args[2])
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            deleted = MovieRepository.delete_many(db_session, [*ids[:4], ids[0], 9999])
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        assert deleted == 4
+        assert [s.split()[0] for s in statements] == [
+            "DELETE",
+            "DELETE",
+            "DELETE",
+            "UPDATE",
+        ]
+        assert [m.title for m in MovieRepository.get_all(db_session)] == ["Movie 4"]
+        assert db_session.execute(text("SELECT * FROM movie_producer")).all() == []
+
+    def test_get_all_paginated(self, db_session: Session) -> None:
+        """
+        Testa a paginação por cursor (keyset) ordenada por ID.
+        """
+        movies = [
+            MovieRepository.create(db_session, f"Movie {i}", 2000 + i, False)
+            for i in range(5)
+        ]
+
+        first_page = MovieRepository.get_all(db_session, limit=2)
+        assert [m.id for m in first_page] == [movies[0].id, movies[1].id]
+
+        second_page = MovieRepository.get_all(
+            db_session, limit=2, after_id=cast(int, first_page[-1].id)
+        )
+        assert [m.id for m in second_page] == [movies[2].id, movies[3].id]
+
+        last_page = MovieRepository.get_all(
+            db_session, limit=2, after_id=cast(int, second_page[-1].id)
+        )
+        assert [m.id for m in last_page] == [movies[4].id]
+
+    def test_get_all_expand_many_producers_and_studios(
+        self, db_session: Session
+    ) -> None:
+        """
+        Testa a expansão de um filme com vários produtores e estúdios,
+        garantindo que não haja duplicação por produto cartesiano.
+        """
+        movie = MovieRepository.create(db_session, "Battlefield Earth", 2000, True)
+        producers = ProducerRepository.create_multiple(
+            db_session, [f"Producer {i}" for i in range(5)]
+        )
+        studios = StudioRepository.create_multiple(
+            db_session, [f"Studio {i}" for i in range(5)]
+        )
+        movie.producers.extend(producers)
+        movie.studios.extend(studios)
+        db_session.commit()
+        db_session.expire_all()
+
+        for movies in (
+            MovieRepository.get_all(db_session, expand=["producers", "studios"]),
+            MovieRepository.get_winning_movies(db_session),
+        ):
+            assert len(movies) == 1
+            assert len(movies[0].producers) == 5
+            assert len(movies[0].studios) == 5
+
+    def test_get_all_rows_selected_columns(self, db_session: Session) -> None:
+        """
+        Testa se apenas as colunas solicitadas são selecionadas.
+        """
+        movie = MovieRepository.create(db_session, "Inception", 2010, True)
+
+        rows = MovieRepository.get_all_rows(db_session, columns=["id", "title"])
+
+        assert [tuple(row) for row in rows] == [(movie.id, "Inception")]
+        assert list(rows[0]._fields) == ["id", "title"]
+
+    def test_get_all_rows_filters(self, db_session: Session) -> None:
+        """
+        Testa a listagem em tuplas com cada filtro: ano, intervalo de anos,
+        vencedor, indicados, produtor e estúdio.
+        """
+        old = MovieRepository.create(db_session, "Old", 1990, True)
+        new = MovieRepository.create(db_session, "New", 2000, False)
+        producer = ProducerRepository.create(db_session, "Producer")
+        studio = StudioRepository.create(db_session, "Studio")
+        old.producers.append(producer)
+        new.studios.append(studio)
+        db_session.commit()
+
+        def titles(filters: MovieFilter) -> List[str]:
+            rows = MovieRepository.get_all_rows(db_session, 20, filters=filters)
+            return [row.title for row in rows]
+
+        assert titles(MovieFilter(year=1990)) == ["Old"]
+        assert titles(MovieFilter(year_from=1985, year_to=1995)) == ["Old"]
+        assert titles(MovieFilter(winner=True)) == ["Old"]
+        assert titles(MovieFilter(winner=False)) == ["New"]
+        assert titles(MovieFilter(producer_id=cast(int, producer.id))) == ["Old"]
+        assert titles(MovieFilter(studio_id=cast(int, studio.id))) == ["New"]
+
+    def test_filters_and_winners_use_indexes(self, db_session: Session) -> None:
+        """
+        Testa se os filtros e a busca de vencedores usam os índices de
+        ano/vencedor (plano de execução do SQLite).
+        """
+
+        def plan(stmt: Any) -> str:
+            sql = str(
+                stmt.compile(
+                    dialect=db_session.get_bind().dialect,
+                    compile_kwargs={"literal_binds": True},
+                )
+            )
+            rows = db_session.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+            return " ".join(row[-1] for row in rows)
+
+        by_year = MovieRepository._apply_filters(
+            select(Movie.id), MovieFilter(year=1990, winner=True)
+        )
+        winners = (
+            db_session.query(Movie).filter(Movie.winner.is_(True)).order_by(Movie.year)
+        )
+
+        assert "ix_movies_year_winner" in plan(by_year)
+        assert "ix_movies_winners_year" in plan(winners.statement)
+        assert "TEMP B-TREE" not in plan(winners.statement)
@@ -1,4 +1,6 @@
+from pytest_mock import MockFixture
 from sqlalchemy.orm import Session
+from app.config import Config
 from app.models.producer import Producer
 from app.repositories.producer_repository import ProducerRepository
 from typing import cast
@@ -116,3 +118,24 @@ class TestProducerRepository:
         Testa a remoção de um produtor inexistente.
         """
         assert ProducerRepository.delete(db_session, 9999) is False
+
+    def test_get_by_names_and_ids_chunked(
+        self, db_session: Session, mocker: MockFixture
+    ) -> None:
+        """
+        Testa a busca em lote dividindo a consulta IN (...) em blocos.
+        """
+        mocker.patch.object(Config, "IN_CLAUSE_CHUNK_SIZE", 2)
+        producers = [
+            ProducerRepository.create(db_session, f"Producer {i}") for i in range(5)
+        ]
+
+        by_name = ProducerRepository.get_by_names(
+            db_session, ["Producer 4", "Producer 0", "Producer 4", "Missing"]
+        )
+        by_id = ProducerRepository.get_by_ids(
+            db_session, [cast(int, p.id) for p in producers]
+        )
+
+        assert sorted(str(p.name) for p in by_name) == ["Producer 0", "Producer 4"]
+        assert len(by_id) == 5
@@ -0,0 +1,266 @@
+import gzip
+import json
+from pytest_mock import MockFixture
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.models.movie import Movie
+from app.models.producer import Producer
+from app.models.studio import Studio
+from app.repositories.movie_repository import MovieRepository
+from app.schemas.batch import BatchGetRequest
+from app.schemas.movie import MovieBulkItem, MovieBulkRequest, MovieCreate, MovieFilter
+from app.schemas.producer import ProducerCreate
+from app.services.async_award_interval_service import AsyncAwardIntervalService
+from app.services.async_catalog_snapshot_service import AsyncCatalogSnapshotService
+from app.services.async_generation_service import AsyncGenerationService
+from app.services.async_movie_service import AsyncMovieService
+from app.services.async_producer_service import AsyncProducerService
+from app.services.async_studio_service import AsyncStudioService
+from app.services.award_interval_service import AwardIntervalService
+from app.services.generation_service import GenerationService
+from app.services.movie_service import MovieService
+from app.services.producer_service import ProducerService
+from app.services.studio_service import StudioService
+from typing import AsyncIterator, List
+
+
+def seed_movies(db: Session) -> None:
+    """Cadastra quatro filmes, três vencedores, com produtores e estúdios."""
+    tom, ann, uni = Producer(name="Tom"), Producer(name="Ann"), Studio(name="Uni")
+    for title, year, winner, producers in (
+        ("Cats", 2000, True, [tom]),
+        ("Dogs", 2003, False, [ann]),
+        ("Birds", 2006, True, [tom, ann]),
+        ("Fish", 2010, True, [tom]),
+    ):
+        db.add(
+            Movie(
+                title=title,
+                year=year,
+                winner=winner,
+                producers=producers,
+                studios=[uni],
+            )
+        )
+    db.commit()
+
+
+async def collect(chunks: AsyncIterator[bytes]) -> bytes:
+    """Junta os blocos de uma resposta em streaming."""
+    return b"".join([chunk async for chunk in chunks])
+
+
+class TestAsyncMovieService:
+    """
+    Testes da service async de filmes: as respostas devem ser iguais às da
+    versão síncrona.
+    """
+
+    async def test_listing_matches_sync(
+        self, db_session: Session, async_db_session: AsyncSession
+    ) -> None:
+        """Testa se a listagem, com expansões, campos, filtros e páginas, gera
+        os mesmos bytes da versão síncrona."""
+        seed_movies(db_session)
+
+        for args in (
+            (["producers", "studios"], None, None, None, None),
+            (["producers"], 2, 1, None, MovieFilter(winner=True)),
+            ([], None, None, ["title"], MovieFilter(year_from=2003)),
+        ):
+            assert await AsyncMovieService.get_all_movies_json(
+                async_db_session, *args
+            ) == MovieService.get_all_movies_json(db_session, *args)
+
+    async def test_stream_matches_sync(
+        self, db_session: Session, async_db_session: AsyncSession
+    ) -> None:
+        """Testa se o NDJSON e o JSON em streaming são iguais aos da versão
+        síncrona."""
+        seed_movies(db_session)
+        expand = ["producers", "studios"]
+
+        for ndjson in (True, False):
+            assert await collect(
+                AsyncMovieService.stream_movies(async_db_session, expand, 1, ndjson)
+            ) == b"".join(MovieService.stream_movies(db_session, expand, 1, ndjson))
+
+    async def test_crud_batch_and_search(
+        self, db_session: Session, async_db_session: AsyncSession
+    ) -> None:
+        """Testa criação, buscas, busca em lote, busca textual e remoções."""
+        seed_movies(db_session)
+        created = await AsyncMovieService.create_movie(
+            async_db_session, MovieCreate(title="Cat People", year=1982, winner=False)
+        )
+
+        assert await AsyncMovieService.get_movie_by_id(
+            async_db_session, created.id
+        ) == MovieService.get_movie_by_id(db_session, created.id)
+        found = await AsyncMovieService.get_movie_by_title(async_db_session, "Cats")
+        assert found is not None and found.year == 2000
+        batch = BatchGetRequest(names=["Fish", "Nope", "Cats"])
+        assert await AsyncMovieService.batch_get_movies(
+            async_db_session, batch
+        ) == MovieService.batch_get_movies(db_session, batch)
+        assert await AsyncMovieService.search_movies(
+            async_db_session, "cat", 10
+        ) == MovieService.search_movies(db_session, "cat", 10)
+
+        assert await AsyncMovieService.delete_movie(async_db_session, created.id)
+        assert not await AsyncMovieService.get_movie_by_id(async_db_session, created.id)
+        deleted = await AsyncMovieService.delete_movies(async_db_session, [1, 2])
+        assert deleted.deleted == 2
+
+    async def test_bulk_create_movies(
+        self, db_session: Session, async_db_session: AsyncSession, mocker: MockFixture
+    ) -> None:
+        """Testa o cadastro em lote com produtores e estúdios e a situação de
+        cada filme."""
+        invalidate = mocker.patch.object(AwardIntervalService, "invalidate_cache")
+        request = MovieBulkRequest(
+            movies=[
+                MovieBulkItem(
+                    title=f"Bulk {i}",
+                    year=2000 + i,
+                    winner=True,
+                    producers=["Bulk P", f"Bulk P{i}"],
+                    studios=["Bulk S"],
+                )
+                for i in range(3)
+            ]
+            + [MovieBulkItem(title="Bulk 0", year=2000, winner=True)]
+        )
+
+        first = await AsyncMovieService.bulk_create_movies(async_db_session, request)
+        second = await AsyncMovieService.bulk_create_movies(async_db_session, request)
+
+        assert first.created == 3
+        assert [r.status for r in first.results] == [
+            "created",
+            "created",
+            "created",
+            "duplicate",
+        ]
+        assert second.created == 0
+        assert [r.status for r in second.results] == ["exists"] * 4
+        assert invalidate.call_count == 1
+        movie = MovieRepository.get_by_title(db_session, "Bulk 1")
+        assert movie is not None
+        assert sorted(p.name for p in movie.producers) == ["Bulk P", "Bulk P1"]
+        assert [s.name for s in movie.studios] == ["Bulk S"]
+
+
+class TestAsyncProducerAndStudioServices:
+    """Testes das services async de produtores e estúdios."""
+
+    async def test_listings_match_sync(
+        self, db_session: Session, async_db_session: AsyncSession
+    ) -> None:
+        """Testa se listagens, streaming, buscas e lotes batem com a versão
+        síncrona."""
+        seed_movies(db_session)
+
+        assert await AsyncProducerService.get_all_producers_json(
+            async_db_session, 1, None, ["name"]
+        ) == ProducerService.get_all_producers_json(db_session, 1, None, ["name"])
+        assert await AsyncStudioService.get_all_studios_json(
+            async_db_session
+        ) == StudioService.get_all_studios_json(db_session)
+        assert await collect(
+            AsyncProducerService.stream_producers(async_db_session, None, False)
+        ) == b"".join(ProducerService.stream_producers(db_session, None, False))
+        assert await collect(
+            AsyncStudioService.stream_studios(async_db_session)
+        ) == b"".join(StudioService.stream_studios(db_session))
+        assert await AsyncProducerService.search_producers(
+            async_db_session, "t", 10
+        ) == ProducerService.search_producers(db_session, "t", 10)
+        batch = BatchGetRequest(ids=[2, 99, 1])
+        assert await AsyncStudioService.batch_get_studios(
+            async_db_session, batch
+        ) == StudioService.batch_get_studios(db_session, batch)
+
+    async def test_producer_crud_invalidates_awards(
+        self, async_db_session: AsyncSession, mocker: MockFixture
+    ) -> None:
+        """Testa criação, busca por nome e remoção, que invalida os prêmios."""
+        invalidate = mocker.patch.object(AwardIntervalService, "invalidate_cache")
+        assert (
+            await AsyncProducerService.get_producer_by_name(async_db_session, "Allan")
+            is None
+        )
+
+        created = await AsyncProducerService.create_producer(
+            async_db_session, ProducerCreate(name="Allan")
+        )
+
+        assert (
+            await AsyncProducerService.get_producer_by_name(async_db_session, "Allan")
+            == created
+        )
+        assert await AsyncProducerService.delete_producer(async_db_session, created.id)
+        assert (
+            await AsyncProducerService.get_producer_by_id(async_db_session, created.id)
+            is None
+        )
+        invalidate.assert_called_once()
+
+
+class TestAsyncSupportServices:
+    """Testes das services async de prêmios, gerações e catálogo."""
+
+    async def test_award_intervals_match_sync(
+        self, db_session: Session, async_db_session: AsyncSession
+    ) -> None:
+        """Testa se o cálculo de intervalos é igual ao da versão síncrona."""
+        seed_movies(db_session)
+
+        assert await AsyncAwardIntervalService.calculate_award_intervals(
+            async_db_session
+        ) == AwardIntervalService.calculate_award_intervals(db_session)
+        AwardIntervalService.invalidate_cache()
+        cached = await AsyncAwardIntervalService.calculate_award_intervals_cached(
+            async_db_session
+        )
+        assert cached == AwardIntervalService.calculate_award_intervals_cached(
+            db_session
+        )
+
+    async def test_validators_and_cache_validation(
+        self, db_session: Session, async_db_session: AsyncSession
+    ) -> None:
+        """
+        Testa se os validadores são os mesmos da versão síncrona e se uma
+        escrita feita por outra sessão esvazia os caches na próxima checagem.
+        """
+        tables = ["movies", "producers", "studios"]
+        assert await AsyncGenerationService.list_validators(
+            async_db_session, "movies", tables, "json"
+        ) == GenerationService.list_validators(db_session, "movies", tables, "json")
+
+        await AsyncGenerationService.validate_caches(async_db_session, 0)
+        assert not await AsyncMovieService.get_movie_by_title(async_db_session, "New")
+        MovieRepository.create(db_session, "New", 2020, False)
+
+        await AsyncGenerationService.validate_caches(async_db_session, 0)
+        found = await AsyncMovieService.get_movie_by_title(async_db_session, "New")
+        assert found is not None and found.year == 2020
+
+    async def test_catalog_snapshot(
+        self, db_session: Session, async_db_session: AsyncSession
+    ) -> None:
+        """Testa se o snapshot comprimido é gerado uma vez por ETag e contém o
+        catálogo expandido."""
+        seed_movies(db_session)
+        bodies: List[bytes] = [
+            await AsyncCatalogSnapshotService.get_catalog(
+                async_db_session, '"catalog-1"', "gzip"
+            )
+            for _ in range(2)
+        ]
+
+        assert bodies[0] == bodies[1]
+        assert json.loads(gzip.decompress(bodies[0])) == json.loads(
+            MovieService.get_all_movies_json(db_session, ["producers", "studios"])
+        )
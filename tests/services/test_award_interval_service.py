@@ -211,7 +211,7 @@ class TestAwardIntervalService:
         mocker.patch(
             "app.services.award_interval_service.get_db", lambda: iter([MagicMock()])
         )
-        mocker.patch.object(
+        calculate = mocker.patch.object(
             AwardIntervalService,
             "calculate_award_intervals",
             return_value=mock_response,
@@ -222,21 +222,15 @@ class TestAwardIntervalService:
 
         # Primeira chamada deve armazenar no cache
         AwardIntervalService.calculate_award_intervals_cached(db_session)
-        assert (
-            AwardIntervalService.calculate_award_intervals_cached.cache_info().hits == 0
-        )
+        assert calculate.call_count == 1
 
         # Chamada subsequente usa cache
         AwardIntervalService.calculate_award_intervals_cached(db_session)
-        assert (
-            AwardIntervalService.calculate_award_intervals_cached.cache_info().hits == 1
-        )
+        assert calculate.call_count == 1
 
         # Limpa o cache para testar uso novamente
         AwardIntervalService.invalidate_cache()
 
         # Nova chamada deve recalcular e não usar o cache
         AwardIntervalService.calculate_award_intervals_cached(db_session)
-        assert (
-            AwardIntervalService.calculate_award_intervals_cached.cache_info().hits == 0
-        )
+        assert calculate.call_count == 2
@@ -4,6 +4,10 @@ from app.repositories import MovieRepository, ProducerRepository, StudioReposito
 from sqlalchemy.orm import Session
 from app.services.csv_importer_service import CSVImporterService
 from app.schemas.csv_importer import CSVImportRequest, CSVImportResponse
+from app.repositories.generation_repository import GenerationRepository
+
+# Tabelas alteradas por uma importação
+TABLES = ("movies", "producers", "studios")
 
 
 class TestCSVImporterService:
@@ -121,3 +125,29 @@ class TestCSVImporterService:
 
         studios = StudioRepository.get_all(db_session)
         assert len(studios) > 0
+
+    def test_save_to_database_bumps_generation_once(
+        self, db_session: Session, mocker: MockFixture
+    ) -> None:
+        """
+        Testa se a importação incrementa as gerações uma única vez, e não a
+        cada filme, produtor ou estúdio criado.
+        """
+        before, _ = GenerationRepository.get(db_session, TABLES)
+        bump = mocker.spy(GenerationRepository, "bump")
+        movies_data = [
+            CSVImportRequest(
+                title=f"Filme {i}",
+                year=2000 + i,
+                winner=False,
+                producers=[f"Produtor {i}", "Produtor comum"],
+                studios=[f"Estúdio {i}"],
+            )
+            for i in range(3)
+        ]
+
+        CSVImporterService._save_to_database(db_session, movies_data)
+
+        bump.assert_called_once_with(db_session, *TABLES)
+        after, _ = GenerationRepository.get(db_session, TABLES)
+        assert after == tuple(generation + 1 for generation in before)
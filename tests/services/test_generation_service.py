@@ -0,0 +1,54 @@
+from pytest_mock import MockFixture
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.models.movie import Movie
+from app.repositories.generation_repository import GenerationRepository
+from app.repositories.movie_repository import MovieRepository
+from app.services.award_interval_service import AwardIntervalService
+from app.services.generation_service import GenerationService
+from app.services.movie_service import MovieService
+
+
+def write_from_other_process(db: Session, movie_id: int, title: str) -> None:
+    """Simula a escrita de outro processo: altera o banco sem tocar nos caches."""
+    db.execute(update(Movie).where(Movie.id == movie_id).values(title=title))
+    GenerationRepository.bump(db, "movies")
+    db.commit()
+
+
+class TestGenerationService:
+    """Testes da validação dos caches em memória pelas gerações do banco."""
+
+    def test_validate_caches_sees_other_process_writes(
+        self, db_session: Session
+    ) -> None:
+        """Testa se os caches de entidades e de prêmios são renovados."""
+        movie = MovieRepository.create(db_session, "Cats", 2019, True)
+        GenerationService.validate_caches(db_session, interval=0)
+        MovieService.get_movie_by_id(db_session, movie.id)
+        AwardIntervalService.calculate_award_intervals_cached(db_session)
+
+        write_from_other_process(db_session, movie.id, "Dogs")
+        cached = MovieService.get_movie_by_id(db_session, movie.id)
+        GenerationService.validate_caches(db_session, interval=0)
+        fresh = MovieService.get_movie_by_id(db_session, movie.id)
+
+        assert cached is not None and cached.title == "Cats"
+        assert fresh is not None and fresh.title == "Dogs"
+        assert AwardIntervalService.CACHE.stats()["size"] == 0
+
+    def test_validate_caches_interval(
+        self, db_session: Session, mocker: MockFixture
+    ) -> None:
+        """Testa o intervalo entre checagens e a validação desativada."""
+        get = mocker.spy(GenerationRepository, "get")
+        mocker.patch.object(GenerationService, "_last_validation", float("-inf"))
+
+        GenerationService.validate_caches(db_session, interval=60)
+        GenerationService.validate_caches(db_session, interval=60)
+        GenerationService.validate_caches(db_session, interval=-1)
+        assert get.call_count == 1
+
+        GenerationService.validate_caches(db_session, interval=0)
+        assert get.call_count == 2
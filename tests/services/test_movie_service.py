@@ -1,7 +1,16 @@
+import json
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pytest_mock import MockFixture
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 from app.repositories.movie_repository import MovieRepository
+from app.services.award_interval_service import AwardIntervalService
 from app.services.movie_service import MovieService
 from app.schemas.movie import (
+    MovieBulkItem,
+    MovieBulkRequest,
     MovieCreate,
     MovieDetailedResponse,
     MovieResponse,
@@ -11,7 +20,7 @@ from app.schemas.producer import ProducerCreate, ProducerResponse
 from app.schemas.studio import StudioCreate, StudioResponse
 from app.repositories.producer_repository import ProducerRepository
 from app.repositories.studio_repository import StudioRepository
-from typing import List, cast
+from typing import Any, List, Optional, cast
 
 from app.services.producer_service import ProducerService
 from app.services.studio_service import StudioService
@@ -97,6 +106,53 @@ class TestMovieService:
         )
         assert deleted_movie is None
 
+    def test_get_movie_by_id_uses_cache(self, db_session: Session) -> None:
+        """Testa se buscas repetidas por ID e título não voltam ao banco."""
+        created = MovieService.create_movie(
+            db_session, MovieCreate(title="Cached", year=2001, winner=False)
+        )
+        MovieService.get_movie_by_id(db_session, cast(int, created.id))
+        MovieService.get_movie_by_title(db_session, "Cached")
+
+        statements: List[str] = []
+
+        def capture(*args: Any) -> None:
+            statements.append(args[2])
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            by_id = MovieService.get_movie_by_id(db_session, cast(int, created.id))
+            by_title = MovieService.get_movie_by_title(db_session, "Cached")
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        assert statements == []
+        assert by_id == by_title == created
+
+    def test_cached_miss_is_invalidated_on_create(self, db_session: Session) -> None:
+        """Testa se o resultado negativo em cache é descartado ao criar o filme."""
+        assert MovieService.get_movie_by_title(db_session, "Later") is None
+
+        MovieService.create_movie(
+            db_session, MovieCreate(title="Later", year=2002, winner=False)
+        )
+
+        movie = MovieService.get_movie_by_title(db_session, "Later")
+        assert movie is not None
+        assert movie.year == 2002
+
+    def test_delete_movie_invalidates_title_cache(self, db_session: Session) -> None:
+        """Testa se a remoção descarta também a entrada por título."""
+        created = MovieService.create_movie(
+            db_session, MovieCreate(title="Gone", year=2003, winner=False)
+        )
+        assert MovieService.get_movie_by_title(db_session, "Gone") == created
+
+        MovieService.delete_movie(db_session, cast(int, created.id))
+
+        assert MovieService.get_movie_by_title(db_session, "Gone") is None
+
     def test_delete_movie_not_found(self, db_session: Session) -> None:
         """Testa a remoção de um filme inexistente."""
         assert MovieService.delete_movie(db_session, 9999) is False
@@ -207,3 +263,108 @@ class TestMovieService:
         assert all_movies.movies[0].studios is not None
         assert len(all_movies.movies[0].studios) == 1
         assert all_movies.movies[0].studios[0].name == "Paramount Pictures"
+
+    def test_stream_movies(self, db_session: Session) -> None:
+        """Testa a serialização em streaming a partir de um cursor."""
+        movies = [
+            MovieRepository.create(db_session, f"Movie {i}", 2000 + i, False)
+            for i in range(3)
+        ]
+
+        body = b"".join(
+            MovieService.stream_movies(
+                db_session, [], after_id=cast(int, movies[0].id), ndjson=True
+            )
+        )
+
+        titles = [json.loads(line)["title"] for line in body.splitlines()]
+        assert titles == ["Movie 1", "Movie 2"]
+
+    @pytest.mark.parametrize(
+        "expand", [[], ["producers"], ["studios"], ["producers", "studios"]]
+    )
+    @pytest.mark.parametrize("limit", [None, 2])
+    def test_get_all_movies_json_matches_pydantic_path(
+        self, db_session: Session, expand: List[str], limit: Optional[int]
+    ) -> None:
+        """
+        Testa se o caminho rápido gera exatamente os mesmos bytes que a
+        resposta serializada pelo FastAPI a partir dos modelos pydantic."""
+        producers = [
+            ProducerRepository.create(db_session, name) for name in ["Zoë", "Ana"]
+        ]
+        studios = [StudioRepository.create(db_session, "Estúdio Ñ")]
+        for i, title in enumerate(["Amélie", "Crouching Tiger 卧虎藏龙", 'Say "Hi"']):
+            movie = MovieRepository.create(db_session, title, 2000 + i, i % 2 == 0)
+            movie.producers.extend(producers[: i + 1])
+            movie.studios.extend(studios[:i])
+        db_session.commit()
+
+        expected = JSONResponse(
+            content=jsonable_encoder(
+                MovieService.get_all_movies(db_session, expand, limit)
+            )
+        ).body
+
+        assert MovieService.get_all_movies_json(db_session, expand, limit) == expected
+
+    def test_bulk_create_movies_is_set_based(
+        self, db_session: Session, mocker: MockFixture
+    ) -> None:
+        """
+        Testa se o cadastro em lote usa a mesma quantidade de consultas
+        independentemente do tamanho do lote e invalida o cache de prêmios."""
+        invalidate = mocker.patch.object(AwardIntervalService, "invalidate_cache")
+        statements: List[str] = []
+
+        def count(*args: Any) -> None:
+            statements.append(args[2])
+
+        def bulk(prefix: str, size: int) -> int:
+            request = MovieBulkRequest(
+                movies=[
+                    MovieBulkItem(
+                        title=f"{prefix} {i}",
+                        year=2000,
+                        winner=True,
+                        producers=[f"{prefix} Producer {i}"],
+                        studios=[f"{prefix} Studio {i % 2}"],
+                    )
+                    for i in range(size)
+                ]
+            )
+            statements.clear()
+            engine = db_session.get_bind()
+            event.listen(engine, "before_cursor_execute", count)
+            try:
+                result = MovieService.bulk_create_movies(db_session, request)
+            finally:
+                event.remove(engine, "before_cursor_execute", count)
+            assert result.created == size
+            return len(statements)
+
+        assert bulk("Small", 5) == bulk("Large", 50)
+        invalidate.assert_called()
+
+    def test_bulk_create_movies_clears_entity_cache(self, db_session: Session) -> None:
+        """Testa se o cadastro em lote descarta os resultados negativos em cache."""
+        assert MovieService.get_movie_by_title(db_session, "Bulk") is None
+        assert ProducerService.get_producer_by_name(db_session, "Bulk P") is None
+
+        MovieService.bulk_create_movies(
+            db_session,
+            MovieBulkRequest(
+                movies=[
+                    MovieBulkItem(
+                        title="Bulk",
+                        year=2000,
+                        winner=False,
+                        producers=["Bulk P"],
+                        studios=["Bulk S"],
+                    )
+                ]
+            ),
+        )
+
+        assert MovieService.get_movie_by_title(db_session, "Bulk") is not None
+        assert ProducerService.get_producer_by_name(db_session, "Bulk P") is not None
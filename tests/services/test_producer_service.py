@@ -1,3 +1,6 @@
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from app.services.producer_service import ProducerService
 from app.schemas.producer import ProducerCreate, ProducerResponse
@@ -69,6 +72,22 @@ class TestProducerService:
         assert len(all_producers.producers) == 2
         assert all(isinstance(p, ProducerResponse) for p in all_producers.producers)
 
+    @pytest.mark.parametrize("limit", [None, 1])
+    def test_get_all_producers_json_matches_pydantic_path(
+        self, db_session: Session, limit: Optional[int]
+    ) -> None:
+        """Testa se o caminho rápido gera os mesmos bytes que o caminho pydantic."""
+        for name in ["São Paulo", "Zoë", 'Say "Hi"']:
+            ProducerService.create_producer(db_session, ProducerCreate(name=name))
+
+        expected = JSONResponse(
+            content=jsonable_encoder(
+                ProducerService.get_all_producers(db_session, limit)
+            )
+        ).body
+
+        assert ProducerService.get_all_producers_json(db_session, limit) == expected
+
     def test_delete_producer(self, db_session: Session) -> None:
         """Testa a remoção de um produtor pelo ID."""
         producer_data = ProducerCreate(name="George Lucas")
@@ -1,3 +1,6 @@
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from app.services.studio_service import StudioService
 from app.schemas.studio import StudioCreate, StudioResponse
@@ -65,6 +68,20 @@ class TestStudioService:
         assert len(all_studios.studios) == 2
         assert all(isinstance(s, StudioResponse) for s in all_studios.studios)
 
+    @pytest.mark.parametrize("limit", [None, 1])
+    def test_get_all_studios_json_matches_pydantic_path(
+        self, db_session: Session, limit: Optional[int]
+    ) -> None:
+        """Testa se o caminho rápido gera os mesmos bytes que o caminho pydantic."""
+        for name in ["São Paulo", "Zoë", 'Say "Hi"']:
+            StudioService.create_studio(db_session, StudioCreate(name=name))
+
+        expected = JSONResponse(
+            content=jsonable_encoder(StudioService.get_all_studios(db_session, limit))
+        ).body
+
+        assert StudioService.get_all_studios_json(db_session, limit) == expected
+
     def test_delete_studio(self, db_session: Session) -> None:
         """Testa a remoção de um estúdio pelo ID."""
         studio_data = StudioCreate(name="Columbia Pictures")
@@ -0,0 +1,14 @@
+from app.utils.batch import align_to_keys
+
+
+class TestBatch:
+    """Testes para o alinhamento dos resultados de buscas em lote."""
+
+    def test_align_to_keys(self) -> None:
+        """Testa se a ordem pedida é mantida e as ausências são marcadas."""
+        results, missing = align_to_keys(
+            ["b", "x", "a", "b"], [("a", 1), ("b", 2)], lambda item: item[0]
+        )
+
+        assert results == [("b", 2), None, ("a", 1), ("b", 2)]
+        assert missing == ["x"]
@@ -0,0 +1,139 @@
+from typing import List
+
+from app.utils.cache import TTLCache
+
+
+class FakeTimer:
+    """Relógio controlado manualmente para testar a expiração."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """Testes para o cache LRU com expiração."""
+
+    def test_get_or_load_caches_value(self) -> None:
+        """Testa se o loader só é chamado na primeira busca."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        calls: List[int] = []
+
+        def loader() -> str:
+            calls.append(1)
+            return "valor"
+
+        assert cache.get_or_load("a", loader) == "valor"
+        assert cache.get_or_load("a", loader) == "valor"
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hit_ratio"] == 0.5
+
+    def test_negative_results_are_cached(self) -> None:
+        """Testa se resultados None também ficam em cache."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("ausente", None)
+
+        assert cache.get("ausente") == (True, None)
+        assert cache.get("outro") == (False, None)
+
+    def test_negative_results_use_short_ttl(self) -> None:
+        """Testa se None expira em `negative_ttl`, antes dos demais valores."""
+        timer = FakeTimer()
+        cache = TTLCache(maxsize=10, ttl=60, timer=timer, negative_ttl=1)
+        cache.set("ausente", None)
+        cache.set("presente", 1)
+
+        timer.now = 1.0
+        assert cache.get("ausente") == (False, None)
+        assert cache.get("presente") == (True, 1)
+
+    def test_load_racing_a_delete_is_not_stored(self) -> None:
+        """
+        Testa se um valor carregado antes de uma remoção não é gravado
+        depois dela (a carga leu o banco antes da escrita).
+        """
+        cache = TTLCache(maxsize=10, ttl=60)
+
+        def stale_loader() -> str:
+            cache.delete("a")  # escrita concorrente durante a carga
+            return "antigo"
+
+        assert cache.get_or_load("a", stale_loader) == "antigo"
+        assert cache.get("a") == (False, None)
+        assert cache.get_or_load("a", lambda: "novo") == "novo"
+        assert cache.get("a") == (True, "novo")
+
+    async def test_get_or_load_async(self) -> None:
+        """Testa a variante com carregador async e a corrida com remoções."""
+        cache = TTLCache(maxsize=10, ttl=60)
+
+        async def stale_loader() -> str:
+            cache.delete("a")
+            return "antigo"
+
+        async def loader() -> str:
+            return "novo"
+
+        assert await cache.get_or_load_async("a", stale_loader) == "antigo"
+        assert cache.get("a") == (False, None)
+        assert await cache.get_or_load_async("a", loader) == "novo"
+        assert await cache.get_or_load_async("a", stale_loader) == "novo"
+
+    def test_entries_expire_after_ttl(self) -> None:
+        """Testa se entradas expiradas são descartadas."""
+        timer = FakeTimer()
+        cache = TTLCache(maxsize=10, ttl=5, timer=timer)
+        cache.set("a", 1)
+
+        timer.now = 4.9
+        assert cache.get("a") == (True, 1)
+        timer.now = 5.0
+        assert cache.get("a") == (False, None)
+        assert cache.stats()["size"] == 0
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Testa se, cheio, o cache remove o item usado há mais tempo."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        assert cache.stats()["evictions"] == 1
+
+    def test_delete_and_clear(self) -> None:
+        """Testa a remoção de chaves específicas e a limpeza total."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        cache.delete("a", "inexistente")
+        assert cache.get("a") == (False, None)
+
+        cache.clear()
+        assert cache.stats()["size"] == 0
+
+    def test_validate_by_generation(self) -> None:
+        """Testa o esvaziamento quando a geração de uma tabela do cache muda."""
+        cache = TTLCache(maxsize=10, ttl=60, tables=("movies",))
+        untracked = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+        untracked.set("a", 1)
+
+        assert cache.validate({"movies": 1}) is True  # sem referência ainda
+        cache.set("a", 1)
+        assert cache.validate({"movies": 1, "producers": 7}) is False
+        assert cache.get("a") == (True, 1)
+
+        assert cache.validate({"movies": 2}) is True
+        assert cache.get("a") == (False, None)
+        assert cache.stats()["invalidations"] == 2
+        assert untracked.validate({"movies": 2}) is False
+        assert untracked.get("a") == (True, 1)
@@ -0,0 +1,20 @@
+import pytest
+
+from app.utils.chunking import chunked
+
+
+class TestChunking:
+    """Testes para a divisão de sequências em blocos."""
+
+    def test_chunked_splits_in_order(self) -> None:
+        """Testa se os blocos preservam a ordem e o último fica com o resto."""
+        assert list(chunked([1, 2, 3, 4, 5], 2)) == [[1, 2], [3, 4], [5]]
+
+    def test_chunked_empty(self) -> None:
+        """Testa se uma sequência vazia não gera blocos."""
+        assert list(chunked([], 3)) == []
+
+    def test_chunked_invalid_size(self) -> None:
+        """Testa se tamanhos não positivos são rejeitados."""
+        with pytest.raises(ValueError):
+            list(chunked([1], 0))
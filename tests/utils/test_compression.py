@@ -0,0 +1,46 @@
+import gzip
+
+import brotli
+import pytest
+
+from app.utils.compression import compress, negotiate_encoding
+
+
+class TestCompression:
+    """Testes para a negociação e a compressão de respostas."""
+
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            ("gzip, deflate", "gzip"),
+            ("br;q=0.5, gzip;q=0.8", "gzip"),
+            ("gzip;q=0", None),
+            ("*", "br"),
+            ("identity", None),
+            (None, None),
+        ],
+    )
+    def test_negotiate_encoding(self, header: str | None, expected: str | None) -> None:
+        """Testa a escolha da codificação a partir do Accept-Encoding."""
+        assert negotiate_encoding(header) == expected
+
+    def test_negotiate_prefers_brotli_on_tie(self) -> None:
+        """Testa se, com pesos iguais, a preferência do servidor (br) vence."""
+        assert negotiate_encoding("gzip, br") == "br"
+        assert negotiate_encoding("gzip, br;q=0.9") == "gzip"
+
+    def test_compress_brotli(self) -> None:
+        """Testa se o brotli gerado é reversível."""
+        body = b'{"movies":[]}' * 100
+
+        assert brotli.decompress(compress(body, "br")) == body
+
+    def test_compress_gzip_is_deterministic(self) -> None:
+        """Testa se o gzip gerado é reversível e estável entre chamadas."""
+        body = b'{"movies":[]}' * 100
+        compressed = compress(body, "gzip")
+
+        assert gzip.decompress(compressed) == body
+        assert compress(body, "gzip") == compressed
+        with pytest.raises(ValueError):
+            compress(body, "zstd")
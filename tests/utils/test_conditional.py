@@ -0,0 +1,36 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.utils.conditional import entity_tag, etag_matches, http_date
+
+
+class TestConditional:
+    """Testes para os utilitários de requisições condicionais."""
+
+    def test_entity_tag(self) -> None:
+        """Testa se a ETag combina listagem, representação e gerações."""
+        assert entity_tag("movies", [3, 1], "json") == '"movies-json-3.1"'
+
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            ('"movies-json-3"', True),
+            ('W/"movies-json-3"', True),
+            ('"outra", "movies-json-3"', True),
+            ("*", True),
+            ('"movies-json-2"', False),
+            (None, False),
+        ],
+    )
+    def test_etag_matches(self, header: str | None, expected: bool) -> None:
+        """Testa a comparação fraca do If-None-Match."""
+        assert etag_matches(header, '"movies-json-3"') is expected
+
+    def test_http_date_assumes_utc(self) -> None:
+        """Testa a formatação de datas sem fuso como UTC."""
+        assert (
+            http_date(datetime(2024, 1, 2, 3, 4, 5))
+            == http_date(datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc))
+            == "Tue, 02 Jan 2024 03:04:05 GMT"
+        )
@@ -0,0 +1,50 @@
+import pytest
+from pytest_mock import MockFixture
+
+from app.config import Config
+from app.utils.pagination import (
+    build_page,
+    decode_cursor,
+    encode_cursor,
+    resolve_page,
+)
+
+
+class TestPagination:
+    """Testes para os utilitários de paginação por cursor."""
+
+    def test_encode_decode_cursor(self) -> None:
+        """Testa se o cursor gerado é opaco e recupera o ID original."""
+        cursor = encode_cursor(42)
+
+        assert "42" not in cursor
+        assert decode_cursor(cursor) == 42
+
+    @pytest.mark.parametrize("cursor", ["invalido", "!!!", encode_cursor(1)[:-1]])
+    def test_decode_invalid_cursor(self, cursor: str) -> None:
+        """Testa se cursores inválidos geram ValueError."""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+    def test_resolve_page_without_parameters(self) -> None:
+        """Testa se a ausência de parâmetros mantém a listagem completa."""
+        assert resolve_page(None, None) == (None, None)
+
+    def test_resolve_page_clamps_limit(self, mocker: MockFixture) -> None:
+        """Testa se o limite é restrito ao tamanho máximo do servidor."""
+        mocker.patch.object(Config, "MAX_PAGE_SIZE", 10)
+
+        assert resolve_page(500, None) == (10, None)
+        assert resolve_page(None, encode_cursor(3)) == (10, 3)
+        assert resolve_page(5, encode_cursor(3)) == (5, 3)
+
+    def test_build_page(self) -> None:
+        """Testa o recorte da página e a geração do próximo cursor."""
+        page, cursor = build_page([1, 2, 3], 2, lambda item: item)
+
+        assert page == [1, 2]
+        assert cursor is not None
+        assert decode_cursor(cursor) == 2
+
+        assert build_page([1, 2], 2, lambda item: item) == ([1, 2], None)
+        assert build_page([1, 2], None, lambda item: item) == ([1, 2], None)
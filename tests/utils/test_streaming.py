@@ -0,0 +1,49 @@
+import json
+
+from app.schemas.producer import ProducerResponse
+from app.utils.streaming import (
+    buffered,
+    json_list_envelope,
+    ndjson_lines,
+    wants_ndjson,
+)
+
+
+class TestStreaming:
+    """Testes para os utilitários de serialização em streaming."""
+
+    def test_wants_ndjson(self) -> None:
+        """Testa a detecção do formato NDJSON pelo cabeçalho Accept."""
+        assert wants_ndjson("application/x-ndjson")
+        assert wants_ndjson("application/json, application/x-ndjson;q=0.9")
+        assert not wants_ndjson("application/json")
+        assert not wants_ndjson(None)
+
+    def test_ndjson_lines(self) -> None:
+        """Testa se cada item é serializado em uma linha."""
+        items = [ProducerResponse(id=1, name="A"), ProducerResponse(id=2, name="B")]
+        lines = b"".join(ndjson_lines(items)).decode().splitlines()
+
+        assert [json.loads(line) for line in lines] == [
+            {"name": "A", "id": 1},
+            {"name": "B", "id": 2},
+        ]
+
+    def test_json_list_envelope(self) -> None:
+        """Testa se o envelope gerado é o mesmo da listagem comum."""
+        items = [ProducerResponse(id=1, name="A"), ProducerResponse(id=2, name="B")]
+
+        body = json.loads(b"".join(json_list_envelope("producers", items)))
+        assert body == {
+            "producers": [{"name": "A", "id": 1}, {"name": "B", "id": 2}],
+            "next_cursor": None,
+        }
+
+        empty = json.loads(b"".join(json_list_envelope("producers", [])))
+        assert empty == {"producers": [], "next_cursor": None}
+
+    def test_buffered(self) -> None:
+        """Testa o agrupamento de fragmentos em blocos maiores."""
+        chunks = list(buffered([b"ab", b"cd", b"ef", b"g"], size=4))
+
+        assert chunks == [b"abcd", b"efg"]
@@ -0,0 +1,34 @@
+import pytest
+
+from app.utils.text import fts_query, normalize_name, prefix_upper_bound
+
+
+class TestText:
+    """Testes para a normalização de nomes usada nas buscas."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (" Éric Rohmer ", "eric rohmer"),
+            ("ESTÚDIO Ñ", "estudio n"),
+            ("Straße", "strasse"),
+            ("Zoë", "zoe"),
+        ],
+    )
+    def test_normalize_name(self, value: str, expected: str) -> None:
+        """Testa a remoção de acentos, espaços e maiúsculas."""
+        assert normalize_name(value) == expected
+
+    def test_prefix_upper_bound(self) -> None:
+        """Testa se o limite superior cobre exatamente os nomes com o prefixo."""
+        upper = prefix_upper_bound("ab")
+
+        assert upper == "ac"
+        assert "ab" <= "abzzz" < upper
+        assert not ("ab" <= "ac" < upper)
+        assert prefix_upper_bound("") is None
+
+    def test_fts_query(self) -> None:
+        """Testa se a consulta FTS5 escapa o texto e usa prefixo na última palavra."""
+        assert fts_query('Lonely "Lad') == '"Lonely" "Lad"*'
+        assert fts_query("*-") == ""